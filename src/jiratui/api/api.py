@@ -3,13 +3,14 @@ from datetime import date, datetime
 from io import BufferedReader
 import json
 import logging
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import httpx
-import puremagic
 
 from jiratui.api.client import AsyncJiraClient, JiraClient, JiraTUIAsyncHTTPClient
+from jiratui.api.uploads import MultipartFileUpload, UploadProgressCallback
 from jiratui.api.utils import build_issue_search_jql
 from jiratui.config import ApplicationConfiguration
 from jiratui.constants import (
@@ -96,6 +97,12 @@ class JiraAPI:
     def sync_client(self) -> JiraClient:
         return self._sync_client
 
+    async def close(self) -> None:
+        """Releases the connections used by the clients of the API."""
+        await self._client.close_async_client()
+        await self._async_http_client.close_async_client()
+        await self._sync_client.close_client()
+
     async def search_projects(
         self,
         offset: int | None = None,
@@ -357,6 +364,32 @@ class JiraAPI:
             params=params,
         )
 
+    async def get_issues_bulk(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> dict:
+        """Retrieves the details of several work items by ID or key in a single request.
+
+        Work items that do not exist, or that the user is not allowed to see, are reported in the `issueErrors` key
+        of the response instead of failing the request.
+
+        **See Also**:
+        - [api-rest-api-3-issue-bulkfetch-post](https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-bulkfetch-post)
+
+        Args:
+            issue_ids_or_keys: the IDs or keys of the work items to retrieve; up to 100.
+            fields: retrieve these fields for every work item. It defaults to the navigable fields.
+
+        Returns:
+            A dictionary with the work items in the key `issues`.
+        """
+
+        payload: dict[str, Any] = {'issueIdsOrKeys': issue_ids_or_keys}
+        if fields:
+            payload['fields'] = fields
+        return await self._client.make_request(  # type:ignore[return-value]
+            method=httpx.AsyncClient.post, url='issue/bulkfetch', data=json.dumps(payload)
+        )
+
     async def issue_picker(
         self,
         query: str,
@@ -1173,14 +1206,68 @@ class JiraAPI:
                         f'Unable to determine the type of file: {filename}. Unable to upload it as attachment.'
                     )
             return self._sync_client.make_request(  # type:ignore[return-value]
-                method=httpx.post,
+                method=httpx.Client.post,
                 url=f'issue/{issue_id_or_key}/attachments',
                 headers={'X-Atlassian-Token': 'no-check'},
                 files={'file': (file_name, file_to_upload, detected_mime_type)},
             )
 
+    async def upload_attachment_to_issue(
+        self,
+        issue_id_or_key: str,
+        filename: str,
+        file_name: str,
+        on_progress: UploadProgressCallback | None = None,
+    ) -> list[dict]:
+        """Adds an attachment to an issue streaming the content of the file.
+
+        Unlike `add_attachment_to_issue()` the file is sent in chunks, without loading it into memory and without
+        blocking the event loop.
+
+        **See Also**:
+        - [api-rest-api-3-issue-issueidorkey-attachments-post](https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-attachments/#api-rest-api-3-issue-issueidorkey-attachments-post)
+
+        Args:
+            issue_id_or_key: the case-sensitive key of the work item.
+            filename: the full name of the file to upload.
+            file_name: the name of the file to upload.
+            on_progress: an optional function that receives the number of bytes sent and the size of the file.
+
+        Returns:
+            A list of dictionaries with the results.
+        """
+
+        try:
+            # attempt to detect the MIME type based on the content of the file
+            detected_mime_type = await asyncio.to_thread(self._detect_mime_type_of_file, filename)
+        except FileNotFoundError as e:
+            self.logger.warning(
+                f'File not found. Unable to determine the MIME type of he file {filename}.'
+            )
+            raise FileUploadException(
+                f'The file {filename} was not found. Unable to upload it as attachment.'
+            ) from e
+        if detected_mime_type is None:
+            raise FileUploadException(
+                f'Unable to determine the type of file: {filename}. Unable to upload it as attachment.'
+            )
+        return await self._client.upload_file(  # type:ignore[return-value]
+            url=f'issue/{issue_id_or_key}/attachments',
+            upload=MultipartFileUpload(
+                filename, file_name, mime_type=detected_mime_type, on_progress=on_progress
+            ),
+            headers={'X-Atlassian-Token': 'no-check'},
+        )
+
+    @classmethod
+    def _detect_mime_type_of_file(cls, filename: str) -> str | None:
+        with open(filename, 'rb') as file_to_upload:
+            return cls._detect_file_mime_type(file_to_upload)
+
     @staticmethod
     def _detect_file_mime_type(file_to_upload: BufferedReader) -> str | None:
+        import puremagic
+
         puremagic_result: list[puremagic.PureMagicWithConfidence] = puremagic.magic_string(
             file_to_upload.read(2028)
         )
@@ -1242,6 +1329,29 @@ class JiraAPI:
             follow_redirects=True,
         )
 
+    async def download_attachment_content(
+        self, attachment_id: str, destination: Path
+    ) -> Path | None:
+        """Downloads the contents of an attachment to a file.
+
+        The contents are streamed to disk so the file is never loaded into memory. An interrupted download is resumed
+        the next time the same destination is requested.
+
+        **See Also**:
+        - [api-rest-api-3-attachment-content-id-get](https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-attachments/#api-rest-api-3-attachment-content-id-get)
+        - [api-rest-api-2-attachment-content-id-get](https://developer.atlassian.com/cloud/jira/platform/rest/v2/api-group-issue-attachments/#api-rest-api-2-attachment-content-id-get)
+
+        Args:
+            attachment_id: The ID of the attachment.
+            destination: The path of the file where the contents are stored.
+
+        Returns:
+            The path of the downloaded file.
+        """
+        return await self._async_http_client.download_file(
+            url=f'attachment/content/{attachment_id}', destination=destination
+        )
+
     async def get_issue_work_log(
         self,
         issue_id_or_key: str,
@@ -1610,6 +1720,38 @@ class JiraDataCenterAPI(JiraAPI):
             method=httpx.AsyncClient.post, url='search', data=json.dumps(payload)
         )
 
+    async def get_issues_bulk(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> dict:
+        """Retrieves the details of several work items by ID or key in a single request.
+
+        Jira Data Center does not support fetching work items in bulk; the work items are searched with a JQL query
+        instead. The query is not validated strictly, so work items that do not exist are ignored instead of failing
+        the request.
+
+        **See Also**:
+        - [api-api-2-search-post](https://developer.atlassian.com/server/jira/platform/rest/v11001/api-group-search/#api-api-2-search-post)
+
+        Args:
+            issue_ids_or_keys: the IDs or keys of the work items to retrieve.
+            fields: retrieve these fields for every work item.
+
+        Returns:
+            A dictionary with the work items in the key `issues`.
+        """
+
+        keys = ', '.join(f'"{issue_id_or_key}"' for issue_id_or_key in issue_ids_or_keys)
+        payload: dict[str, Any] = {
+            'jql': f'key in ({keys})',
+            'maxResults': len(issue_ids_or_keys),
+            'validateQuery': 'warn',
+        }
+        if fields:
+            payload['fields'] = fields
+        return await self._client.make_request(  # type:ignore[return-value]
+            method=httpx.AsyncClient.post, url='search', data=json.dumps(payload)
+        )
+
     async def work_items_search_approximate_count(
         self,
         project_key: str | None = None,
@@ -1736,6 +1878,33 @@ class JiraDataCenterAPI(JiraAPI):
             A bytes representation of the attachment's content; or `None` if the attachment can not be downloaded.
         """
 
+        if content_url := await self._get_attachment_content_url(attachment_id):
+            return await self._async_http_client.make_request(
+                method=httpx.AsyncClient.get,
+                url=content_url,
+                follow_redirects=True,
+            )
+        return None
+
+    async def download_attachment_content(
+        self, attachment_id: str, destination: Path
+    ) -> Path | None:
+        """Downloads the contents of an attachment to a file.
+
+        Args:
+            attachment_id: The ID of the attachment.
+            destination: The path of the file where the contents are stored.
+
+        Returns:
+            The path of the downloaded file; or `None` if the attachment can not be downloaded.
+        """
+        if content_url := await self._get_attachment_content_url(attachment_id):
+            return await self._async_http_client.download_file(
+                url=content_url, destination=destination
+            )
+        return None
+
+    async def _get_attachment_content_url(self, attachment_id: str) -> str | None:
         attachment: dict
         if attachment := await self.get_attachment(attachment_id):
             if content := attachment.get('content'):
@@ -1745,7 +1914,7 @@ class JiraDataCenterAPI(JiraAPI):
                 parsed_content = urlsplit(content)
                 if parsed_content.scheme and parsed_content.netloc:
                     parsed_base_url = urlsplit(self.base_url)
-                    content = urlunsplit(
+                    return urlunsplit(
                         (
                             parsed_base_url.scheme,
                             parsed_base_url.netloc,
@@ -1754,13 +1923,7 @@ class JiraDataCenterAPI(JiraAPI):
                             parsed_content.fragment,
                         )
                     )
-                else:
-                    content = urljoin(f'{self.base_url.rstrip("/")}/', content)
-                return await self._async_http_client.make_request(
-                    method=httpx.AsyncClient.get,
-                    url=content,
-                    follow_redirects=True,
-                )
+                return urljoin(f'{self.base_url.rstrip("/")}/', content)
         return None
 
     async def get_issue_work_log(
@@ -1926,6 +2089,14 @@ class JiraSoftwareCloudAPI:
         self._base_url = base_url
         self.logger = JiraTUILogger(logging.getLogger(LOGGER_NAME), configuration.enable_logging)
 
+    @property
+    def client(self) -> AsyncJiraClient:
+        return self._client
+
+    async def close(self) -> None:
+        """Releases the connections used by the client of the API."""
+        await self._client.close_async_client()
+
     async def get_boards(
         self,
         offset: int | None = None,
@@ -0,0 +1,220 @@
+"""A cache of the responses of the Jira REST API.
+
+Some resources of the API, e.g. the types of work items, the statuses or the fields, rarely change but are requested
+many times while the application runs. `ResponseCache` keeps the content of these responses in memory for a
+configurable number of seconds (TTL). When an entry expires and the server provided a validator (`ETag` or
+`Last-Modified`) the entry is revalidated using a conditional request instead of being downloaded again.
+
+The cache is bounded by the size (in bytes) of the content of the responses; when the budget is exceeded the least
+recently used entries are evicted.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+
+import httpx
+
+from jiratui.config import ResponseCacheConfiguration
+from jiratui.constants import RESPONSE_CACHE_DEFAULT_TTLS
+
+
+@dataclass
+class CachedResponse:
+    """The content of a cached response and the metadata required to revalidate it."""
+
+    content: bytes
+    headers: httpx.Headers
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def can_be_revalidated(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Builds the headers that turn a request for this resource into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request | None = None) -> httpx.Response:
+        return httpx.Response(200, headers=self.headers, content=self.content, request=request)
+
+
+@dataclass
+class ResponseCacheStatistics:
+    hits: int = 0
+    """The number of requests served from the cache without contacting the server."""
+    misses: int = 0
+    """The number of requests that required downloading the resource."""
+    revalidations: int = 0
+    """The number of expired entries that the server confirmed are still valid (HTTP 304)."""
+    evictions: int = 0
+    """The number of entries removed to keep the cache within its size budget."""
+
+
+@dataclass
+class ResponseCache:
+    """An LRU cache of responses with per-resource TTLs and a budget in bytes."""
+
+    max_size: int
+    ttls: dict[str, int] = field(default_factory=lambda: dict(RESPONSE_CACHE_DEFAULT_TTLS))
+    statistics: ResponseCacheStatistics = field(default_factory=ResponseCacheStatistics)
+    _entries: OrderedDict[tuple, CachedResponse] = field(default_factory=OrderedDict, repr=False)
+    _size: int = field(default=0, repr=False)
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: ResponseCacheConfiguration | None
+    ) -> 'ResponseCache | None':
+        """Builds a cache based on the configuration of the application.
+
+        Args:
+            configuration: the settings of the cache.
+
+        Returns:
+            An instance of `ResponseCache` or `None` if the cache is disabled.
+        """
+
+        if configuration is None or not configuration.enabled:
+            return None
+        ttls = dict(RESPONSE_CACHE_DEFAULT_TTLS)
+        ttls.update(configuration.ttls or {})
+        return cls(max_size=configuration.max_size, ttls=ttls)
+
+    @property
+    def size(self) -> int:
+        """The size in bytes of the content of all the cached responses."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, resource: str) -> int | None:
+        """Retrieves the TTL of a resource.
+
+        Args:
+            resource: the URL of the resource relative to the base URL of the API, e.g. `field`.
+
+        Returns:
+            The number of seconds responses are cached for or `None` if the resource is not cacheable.
+        """
+
+        if (ttl := self.ttls.get(resource.strip('/'))) is not None and ttl > 0:
+            return ttl
+        return None
+
+    @staticmethod
+    def build_key(resource: str, params: dict | None = None) -> tuple:
+        return resource.strip('/'), tuple(
+            sorted((str(k), str(v)) for k, v in (params or {}).items())
+        )
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: tuple, response: httpx.Response, ttl: int) -> CachedResponse | None:
+        """Stores the content of a successful response.
+
+        Args:
+            key: the key of the entry.
+            response: the response to cache.
+            ttl: the number of seconds the response is considered fresh.
+
+        Returns:
+            The new entry or `None` if the response can not be cached.
+        """
+
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or len(response.content) > self.max_size:
+            self.discard(key)
+            return None
+        entry = CachedResponse(
+            content=response.content,
+            headers=httpx.Headers(
+                {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower()
+                    not in ('content-encoding', 'content-length', 'transfer-encoding')
+                }
+            ),
+            expires_at=time.monotonic() + ttl,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        self.discard(key)
+        self._entries[key] = entry
+        self._size += entry.size
+        self._evict()
+        return entry
+
+    def refresh(
+        self, key: tuple, entry: CachedResponse, response: httpx.Response, ttl: int
+    ) -> None:
+        """Extends the lifetime of an entry after the server confirmed that it is still valid.
+
+        Args:
+            key: the key of the entry.
+            entry: the entry to refresh.
+            response: the `304 Not Modified` response sent by the server.
+            ttl: the number of seconds the response is considered fresh.
+
+        Returns:
+            Nothing.
+        """
+
+        entry.expires_at = time.monotonic() + ttl
+        entry.etag = response.headers.get('ETag', entry.etag)
+        entry.last_modified = response.headers.get('Last-Modified', entry.last_modified)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self.statistics.revalidations += 1
+
+    def discard(self, key: tuple) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= entry.size
+
+    def invalidate(self, resource: str) -> None:
+        """Removes all the entries of a resource, regardless of the query parameters used to request it.
+
+        Entries of the collections that contain the resource are removed too, e.g. invalidating `issueLinkType/1000`
+        removes the cached response of `issueLinkType`.
+
+        Args:
+            resource: the URL of the resource relative to the base URL of the API.
+
+        Returns:
+            Nothing.
+        """
+
+        resource = resource.strip('/')
+        for key in [
+            key for key in self._entries if key[0] == resource or resource.startswith(f'{key[0]}/')
+        ]:
+            self.discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.statistics.evictions += 1
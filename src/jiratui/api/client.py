@@ -1,11 +1,23 @@
+import asyncio
 import logging
+from pathlib import Path
 import ssl
+import time
 from typing import Any, Callable
 
 import httpx
 
+from jiratui.api.cache import CachedResponse, ResponseCache
+from jiratui.api.pool import ConnectionPool, acquire_connection_pool, release_connection_pool
+from jiratui.api.throttling import (
+    RATE_LIMITED_STATUS_CODES,
+    RateLimiter,
+    RetryPolicy,
+    get_method_name,
+)
+from jiratui.api.uploads import MultipartFileUpload
 from jiratui.config import ApplicationConfiguration
-from jiratui.constants import LOGGER_NAME
+from jiratui.constants import ATTACHMENT_DOWNLOAD_CHUNK_SIZE_IN_BYTES, LOGGER_NAME
 from jiratui.exceptions import (
     AuthorizationException,
     PermissionException,
@@ -67,7 +79,6 @@ class JiraTUIAsyncHTTPClient:
         api_token: str,
         configuration: ApplicationConfiguration,
     ):
-        ssl_certificate_settings: ssl.SSLContext | bool = _setup_ssl_certificates(configuration)
         self.base_url: str = base_url.rstrip('/')
         if configuration.use_bearer_authentication:
             self.authentication: httpx.Auth | httpx.BasicAuth | None = JiraTUIBearerAuth(
@@ -77,11 +88,20 @@ class JiraTUIAsyncHTTPClient:
             self.authentication = None
         else:
             self.authentication = httpx.BasicAuth(api_username, api_token)
-        self.client: httpx.AsyncClient = httpx.AsyncClient(
-            verify=ssl_certificate_settings, timeout=None
-        )
+        # all the clients connecting to the same Jira server share the same pool of connections
+        self.connection_pool: ConnectionPool = acquire_connection_pool(self.base_url, configuration)
+        self._connection_pool_released = False
+        self.client: httpx.AsyncClient = self.connection_pool.async_client
+        # the requests sent to the same Jira server share the same rate limits
+        self.rate_limiter: RateLimiter = self.connection_pool.rate_limiter
+        self.retry_policy = RetryPolicy.from_configuration(configuration.rate_limit)
+        self.response_cache: ResponseCache | None = self._create_response_cache(configuration)
         self.logger = JiraTUILogger(logging.getLogger(LOGGER_NAME), configuration.enable_logging)
 
+    @staticmethod
+    def _create_response_cache(configuration: ApplicationConfiguration) -> ResponseCache | None:
+        return None
+
     @staticmethod
     def set_headers(headers: dict | None = None) -> dict:
         default_headers = {
@@ -103,8 +123,10 @@ class JiraTUIAsyncHTTPClient:
         return f'{self.base_url}/{resource}'
 
     async def close_async_client(self):
-        # httpx.AsyncClient.aclose must be awaited!
-        await self.client.aclose()
+        # the connections are closed when the last client using the pool releases it
+        if not self._connection_pool_released:
+            self._connection_pool_released = True
+            await release_connection_pool(self.connection_pool)
 
     async def make_request(
         self,
@@ -138,20 +160,151 @@ class JiraTUIAsyncHTTPClient:
         headers = self.set_headers(headers)
         full_url = self.get_resource_url(url)
 
+        cache_key: tuple | None = None
+        cached_response: CachedResponse | None = None
+        cache_ttl: int | None = None
+        if self.response_cache is not None:
+            if method is not httpx.AsyncClient.get:
+                # any change to a resource makes the cached responses of the resource stale
+                self.response_cache.invalidate(url)
+            elif (cache_ttl := self.response_cache.get_ttl(url)) is not None:
+                cache_key = self.response_cache.build_key(url, kwargs.get('params'))
+                if (cached_response := self.response_cache.get(cache_key)) is not None:
+                    if cached_response.is_fresh:
+                        self.response_cache.statistics.hits += 1
+                        return self._parse_response(cached_response.to_response())
+                    if cached_response.can_be_revalidated:
+                        headers.update(cached_response.conditional_headers())
+                    else:
+                        cached_response = None
+
+        response: httpx.Response = await self._send_request(
+            method, full_url, headers=headers, timeout=timeout, **kwargs
+        )
+
+        if (
+            response.status_code == 304
+            and self.response_cache is not None
+            and cache_key is not None
+            and cached_response is not None
+        ):
+            self.response_cache.refresh(cache_key, cached_response, response, cache_ttl or 0)
+            return self._parse_response(cached_response.to_response())
+
+        self._raise_for_status(response, full_url)
+
+        if response.status_code == 204:
+            return self._empty_response(response)
+
         try:
-            response: httpx.Response = await method(
-                self.client,
-                url=full_url,
-                headers=headers,
-                timeout=timeout,
-                auth=self.authentication,
-                **kwargs,
-            )
-        except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
-            msg = f'{e.__class__.__name__}: {e}.'
-            self.logger.error(msg, extra={'url': full_url})
-            raise ServiceUnavailableException(msg, extra={'url': full_url}) from e
+            parsed_response = self._parse_response(response)
+        except Exception as e:
+            if response.status_code == 201:
+                return self._empty_response(response)
+            log_msg = f'{e.__class__.__name__}: {e}.'
+            self.logger.error(log_msg, extra={'url': full_url, 'status_code': response.status_code})
+            raise ServiceInvalidResponseException(log_msg, extra={}) from e
+
+        if self.response_cache is not None and cache_key is not None:
+            self.response_cache.statistics.misses += 1
+            if response.status_code == 200:
+                self.response_cache.store(cache_key, response, cache_ttl or 0)
+        return parsed_response
+
+    async def download_file(
+        self,
+        url: str,
+        destination: Path,
+        headers: dict | None = None,
+        timeout: int = 55,
+        chunk_size: int = ATTACHMENT_DOWNLOAD_CHUNK_SIZE_IN_BYTES,
+    ) -> Path:
+        """Downloads a file from the Jira REST API streaming it to disk.
+
+        The content is written to a partial file next to the destination, one chunk at a time, so it is never loaded
+        into memory. The partial file is moved to the destination once the download completes. If a previous download
+        of the same file was interrupted the download resumes from the end of the partial file using a `Range`
+        request; servers that ignore the header send the whole file again.
+
+        Args:
+            url: the (relative) URL to request.
+            destination: the path of the downloaded file.
+            headers: any HTTP headers.
+            timeout: an optional timeout (in seconds) of every read. Default is 55.
+            chunk_size: the number of bytes written to disk at a time.
+
+        Returns:
+            The path of the downloaded file.
+
+        Raises:
+            ServiceUnavailableException: If the service is unavailable or times out.
+            ResourceNotFoundException: If the requested resource is not found (404).
+            AuthorizationException: If authentication fails (401).
+            PermissionException: If permission is denied (403).
+            ServiceInvalidRequestException: If the request fails.
+        """
+
+        full_url = self.get_resource_url(url)
+        partial_file = destination.with_name(f'{destination.name}.part')
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            offset = partial_file.stat().st_size if partial_file.exists() else 0
+            request_headers = self.set_headers(headers)
+            if offset:
+                request_headers['Range'] = f'bytes={offset}-'
+            await self.rate_limiter.acquire()
+            released = False
+            try:
+                async with self.client.stream(
+                    'GET',
+                    full_url,
+                    headers=request_headers,
+                    timeout=timeout,
+                    auth=self.authentication,
+                    follow_redirects=True,
+                ) as response:
+                    # the slot is released once the headers are received; the body may take long to download
+                    self.rate_limiter.release(response)
+                    released = True
+                    if response.status_code == 416 and offset:
+                        # the partial file does not match the file on the server; start over
+                        partial_file.unlink(missing_ok=True)
+                        continue
+                    if response.is_error:
+                        await response.aread()
+                        self._raise_for_status(response, full_url)
+                    # a 200 response means the server ignored the range and sent the whole file
+                    mode = 'ab' if response.status_code == 206 else 'wb'
+                    with partial_file.open(mode) as downloaded_file:
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            await asyncio.to_thread(downloaded_file.write, chunk)
+            except httpx.TransportError as e:
+                # the partial file is kept so that the next attempt resumes the download
+                msg = f'{e.__class__.__name__}: {e}.'
+                self.logger.error(msg, extra={'url': full_url})
+                raise ServiceUnavailableException(msg, extra={'url': full_url}) from e
+            finally:
+                if not released:
+                    self.rate_limiter.release()
+            partial_file.replace(destination)
+            return destination
+
+    def _raise_for_status(self, response: httpx.Response, url: str) -> None:
+        """Raises the exception that corresponds to the status code of an error response.
 
+        Args:
+            response: the response of the server.
+            url: the URL requested.
+
+        Returns:
+            Nothing if the response is successful.
+
+        Raises:
+            ResourceNotFoundException: If the requested resource is not found (404).
+            AuthorizationException: If authentication fails (401).
+            PermissionException: If permission is denied (403).
+            ServiceInvalidRequestException: If the request fails for any other reason.
+        """
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -159,7 +312,7 @@ class JiraTUIAsyncHTTPClient:
             error_details: dict | None = self._parse_error_response(response)
 
             extra = {
-                'url': full_url,
+                'url': url,
                 'status_code': response.status_code,
             }
 
@@ -178,17 +331,84 @@ class JiraTUIAsyncHTTPClient:
                 raise PermissionException(message, extra=extra) from e
             raise ServiceInvalidRequestException(message, extra=extra) from e
 
-        if response.status_code == 204:
-            return self._empty_response(response)
+    async def _send_request(
+        self, method: Callable, url: str, headers: dict, timeout: int, **kwargs
+    ) -> httpx.Response:
+        """Sends a request to the server honouring the rate limits of the server.
 
-        try:
-            return self._parse_response(response)
-        except Exception as e:
-            if response.status_code == 201:
-                return self._empty_response(response)
-            log_msg = f'{e.__class__.__name__}: {e}.'
-            self.logger.error(log_msg, extra={'url': full_url, 'status_code': response.status_code})
-            raise ServiceInvalidResponseException(log_msg, extra={}) from e
+        Requests of idempotent methods that fail because the server is rate limiting the client, is temporarily
+        unavailable or can not be reached are sent again after a delay. The delay is taken from the `Retry-After` or
+        `X-RateLimit-Reset` headers of the response or calculated using exponential backoff with jitter.
+
+        Args:
+            method: the HTTP method to execute.
+            url: the URL to request.
+            headers: the HTTP headers.
+            timeout: the timeout (in seconds) of the request.
+            **kwargs: arguments passed directly to the callable method.
+
+        Returns:
+            The response of the last request sent.
+
+        Raises:
+            ServiceUnavailableException: If the service is unavailable or times out.
+        """
+
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            response: httpx.Response | None = None
+            error: Exception | None = None
+            try:
+                response = await method(
+                    self.client,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    auth=self.authentication,
+                    **kwargs,
+                )
+            except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
+                error = e
+            finally:
+                self.rate_limiter.release(response)
+
+            if response is not None and response.status_code in RATE_LIMITED_STATUS_CODES:
+                self.logger.warning(
+                    'The Jira server is rate limiting the requests',
+                    extra={
+                        'url': url,
+                        'status_code': response.status_code,
+                        'concurrency_limit': int(self.rate_limiter.concurrency_limit),
+                        **self.rate_limiter.statistics.as_dict(),
+                    },
+                )
+            # a read timeout may happen after the server processed the request, so it is never retried
+            delay = (
+                None
+                if isinstance(error, httpx.ReadTimeout)
+                else self.retry_policy.get_delay(method, attempt, response)
+            )
+            if delay is None:
+                if error is not None:
+                    msg = f'{error.__class__.__name__}: {error}.'
+                    self.logger.error(msg, extra={'url': url})
+                    raise ServiceUnavailableException(msg, extra={'url': url}) from error
+                return response  # type:ignore[return-value]
+            attempt += 1
+            self.rate_limiter.statistics.retries += 1
+            self.logger.warning(
+                'Retrying request',
+                extra={
+                    'url': url,
+                    'method': get_method_name(method),
+                    'status_code': response.status_code if response is not None else None,
+                    'error': str(error) if error is not None else None,
+                    'attempt': attempt,
+                    'delay': round(delay, 3),
+                },
+            )
+            await asyncio.sleep(delay)
 
     @staticmethod
     def _parse_error_response(response: httpx.Response) -> dict | None:
@@ -214,7 +434,6 @@ class JiraClient:
         api_token: str,
         configuration: ApplicationConfiguration,
     ):
-        ssl_certificate_settings: ssl.SSLContext | bool = _setup_ssl_certificates(configuration)
         self.base_url: str = base_url.rstrip('/')
         if configuration.use_bearer_authentication:
             self.authentication: httpx.Auth | httpx.BasicAuth | None = JiraTUIBearerAuth(
@@ -224,7 +443,13 @@ class JiraClient:
             self.authentication = None
         else:
             self.authentication = httpx.BasicAuth(api_username, api_token)
-        self.client: httpx.Client = httpx.Client(verify=ssl_certificate_settings, timeout=None)
+        # all the clients connecting to the same Jira server share the same pool of connections
+        self.connection_pool: ConnectionPool = acquire_connection_pool(self.base_url, configuration)
+        self._connection_pool_released = False
+        self.client: httpx.Client = self.connection_pool.sync_client
+        # the requests sent to the same Jira server share the same rate limits
+        self.rate_limiter: RateLimiter = self.connection_pool.rate_limiter
+        self.retry_policy = RetryPolicy.from_configuration(configuration.rate_limit)
         self.logger = logging.getLogger(LOGGER_NAME)
 
     @staticmethod
@@ -239,6 +464,13 @@ class JiraClient:
     def get_resource_url(self, resource: str) -> str:
         return f'{self.base_url}/{resource}'
 
+    async def close_client(self):
+        # the connections are closed when the last client using the pool releases it; closing the pool may require
+        # closing the async client that shares it, hence this is a coroutine
+        if not self._connection_pool_released:
+            self._connection_pool_released = True
+            await release_connection_pool(self.connection_pool)
+
     def make_request(
         self,
         method: Callable,
@@ -250,14 +482,50 @@ class JiraClient:
         headers = self.set_headers(headers)
         url = self.get_resource_url(url)
 
-        try:
-            response: httpx.Response = method(
-                url, headers=headers, timeout=timeout, auth=self.authentication, **kwargs
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire_blocking()
+            response: httpx.Response | None = None
+            error: Exception | None = None
+            try:
+                response = method(
+                    self.client,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    auth=self.authentication,
+                    **kwargs,
+                )
+            except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
+                error = e
+            if response is not None:
+                self.rate_limiter.observe(response)
+            # a read timeout may happen after the server processed the request, so it is never retried
+            delay = (
+                None
+                if isinstance(error, httpx.ReadTimeout)
+                else self.retry_policy.get_delay(method, attempt, response)
+            )
+            if delay is None:
+                break
+            attempt += 1
+            self.rate_limiter.statistics.retries += 1
+            self.logger.warning(
+                'Retrying request',
+                extra={
+                    'url': url,
+                    'method': get_method_name(method),
+                    'status_code': response.status_code if response is not None else None,
+                    'attempt': attempt,
+                    'delay': round(delay, 3),
+                },
             )
-        except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
-            msg = f'{e.__class__.__name__}: {e}.'
+            time.sleep(delay)
+
+        if error is not None or response is None:
+            msg = f'{error.__class__.__name__}: {error}.'
             self.logger.error(msg, extra={'url': url})
-            raise ServiceUnavailableException(msg, extra={'url': url}) from e
+            raise ServiceUnavailableException(msg, extra={'url': url}) from error
 
         try:
             response.raise_for_status()
@@ -333,3 +601,41 @@ class AsyncJiraClient(JiraTUIAsyncHTTPClient):
 
     def _parse_response(self, response: httpx.Response) -> Any:
         return response.json()
+
+    async def upload_file(
+        self,
+        url: str,
+        upload: MultipartFileUpload,
+        headers: dict | None = None,
+        timeout: int = 55,
+    ) -> Any | None:
+        """Uploads a file to the Jira REST API streaming it as `multipart/form-data`.
+
+        The file is read and sent in chunks, so it is never loaded into memory. Cancelling the task that awaits this
+        coroutine aborts the upload.
+
+        Args:
+            url: the (relative) URL to request.
+            upload: the body of the request.
+            headers: any HTTP headers.
+            timeout: an optional timeout (in seconds) of every read and write. Default is 55.
+
+        Returns:
+            The parsed JSON response from the API.
+        """
+        return await self.make_request(
+            method=httpx.AsyncClient.post,
+            url=url,
+            headers={
+                **(headers or {}),
+                'Content-Type': upload.content_type,
+                'Content-Length': str(upload.content_length),
+            },
+            timeout=timeout,
+            content=upload,
+        )
+
+    @staticmethod
+    def _create_response_cache(configuration: ApplicationConfiguration) -> ResponseCache | None:
+        # only the responses of the (JSON) resources that rarely change are cached
+        return ResponseCache.from_configuration(configuration.response_cache)
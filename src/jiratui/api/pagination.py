@@ -0,0 +1,129 @@
+"""Pagination of the offset-based endpoints of the Jira API.
+
+Many endpoints of the Jira API return the results in pages that are requested with an offset (`startAt`) and a limit
+(`maxResults`). Besides the items of the page the responses include some of `total`, `isLast` and `maxResults`.
+
+`OffsetPaginator` fetches the first page and, if the response includes the total number of items, fetches the
+remaining pages concurrently (with bounded parallelism). Otherwise, it falls back to fetching the pages one at a time
+until the server reports that the last page was retrieved.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+DEFAULT_MAXIMUM_CONCURRENT_PAGES = 5
+"""The default maximum number of pages requested concurrently."""
+
+
+class OffsetPaginator:
+    """Retrieves all the pages of results of an offset-based endpoint.
+
+    Example:
+
+    ```python
+    paginator = OffsetPaginator(
+        lambda offset, limit: api.get_users_in_group(group_id='1', offset=offset, limit=limit),
+        page_size=50,
+    )
+    async for user in paginator.items():
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[dict]],
+        page_size: int,
+        items_key: str = 'values',
+        max_pages: int | None = None,
+        max_concurrency: int = DEFAULT_MAXIMUM_CONCURRENT_PAGES,
+    ):
+        """Initializes the paginator.
+
+        Args:
+            fetch_page: a function that receives the offset and the limit of a page and returns the response of the
+            API.
+            page_size: the maximum number of items to request per page.
+            items_key: the key of the response that holds the items of the page, e.g. `values`, `worklogs`.
+            max_pages: the maximum number of pages to fetch. This ensures the pagination ends eventually.
+            max_concurrency: the maximum number of pages requested concurrently.
+        """
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.items_key = items_key
+        self.max_pages = max_pages
+        self.max_concurrency = max(max_concurrency, 1)
+        self.offset: int = 0
+        """The offset of the page that is being retrieved, e.g. the page that failed if an exception is raised."""
+
+    def _is_last_page(self, page: dict, pages_fetched: int) -> bool:
+        if self.max_pages is not None and pages_fetched >= self.max_pages:
+            return True
+        return page.get('isLast') is True or not page.get(self.items_key)
+
+    async def pages(self) -> AsyncIterator[dict]:
+        """Retrieves the pages of results in order.
+
+        Returns:
+            An async iterator of the responses of the API.
+
+        Raises:
+            Any exception raised while fetching a page. The pages retrieved before the failure are yielded first.
+        """
+
+        self.offset = 0
+        first_page: dict = await self.fetch_page(0, self.page_size)
+        yield first_page
+        if self._is_last_page(first_page, 1):
+            return
+
+        # the server may return fewer items per page than requested
+        step = int(first_page.get('maxResults') or self.page_size)
+        total = first_page.get('total')
+        if not isinstance(total, int):
+            # the total is unknown; fetch one page at a time until the last one
+            pages_fetched = 1
+            while True:
+                self.offset = pages_fetched * step
+                page = await self.fetch_page(self.offset, self.page_size)
+                pages_fetched += 1
+                yield page
+                if self._is_last_page(page, pages_fetched):
+                    return
+
+        offsets = list(range(step, total, step))
+        if self.max_pages is not None:
+            offsets = offsets[: self.max_pages - 1]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(offset: int) -> dict:
+            async with semaphore:
+                return await self.fetch_page(offset, self.page_size)
+
+        tasks = [asyncio.create_task(fetch(offset)) for offset in offsets]
+        try:
+            for offset, task in zip(offsets, tasks, strict=True):
+                self.offset = offset
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def items(self) -> AsyncIterator[Any]:
+        """Retrieves the items of every page in order.
+
+        Returns:
+            An async iterator of the items.
+        """
+        async for page in self.pages():
+            for item in page.get(self.items_key, []):
+                yield item
+
+    async def collect(self) -> list:
+        """Retrieves the items of every page.
+
+        Returns:
+            The list of items.
+        """
+        return [item async for item in self.items()]
@@ -0,0 +1,163 @@
+"""Pools of HTTP connections shared by the clients of the Jira REST APIs.
+
+The application talks to the same Jira server using several clients: an async JSON client for the Jira Platform API,
+an async HTTP client for downloading attachments, a sync client for uploading attachments and an async JSON client for
+the Jira Software Cloud API. Instead of every client keeping its own pool of connections, and paying for its own TCP
+and TLS handshakes, all the clients built for the same server share a single `ConnectionPool`.
+"""
+
+from dataclasses import dataclass, field
+import importlib.util
+import logging
+import ssl
+
+import httpx
+
+from jiratui.api.throttling import RateLimiter
+from jiratui.config import ApplicationConfiguration, ConnectionPoolConfiguration
+from jiratui.constants import LOGGER_NAME
+
+_CONNECTION_POOLS: dict[tuple, 'ConnectionPool'] = {}
+"""The connection pools currently in use, keyed by the origin of the Jira server and the settings of the pool."""
+
+
+@dataclass
+class ConnectionPool:
+    """A pool of HTTP connections to a Jira server.
+
+    The pool provides an async client and a sync client. Both clients use the same SSL settings and connection limits
+    but, due to how `httpx` works, the sync client keeps its own set of connections. The requests sent by the clients
+    sharing the pool are throttled by the pool's `RateLimiter`.
+    """
+
+    key: tuple
+    verify: ssl.SSLContext | bool
+    limits: httpx.Limits
+    rate_limiter: RateLimiter
+    http2: bool = False
+    references: int = 0
+    _async_client: httpx.AsyncClient | None = field(default=None, repr=False)
+    _sync_client: httpx.Client | None = field(default=None, repr=False)
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                verify=self.verify, limits=self.limits, http2=self.http2, timeout=None
+            )
+        return self._async_client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(
+                verify=self.verify, limits=self.limits, http2=self.http2, timeout=None
+            )
+        return self._sync_client
+
+    async def close(self) -> None:
+        """Closes all the connections of the pool."""
+        if self.rate_limiter.statistics.requests:
+            logging.getLogger(LOGGER_NAME).info(
+                'Rate limiter statistics', extra={**self.rate_limiter.statistics.as_dict()}
+            )
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+
+def _http2_supported() -> bool:
+    """Indicates whether the optional dependencies required to negotiate HTTP/2 are installed."""
+    return importlib.util.find_spec('h2') is not None
+
+
+def _build_pool_key(base_url: str, configuration: ApplicationConfiguration) -> tuple:
+    url = httpx.URL(base_url)
+    ssl_settings: tuple = ()
+    if ssl_configuration := configuration.ssl:
+        ssl_settings = (
+            ssl_configuration.verify_ssl,
+            ssl_configuration.ca_bundle,
+            ssl_configuration.certificate_file,
+            ssl_configuration.key_file,
+        )
+    pool_configuration: ConnectionPoolConfiguration = configuration.connection_pool
+    return (
+        url.scheme,
+        url.host,
+        url.port,
+        ssl_settings,
+        pool_configuration.max_connections,
+        pool_configuration.max_keepalive_connections,
+        pool_configuration.keepalive_expiry,
+        pool_configuration.http2,
+    )
+
+
+def acquire_connection_pool(
+    base_url: str, configuration: ApplicationConfiguration
+) -> ConnectionPool:
+    """Retrieves the connection pool for the Jira server identified by the given URL.
+
+    If no client is using a pool for the server yet then a new pool is created. Every call increases the number of
+    references to the pool; clients must call `release_connection_pool()` when they no longer need it.
+
+    Args:
+        base_url: the URL of the Jira server or any of its API endpoints. Only its origin is used to identify the pool.
+        configuration: the configuration of the application.
+
+    Returns:
+        An instance of `ConnectionPool`.
+    """
+
+    key = _build_pool_key(base_url, configuration)
+    if (pool := _CONNECTION_POOLS.get(key)) is None:
+        # avoid circular dependency
+        from jiratui.api.client import _setup_ssl_certificates
+
+        pool_configuration: ConnectionPoolConfiguration = configuration.connection_pool
+        http2 = pool_configuration.http2
+        if http2 and not _http2_supported():
+            logging.getLogger(LOGGER_NAME).warning(
+                'HTTP/2 is enabled but the required dependencies are not installed. Falling back to HTTP/1.1. '
+                'Install them with: pip install jiratui[http2]'
+            )
+            http2 = False
+        pool = ConnectionPool(
+            key=key,
+            verify=_setup_ssl_certificates(configuration),
+            limits=httpx.Limits(
+                max_connections=pool_configuration.max_connections,
+                max_keepalive_connections=pool_configuration.max_keepalive_connections,
+                keepalive_expiry=pool_configuration.keepalive_expiry,
+            ),
+            rate_limiter=RateLimiter.from_configuration(
+                configuration.rate_limit, cloud=configuration.cloud
+            ),
+            http2=http2,
+        )
+        _CONNECTION_POOLS[key] = pool
+    pool.references += 1
+    return pool
+
+
+async def release_connection_pool(pool: ConnectionPool) -> None:
+    """Releases a reference to a connection pool.
+
+    When the last reference is released the connections of the pool are closed and the pool is discarded.
+
+    Args:
+        pool: the pool to release.
+
+    Returns:
+        Nothing.
+    """
+
+    pool.references = max(pool.references - 1, 0)
+    if pool.references == 0:
+        if _CONNECTION_POOLS.get(pool.key) is pool:
+            del _CONNECTION_POOLS[pool.key]
+        await pool.close()
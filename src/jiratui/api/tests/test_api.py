@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 import json
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import httpx
@@ -8,7 +9,7 @@ import respx
 
 from jiratui.api.api import JiraAPI, JiraAPIv2, JiraDataCenterAPI
 from jiratui.api.utils import build_issue_search_jql
-from jiratui.exceptions import FileUploadException
+from jiratui.exceptions import FileUploadException, ResourceNotFoundException
 from jiratui.models import WorkItemsSearchOrderBy
 from jiratui.utils.test_utilities import get_url_pattern, load_json_response
 
@@ -3418,6 +3419,51 @@ def test_add_attachment_to_issue(detect_file_mime_type_mock: Mock, jira_api: Jir
         assert result == {}
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, '_detect_file_mime_type')
+@respx.mock
+async def test_upload_attachment_to_issue(
+    detect_file_mime_type_mock: Mock, tmp_path, jira_api: JiraAPI
+):
+    # GIVEN
+    detect_file_mime_type_mock.return_value = 'text/plain'
+    file_path = tmp_path / 'test-file.txt'
+    file_path.write_text(DATA)
+    route = respx.post(get_url_pattern('issue/key-1/attachments'))
+    route.mock(return_value=httpx.Response(200, json=[{'id': '1'}]))
+    progress: list[tuple[int, int]] = []
+    # WHEN
+    result = await jira_api.upload_attachment_to_issue(
+        'key-1',
+        str(file_path),
+        'test-file.txt',
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    # THEN
+    assert result == [{'id': '1'}]
+    request = route.calls.last.request
+    assert request.headers['X-Atlassian-Token'] == 'no-check'
+    assert request.headers['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert int(request.headers['Content-Length']) > len(DATA)
+    # the whole file was sent
+    assert progress[0] == (0, len(DATA))
+    assert progress[-1] == (len(DATA), len(DATA))
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, '_detect_file_mime_type')
+async def test_upload_attachment_to_issue_mime_detection_returns_empty_mime_type(
+    detect_file_mime_type_mock: Mock, tmp_path, jira_api: JiraAPI
+):
+    # GIVEN
+    file_path = tmp_path / 'test-file.txt'
+    file_path.write_text(DATA)
+    detect_file_mime_type_mock.return_value = None
+    # WHEN/THEN
+    with pytest.raises(FileUploadException):
+        await jira_api.upload_attachment_to_issue('key-1', str(file_path), 'test-file.txt')
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_delete_work_log(jira_api: JiraAPI):
@@ -3606,6 +3652,91 @@ async def test_get_attachment_content(jira_api: JiraAPI):
     assert route.calls.last.request.url.path == '/rest/api/3/attachment/content/1'
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_attachment_content(jira_api: JiraAPI, tmp_path: Path):
+    # GIVEN
+    route = respx.get(get_url_pattern('attachment/content/1'))
+    route.mock(return_value=httpx.Response(200, content=b'attachment contents'))
+    destination = tmp_path / 'attachments' / '1-19'
+    # WHEN
+    result = await jira_api.download_attachment_content('1', destination)
+    # THEN
+    assert route.calls.last.request.url.path == '/rest/api/3/attachment/content/1'
+    assert 'Range' not in route.calls.last.request.headers
+    assert result == destination
+    assert destination.read_bytes() == b'attachment contents'
+    assert not (tmp_path / 'attachments' / '1-19.part').exists()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_attachment_content_resumes_an_interrupted_download(
+    jira_api: JiraAPI, tmp_path: Path
+):
+    # GIVEN
+    route = respx.get(get_url_pattern('attachment/content/1'))
+    route.mock(return_value=httpx.Response(206, content=b' contents'))
+    destination = tmp_path / '1-19'
+    (tmp_path / '1-19.part').write_bytes(b'attachment')
+    # WHEN
+    await jira_api.download_attachment_content('1', destination)
+    # THEN
+    assert route.calls.last.request.headers['Range'] == 'bytes=10-'
+    assert destination.read_bytes() == b'attachment contents'
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_attachment_content_when_the_server_ignores_the_range(
+    jira_api: JiraAPI, tmp_path: Path
+):
+    # GIVEN
+    route = respx.get(get_url_pattern('attachment/content/1'))
+    route.mock(return_value=httpx.Response(200, content=b'attachment contents'))
+    destination = tmp_path / '1-19'
+    (tmp_path / '1-19.part').write_bytes(b'attachment')
+    # WHEN
+    await jira_api.download_attachment_content('1', destination)
+    # THEN
+    assert destination.read_bytes() == b'attachment contents'
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_attachment_content_fails(jira_api: JiraAPI, tmp_path: Path):
+    # GIVEN
+    route = respx.get(get_url_pattern('attachment/content/1'))
+    route.mock(return_value=httpx.Response(404, json={'errorMessages': ['Not found']}))
+    destination = tmp_path / '1-19'
+    # WHEN
+    with pytest.raises(ResourceNotFoundException):
+        await jira_api.download_attachment_content('1', destination)
+    # THEN
+    assert not destination.exists()
+
+
+@patch.object(JiraDataCenterAPI, 'get_attachment')
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_attachment_content_using_jira_dc(
+    get_attachment_mock: AsyncMock, jira_api_dc: JiraDataCenterAPI, tmp_path: Path
+):
+    # GIVEN
+    get_attachment_mock.return_value = {
+        'content': 'http://internal-jira/secure/attachment/1/filename.abc'
+    }
+    route = respx.get('https://foo.bar/secure/attachment/1/filename.abc')
+    route.mock(return_value=httpx.Response(200, content=b'attachment contents'))
+    destination = tmp_path / '1-19'
+    # WHEN
+    result = await jira_api_dc.download_attachment_content('1', destination)
+    # THEN
+    assert route.called
+    assert result == destination
+    assert destination.read_bytes() == b'attachment contents'
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_user_picker(jira_api: JiraAPI):
@@ -0,0 +1,167 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from jiratui.api.cache import ResponseCache
+from jiratui.api.client import AsyncJiraClient, JiraTUIAsyncHTTPClient
+from jiratui.config import ResponseCacheConfiguration
+from jiratui.utils.test_utilities import get_url_pattern
+
+
+@pytest.fixture
+def client(config_for_testing) -> AsyncJiraClient:
+    return AsyncJiraClient('http://foo.bar', 'bart', '12345', config_for_testing)
+
+
+def test_response_cache_from_configuration_merges_the_ttls():
+    # WHEN
+    cache = ResponseCache.from_configuration(
+        ResponseCacheConfiguration(max_size=100, ttls={'field': 10, 'status': 0, 'priority': 60})
+    )
+    # THEN
+    assert cache is not None
+    assert cache.max_size == 100
+    assert cache.get_ttl('field') == 10
+    assert cache.get_ttl('/priority') == 60
+    assert cache.get_ttl('status') is None
+    assert cache.get_ttl('issuetype') == 1800
+    assert cache.get_ttl('issue/WORK-1') is None
+
+
+def test_response_cache_from_configuration_disabled():
+    assert ResponseCache.from_configuration(ResponseCacheConfiguration(enabled=False)) is None
+
+
+def test_response_cache_evicts_the_least_recently_used_entries():
+    # GIVEN
+    cache = ResponseCache(max_size=10)
+    cache.store(('a', ()), httpx.Response(200, content=b'1234'), 60)
+    cache.store(('b', ()), httpx.Response(200, content=b'1234'), 60)
+    cache.get(('a', ()))
+    # WHEN
+    cache.store(('c', ()), httpx.Response(200, content=b'1234'), 60)
+    # THEN
+    assert cache.get(('b', ())) is None
+    assert cache.get(('a', ())) is not None
+    assert cache.get(('c', ())) is not None
+    assert cache.size == 8
+    assert cache.statistics.evictions == 1
+
+
+def test_response_cache_does_not_store_large_or_no_store_responses():
+    # GIVEN
+    cache = ResponseCache(max_size=10)
+    # WHEN
+    cache.store(('a', ()), httpx.Response(200, content=b'12345678901'), 60)
+    cache.store(
+        ('b', ()), httpx.Response(200, content=b'1', headers={'Cache-Control': 'no-store'}), 60
+    )
+    # THEN
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_response_cache_invalidate_removes_the_collection():
+    # GIVEN
+    cache = ResponseCache(max_size=100)
+    cache.store(('issueLinkType', ()), httpx.Response(200, content=b'[]'), 60)
+    cache.store(('field', ()), httpx.Response(200, content=b'[]'), 60)
+    # WHEN
+    cache.invalidate('issueLinkType/1000')
+    # THEN
+    assert cache.get(('issueLinkType', ())) is None
+    assert cache.get(('field', ())) is not None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_serves_fresh_responses_from_the_cache(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('field'))
+    route.mock(return_value=httpx.Response(200, json=[{'id': 'summary'}]))
+    # WHEN
+    first = await client.make_request(httpx.AsyncClient.get, 'field')
+    second = await client.make_request(httpx.AsyncClient.get, 'field')
+    # THEN
+    assert first == second == [{'id': 'summary'}]
+    assert route.call_count == 1
+    assert client.response_cache.statistics.misses == 1
+    assert client.response_cache.statistics.hits == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_does_not_cache_other_resources(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('issue/WORK-1'))
+    route.mock(return_value=httpx.Response(200, json={'key': 'WORK-1'}))
+    # WHEN
+    await client.make_request(httpx.AsyncClient.get, 'issue/WORK-1')
+    await client.make_request(httpx.AsyncClient.get, 'issue/WORK-1')
+    # THEN
+    assert route.call_count == 2
+    assert len(client.response_cache) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_revalidates_expired_responses(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('field'))
+    route.side_effect = [
+        httpx.Response(200, json=[{'id': 'summary'}], headers={'ETag': '"v1"'}),
+        httpx.Response(304, headers={'ETag': '"v1"'}),
+    ]
+    await client.make_request(httpx.AsyncClient.get, 'field')
+    # WHEN
+    with patch('jiratui.api.cache.time.monotonic', return_value=10**9):
+        result = await client.make_request(httpx.AsyncClient.get, 'field')
+    # THEN
+    assert result == [{'id': 'summary'}]
+    assert route.call_count == 2
+    assert route.calls.last.request.headers['If-None-Match'] == '"v1"'
+    assert client.response_cache.statistics.revalidations == 1
+    assert client.response_cache.statistics.misses == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_downloads_expired_responses_that_changed(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('status'))
+    route.side_effect = [
+        httpx.Response(
+            200, json=[{'id': '1'}], headers={'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        ),
+        httpx.Response(200, json=[{'id': '2'}]),
+    ]
+    await client.make_request(httpx.AsyncClient.get, 'status')
+    # WHEN
+    with patch('jiratui.api.cache.time.monotonic', return_value=10**9):
+        result = await client.make_request(httpx.AsyncClient.get, 'status')
+    # THEN
+    assert result == [{'id': '2'}]
+    assert route.calls.last.request.headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert client.response_cache.statistics.misses == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_invalidates_the_cache_on_writes(client):
+    # GIVEN
+    get_route = respx.get(get_url_pattern('issueLinkType'))
+    get_route.mock(return_value=httpx.Response(200, json={'issueLinkTypes': []}))
+    respx.delete(get_url_pattern('issueLinkType/1000')).mock(return_value=httpx.Response(204))
+    await client.make_request(httpx.AsyncClient.get, 'issueLinkType')
+    # WHEN
+    await client.make_request(httpx.AsyncClient.delete, 'issueLinkType/1000')
+    await client.make_request(httpx.AsyncClient.get, 'issueLinkType')
+    # THEN
+    assert get_route.call_count == 2
+
+
+def test_http_client_does_not_cache_responses(config_for_testing):
+    client = JiraTUIAsyncHTTPClient('http://foo.bar', 'bart', '12345', config_for_testing)
+    assert client.response_cache is None
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from jiratui.api.pagination import OffsetPaginator
+
+
+def build_page_fetcher(total: int | None, calls: list, fail_at: int | None = None):
+    async def fetch_page(offset: int, limit: int) -> dict:
+        calls.append((offset, limit))
+        await asyncio.sleep(0)
+        if offset == fail_at:
+            raise ValueError('some error')
+        stop = min(offset + limit, total or 25)
+        page: dict = {
+            'values': list(range(offset, stop)),
+            'startAt': offset,
+            'maxResults': limit,
+            'isLast': stop >= (total or 25),
+        }
+        if total is not None:
+            page['total'] = total
+        return page
+
+    return fetch_page
+
+
+@pytest.mark.asyncio
+async def test_offset_paginator_fetches_the_remaining_pages_concurrently():
+    # GIVEN
+    calls: list = []
+    in_flight = 0
+    max_in_flight = 0
+    fetcher = build_page_fetcher(total=95, calls=calls)
+
+    async def fetch_page(offset: int, limit: int) -> dict:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            return await fetcher(offset, limit)
+        finally:
+            in_flight -= 1
+
+    paginator = OffsetPaginator(fetch_page, page_size=10, max_concurrency=3)
+    # WHEN
+    items = await paginator.collect()
+    # THEN
+    assert items == list(range(95))
+    assert sorted(calls) == [(offset, 10) for offset in range(0, 95, 10)]
+    assert 1 < max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_offset_paginator_without_total_fetches_the_pages_sequentially():
+    # GIVEN
+    calls: list = []
+    paginator = OffsetPaginator(build_page_fetcher(total=None, calls=calls), page_size=10)
+    # WHEN
+    items = await paginator.collect()
+    # THEN
+    assert items == list(range(25))
+    assert calls == [(0, 10), (10, 10), (20, 10)]
+
+
+@pytest.mark.asyncio
+async def test_offset_paginator_uses_the_page_size_of_the_server():
+    # GIVEN
+    calls: list = []
+    fetcher = build_page_fetcher(total=30, calls=calls)
+
+    async def fetch_page(offset: int, limit: int) -> dict:
+        # the server caps the page size
+        return await fetcher(offset, 15)
+
+    paginator = OffsetPaginator(fetch_page, page_size=50)
+    # WHEN
+    items = await paginator.collect()
+    # THEN
+    assert items == list(range(30))
+    assert sorted(calls) == [(0, 15), (15, 15)]
+
+
+@pytest.mark.asyncio
+async def test_offset_paginator_limits_the_number_of_pages():
+    # GIVEN
+    calls: list = []
+    paginator = OffsetPaginator(
+        build_page_fetcher(total=100, calls=calls), page_size=10, max_pages=3
+    )
+    # WHEN
+    items = await paginator.collect()
+    # THEN
+    assert items == list(range(30))
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_offset_paginator_yields_the_pages_before_a_failure():
+    # GIVEN
+    calls: list = []
+    paginator = OffsetPaginator(build_page_fetcher(total=50, calls=calls, fail_at=20), page_size=10)
+    items: list = []
+    # WHEN
+    with pytest.raises(ValueError):
+        async for item in paginator.items():
+            items.append(item)
+    # THEN
+    assert items == list(range(20))
+    assert paginator.offset == 20
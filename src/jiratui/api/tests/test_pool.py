@@ -0,0 +1,114 @@
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from jiratui.api.api import JiraAPI, JiraSoftwareCloudAPI
+from jiratui.api.client import AsyncJiraClient
+from jiratui.api.pool import _CONNECTION_POOLS, acquire_connection_pool, release_connection_pool
+from jiratui.config import ApplicationConfiguration, ConnectionPoolConfiguration
+
+
+@pytest.fixture(autouse=True)
+def clear_connection_pools():
+    _CONNECTION_POOLS.clear()
+    yield
+    _CONNECTION_POOLS.clear()
+
+
+def test_clients_for_the_same_server_share_the_connection_pool(config_for_testing):
+    # WHEN
+    api = JiraAPI('https://foo.bar', 'foo', 'bar', config_for_testing)
+    software_api = JiraSoftwareCloudAPI('https://foo.bar', 'foo', 'bar', config_for_testing)
+    # THEN
+    assert len(_CONNECTION_POOLS) == 1
+    pool = api.client.connection_pool
+    assert api.async_http_client.connection_pool is pool
+    assert api.sync_client.connection_pool is pool
+    assert software_api.client.connection_pool is pool
+    assert api.client.client is api.async_http_client.client
+    assert api.client.client is software_api.client.client
+    assert api.sync_client.client is pool.sync_client
+    assert pool.references == 4
+
+
+def test_clients_for_different_servers_do_not_share_the_connection_pool(config_for_testing):
+    # WHEN
+    client_a = AsyncJiraClient('https://foo.bar/rest/api/3/', 'foo', 'bar', config_for_testing)
+    client_b = AsyncJiraClient('https://bar.foo/rest/api/3/', 'foo', 'bar', config_for_testing)
+    # THEN
+    assert client_a.connection_pool is not client_b.connection_pool
+    assert client_a.client is not client_b.client
+
+
+def test_connection_pool_uses_the_configured_limits(config_for_testing):
+    # GIVEN
+    config_for_testing.connection_pool = ConnectionPoolConfiguration(
+        max_connections=5, max_keepalive_connections=2, keepalive_expiry=10
+    )
+    # WHEN
+    pool = acquire_connection_pool('https://foo.bar', config_for_testing)
+    # THEN
+    assert pool.limits == httpx.Limits(
+        max_connections=5, max_keepalive_connections=2, keepalive_expiry=10
+    )
+
+
+@patch('jiratui.api.pool._http2_supported')
+def test_connection_pool_falls_back_to_http1_without_http2_support(
+    http2_supported_mock: Mock, config_for_testing
+):
+    # GIVEN
+    http2_supported_mock.return_value = False
+    config_for_testing.connection_pool = ConnectionPoolConfiguration(http2=True)
+    # WHEN
+    pool = acquire_connection_pool('https://foo.bar', config_for_testing)
+    # THEN
+    assert pool.http2 is False
+
+
+@pytest.mark.asyncio
+async def test_release_connection_pool_closes_the_pool_after_the_last_reference(
+    config_for_testing: ApplicationConfiguration,
+):
+    # GIVEN
+    api = JiraAPI('https://foo.bar', 'foo', 'bar', config_for_testing)
+    pool = api.client.connection_pool
+    async_client = pool.async_client
+    # WHEN
+    await api.client.close_async_client()
+    await api.async_http_client.close_async_client()
+    # THEN
+    assert pool.references == 1
+    assert not async_client.is_closed
+    # WHEN
+    await api.sync_client.close_client()
+    # THEN
+    assert pool.references == 0
+    assert async_client.is_closed
+    assert _CONNECTION_POOLS == {}
+
+
+@pytest.mark.asyncio
+async def test_close_async_client_releases_the_pool_only_once(config_for_testing):
+    # GIVEN
+    client_a = AsyncJiraClient('https://foo.bar/rest/api/3/', 'foo', 'bar', config_for_testing)
+    AsyncJiraClient('https://foo.bar/rest/agile/1.0/', 'foo', 'bar', config_for_testing)
+    # WHEN
+    await client_a.close_async_client()
+    await client_a.close_async_client()
+    # THEN
+    assert client_a.connection_pool.references == 1
+    assert not client_a.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_release_connection_pool_creates_a_new_pool_after_closing(config_for_testing):
+    # GIVEN
+    pool = acquire_connection_pool('https://foo.bar', config_for_testing)
+    await release_connection_pool(pool)
+    # WHEN
+    new_pool = acquire_connection_pool('https://foo.bar', config_for_testing)
+    # THEN
+    assert new_pool is not pool
+    assert new_pool.references == 1
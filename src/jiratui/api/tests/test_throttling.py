@@ -0,0 +1,267 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import respx
+
+from jiratui.api.client import AsyncJiraClient, JiraClient
+from jiratui.api.throttling import (
+    RateLimiter,
+    RetryPolicy,
+    is_near_rate_limit,
+    parse_retry_after,
+)
+from jiratui.config import RateLimitConfiguration
+from jiratui.exceptions import ServiceInvalidRequestException, ServiceUnavailableException
+from jiratui.utils.test_utilities import get_url_pattern
+
+
+@pytest.fixture
+def client(config_for_testing) -> AsyncJiraClient:
+    return AsyncJiraClient('http://throttled.bar', 'bart', '12345', config_for_testing)
+
+
+def test_parse_retry_after_in_seconds():
+    assert parse_retry_after(httpx.Headers({'Retry-After': '5'})) == 5.0
+    assert parse_retry_after(httpx.Headers({'Retry-After': '-1'})) == 0.0
+    assert parse_retry_after(httpx.Headers({})) is None
+    assert parse_retry_after(httpx.Headers({'Retry-After': 'soon'})) is None
+
+
+def test_parse_retry_after_as_a_date():
+    retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=60)
+    delay = parse_retry_after(
+        httpx.Headers({'Retry-After': format_datetime(retry_at, usegmt=True)})
+    )
+    assert 55 < delay <= 60
+
+
+def test_parse_retry_after_uses_the_rate_limit_reset():
+    reset = (datetime.now(tz=timezone.utc) + timedelta(seconds=30)).isoformat()
+    headers = httpx.Headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset})
+    assert 25 < parse_retry_after(headers) <= 30
+    headers = httpx.Headers({'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': reset})
+    assert parse_retry_after(headers) is None
+
+
+def test_is_near_rate_limit():
+    assert is_near_rate_limit(httpx.Headers({'X-RateLimit-NearLimit': 'true'}))
+    assert is_near_rate_limit(
+        httpx.Headers({'X-RateLimit-Remaining': '5', 'X-RateLimit-Limit': '100'})
+    )
+    assert not is_near_rate_limit(
+        httpx.Headers({'X-RateLimit-Remaining': '50', 'X-RateLimit-Limit': '100'})
+    )
+    assert not is_near_rate_limit(httpx.Headers({}))
+
+
+def test_retry_policy_only_retries_idempotent_methods():
+    # GIVEN
+    policy = RetryPolicy(max_retries=2, backoff_factor=1, max_backoff=10)
+    response = httpx.Response(503)
+    # THEN
+    assert 0 <= policy.get_delay(httpx.AsyncClient.get, 0, response) <= 1
+    assert 0 <= policy.get_delay(httpx.AsyncClient.put, 1, response) <= 2
+    assert policy.get_delay(httpx.AsyncClient.get, 2, response) is None
+    assert policy.get_delay(httpx.AsyncClient.post, 0, response) is None
+    assert policy.get_delay(httpx.AsyncClient.get, 0, httpx.Response(500)) is None
+    assert policy.get_delay(httpx.AsyncClient.get, 0, None) is not None
+
+
+def test_retry_policy_honours_retry_after():
+    # GIVEN
+    policy = RetryPolicy(max_backoff=10)
+    # THEN
+    assert (
+        policy.get_delay(httpx.Client.get, 0, httpx.Response(429, headers={'Retry-After': '7'}))
+        == 7
+    )
+    assert (
+        policy.get_delay(httpx.Client.get, 0, httpx.Response(429, headers={'Retry-After': '60'}))
+        is None
+    )
+
+
+def test_rate_limiter_adapts_the_concurrency_limit():
+    # GIVEN
+    limiter = RateLimiter(requests_per_second=None, burst=10, max_concurrency=8, min_concurrency=2)
+    # WHEN
+    limiter.release(httpx.Response(429))
+    # THEN
+    assert limiter.concurrency_limit == 4
+    assert limiter.statistics.rate_limited == 1
+    # WHEN
+    limiter.release(httpx.Response(429))
+    limiter.release(httpx.Response(503))
+    # THEN
+    assert limiter.concurrency_limit == 2
+    # WHEN
+    for _ in range(4):
+        limiter.release(httpx.Response(200))
+    # THEN
+    assert 3 <= limiter.concurrency_limit < 4
+    # WHEN
+    limiter.release(httpx.Response(200, headers={'X-RateLimit-NearLimit': 'true'}))
+    # THEN
+    assert limiter.concurrency_limit < 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limits_the_concurrency():
+    # GIVEN
+    limiter = RateLimiter(requests_per_second=None, burst=10, max_concurrency=2)
+    await limiter.acquire()
+    await limiter.acquire()
+    # WHEN
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    # THEN
+    assert not waiting.done()
+    # WHEN
+    limiter.release(httpx.Response(200))
+    await asyncio.wait_for(waiting, 1)
+    # THEN
+    assert limiter.in_flight == 2
+    assert limiter.statistics.requests == 3
+    assert limiter.statistics.throttled == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_tokens():
+    # GIVEN
+    limiter = RateLimiter(requests_per_second=100, burst=1, max_concurrency=10)
+    # the time only passes while the limiter sleeps, so the test does not depend on the speed of the machine
+    now = [0.0]
+
+    async def sleep(delay: float) -> None:
+        now[0] += delay
+
+    with (
+        patch('jiratui.api.throttling.time') as time_mock,
+        patch('jiratui.api.throttling.asyncio.sleep', AsyncMock(side_effect=sleep)) as sleep_mock,
+    ):
+        time_mock.monotonic.side_effect = lambda: now[0]
+        await limiter.acquire()
+        # WHEN
+        await limiter.acquire()
+    # THEN
+    sleep_mock.assert_awaited_once_with(pytest.approx(0.01))
+    assert limiter.statistics.throttled == 1
+
+
+@pytest.mark.parametrize(
+    'enabled, cloud, expected_enabled',
+    [(None, True, True), (None, False, False), (True, False, True), (False, True, False)],
+)
+def test_rate_limiter_from_configuration(enabled, cloud, expected_enabled):
+    # WHEN
+    limiter = RateLimiter.from_configuration(RateLimitConfiguration(enabled=enabled), cloud=cloud)
+    # THEN
+    assert limiter.enabled is expected_enabled
+
+
+@pytest.mark.asyncio
+async def test_disabled_rate_limiter_does_not_limit_the_requests():
+    # GIVEN
+    limiter = RateLimiter(requests_per_second=1, burst=1, max_concurrency=1, enabled=False)
+    # WHEN
+    for _ in range(5):
+        await asyncio.wait_for(limiter.acquire(), 1)
+    limiter.release(httpx.Response(429, headers={'Retry-After': '60'}))
+    # THEN
+    assert limiter.statistics.requests == 5
+    assert limiter.statistics.rate_limited == 0
+    assert limiter.concurrency_limit == 1
+
+
+def test_rate_limiter_blocks_the_sync_requests_while_paused():
+    # GIVEN
+    limiter = RateLimiter(requests_per_second=None, burst=10, max_concurrency=10)
+    limiter.observe(httpx.Response(429, headers={'Retry-After': '5'}))
+    # WHEN
+    with patch('jiratui.api.throttling.time.sleep') as sleep_mock:
+        # the pause ends while the thread sleeps
+        sleep_mock.side_effect = lambda _: setattr(limiter, '_paused_until', 0.0)
+        limiter.acquire_blocking()
+    # THEN
+    assert 4 < sleep_mock.call_args_list[0].args[0] <= 5
+    assert limiter.statistics.requests == 1
+    assert limiter.statistics.throttled == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_retries_rate_limited_requests(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('myself'))
+    route.side_effect = [
+        httpx.Response(429, headers={'Retry-After': '0'}),
+        httpx.Response(200, json={'accountId': '1'}),
+    ]
+    # WHEN
+    result = await client.make_request(httpx.AsyncClient.get, 'myself')
+    # THEN
+    assert result == {'accountId': '1'}
+    assert route.call_count == 2
+    assert client.rate_limiter.statistics.retries >= 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_does_not_retry_non_idempotent_requests(client):
+    # GIVEN
+    route = respx.post(get_url_pattern('issue'))
+    route.mock(return_value=httpx.Response(429, headers={'Retry-After': '0'}))
+    # WHEN
+    with pytest.raises(ServiceInvalidRequestException):
+        await client.make_request(httpx.AsyncClient.post, 'issue', json={})
+    # THEN
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_gives_up_after_the_maximum_number_of_retries(client):
+    # GIVEN
+    route = respx.get(get_url_pattern('serverInfo'))
+    route.side_effect = httpx.ConnectError('unreachable')
+    # WHEN
+    with patch('jiratui.api.client.asyncio.sleep', AsyncMock()) as sleep_mock:
+        with pytest.raises(ServiceUnavailableException):
+            await client.make_request(httpx.AsyncClient.get, 'serverInfo')
+    # THEN
+    assert route.call_count == client.retry_policy.max_retries + 1
+    assert sleep_mock.await_count == client.retry_policy.max_retries
+
+
+@respx.mock
+def test_sync_client_retries_unavailable_servers(config_for_testing):
+    # GIVEN
+    client = JiraClient('http://throttled.bar', 'bart', '12345', config_for_testing)
+    route = respx.get(get_url_pattern('myself'))
+    route.side_effect = [httpx.Response(503), httpx.Response(200, json={'accountId': '1'})]
+    # WHEN
+    with patch('jiratui.api.client.time.sleep') as sleep_mock:
+        result = client.make_request(httpx.Client.get, 'myself')
+    # THEN
+    assert result == {'accountId': '1'}
+    assert sleep_mock.call_count == 1
+
+
+@respx.mock
+def test_sync_client_shares_the_rate_limiter_of_the_server(config_for_testing):
+    # GIVEN
+    client = JiraClient('http://throttled.bar', 'bart', '12345', config_for_testing)
+    respx.get(get_url_pattern('myself')).mock(
+        return_value=httpx.Response(200, json={'accountId': '1'})
+    )
+    requests = client.rate_limiter.statistics.requests
+    # WHEN
+    client.make_request(httpx.Client.get, 'myself')
+    # THEN
+    assert client.rate_limiter is client.connection_pool.rate_limiter
+    assert client.rate_limiter.statistics.requests == requests + 1
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from jiratui.api.uploads import MultipartFileUpload
+
+
+@pytest.mark.asyncio
+async def test_multipart_file_upload(tmp_path: Path):
+    # GIVEN
+    file_path = tmp_path / 'build.log'
+    file_path.write_bytes(b'0123456789' * 10)
+    progress: list[tuple[int, int]] = []
+    upload = MultipartFileUpload(
+        file_path,
+        'build "1".log',
+        mime_type='text/plain',
+        chunk_size=40,
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    # WHEN
+    chunks = [chunk async for chunk in upload]
+    # THEN
+    body = b''.join(chunks)
+    assert upload.content_type == f'multipart/form-data; boundary={upload.boundary}'
+    assert upload.content_length == len(body)
+    assert (
+        body
+        == (
+            f'--{upload.boundary}\r\n'
+            'Content-Disposition: form-data; name="file"; filename="build \\"1\\".log"\r\n'
+            'Content-Type: text/plain\r\n\r\n'
+            f'{"0123456789" * 10}\r\n'
+            f'--{upload.boundary}--\r\n'
+        ).encode()
+    )
+    # the file is sent in chunks
+    assert len(chunks) == 5
+    assert progress == [(0, 100), (40, 100), (80, 100), (100, 100)]
+
+
+@pytest.mark.asyncio
+async def test_multipart_file_upload_without_mime_type(tmp_path: Path):
+    # GIVEN
+    file_path = tmp_path / 'empty.bin'
+    file_path.write_bytes(b'')
+    upload = MultipartFileUpload(file_path, 'empty.bin')
+    # WHEN
+    body = b''.join([chunk async for chunk in upload])
+    # THEN
+    assert b'Content-Type: application/octet-stream\r\n\r\n\r\n' in body
+    assert upload.content_length == len(body)
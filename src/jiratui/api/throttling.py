@@ -0,0 +1,332 @@
+"""Rate limiting and retrying of the requests sent to a Jira server.
+
+Jira Cloud enforces rate limits; when a client exceeds them the server responds with `429 Too Many Requests` (or
+`503 Service Unavailable`) and the headers `Retry-After` and `X-RateLimit-*` describe when the client may try again.
+See https://developer.atlassian.com/cloud/jira/platform/rate-limiting/.
+
+Every connection pool, i.e. every Jira server, has a `RateLimiter` that combines:
+
+- a token bucket that limits the number of requests sent per second, and
+- an adaptive concurrency limit (AIMD) that shrinks when the server signals that the client is being rate limited and
+grows back slowly while the requests succeed.
+
+Unless configured otherwise the limits only apply to Jira Cloud; Jira Data Center does not enforce rate limits by
+default. `RetryPolicy` decides whether and when a failed request is sent again. Only idempotent methods are retried.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+
+import httpx
+
+from jiratui.config import RateLimitConfiguration
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+"""The HTTP methods that can be safely retried."""
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+"""The status codes of the responses of requests that may succeed if they are sent again."""
+RATE_LIMITED_STATUS_CODES = frozenset({429, 503})
+"""The status codes the server uses to signal that the client exceeded the rate limits."""
+
+
+def get_method_name(method) -> str:
+    """Retrieves the name of the HTTP method of a client's method, e.g. `httpx.AsyncClient.get` -> `GET`."""
+    return getattr(method, '__name__', '').upper()
+
+
+def is_idempotent(method) -> bool:
+    return get_method_name(method) in IDEMPOTENT_METHODS
+
+
+def parse_retry_after(headers: httpx.Headers) -> float | None:
+    """Extracts the number of seconds to wait before sending a request again from the headers of a response.
+
+    It supports the `Retry-After` header (in seconds or as an HTTP date) and, when the server reports that no requests
+    remain, the `X-RateLimit-Reset` header (an ISO 8601 timestamp).
+
+    Args:
+        headers: the headers of the response.
+
+    Returns:
+        The number of seconds to wait or `None` if the headers do not specify it.
+    """
+
+    if retry_after := headers.get('Retry-After'):
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            return max((retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+    if headers.get('X-RateLimit-Remaining') == '0' and (reset := headers.get('X-RateLimit-Reset')):
+        try:
+            reset_at = datetime.fromisoformat(reset.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max((reset_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+    return None
+
+
+def is_near_rate_limit(headers: httpx.Headers) -> bool:
+    """Indicates whether the server reports that the client is about to exceed the rate limits."""
+    if headers.get('X-RateLimit-NearLimit', '').lower() == 'true':
+        return True
+    try:
+        remaining = int(headers['X-RateLimit-Remaining'])
+        limit = int(headers['X-RateLimit-Limit'])
+    except (KeyError, ValueError):
+        return False
+    return limit > 0 and remaining / limit < 0.1
+
+
+@dataclass
+class RateLimiterStatistics:
+    requests: int = 0
+    """The number of requests sent."""
+    throttled: int = 0
+    """The number of requests that had to wait for a token or for a concurrency slot."""
+    rate_limited: int = 0
+    """The number of responses that signaled that the client exceeded the rate limits."""
+    retries: int = 0
+    """The number of requests sent again after a failure."""
+
+    def as_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'rate_limited': self.rate_limited,
+            'retries': self.retries,
+        }
+
+
+@dataclass
+class RateLimiter:
+    """Limits the rate and the concurrency of the requests sent to a Jira server."""
+
+    requests_per_second: float | None
+    """The number of tokens added to the bucket every second. If `None` the rate is not limited."""
+    burst: int
+    """The capacity of the bucket, i.e. the number of requests that can be sent at once after a quiet period."""
+    max_concurrency: int
+    """The maximum number of requests in flight."""
+    min_concurrency: int = 1
+    """The minimum number of requests in flight the adaptive limit can shrink to."""
+    enabled: bool = True
+    """If `False` the requests are never delayed; only the statistics are collected."""
+    statistics: RateLimiterStatistics = field(default_factory=RateLimiterStatistics)
+    concurrency_limit: float = field(init=False)
+    in_flight: int = field(default=0, init=False)
+    _tokens: float = field(init=False, repr=False)
+    _last_refill: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _paused_until: float = field(default=0.0, init=False, repr=False)
+    _waiters: deque[asyncio.Future] = field(default_factory=deque, init=False, repr=False)
+    # the sync client sends its requests from worker threads
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.min_concurrency = max(1, min(self.min_concurrency, self.max_concurrency))
+        self.concurrency_limit = float(self.max_concurrency)
+        self._tokens = float(self.burst)
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: RateLimitConfiguration, cloud: bool
+    ) -> 'RateLimiter':
+        """Builds the rate limiter of a Jira server.
+
+        Args:
+            configuration: the settings of the rate limits.
+            cloud: whether the server is a Jira Cloud server. If `configuration.enabled` is not set the limits only
+            apply to Jira Cloud.
+
+        Returns:
+            An instance of `RateLimiter`.
+        """
+        return cls(
+            requests_per_second=configuration.requests_per_second,
+            burst=max(configuration.burst, 1),
+            max_concurrency=max(configuration.max_concurrency, 1),
+            min_concurrency=configuration.min_concurrency,
+            enabled=cloud if configuration.enabled is None else configuration.enabled,
+        )
+
+    def _refill(self, now: float) -> None:
+        if self.requests_per_second:
+            elapsed = max(now - self._last_refill, 0.0)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+        else:
+            self._tokens = float(self.burst)
+        self._last_refill = now
+
+    def _get_delay(self, now: float) -> float:
+        """Calculates the number of seconds to wait for a token or for the end of a pause requested by the server."""
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens < 1:
+            return (1 - self._tokens) / (self.requests_per_second or 1)
+        return 0.0
+
+    def _take_token(self, throttled: bool) -> None:
+        self._tokens -= 1
+        self.statistics.requests += 1
+        if throttled:
+            self.statistics.throttled += 1
+
+    async def acquire(self) -> None:
+        """Waits until a request can be sent to the server."""
+        if not self.enabled:
+            self.statistics.requests += 1
+            return
+        throttled = False
+        while True:
+            with self._lock:
+                delay = self._get_delay(time.monotonic())
+                if delay <= 0 and self.in_flight < int(self.concurrency_limit):
+                    self._take_token(throttled)
+                    self.in_flight += 1
+                    return
+            throttled = True
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def acquire_blocking(self) -> None:
+        """Blocks the calling thread until a request can be sent to the server.
+
+        This is used by the sync client. Its requests take tokens from the bucket and wait for the pauses requested by
+        the server but, they do not take a slot of the concurrency limit.
+        """
+        if not self.enabled:
+            self.statistics.requests += 1
+            return
+        throttled = False
+        while True:
+            with self._lock:
+                delay = self._get_delay(time.monotonic())
+                if delay <= 0:
+                    self._take_token(throttled)
+                    return
+            throttled = True
+            time.sleep(delay)
+
+    def release(self, response: httpx.Response | None = None) -> None:
+        """Releases the concurrency slot of a request and adapts the limits based on its response.
+
+        Args:
+            response: the response of the request, if any.
+
+        Returns:
+            Nothing.
+        """
+
+        self.in_flight = max(self.in_flight - 1, 0)
+        if response is not None:
+            self.observe(response)
+        self._wake_waiters()
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapts the limits based on the response of a request.
+
+        Args:
+            response: the response of the request.
+
+        Returns:
+            Nothing.
+        """
+
+        if not self.enabled:
+            return
+        with self._lock:
+            if response.status_code in RATE_LIMITED_STATUS_CODES:
+                self.statistics.rate_limited += 1
+                self.concurrency_limit = max(
+                    float(self.min_concurrency), self.concurrency_limit / 2
+                )
+                if (delay := parse_retry_after(response.headers)) is not None:
+                    self.pause(delay)
+            elif is_near_rate_limit(response.headers):
+                self.concurrency_limit = max(
+                    float(self.min_concurrency), self.concurrency_limit * 0.75
+                )
+            elif response.is_success:
+                # grows by ~1 every time a full window of requests succeeds
+                self.concurrency_limit = min(
+                    float(self.max_concurrency),
+                    self.concurrency_limit + 1 / self.concurrency_limit,
+                )
+
+    def pause(self, seconds: float) -> None:
+        """Stops sending requests for a number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wake_waiters(self) -> None:
+        available = int(self.concurrency_limit) - self.in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+
+@dataclass
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again."""
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    """The base (in seconds) of the exponential backoff."""
+    max_backoff: float = 30.0
+    """The maximum number of seconds to wait before sending a request again. If the server asks the client to wait
+    longer the request is not retried."""
+
+    @classmethod
+    def from_configuration(cls, configuration: RateLimitConfiguration) -> 'RetryPolicy':
+        return cls(
+            max_retries=max(configuration.max_retries, 0),
+            backoff_factor=configuration.backoff_factor,
+            max_backoff=configuration.max_backoff,
+        )
+
+    def get_delay(
+        self, method, attempt: int, response: httpx.Response | None = None
+    ) -> float | None:
+        """Calculates the number of seconds to wait before sending a failed request again.
+
+        Args:
+            method: the method of the client used to send the request, e.g. `httpx.AsyncClient.get`.
+            attempt: the number of retries sent so far.
+            response: the response of the request or `None` if the request failed to connect to the server.
+
+        Returns:
+            The number of seconds to wait or `None` if the request must not be retried.
+        """
+
+        if attempt >= self.max_retries or not is_idempotent(method):
+            return None
+        if response is not None:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return None
+            if (delay := parse_retry_after(response.headers)) is not None:
+                return delay if delay <= self.max_backoff else None
+        # exponential backoff with "full jitter"
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
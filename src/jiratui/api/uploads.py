@@ -0,0 +1,87 @@
+"""Streamed uploads of files to the Jira REST API.
+
+`MultipartFileUpload` is the body of a `multipart/form-data` request with a single file. The body is produced as an
+async iterator of chunks: the file is read one chunk at a time, in a worker thread, so uploading a large file neither
+loads it into memory nor blocks the event loop. The size of the body is known beforehand, so the request is sent with
+a `Content-Length` header instead of using chunked transfer encoding.
+
+Example:
+
+```python
+upload = MultipartFileUpload('/tmp/build.log', file_name='build.log', mime_type='text/plain')
+await client.post(
+    url,
+    content=upload,
+    headers={'Content-Type': upload.content_type, 'Content-Length': str(upload.content_length)},
+)
+```
+"""
+
+import asyncio
+import os
+from typing import AsyncIterator, Callable
+from uuid import uuid4
+
+from jiratui.constants import ATTACHMENT_UPLOAD_CHUNK_SIZE_IN_BYTES
+
+UploadProgressCallback = Callable[[int, int], None]
+"""A function that receives the number of bytes of a file sent so far and the size of the file."""
+
+
+class MultipartFileUpload:
+    """The streamed `multipart/form-data` body of a request that uploads a file."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        file_name: str,
+        mime_type: str | None = None,
+        field_name: str = 'file',
+        chunk_size: int = ATTACHMENT_UPLOAD_CHUNK_SIZE_IN_BYTES,
+        on_progress: UploadProgressCallback | None = None,
+    ):
+        """Initializes the body.
+
+        Args:
+            path: the path of the file to upload.
+            file_name: the name of the file reported to the server.
+            mime_type: the MIME type of the file.
+            field_name: the name of the form field that holds the file.
+            chunk_size: the number of bytes read from the file at a time.
+            on_progress: an optional function called after every chunk is sent.
+        """
+        self.path = path
+        self.chunk_size = max(chunk_size, 1)
+        self.on_progress = on_progress
+        self.file_size: int = os.path.getsize(path)
+        self.boundary: str = uuid4().hex
+        escaped_file_name = file_name.replace('\\', '\\\\').replace('"', '\\"')
+        self._preamble: bytes = (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{escaped_file_name}"\r\n'
+            f'Content-Type: {mime_type or "application/octet-stream"}\r\n\r\n'
+        ).encode()
+        self._epilogue: bytes = f'\r\n--{self.boundary}--\r\n'.encode()
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    @property
+    def content_length(self) -> int:
+        return len(self._preamble) + self.file_size + len(self._epilogue)
+
+    def _report_progress(self, bytes_sent: int) -> None:
+        if self.on_progress is not None:
+            self.on_progress(bytes_sent, self.file_size)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._preamble
+        bytes_sent = 0
+        self._report_progress(bytes_sent)
+        with open(self.path, 'rb') as file_to_upload:
+            while chunk := await asyncio.to_thread(file_to_upload.read, self.chunk_size):
+                yield chunk
+                bytes_sent += len(chunk)
+                self._report_progress(bytes_sent)
+        yield self._epilogue
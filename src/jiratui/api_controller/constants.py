@@ -13,6 +13,48 @@ RECORDS_PER_PAGE_LIST_GROUPS = 50
 MAXIMUM_PAGE_NUMBER_LIST_GROUPS = 20
 """Controls the maximum number of pages to retrieve when fetching users in a group. This ensures the search ends
 eventually."""
+MAXIMUM_CONCURRENT_PAGES_LIST_GROUP_USERS = 5
+"""The maximum number of pages of users in a group requested concurrently."""
+RECORDS_PER_PAGE_LIST_COMMENTS = 100
+"""The maximum number of comments to return per page when listing all the comments of a work item."""
+MAXIMUM_CONCURRENT_PAGES_LIST_COMMENTS = 5
+"""The maximum number of pages of comments requested concurrently."""
+RECORDS_PER_PAGE_LIST_WORKLOGS = 1000
+"""The maximum number of entries to return per page when listing the work log of a work item. The server may return
+fewer entries per page."""
+MAXIMUM_CONCURRENT_PAGES_LIST_WORKLOGS = 5
+"""The maximum number of pages of the work log requested concurrently."""
 RECORDS_PER_PAGE_SEARCH_USERS_ASSIGNABLE_TO_PROJECTS = 1000
 RECORDS_PER_PAGE_SEARCH_USERS_ASSIGNABLE_TO_ISSUES = 1000
 RECORDS_PER_PAGE_SEARCH_USERS = 1000
+RECORDS_PER_PAGE_SYNC_PROJECT_MIRROR = 100
+"""The maximum number of work items to return per page when synchronizing the local mirror of a project."""
+PROJECT_MIRROR_SYNC_OVERLAP = 60
+"""The number of seconds that an incremental synchronization of the local mirror of a project overlaps with the
+previous one. JQL dates have a precision of minutes, so work items updated in the same minute as the last work item
+synchronized are requested again."""
+PROJECT_MIRROR_FIELDS = [
+    'id',
+    'key',
+    'summary',
+    'status',
+    'issuetype',
+    'parent',
+    'assignee',
+    'labels',
+    'priority',
+    'project',
+    'created',
+    'updated',
+]
+"""The fields of the work items stored in the local mirror of a project."""
+PROJECT_MIRROR_PAGE_TOKEN = 'project-mirror'
+"""The token of the next page of the search results served by the local mirror of projects. The mirror selects pages
+by their number, so the token only signals that there are more results."""
+SEARCH_ISSUES_PREFETCH_PAGES = 1
+"""The default number of pages of work items fetched ahead of the page being consumed when streaming search results."""
+WORK_ITEMS_BULK_FETCH_BATCH_SIZE = 100
+"""The maximum number of work items retrieved per request when fetching work items in bulk. The number should be
+between 1 and 100."""
+RECORDS_PER_PAGE_LIST_CHILD_WORK_ITEMS = 1000
+"""The maximum number of keys of child work items to return per page when listing the children of a work item."""
@@ -1,5 +1,6 @@
 import asyncio
 from collections import defaultdict
+import contextlib
 import dataclasses
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
@@ -7,30 +8,49 @@ import logging
 import mimetypes
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, AsyncGenerator, Awaitable, Callable
 
 from dateutil.parser import isoparse  # type:ignore[import-untyped]
 
 from jiratui.api.api import JiraAPI, JiraAPIv2, JiraDataCenterAPI, JiraSoftwareCloudAPI
+from jiratui.api.pagination import OffsetPaginator
+from jiratui.api.uploads import UploadProgressCallback
 from jiratui.api_controller.constants import (
+    MAXIMUM_CONCURRENT_PAGES_LIST_COMMENTS,
+    MAXIMUM_CONCURRENT_PAGES_LIST_GROUP_USERS,
+    MAXIMUM_CONCURRENT_PAGES_LIST_WORKLOGS,
     MAXIMUM_PAGE_NUMBER_LIST_GROUPS,
     MAXIMUM_PAGE_NUMBER_SEARCH_PROJECTS,
+    PROJECT_MIRROR_FIELDS,
+    PROJECT_MIRROR_PAGE_TOKEN,
+    PROJECT_MIRROR_SYNC_OVERLAP,
+    RECORDS_PER_PAGE_LIST_CHILD_WORK_ITEMS,
+    RECORDS_PER_PAGE_LIST_COMMENTS,
     RECORDS_PER_PAGE_LIST_GROUP_USERS,
     RECORDS_PER_PAGE_LIST_GROUPS,
+    RECORDS_PER_PAGE_LIST_WORKLOGS,
     RECORDS_PER_PAGE_SEARCH_PROJECTS,
     RECORDS_PER_PAGE_SEARCH_USERS,
     RECORDS_PER_PAGE_SEARCH_USERS_ASSIGNABLE_TO_ISSUES,
     RECORDS_PER_PAGE_SEARCH_USERS_ASSIGNABLE_TO_PROJECTS,
+    RECORDS_PER_PAGE_SYNC_PROJECT_MIRROR,
+    SEARCH_ISSUES_PREFETCH_PAGES,
+    WORK_ITEMS_BULK_FETCH_BATCH_SIZE,
 )
-from jiratui.api_controller.factories import WorkItemFactory
+from jiratui.api_controller.factories import WorkItemFactory, build_comments
+from jiratui.api_controller.single_flight import SingleFlight, single_flight
+from jiratui.api_controller.work_item_cache import WorkItemCache
 from jiratui.config import CONFIGURATION, ApplicationConfiguration
 from jiratui.constants import (
     ATTACHMENT_MAXIMUM_FILE_SIZE_IN_BYTES,
+    ATTACHMENT_STREAMED_UPLOAD_MAXIMUM_FILE_SIZE_IN_BYTES,
     DEFAULT_JIRA_API_VERSION,
     ISSUE_SEARCH_DEFAULT_MAX_RESULTS,
     LOGGER_NAME,
 )
 from jiratui.exceptions import (
+    APIException,
     ServiceInvalidResponseException,
     ServiceUnavailableException,
     UpdateWorkItemException,
@@ -53,6 +73,7 @@ from jiratui.models import (
     JiraIssue,
     JiraIssuePickerSuggestion,
     JiraIssueSearchResponse,
+    JiraIssueSearchRow,
     JiraMyselfInfo,
     JiraServerInfo,
     JiraTimeTrackingConfiguration,
@@ -68,7 +89,11 @@ from jiratui.models import (
     WorkItemsSearchOrderBy,
 )
 from jiratui.utils.adf import convert_markdown_to_adf
+from jiratui.utils.attachment_cache import AttachmentCache
 from jiratui.utils.logging import JiraTUILogger
+from jiratui.utils.metadata_cache import MetadataCache
+from jiratui.utils.project_mirror import ProjectMirror
+from jiratui.utils.work_item_index import WorkItemIndex
 
 
 @dataclass
@@ -83,7 +108,131 @@ class APIControllerResponse(BaseModel):
         return dataclasses.asdict(self)
 
 
-class APIController:
+class WorkItemsSearchIterator:
+    """Pages through the results of a search of work items while the next pages are retrieved in the background.
+
+    Besides `APIController`, it is used by the controllers that run the searches in another process, e.g. the daemon of
+    the CLI, so that only the pages of results are requested from that process.
+    """
+
+    config: ApplicationConfiguration
+    search_issues: Callable[..., Awaitable[APIControllerResponse]]
+    search_issues_by_page_number: Callable[..., Awaitable[APIControllerResponse]]
+
+    async def iter_search_issues(
+        self,
+        project_key: str | None = None,
+        created_from: date | None = None,
+        created_until: date | None = None,
+        status: int | None = None,
+        assignee: str | None = None,
+        issue_type: int | None = None,
+        search_in_active_sprint: bool = False,
+        jql_query: str | None = None,
+        limit: int | None = None,
+        order_by: WorkItemsSearchOrderBy | None = None,
+        fields: list[str] | None = None,
+        prefetch: int = SEARCH_ISSUES_PREFETCH_PAGES,
+    ) -> AsyncGenerator[JiraIssue, None]:
+        """Searches for issues matching specified JQL query and other criteria and yields every work item found.
+
+        The pages of results are fetched in a background task that runs ahead of the consumer: while the work items
+        of page N are consumed, up to `prefetch` pages after it are retrieved. Pages are requested using
+        `next_page_token` in Jira Cloud and page numbers in Jira DC.
+
+        Args:
+            project_key: the case-sensitive key of the project whose work items we want to search.
+            created_from: search work items created from this date forward (inclusive).
+            created_until: search work items created until this date (inclusive).
+            status: search work items with this status.
+            assignee: search work items assigned to this user's account ID.
+            issue_type: search work items of this type.
+            search_in_active_sprint: if `True` only work items that belong to the currently active sprint will be
+            retrieved.
+            jql_query: search work items using this (additional) JQL query.
+            limit: the maximum number of items to retrieve per page.
+            order_by: an instance of `WorkItemsSearchOrderBy` to sort the results.
+            fields: the fields to retrieve for every work item.
+            prefetch: the maximum number of pages retrieved ahead of the page being consumed.
+
+        Returns:
+            An async generator of `JiraIssue` instances.
+
+        Raises:
+            APIException: if a page of results can not be retrieved. The work items of the previous pages are yielded
+            first. Any other exception raised while fetching a page is raised too.
+        """
+
+        search_criteria: dict = {
+            'project_key': project_key,
+            'created_from': created_from,
+            'created_until': created_until,
+            'status': status,
+            'assignee': assignee,
+            'issue_type': issue_type,
+            'search_in_active_sprint': search_in_active_sprint,
+            'jql_query': jql_query,
+            'limit': limit,
+            'order_by': order_by,
+            'fields': fields,
+        }
+        # a page of results, the exception raised while fetching a page or, `None` once the last page was fetched
+        pages: asyncio.Queue[APIControllerResponse | Exception | None] = asyncio.Queue()
+        # the number of pages that can be fetched ahead of the page being consumed
+        slots = asyncio.Semaphore(max(prefetch, 1))
+
+        async def fetch_pages() -> None:
+            next_page_token: str | None = None
+            page = 1
+            try:
+                while True:
+                    await slots.acquire()
+                    response: APIControllerResponse
+                    if self.config.cloud:
+                        response = await self.search_issues(
+                            next_page_token=next_page_token, **search_criteria
+                        )
+                    else:
+                        response = await self.search_issues_by_page_number(
+                            page=page, **search_criteria
+                        )
+                    await pages.put(response)
+                    if not response.success:
+                        return
+                    result: JiraIssueSearchResponse = response.result
+                    if self.config.cloud:
+                        next_page_token = result.next_page_token
+                        is_last = result.is_last or not next_page_token
+                    else:
+                        fetched = (result.offset or 0) + len(result.issues)
+                        is_last = bool(result.is_last) or (
+                            result.total is not None and fetched >= result.total
+                        )
+                    if is_last or not result.issues:
+                        await pages.put(None)
+                        return
+                    page += 1
+            except Exception as e:
+                # the consumer raises it; otherwise it would wait for the next page forever
+                await pages.put(e)
+
+        producer = asyncio.create_task(fetch_pages())
+        try:
+            while (response := await pages.get()) is not None:
+                if isinstance(response, Exception):
+                    raise response
+                slots.release()
+                if not response.success:
+                    raise APIException(response.error)
+                for work_item in response.result.issues:
+                    yield work_item
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+
+class APIController(WorkItemsSearchIterator):
     """A controller for the JirAPI to provide some additional functionality and integration of multiple endpoints."""
 
     def __init__(self, configuration: ApplicationConfiguration | None = None):
@@ -127,10 +276,497 @@ class APIController:
         self.skip_users_without_email = self.config.ignore_users_without_email
         self.logger = JiraTUILogger(logging.getLogger(LOGGER_NAME), self.config.enable_logging)
         self._required_fields_cache: dict[str, list[str]] = {}
+        # identical read-only calls in flight at the same time share a single request
+        self.single_flight = SingleFlight()
+        # persistent cache of the metadata of the server, e.g. projects, statuses; shared by every launch of the app
+        self.metadata_cache: MetadataCache | None = None
+        if self.config.metadata_cache.enabled:
+            self.metadata_cache = MetadataCache.for_account(
+                self.config.jira_api_base_url,
+                self.config.jira_api_username,
+                max_age=self.config.metadata_cache.max_age,
+            )
+        self.metadata_served_from_cache = False
+        """Indicates whether any metadata was retrieved from the persistent cache instead of the server."""
+        self._revalidation_tasks: dict[str, asyncio.Task] = {}
+        # work items retrieved recently; operations that update a work item invalidate its entries
+        self.work_item_cache = WorkItemCache.from_configuration(self.config.work_item_cache)
+        # persistent cache of the attached files viewed in the application
+        self.attachment_cache: AttachmentCache | None = None
+        if self.config.attachment_cache.enabled:
+            self.attachment_cache = AttachmentCache.for_account(
+                self.config.jira_api_base_url,
+                self.config.jira_api_username,
+                max_size=self.config.attachment_cache.max_size,
+            )
+        # local full-text index of the work items retrieved from the server
+        self.work_item_index: WorkItemIndex | None = None
+        if self.config.full_text_index.enabled:
+            self.work_item_index = WorkItemIndex.for_account(
+                self.config.jira_api_base_url, self.config.jira_api_username
+            )
+        self._indexing_tasks: set[asyncio.Task] = set()
+        # local mirror of the work items of the projects the user works in
+        self.project_mirror: ProjectMirror | None = None
+        if self.config.project_mirror.projects:
+            self.project_mirror = ProjectMirror.for_account(
+                self.config.jira_api_base_url, self.config.jira_api_username
+            )
+
+    async def close_connections(self) -> None:
+        """Releases the HTTP connections used by the clients of the APIs.
+
+        All the clients connecting to the same Jira server share a pool of connections. The connections are closed
+        once every client sharing the pool has released it.
+        """
+        await self.api.close()
+        await self.jira_software_cloud_api.close()
+
+    def _invalidate_work_items(self, *issue_ids_or_keys: str | None) -> None:
+        """Discards the copies of work items kept in memory after an update of the work items in the server.
+
+        The calls in flight may have retrieved the work items before the update, so later calls do not join them.
+
+        Args:
+            *issue_ids_or_keys: the keys or ids of the work items. If none is given every work item is discarded, e.g.
+                when the work items affected by the update are unknown.
+
+        Returns:
+            Nothing.
+        """
+        if issue_ids_or_keys:
+            self.work_item_cache.invalidate(*issue_ids_or_keys)
+        else:
+            self.work_item_cache.clear()
+        self.single_flight.clear()
+
+    def _update_index(self, update: Callable[..., None], *args: Any) -> None:
+        """Updates the local full-text index in a background thread, so the caller does not wait for it.
+
+        Args:
+            update: a method of `work_item_index`.
+            *args: the arguments of the method.
+
+        Returns:
+            Nothing.
+        """
+        if self.work_item_index is None:
+            return
+        task = asyncio.create_task(asyncio.to_thread(update, *args))
+        self._indexing_tasks.add(task)
+        task.add_done_callback(self._indexing_tasks.discard)
+
+    async def search_work_item_index(self, text: str) -> APIControllerResponse:
+        """Searches the local full-text index of the work items retrieved from the server.
+
+        The index holds the summary, description and comments of the work items viewed in the application and, the
+        summary of the work items found by searches. No request is sent to the server.
+
+        Args:
+            text: the text to find in the key, summary, description or comments of the work items.
+
+        Returns:
+            An instance of `APIControllerResponse` with a `JiraIssueSearchResponse` of `JiraIssueSearchRow` instances
+            or, an error if the index is disabled.
+        """
+        if self.work_item_index is None:
+            return APIControllerResponse(
+                success=False, error='The local index of work items is disabled.'
+            )
+        rows: list[JiraIssueSearchRow] = await asyncio.to_thread(
+            self.work_item_index.search, text, self.config.full_text_index.max_results
+        )
+        return APIControllerResponse(result=JiraIssueSearchResponse(issues=rows, is_last=True))
+
+    def project_mirror_covers(
+        self,
+        project_key: str | None = None,
+        search_in_active_sprint: bool = False,
+        jql_query: str | None = None,
+        order_by: WorkItemsSearchOrderBy | None = None,
+        **criteria: Any,
+    ) -> bool:
+        """Determines whether the local mirror of projects can serve a search of work items.
+
+        The mirror serves searches of a single mirrored project, already synchronized, whose filters are the ones the
+        mirror stores: type, status, assignee and date of creation. Searches with a JQL query, searches in the active
+        sprint and searches sorted by priority are sent to the server.
+
+        Args:
+            project_key: the case-sensitive key of the project whose work items are searched.
+            search_in_active_sprint: whether the search is limited to the currently active sprint.
+            jql_query: the JQL query of the search.
+            order_by: the order of the results.
+            **criteria: the other criteria of the search, as accepted by `search_issues`.
+
+        Returns:
+            `True` if `search_project_mirror` can serve the search; `False` otherwise.
+        """
+        return bool(
+            self.project_mirror is not None
+            and project_key
+            and project_key in self.config.project_mirror.projects
+            and not search_in_active_sprint
+            and not jql_query
+            and ProjectMirror.supports_order(order_by)
+            and self.project_mirror.is_synced(project_key)
+        )
+
+    async def search_project_mirror(
+        self,
+        project_key: str,
+        created_from: date | None = None,
+        created_until: date | None = None,
+        status: int | None = None,
+        assignee: str | None = None,
+        issue_type: int | None = None,
+        order_by: WorkItemsSearchOrderBy | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        compact: bool = False,
+    ) -> APIControllerResponse:
+        """Searches work items in the local mirror of projects. No request is sent to the server.
+
+        Use `project_mirror_covers` to determine whether the mirror can serve a search.
+
+        Args:
+            project_key: the case-sensitive key of the project whose work items we want to search.
+            created_from: search work items created from this date forward (inclusive).
+            created_until: search work items created until this date (inclusive).
+            status: search work items with this status.
+            assignee: search work items assigned to this user's account ID.
+            issue_type: search work items of this type.
+            order_by: an instance of `WorkItemsSearchOrderBy` to sort the results.
+            offset: the index of the first work item to retrieve.
+            limit: the maximum number of items to retrieve.
+            compact: if `True` the work items found are instances of `JiraIssueSearchRow` instead of `JiraIssue`.
+
+        Returns:
+            An instance of `APIControllerResponse` with a `JiraIssueSearchResponse` or, an error if the mirror is
+            disabled or it can not be read. The response has the total number of work items found and, if there are
+            more, the `next_page_token` is `PROJECT_MIRROR_PAGE_TOKEN`.
+        """
+        if self.project_mirror is None:
+            return APIControllerResponse(
+                success=False, error='The local mirror of projects is disabled.'
+            )
+        try:
+            work_items, total = await asyncio.to_thread(
+                self.project_mirror.search,
+                project_key,
+                created_from=created_from,
+                created_until=created_until,
+                status=status,
+                assignee=assignee,
+                issue_type=issue_type,
+                order_by=order_by,
+                offset=offset,
+                limit=limit,
+                compact=compact,
+            )
+        except Exception as e:
+            self.logger.error(
+                'Unable to search the local mirror of projects',
+                extra={'project_key': project_key, 'error': str(e)},
+            )
+            return APIControllerResponse(
+                success=False, error='Unable to search the local mirror of projects.'
+            )
+        is_last = offset + len(work_items) >= total
+        return APIControllerResponse(
+            result=JiraIssueSearchResponse(
+                issues=work_items,
+                next_page_token=None if is_last else PROJECT_MIRROR_PAGE_TOKEN,
+                is_last=is_last,
+                total=total,
+                offset=offset,
+            )
+        )
+
+    async def sync_project_mirror(self, project_key: str) -> APIControllerResponse:
+        """Synchronizes the local mirror of a project with the server.
+
+        The first synchronization of a project, and then one every `project_mirror.full_sync_interval` seconds,
+        retrieves every work item of the project and removes the mirrored work items that no longer exist. The
+        others only retrieve the work items updated since the last work item synchronized, i.e. JQL
+        `updated >= "<date>"`.
+
+        Args:
+            project_key: the case-sensitive key of the project.
+
+        Returns:
+            An instance of `APIControllerResponse` with the number of work items retrieved or, an error if the
+            synchronization fails. A failed synchronization does not change the state of the project in the mirror, so
+            the next one retrieves the same work items again.
+        """
+        if self.project_mirror is None:
+            return APIControllerResponse(
+                success=False, error='The local mirror of projects is disabled.'
+            )
+        mirror: ProjectMirror = self.project_mirror
+        synced_at = time.time()
+        try:
+            state = await asyncio.to_thread(mirror.get_state, project_key)
+        except Exception as e:
+            return APIControllerResponse(
+                success=False, error=f'Unable to read the local mirror of projects: {str(e)}'
+            )
+        criteria: dict = {
+            'project_key': project_key,
+            'fields': PROJECT_MIRROR_FIELDS,
+            'limit': RECORDS_PER_PAGE_SYNC_PROJECT_MIRROR,
+        }
+        full = (
+            state is None
+            or not state.last_updated
+            or synced_at - state.full_synced_at >= self.config.project_mirror.full_sync_interval
+        )
+        if state is not None and not full:
+            criteria['jql_query'] = f'updated >= "{state.last_updated}" order by updated asc'
+        else:
+            criteria['order_by'] = WorkItemsSearchOrderBy.KEY_ASC
+
+        last_updated: datetime | None = None
+        count = 0
+        next_page_token: str | None = None
+        while True:
+            response: APIControllerResponse
+            if self.config.cloud:
+                response = await self.search_issues(next_page_token=next_page_token, **criteria)
+            else:
+                response = await self.search_issues_by_page_number(offset=count, **criteria)
+            if not response.success or response.result is None:
+                self.logger.warning(
+                    'Unable to synchronize the local mirror of a project',
+                    extra={'project_key': project_key, 'error': response.error},
+                )
+                return APIControllerResponse(success=False, error=response.error)
+            page: JiraIssueSearchResponse = response.result
+            if page.issues:
+                try:
+                    await asyncio.to_thread(mirror.store, project_key, page.issues, synced_at)
+                except Exception as e:
+                    return APIControllerResponse(
+                        success=False,
+                        error=f'Unable to update the local mirror of projects: {str(e)}',
+                    )
+                count += len(page.issues)
+                for work_item in page.issues:
+                    if work_item.updated and (
+                        last_updated is None or work_item.updated > last_updated
+                    ):
+                        last_updated = work_item.updated
+            if self.config.cloud:
+                next_page_token = page.next_page_token
+                if not page.issues or page.is_last or not next_page_token:
+                    break
+            elif not page.issues or page.total is None or count >= page.total:
+                break
+
+        # JQL interprets dates in the time zone of the user, which is the time zone of the dates of the work items
+        watermark: str | None = None
+        if last_updated:
+            watermark = (last_updated - timedelta(seconds=PROJECT_MIRROR_SYNC_OVERLAP)).strftime(
+                '%Y-%m-%d %H:%M'
+            )
+        try:
+            await asyncio.to_thread(mirror.finish_sync, project_key, synced_at, full, watermark)
+        except Exception as e:
+            return APIControllerResponse(
+                success=False, error=f'Unable to update the local mirror of projects: {str(e)}'
+            )
+        return APIControllerResponse(result=count)
+
+    async def _refresh_project_mirror(self, issue_id_or_key: str) -> None:
+        """Updates the copy of a work item in the local mirror of projects after the work item changed in the server.
+
+        Searches served by the mirror would otherwise return the previous values of the work item until the next
+        synchronization of its project. If the work item can not be retrieved its copy is removed, so the mirror never
+        serves outdated values; the next synchronization restores it.
+
+        Args:
+            issue_id_or_key: the id or case-sensitive key of the work item.
+
+        Returns:
+            Nothing.
+        """
+        if self.project_mirror is None:
+            return
+        projects: list[str] = self.config.project_mirror.projects
+        if '-' in issue_id_or_key and issue_id_or_key.rsplit('-', 1)[0] not in projects:
+            # the work item does not belong to a mirrored project
+            return
+        mirror: ProjectMirror = self.project_mirror
+        synced_at = time.time()
+        response: APIControllerResponse = await self.get_issue(
+            issue_id_or_key, fields=PROJECT_MIRROR_FIELDS
+        )
+        try:
+            if not response.success or not response.result or not response.result.issues:
+                await asyncio.to_thread(mirror.delete, issue_id_or_key)
+                return
+            work_item: JiraIssue = response.result.issues[0]
+            if work_item.project and work_item.project.key in projects:
+                await asyncio.to_thread(mirror.store, work_item.project.key, [work_item], synced_at)
+            else:
+                # the work item was moved to a project that is not mirrored
+                await asyncio.to_thread(mirror.delete, work_item.key)
+        except Exception as e:
+            self.logger.warning(
+                'Unable to update the local mirror of projects',
+                extra={'issue_id_or_key': issue_id_or_key, 'error': str(e)},
+            )
+
+    @single_flight
+    async def get_work_item_children(
+        self, work_item_key: str, fields: list[str] | None = None
+    ) -> APIControllerResponse:
+        """Retrieves the work items whose parent is a work item, e.g. its subtasks.
+
+        The children of the work items of mirrored projects are retrieved from the local mirror. For the others, the
+        keys of the children are searched in the server and the children are retrieved with `get_issues_bulk()`, i.e. a
+        few requests regardless of the number of children.
+
+        Args:
+            work_item_key: the case-sensitive key of the parent work item.
+            fields: the fields to retrieve for every work item when searching the server.
+
+        Returns:
+            An instance of `APIControllerResponse` with a `JiraIssueSearchResponse` with the child work items or, an
+            error if the search fails.
+        """
+        if self.project_mirror_covers(project_key=work_item_key.rsplit('-', 1)[0]):
+            try:
+                children: list[JiraIssue] = await asyncio.to_thread(
+                    self.project_mirror.get_children,  # type:ignore[union-attr]
+                    work_item_key,
+                )
+                return APIControllerResponse(
+                    result=JiraIssueSearchResponse(issues=children, is_last=True)
+                )
+            except Exception as e:
+                self.logger.warning(
+                    'Unable to retrieve the child work items from the local mirror',
+                    extra={'work_item_key': work_item_key, 'error': str(e)},
+                )
+        try:
+            keys: list[str] = await self._list_child_work_item_keys(work_item_key)
+        except ServiceUnavailableException:
+            return APIControllerResponse(
+                success=False, error='Unable to connect to the Jira server.'
+            )
+        except ServiceInvalidResponseException:
+            return APIControllerResponse(
+                success=False, error='The response from the server contains errors.'
+            )
+        except Exception as e:
+            return APIControllerResponse(
+                success=False,
+                error=f'There was an unknown error while searching for work items: {str(e)}',
+            )
+        return await self.get_issues_bulk(keys, fields=fields)
+
+    async def _list_child_work_item_keys(self, work_item_key: str) -> list[str]:
+        # only the keys are requested; this allows the server to return large pages
+        keys: list[str] = []
+        next_page_token: str | None = None
+        while True:
+            response: dict = await self.api.search_issues(
+                jql_query=f'parent={work_item_key}',
+                fields=['key'],
+                next_page_token=next_page_token,
+                offset=len(keys),
+                limit=RECORDS_PER_PAGE_LIST_CHILD_WORK_ITEMS,
+            )
+            page: list[str] = [issue['key'] for issue in response.get('issues', [])]
+            keys.extend(page)
+            # Jira Cloud returns a token for the next page; Jira Data Center returns the total number of work items
+            next_page_token = response.get('nextPageToken')
+            total: int | None = response.get('total')
+            if not page or (not next_page_token and (total is None or len(keys) >= total)):
+                return keys
 
     def _adf_support_enabled(self) -> bool:
         return self.config.cloud and self.config.jira_api_version == 3
 
+    async def _fetch_metadata(
+        self,
+        resource: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cached: bool = False,
+        on_revalidated: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """Fetches metadata of the Jira server and keeps a copy of it in the persistent cache.
+
+        Args:
+            resource: the name of the resource in the cache, e.g. `statuses`.
+            fetch: a function that fetches the resource from the server.
+            cached: if `True` and the resource is in the cache the cached data is returned without contacting the
+            server.
+            on_revalidated: if the cached data is returned and this is set then the resource is fetched again in a
+            background task, the cache is updated and this function is called with the data fetched.
+
+        Returns:
+            The data of the resource.
+
+        Raises:
+            Any exception raised by `fetch`.
+        """
+
+        if self.metadata_cache is None:
+            return await fetch()
+        if (
+            cached
+            and (entry := await asyncio.to_thread(self.metadata_cache.get, resource)) is not None
+        ):
+            self.metadata_served_from_cache = True
+            if on_revalidated is not None:
+                self._revalidate_metadata(resource, fetch, on_revalidated)
+            return entry.data
+        data = await fetch()
+        await asyncio.to_thread(self.metadata_cache.set, resource, data)
+        return data
+
+    def _revalidate_metadata(
+        self,
+        resource: str,
+        fetch: Callable[[], Awaitable[Any]],
+        on_revalidated: Callable[[Any], None],
+    ) -> None:
+        """Refreshes a resource of the persistent metadata cache in a background task.
+
+        The caller does not wait for the request. A resource is only refreshed by one task at a time.
+
+        Args:
+            resource: the name of the resource in the cache, e.g. `createmeta-ABC-10001`.
+            fetch: a function that fetches the resource from the server.
+            on_revalidated: a function that is called with the data fetched.
+
+        Returns:
+            Nothing.
+        """
+        if resource in self._revalidation_tasks:
+            # the resource is already being refreshed
+            return
+
+        async def revalidate() -> None:
+            try:
+                data = await fetch()
+            except Exception as e:
+                exception_details: dict = self._extract_exception_details(e)
+                self.logger.warning(
+                    'Unable to revalidate the cached metadata',
+                    extra={'resource': resource, **exception_details.get('extra', {})},
+                )
+                return
+            if self.metadata_cache is not None:
+                await asyncio.to_thread(self.metadata_cache.set, resource, data)
+            on_revalidated(data)
+
+        task = asyncio.create_task(revalidate())
+        self._revalidation_tasks[resource] = task
+        task.add_done_callback(lambda _: self._revalidation_tasks.pop(resource, None))
+
     @staticmethod
     def _extract_exception_details(exception: Exception) -> dict:
         extra: dict = getattr(exception, 'extra', {}) or {}
@@ -140,7 +776,8 @@ class APIController:
 
     # Projects
 
-    async def get_project_sprints(self, key: str) -> APIControllerResponse:
+    @single_flight
+    async def get_project_sprints(self, key: str, cached: bool = False) -> APIControllerResponse:
         """Retrieves the active and future sprints for a project/space.
 
         This uses the [Jira Software Cloud REST API](https://developer.atlassian.com/cloud/jira/software/rest/intro/).
@@ -150,12 +787,26 @@ class APIController:
 
         Args:
             key: the key or Id of a project/space in Jira.
+            cached: if `True` the sprints stored in the persistent cache (if any) are returned.
 
         Returns:
             An instance of APIControllerResponse with the list of AgileSprint in the project. If an error occurs then it
             returns an instance of APIControllerResponse with success == False an error message.
         """
 
+        resource = f'sprints-{key}'
+        if (
+            cached
+            and self.metadata_cache is not None
+            and (entry := await asyncio.to_thread(self.metadata_cache.get, resource)) is not None
+        ):
+            self.metadata_served_from_cache = True
+            return APIControllerResponse(
+                result=self._build_sprints(
+                    entry.data.get('boards', {}), entry.data.get('sprints', [])
+                )
+            )
+
         try:
             boards_in_project_response: dict = await self.jira_software_cloud_api.get_boards(
                 project_key_or_id=key
@@ -174,6 +825,10 @@ class APIController:
         if not boards_in_project_response or not (
             boards_in_project := boards_in_project_response.get('values', [])
         ):
+            if self.metadata_cache is not None:
+                await asyncio.to_thread(
+                    self.metadata_cache.set, resource, {'boards': {}, 'sprints': []}
+                )
             return APIControllerResponse(result=[])
 
         # get the sprints in every board
@@ -199,35 +854,13 @@ class APIController:
             return APIControllerResponse(success=False, error=exception_details.get('message'))
 
         boards_with_exceptions = 0
-        sprints: list[AgileSprint] = []
+        sprints_in_boards: list[dict] = []
         for item in sprints_in_board_responses:
             if isinstance(item, Exception):
                 boards_with_exceptions += 1
                 continue
-            for sprint in item.get('values', []):  # type:ignore[union-attr]
-                sprints.append(
-                    AgileSprint(
-                        id=int(sprint.get('id')),
-                        name=sprint.get('name'),
-                        state=AgileSprintState(sprint.get('state')),
-                        goal=sprint.get('goal', ''),
-                        start_date=isoparse(sprint.get('startDate'))
-                        if sprint.get('startDate')
-                        else None,
-                        end_date=isoparse(sprint.get('endDate')) if sprint.get('endDate') else None,
-                        complete_date=isoparse(sprint.get('completeDate'))
-                        if sprint.get('completeDate')
-                        else None,
-                        origin_board_id=int(sprint.get('originBoardId'))
-                        if sprint.get('originBoardId') is not None
-                        else None,
-                        origin_board_name=(
-                            boards_by_id.get(int(sprint.get('originBoardId')), {}).get('name')
-                            if sprint.get('originBoardId') is not None
-                            else None
-                        ),
-                    )
-                )
+            sprints_in_boards.extend(item.get('values', []))  # type:ignore[union-attr]
+        sprints: list[AgileSprint] = self._build_sprints(boards_by_id, sprints_in_boards)
         if boards_with_exceptions:
             if boards_with_exceptions == len(sprints_in_board_responses):
                 self.logger.error(
@@ -239,8 +872,49 @@ class APIController:
                     'Failed to extract the sprints of some of the boards in the project',
                     extra={'boards': list(boards_by_id.keys()), 'project': key},
                 )
+        elif self.metadata_cache is not None:
+            await asyncio.to_thread(
+                self.metadata_cache.set,
+                resource,
+                {
+                    'boards': {str(board_id): board for board_id, board in boards_by_id.items()},
+                    'sprints': sprints_in_boards,
+                },
+            )
         return APIControllerResponse(result=sprints)
 
+    @staticmethod
+    def _build_sprints(boards_by_id: dict, sprints_in_boards: list[dict]) -> list[AgileSprint]:
+        # the keys of the boards are strings when the boards are loaded from the persistent cache
+        boards_by_id = {int(board_id): board for board_id, board in boards_by_id.items()}
+        sprints: list[AgileSprint] = []
+        for sprint in sprints_in_boards:
+            sprints.append(
+                AgileSprint(
+                    id=int(sprint.get('id')),
+                    name=sprint.get('name'),
+                    state=AgileSprintState(sprint.get('state')),
+                    goal=sprint.get('goal', ''),
+                    start_date=isoparse(sprint.get('startDate'))
+                    if sprint.get('startDate')
+                    else None,
+                    end_date=isoparse(sprint.get('endDate')) if sprint.get('endDate') else None,
+                    complete_date=isoparse(sprint.get('completeDate'))
+                    if sprint.get('completeDate')
+                    else None,
+                    origin_board_id=int(sprint.get('originBoardId'))
+                    if sprint.get('originBoardId') is not None
+                    else None,
+                    origin_board_name=(
+                        boards_by_id.get(int(sprint.get('originBoardId')), {}).get('name')
+                        if sprint.get('originBoardId') is not None
+                        else None
+                    ),
+                )
+            )
+        return sprints
+
+    @single_flight
     async def get_project(self, key: str) -> APIControllerResponse:
         """Retrieves the details of a project by key.
 
@@ -277,6 +951,7 @@ class APIController:
         query: str | None = None,
         order_by: str | None = None,
         keys: list[str] | None = None,
+        cached: bool = False,
     ) -> APIControllerResponse:
         """Searches for projects using different filters.
 
@@ -290,6 +965,8 @@ class APIController:
             order_by: sort the results by a field: `key` (default), `category`, `issueCount`, `lastIssueUpdatedTime`,
             `name`, `owner`, `archivedDate`, `deletedDate`.
             keys: the project keys to filter the results by.
+            cached: if `True` the projects stored in the persistent cache (if any) are returned. Only searches without
+            a `query` and `order_by` are cached.
 
         Returns:
             An instance of `APIControllerResponse` with the list of `Project` instances. If an error occurs an
@@ -297,6 +974,22 @@ class APIController:
             message.
         """
 
+        resource: str | None = None
+        if self.metadata_cache is not None and query is None and order_by is None:
+            resource = f'projects-{",".join(sorted(keys))}' if keys else 'projects'
+            if (
+                cached
+                and (entry := await asyncio.to_thread(self.metadata_cache.get, resource))
+                is not None
+            ):
+                self.metadata_served_from_cache = True
+                return APIControllerResponse(
+                    result=[
+                        Project(id=item.get('id'), key=item.get('key'), name=item.get('name'))
+                        for item in entry.data
+                    ]
+                )
+
         projects: list[Project] = []
         is_last = False
         i = 0
@@ -334,20 +1027,34 @@ class APIController:
                     )
                 is_last = response.get('isLast')
                 i += 1
+        if self.metadata_cache is not None and resource is not None:
+            await asyncio.to_thread(
+                self.metadata_cache.set,
+                resource,
+                [{'id': item.id, 'key': item.key, 'name': item.name} for item in projects],
+            )
         return APIControllerResponse(result=projects)
 
-    async def get_project_statuses(self, project_key: str) -> APIControllerResponse:
+    @single_flight
+    async def get_project_statuses(
+        self, project_key: str, cached: bool = False
+    ) -> APIControllerResponse:
         """Retrieves the statues applicable to issues of a project.
 
         Args:
             project_key: the case-sensitive key of a project.
+            cached: if `True` the statuses stored in the persistent cache (if any) are returned.
 
         Returns:
             An instance of `APIControllerResponse` with the statuses grouped by type of issues. If an error occurs an
             instance of `APIControllerResponse` with the `error` message and `success = False`.
         """
         try:
-            response: list[dict] = await self.api.get_project_statuses(project_key)
+            response: list[dict] = await self._fetch_metadata(
+                f'project-statuses-{project_key}',
+                lambda: self.api.get_project_statuses(project_key),
+                cached=cached,
+            )
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error(
@@ -377,9 +1084,12 @@ class APIController:
             }
         return APIControllerResponse(result=statuses_by_issue_type)
 
-    async def status(self) -> APIControllerResponse:
+    @single_flight
+    async def status(self, cached: bool = False) -> APIControllerResponse:
         try:
-            response: list[dict] = await self.api.status()
+            response: list[dict] = await self._fetch_metadata(
+                'statuses', self.api.status, cached=cached
+            )
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error(
@@ -479,6 +1189,9 @@ class APIController:
     async def list_all_active_users_in_group(self, group_id: str) -> APIControllerResponse:
         """Retrieves all the active users in a group.
 
+        The first page of results reports the total number of users in the group; the remaining pages are then
+        fetched concurrently.
+
         If an exception occurs while fetching any of the pages then the method will return the list of users found so
         far with `success=False` and an additional error message.
 
@@ -488,54 +1201,51 @@ class APIController:
         Returns:
             An instance of `APIControllerResponse` with the list of `JiraUser` instances.
         """
-        response: dict
         users: list[JiraUser] = []
-        is_last = False
-        i = 0
-        while not is_last and i < MAXIMUM_PAGE_NUMBER_LIST_GROUPS:
-            try:
-                response = await self.api.get_users_in_group(
-                    group_id=group_id,
-                    offset=i * RECORDS_PER_PAGE_LIST_GROUP_USERS,
-                    limit=RECORDS_PER_PAGE_LIST_GROUP_USERS,
-                )
-            except Exception as e:
-                exception_details: dict = self._extract_exception_details(e)
-                self.logger.error(
-                    'Unable to fetch all active users in a group.',
-                    extra={
-                        'error': str(e),
-                        'group_id': group_id,
-                        'offset': i * RECORDS_PER_PAGE_LIST_GROUP_USERS,
-                        'limit': RECORDS_PER_PAGE_LIST_GROUP_USERS,
-                        **exception_details.get('extra', {}),
-                    },
-                )
-                return APIControllerResponse(
-                    success=False,
-                    result=sorted(users, key=lambda x: x.display_name or x.email or x.account_id),
-                    error=exception_details.get('message'),
-                )
-            else:
-                for user in response.get('values', []):
-                    if user.get('active') is False:
-                        continue
-                    # skip users w/o email and w/o display name
-                    if not user.get('emailAddress') and not user.get('displayName'):
-                        continue
-                    users.append(
-                        JiraUser(
-                            email=user.get('emailAddress'),
-                            account_id=user.get('accountId')
-                            if self.config.cloud is True
-                            else user.get('name'),
-                            active=user.get('active'),
-                            display_name=user.get('displayName'),
-                            username=user.get('name') if not self.config.cloud else None,
-                        )
+        paginator = OffsetPaginator(
+            lambda offset, limit: self.api.get_users_in_group(
+                group_id=group_id, offset=offset, limit=limit
+            ),
+            page_size=RECORDS_PER_PAGE_LIST_GROUP_USERS,
+            max_pages=MAXIMUM_PAGE_NUMBER_LIST_GROUPS,
+            max_concurrency=MAXIMUM_CONCURRENT_PAGES_LIST_GROUP_USERS,
+        )
+        try:
+            user: dict
+            async for user in paginator.items():
+                if user.get('active') is False:
+                    continue
+                # skip users w/o email and w/o display name
+                if not user.get('emailAddress') and not user.get('displayName'):
+                    continue
+                users.append(
+                    JiraUser(
+                        email=user.get('emailAddress'),
+                        account_id=user.get('accountId')
+                        if self.config.cloud is True
+                        else user.get('name'),
+                        active=user.get('active'),
+                        display_name=user.get('displayName'),
+                        username=user.get('name') if not self.config.cloud else None,
                     )
-                is_last = response.get('isLast')
-                i += 1
+                )
+        except Exception as e:
+            exception_details: dict = self._extract_exception_details(e)
+            self.logger.error(
+                'Unable to fetch all active users in a group.',
+                extra={
+                    'error': str(e),
+                    'group_id': group_id,
+                    'offset': paginator.offset,
+                    'limit': RECORDS_PER_PAGE_LIST_GROUP_USERS,
+                    **exception_details.get('extra', {}),
+                },
+            )
+            return APIControllerResponse(
+                success=False,
+                result=sorted(users, key=lambda x: x.display_name or x.email or x.account_id),
+                error=exception_details.get('message'),
+            )
         return APIControllerResponse(
             result=sorted(users, key=lambda x: x.display_name or x.email or x.account_id)
         )
@@ -756,6 +1466,7 @@ class APIController:
             result=sorted(users, key=lambda item: item.display_name or item.account_id)
         )
 
+    @single_flight
     async def get_user(self, account_id: str) -> APIControllerResponse:
         """Retrieves the details of a single user.
 
@@ -796,18 +1507,24 @@ class APIController:
 
     # Work Items (aka. Issues)
 
-    async def get_issue_types_for_project(self, project_key: str) -> APIControllerResponse:
+    @single_flight
+    async def get_issue_types_for_project(
+        self, project_key: str, cached: bool = False
+    ) -> APIControllerResponse:
         """Retrieves the types of issues associated to a project.
 
         Args:
             project_key: the ID or (case-sensitive) key of the project whose issue types we want to retrieve.
+            cached: if `True` the types of issues stored in the persistent cache (if any) are returned.
 
         Returns:
             An instance of `APIControllerResponse` with the list of `IssueType` instances. If an error occurs an
             instance of `APIControllerResponse` with the `error` message.
         """
         try:
-            project: dict = await self.api.get_project(project_key)
+            project: dict = await self._fetch_metadata(
+                f'project-{project_key}', lambda: self.api.get_project(project_key), cached=cached
+            )
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error(
@@ -825,17 +1542,23 @@ class APIController:
             ]
         )
 
-    async def get_issue_types(self) -> APIControllerResponse:
+    @single_flight
+    async def get_issue_types(self, cached: bool = False) -> APIControllerResponse:
         """Retrieves all the types of issues relevant for any project.
 
         Warning: this may contain multiple issue types with the same name (different IDs though).
 
+        Args:
+            cached: if `True` the types of issues stored in the persistent cache (if any) are returned.
+
         Returns:
             An instance of `APIControllerResponse` with the list of `IssueType` instances. If an error occurs an
             instance of `APIControllerResponse` with the `error` message.
         """
         try:
-            response: list[dict] = await self.api.get_issue_types_for_user()
+            response: list[dict] = await self._fetch_metadata(
+                'issue-types', self.api.get_issue_types_for_user, cached=cached
+            )
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error(
@@ -844,7 +1567,7 @@ class APIController:
             return APIControllerResponse(success=False, error=exception_details.get('message'))
         else:
             projects_by_id: dict[str, Project] = {}
-            projects: APIControllerResponse = await self.search_projects()
+            projects: APIControllerResponse = await self.search_projects(cached=cached)
             if projects.success:
                 # group projects by ID
                 projects_by_id = {p.id: p for p in projects.result or []}
@@ -888,8 +1611,16 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            # the parent, the subtasks and the linked work items of the work item change too
+            self._invalidate_work_items()
+        if self.work_item_index is not None:
+            self._update_index(self.work_item_index.delete, issue_id_or_key)
+        if self.project_mirror is not None:
+            await asyncio.to_thread(self.project_mirror.delete, issue_id_or_key)
         return APIControllerResponse()
 
+    @single_flight
     async def get_issue(
         self,
         issue_id_or_key: str,
@@ -898,6 +1629,9 @@ class APIController:
     ) -> APIControllerResponse:
         """Retrieves a work item (aka. Jira issue) by its key or id.
 
+        Work items retrieved recently, with the requested fields, are served from `work_item_cache` without sending a
+        request.
+
         Args:
             issue_id_or_key: the ID or case-sensitive key of the work item to retrieve.
             fields: a list of fields to return for the issue. This parameter accepts a comma-separated list. Use it
@@ -915,6 +1649,11 @@ class APIController:
             `success = False` and the error message in the `error` key.
         """
 
+        if (cached := self.work_item_cache.get(issue_id_or_key, fields, properties)) is not None:
+            return APIControllerResponse(result=JiraIssueSearchResponse(issues=[cached]))
+        # the work item is not kept if it is updated while it is retrieved
+        cache_generation: int = self.work_item_cache.generation
+
         fields_strings: str | None = ','.join(fields) if fields else None
         try:
             issue: dict = await self.api.get_issue(
@@ -946,8 +1685,87 @@ class APIController:
                     success=False,
                     error=f'Failed to extract the details of the requested work item {issue_id_or_key}: {str(e)}',
                 )
+            self.work_item_cache.store(
+                issue_id_or_key, instance, fields, properties, generation=cache_generation
+            )
+            if self.work_item_index is not None:
+                self._update_index(self.work_item_index.add, [instance])
             return APIControllerResponse(result=JiraIssueSearchResponse(issues=[instance]))
 
+    @single_flight
+    async def get_issues_bulk(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> APIControllerResponse:
+        """Retrieves several work items by their keys or ids.
+
+        Work items retrieved recently, with the requested fields, are served from `work_item_cache`. The others are
+        requested in batches of up to `WORK_ITEMS_BULK_FETCH_BATCH_SIZE` work items, which are sent concurrently. Work
+        items that do not exist, or that the user can not see, are not included in the result.
+
+        Args:
+            issue_ids_or_keys: the IDs or case-sensitive keys of the work items to retrieve.
+            fields: the fields to retrieve for every work item. It defaults to the navigable fields.
+
+        Returns:
+            An instance of `APIControllerResponse` with a `JiraIssueSearchResponse` with the work items, in the order
+            of `issue_ids_or_keys`, or an error if none of the batches can be retrieved.
+        """
+
+        work_items: dict[str, JiraIssue] = {}
+        missing: list[str] = []
+        cache_generation: int = self.work_item_cache.generation
+        for issue_id_or_key in dict.fromkeys(issue_ids_or_keys):
+            if (cached := self.work_item_cache.get(issue_id_or_key, fields)) is not None:
+                work_items[issue_id_or_key] = cached
+            else:
+                missing.append(issue_id_or_key)
+
+        batches: list[list[str]] = [
+            missing[start : start + WORK_ITEMS_BULK_FETCH_BATCH_SIZE]
+            for start in range(0, len(missing), WORK_ITEMS_BULK_FETCH_BATCH_SIZE)
+        ]
+        # if any exception occurs while retrieving a batch then the exception instance will be in the results list
+        responses = await asyncio.gather(
+            *[self.api.get_issues_bulk(batch, fields=fields) for batch in batches],
+            return_exceptions=True,
+        )
+        error: str | None = None
+        retrieved: list[JiraIssue] = []
+        for batch, response in zip(batches, responses, strict=True):
+            if isinstance(response, BaseException):
+                exception_details: dict = self._extract_exception_details(response)  # type:ignore[arg-type]
+                error = exception_details.get('message')
+                self.logger.error(
+                    'Unable to retrieve the work items',
+                    extra={'issue_ids_or_keys': batch, **exception_details.get('extra', {})},
+                )
+                continue
+            for issue in response.get('issues', []):
+                try:
+                    retrieved.append(WorkItemFactory.create_work_item(issue))
+                except Exception as e:
+                    self.logger.warning(
+                        'There was an error while extracting data from an issue',
+                        extra={'error': str(e), 'issue_id_or_key': issue.get('key')},
+                    )
+        if batches and error is not None and not retrieved:
+            return APIControllerResponse(success=False, error=error)
+
+        for instance in retrieved:
+            self.work_item_cache.store(instance.key, instance, fields, generation=cache_generation)
+            work_items[instance.key] = instance
+            work_items[instance.id] = instance
+        if self.work_item_index is not None and retrieved:
+            self._update_index(self.work_item_index.add, retrieved)
+
+        issues: list[JiraIssue] = []
+        found: set[str] = set()
+        for issue_id_or_key in issue_ids_or_keys:
+            if (work_item := work_items.get(issue_id_or_key)) and work_item.key not in found:
+                found.add(work_item.key)
+                issues.append(work_item)
+        return APIControllerResponse(result=JiraIssueSearchResponse(issues=issues, is_last=True))
+
     async def issue_picker(
         self,
         query: str,
@@ -1044,6 +1862,21 @@ class APIController:
             ),
         }
 
+    @staticmethod
+    def _build_search_results(
+        issues: list[dict], compact: bool = False
+    ) -> list[JiraIssue] | list[JiraIssueSearchRow]:
+        factory: Callable[[dict], JiraIssue] | Callable[[dict], JiraIssueSearchRow] = (
+            WorkItemFactory.create_search_row if compact else WorkItemFactory.create_work_item
+        )
+        work_items: list = []
+        for issue in issues:
+            try:
+                work_items.append(factory(issue))
+            except Exception:
+                continue
+        return work_items
+
     async def search_issues(
         self,
         project_key: str | None = None,
@@ -1058,6 +1891,7 @@ class APIController:
         limit: int | None = None,
         order_by: WorkItemsSearchOrderBy | None = None,
         fields: list[str] | None = None,
+        compact: bool = False,
     ) -> APIControllerResponse:
         """Searches for issues matching specified JQL query and other criteria.
 
@@ -1077,6 +1911,8 @@ class APIController:
             order_by: an instance of `WorkItemsSearchOrderBy` to sort the results.
             fields: the fields to retrieve for every work item. It defaults to: `'id', 'key', 'status', 'summary',
             'issuetype'`
+            compact: if `True` the work items found are instances of `JiraIssueSearchRow` instead of `JiraIssue`. This
+            is meant for lists of search results, which only display a few fields of every work item.
 
         Returns:
             An instance of `APIControllerResponse` with the work items found or, en error if the search can not be
@@ -1104,7 +1940,9 @@ class APIController:
                 jql_query=criteria.get('jql'),
                 fields=fields
                 if fields
-                else ['id', 'key', 'status', 'summary', 'issuetype', 'parent'],
+                else ['id', 'key', 'status', 'summary', 'issuetype', 'parent']
+                # compact results are filtered by assignee and labels too
+                + (['assignee', 'labels'] if compact else []),
                 next_page_token=next_page_token,
                 limit=limit,
                 order_by=order_by,
@@ -1122,14 +1960,11 @@ class APIController:
                 success=False,
                 error=f'There was an unknown error while searching for work items: {str(e)}',
             )
-        issues: list[JiraIssue] = []
-        work_item: JiraIssue
-        for issue in response.get('issues', []):
-            try:
-                work_item = WorkItemFactory.create_work_item(issue)
-                issues.append(work_item)
-            except Exception:
-                continue
+        issues: list[JiraIssue] | list[JiraIssueSearchRow] = self._build_search_results(
+            response.get('issues', []), compact
+        )
+        if self.work_item_index is not None and issues:
+            self._update_index(self.work_item_index.add, issues)
 
         return APIControllerResponse(
             result=JiraIssueSearchResponse(
@@ -1153,6 +1988,8 @@ class APIController:
         limit: int | None = None,
         order_by: WorkItemsSearchOrderBy | None = None,
         fields: list[str] | None = None,
+        compact: bool = False,
+        offset: int | None = None,
     ) -> APIControllerResponse:
         """Searches for issues matching specified JQL query and other criteria.
 
@@ -1171,11 +2008,14 @@ class APIController:
             search_in_active_sprint: if `True` only work items that belong to the currently active sprint will be
             retrieved.
             jql_query: search work items using this (additional) JQL query.
-            page: the page of results to retrieve.
+            page: the page of results to retrieve. Pages hold `limit` work items.
             limit: the maximum number of items to retrieve.
             order_by: an instance of `WorkItemsSearchOrderBy` to sort the results.
             fields: the fields to retrieve for every work item. It defaults to: `'id', 'key', 'status', 'summary',
             'issuetype'`
+            compact: if `True` the work items found are instances of `JiraIssueSearchRow` instead of `JiraIssue`. This
+            is meant for lists of search results, which only display a few fields of every work item.
+            offset: the index of the first work item to retrieve. If set, `page` is ignored.
 
         Returns:
             An instance of `APIControllerResponse` with the work items found or, en error if the search can not be
@@ -1192,10 +2032,12 @@ class APIController:
             jql_query=jql_query,
         )
 
-        if page is None or page <= 0:
+        if offset is not None:
+            offset = max(offset, 0)
+        elif page is None or page <= 0:
             offset = 0
         else:
-            offset = (page - 1) * ISSUE_SEARCH_DEFAULT_MAX_RESULTS
+            offset = (page - 1) * (limit or ISSUE_SEARCH_DEFAULT_MAX_RESULTS)
 
         try:
             response: dict = await self.api.search_issues(
@@ -1210,7 +2052,9 @@ class APIController:
                 jql_query=criteria.get('jql'),
                 fields=fields
                 if fields
-                else ['id', 'key', 'status', 'summary', 'issuetype', 'parent'],
+                else ['id', 'key', 'status', 'summary', 'issuetype', 'parent']
+                # compact results are filtered by assignee and labels too
+                + (['assignee', 'labels'] if compact else []),
                 offset=offset,
                 limit=limit,
                 order_by=order_by,
@@ -1235,14 +2079,11 @@ class APIController:
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
 
-        issues: list[JiraIssue] = []
-        work_item: JiraIssue
-        for issue in response.get('issues', []):
-            try:
-                work_item = WorkItemFactory.create_work_item(issue)
-                issues.append(work_item)
-            except Exception:
-                continue
+        issues: list[JiraIssue] | list[JiraIssueSearchRow] = self._build_search_results(
+            response.get('issues', []), compact
+        )
+        if self.work_item_index is not None and issues:
+            self._update_index(self.work_item_index.add, issues)
 
         return APIControllerResponse(
             result=JiraIssueSearchResponse(
@@ -1254,6 +2095,7 @@ class APIController:
             )
         )
 
+    @single_flight
     async def count_issues(
         self,
         project_key: str | None = None,
@@ -1314,6 +2156,7 @@ class APIController:
 
     # Work Items Web Links
 
+    @single_flight
     async def get_issue_remote_links(
         self, issue_key_or_id: str, global_id: str | None = None
     ) -> APIControllerResponse:
@@ -1412,6 +2255,7 @@ class APIController:
             return APIControllerResponse(success=False, error=exception_details.get('message'))
         return APIControllerResponse()
 
+    @single_flight
     async def global_settings(self) -> APIControllerResponse:
         """Retrieves the global settings of the Jira instance.
 
@@ -1451,6 +2295,7 @@ class APIController:
             )
         )
 
+    @single_flight
     async def server_info(self) -> APIControllerResponse:
         """Retrieves details of the Jira server instance.
 
@@ -1484,6 +2329,7 @@ class APIController:
             )
         )
 
+    @single_flight
     async def myself(self) -> APIControllerResponse:
         """Retrieves details of the Jira user connecting to the API.
 
@@ -1530,6 +2376,7 @@ class APIController:
             )
         )
 
+    @single_flight
     async def get_edit_metadata_for_issue(self, issue_key_or_id: str) -> dict:
         """Retrieves the metadata relevant for editing a work item.
 
@@ -1869,6 +2716,16 @@ class APIController:
                     },
                 )
                 return APIControllerResponse(success=False, error=exception_details.get('message'))
+            finally:
+                # the old and the new parent list the work item as a subtask; the work item may only
+                # provide its key, so the invalidation must not raise an error
+                self._invalidate_work_items(
+                    issue.key,
+                    getattr(issue, 'id', None),
+                    getattr(issue, 'parent_key', None),
+                    updates.get(JiraWorkItemFields.PARENT.value),
+                )
+            await self._refresh_project_mirror(issue.key)
             updated_fields: list[str] = []
             if fields := response.get('fields', {}):
                 updated_fields = list(fields.keys())
@@ -1877,6 +2734,7 @@ class APIController:
             )
         return APIControllerResponse(result=UpdateWorkItemResponse(success=True))
 
+    @single_flight
     async def transitions(self, issue_id_or_key: str) -> APIControllerResponse:
         """Retrieves the applicable (status) transitions of a work item.
 
@@ -1960,10 +2818,14 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_id_or_key)
+        await self._refresh_project_mirror(issue_id_or_key)
         return APIControllerResponse()
 
     # Comments
 
+    @single_flight
     async def get_comment(self, issue_key_or_id: str, comment_id: str) -> APIControllerResponse:
         """Retrieves the details of a comment.
 
@@ -2013,6 +2875,7 @@ class APIController:
             )
         )
 
+    @single_flight
     async def get_comments(
         self,
         issue_key_or_id: str,
@@ -2069,6 +2932,44 @@ class APIController:
             )
         return APIControllerResponse(result=comments)
 
+    @single_flight
+    async def list_all_comments(self, issue_key_or_id: str) -> APIControllerResponse:
+        """Retrieves all the comments of a work item.
+
+        The first page of comments reports the total number of comments; the remaining pages are then fetched
+        concurrently.
+
+        Args:
+            issue_key_or_id: the case-sensitive key or id of a work item.
+
+        Returns:
+            An instance of `APIControllerResponse` with the list of `IssueComment` instances in the `result` key;
+            `success=False` and the detail of the error if one occurs.
+        """
+        paginator = OffsetPaginator(
+            lambda offset, limit: self.api.get_comments(issue_key_or_id, offset, limit),
+            page_size=RECORDS_PER_PAGE_LIST_COMMENTS,
+            items_key='comments',
+            max_concurrency=MAXIMUM_CONCURRENT_PAGES_LIST_COMMENTS,
+        )
+        try:
+            raw_comments: list[dict] = await paginator.collect()
+        except Exception as e:
+            exception_details: dict = self._extract_exception_details(e)
+            self.logger.error(
+                'Unable to fetch comments',
+                extra={
+                    'issue_key_or_id': issue_key_or_id,
+                    'offset': paginator.offset,
+                    **exception_details.get('extra', {}),
+                },
+            )
+            return APIControllerResponse(success=False, error=exception_details.get('message'))
+        comments: list[IssueComment] = build_comments(raw_comments)
+        if self.work_item_index is not None:
+            self._update_index(self.work_item_index.set_comments, issue_key_or_id, comments)
+        return APIControllerResponse(result=comments)
+
     def _convert_comment_message_to_adf(self, message: str) -> dict:
         try:
             return convert_markdown_to_adf(message)
@@ -2105,6 +3006,8 @@ class APIController:
                 extra={'issue_key_or_id': issue_key_or_id, **exception_details.get('extra', {})},
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
         author = response.get('author', {})
         update_author = response.get('updateAuthor')
         comment = IssueComment(
@@ -2152,6 +3055,8 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
         return APIControllerResponse()
 
     # Work Items Links
@@ -2195,6 +3100,8 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(left_issue_key, right_issue_key)
 
     async def delete_issue_link(self, link_id: str) -> APIControllerResponse:
         """Deletes the link between 2 work items.
@@ -2218,8 +3125,12 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            # the work items of the link are unknown
+            self._invalidate_work_items()
         return APIControllerResponse()
 
+    @single_flight
     async def issue_link_types(self) -> APIControllerResponse:
         """Retrieves the types of links that can be created between 2 work items.
 
@@ -2248,23 +3159,30 @@ class APIController:
             )
         return APIControllerResponse(result=link_types)
 
+    @single_flight
     async def get_issue_create_metadata(
         self,
         project_id_or_key: str,
         issue_type_id: str,
+        cached: bool = False,
     ) -> APIControllerResponse:
         """Retrieves the metadata relevant for creating work items of a project and of a certain type.
 
         Args:
             project_id_or_key: the (case-sensitive) key of the project.
             issue_type_id: the ID of the type of work item.
+            cached: if `True` the metadata stored in the persistent cache (if any) is returned.
 
         Returns:
             An instance of `APIControllerResponse(success=True)` with the metadata;
             `APIControllerResponse(success=False)` if there is an error.
         """
         try:
-            response = await self.api.get_issue_create_meta(project_id_or_key, issue_type_id)
+            response = await self._fetch_metadata(
+                f'createmeta-{project_id_or_key}-{issue_type_id}',
+                lambda: self.api.get_issue_create_meta(project_id_or_key, issue_type_id),
+                cached=cached,
+            )
             return APIControllerResponse(result=response)
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
@@ -2278,6 +3196,7 @@ class APIController:
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
 
+    @single_flight
     async def get_required_fields_for_issue_type(
         self, project_key: str, issue_type_id: str
     ) -> APIControllerResponse:
@@ -2285,7 +3204,10 @@ class APIController:
 
         ```{Note}
         Results are cached in memory for the lifetime of the APIController instance. The cache uses
-        `{project_key}:{issue_type_id}` as the key and has no explicit invalidation mechanism.
+        `{project_key}:{issue_type_id}` as the key and has no explicit invalidation mechanism. The metadata used to
+        find the required fields is also read from the persistent metadata cache (if enabled), so the fields are
+        available across launches of the application until the entry expires. Metadata read from the persistent
+        cache is fetched again in the background and, the fields found in it replace the cached ones.
         ```
 
         Args:
@@ -2304,9 +3226,19 @@ class APIController:
         if cache_key in self._required_fields_cache:
             return APIControllerResponse(result=self._required_fields_cache[cache_key])
 
+        def update_required_fields(revalidated_metadata: dict) -> None:
+            self._required_fields_cache[cache_key] = parse_required_fields_from_meta(
+                revalidated_metadata
+            )
+
         # fetch from API
         try:
-            metadata = await self.api.get_issue_create_meta(project_key, issue_type_id)
+            metadata = await self._fetch_metadata(
+                f'createmeta-{project_key}-{issue_type_id}',
+                lambda: self.api.get_issue_create_meta(project_key, issue_type_id),
+                cached=True,
+                on_revalidated=update_required_fields,
+            )
             required_fields = parse_required_fields_from_meta(metadata)
             self._required_fields_cache[cache_key] = required_fields
             return APIControllerResponse(result=required_fields)
@@ -2444,22 +3376,29 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=error_message)
+        finally:
+            # the parent lists the new work item as a subtask
+            self._invalidate_work_items(data.get('parent_key'))
+        if key := result.get('key'):
+            await self._refresh_project_mirror(key)
         return APIControllerResponse(
             result=JiraBaseIssue(id=result.get('id'), key=result.get('key'))
         )
 
     # Attachments
 
-    def add_attachment(self, issue_key_or_id: str, filename: str) -> APIControllerResponse:
-        """Adds a file attachment to a work item.
+    def _validate_attachment_file(
+        self, filename: str, maximum_size: int = ATTACHMENT_MAXIMUM_FILE_SIZE_IN_BYTES
+    ) -> APIControllerResponse | None:
+        """Checks that a file can be attached to a work item.
 
         Args:
-            issue_key_or_id: the case-sensitive key or id of a work item.
             filename: the name of the file to attach.
+            maximum_size: the maximum size (in bytes) of the file.
 
         Returns:
-            An instance of `APIControllerResponse` with the details of the attachment in the `result key; `success=False`
-            and the detail of the error if the file can not be attached.
+            `None` if the file can be attached; otherwise an instance of `APIControllerResponse` with `success=False`
+            and the reason.
         """
         if not filename:
             return APIControllerResponse(
@@ -2480,18 +3419,55 @@ class APIController:
             )
             return APIControllerResponse(success=False, error='The path provided is not a file.')
 
-        if (stats := file_path.stat()) and stats.st_size > ATTACHMENT_MAXIMUM_FILE_SIZE_IN_BYTES:
+        if (stats := file_path.stat()) and stats.st_size > maximum_size:
             self.logger.error(
                 'Add attachment: file size exceeds the maximum allowed.',
                 extra={
                     'file_path': file_path,
                     'size': stats.st_size,
-                    'allowed': ATTACHMENT_MAXIMUM_FILE_SIZE_IN_BYTES,
+                    'allowed': maximum_size,
                 },
             )
             return APIControllerResponse(
                 success=False, error='The file provided is larger than the maximum allowed size.'
             )
+        return None
+
+    @staticmethod
+    def _build_attachment(data: dict) -> Attachment:
+        creator = None
+        if author := data.get('author'):
+            creator = JiraUser(
+                account_id=author.get('accountId'),
+                active=author.get('active'),
+                display_name=author.get('displayName'),
+                email=author.get('emailAddress'),
+            )
+        return Attachment(
+            id=data.get('id'),
+            filename=data.get('filename'),
+            size=data.get('size'),
+            mime_type=data.get('mimeType'),
+            created=isoparse(data.get('created')) if data.get('created') else None,
+            author=creator,
+        )
+
+    def add_attachment(self, issue_key_or_id: str, filename: str) -> APIControllerResponse:
+        """Adds a file attachment to a work item.
+
+        This blocks until the file is uploaded. Use `upload_attachment()` to upload files without blocking the event
+        loop.
+
+        Args:
+            issue_key_or_id: the case-sensitive key or id of a work item.
+            filename: the name of the file to attach.
+
+        Returns:
+            An instance of `APIControllerResponse` with the details of the attachment in the `result key; `success=False`
+            and the detail of the error if the file can not be attached.
+        """
+        if (invalid_file_response := self._validate_attachment_file(filename)) is not None:
+            return invalid_file_response
 
         head, name = os.path.split(filename)
         mime_type, type_encoding = mimetypes.guess_type(filename)
@@ -2510,26 +3486,56 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
-        else:
-            creator = None
-            if author := response[0].get('author'):
-                creator = JiraUser(
-                    account_id=author.get('accountId'),
-                    active=author.get('active'),
-                    display_name=author.get('displayName'),
-                    email=author.get('emailAddress'),
-                )
-            attachment = Attachment(
-                id=response[0].get('id'),
-                filename=response[0].get('filename'),
-                size=response[0].get('size'),
-                mime_type=response[0].get('mimeType'),
-                created=isoparse(response[0].get('created'))
-                if response[0].get('created')
-                else None,
-                author=creator,
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
+        return APIControllerResponse(result=self._build_attachment(response[0]))
+
+    async def upload_attachment(
+        self,
+        issue_key_or_id: str,
+        filename: str,
+        on_progress: UploadProgressCallback | None = None,
+    ) -> APIControllerResponse:
+        """Adds a file attachment to a work item streaming the content of the file.
+
+        The file is read and sent in chunks, so large files are not loaded into memory and the event loop is not
+        blocked. Several files can be uploaded concurrently and cancelling the task that awaits this coroutine aborts
+        the upload.
+
+        Args:
+            issue_key_or_id: the case-sensitive key or id of a work item.
+            filename: the name of the file to attach.
+            on_progress: an optional function that receives the number of bytes sent and the size of the file.
+
+        Returns:
+            An instance of `APIControllerResponse` with the details of the attachment in the `result key; `success=False`
+            and the detail of the error if the file can not be attached.
+        """
+        if (
+            invalid_file_response := self._validate_attachment_file(
+                filename, ATTACHMENT_STREAMED_UPLOAD_MAXIMUM_FILE_SIZE_IN_BYTES
             )
-        return APIControllerResponse(result=attachment)
+        ) is not None:
+            return invalid_file_response
+
+        try:
+            response: list[dict] = await self.api.upload_attachment_to_issue(
+                issue_key_or_id, filename, os.path.basename(filename), on_progress=on_progress
+            )
+        except Exception as e:
+            exception_details: dict = self._extract_exception_details(e)
+            self.logger.error(
+                'Unable to attach files',
+                extra={
+                    'issue_key_or_id': issue_key_or_id,
+                    'filename': filename,
+                    **exception_details.get('extra', {}),
+                },
+            )
+            return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
+        return APIControllerResponse(result=self._build_attachment(response[0]))
 
     async def delete_attachment(self, attachment_id: str) -> APIControllerResponse:
         """Deletes an attachment.
@@ -2552,6 +3558,11 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            # the work item of the attachment is unknown
+            self._invalidate_work_items()
+        if self.attachment_cache is not None:
+            self.attachment_cache.delete(attachment_id)
         return APIControllerResponse()
 
     async def get_attachment_content(self, attachment_id: str) -> APIControllerResponse:
@@ -2580,8 +3591,54 @@ class APIController:
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
 
+    async def download_attachment(
+        self, attachment_id: str, size: int | None = None
+    ) -> APIControllerResponse:
+        """Downloads an attachment to the persistent cache of attachments.
+
+        Attachments that are already in the cache are not downloaded again. If the cache is disabled the content of
+        the attachment is downloaded into memory instead.
+
+        Args:
+            attachment_id: the ID of the attachment.
+            size: the size (in bytes) of the attachment. If it is not provided it is retrieved from the server.
+
+        Returns:
+            An instance of `APIControllerResponse` with the `Path` of the downloaded file (or the bytes representation
+            of the attached file if the cache is disabled) or, an error if the file can not be downloaded.
+        """
+        if self.attachment_cache is None:
+            return await self.get_attachment_content(attachment_id)
+        try:
+            if size is None:
+                attachment: dict = await self.api.get_attachment(attachment_id)
+                size = int(attachment.get('size', 0))
+            if (downloaded_file := self.attachment_cache.get(attachment_id, size)) is None:
+                downloaded_file = await self.api.download_attachment_content(
+                    attachment_id, self.attachment_cache.get_file(attachment_id, size)
+                )
+                if downloaded_file is None:
+                    return APIControllerResponse(
+                        success=False, error='The attachment can not be downloaded'
+                    )
+                await asyncio.to_thread(self.attachment_cache.evict, keep=downloaded_file)
+            return APIControllerResponse(result=downloaded_file)
+        except Exception as e:
+            exception_details: dict = self._extract_exception_details(e)
+            self.logger.error(
+                'An error occurred while trying to download an attachment',
+                extra={
+                    'cloud': self.config.cloud,
+                    'error_message': str(e),
+                    'attachment_id': attachment_id,
+                    **exception_details.get('extra', {}),
+                },
+            )
+            return APIControllerResponse(success=False, error=exception_details.get('message'))
+
     # Worklogs
 
+    @single_flight
     async def get_work_item_worklog(
         self,
         issue_key_or_id: str,
@@ -2594,6 +3651,9 @@ class APIController:
         The author and update author information depends on whether the toll uses Jira DC API, Jira Cloud API v2 or v3.
         ```
 
+        If neither `offset` nor `limit` are set then every entry of the work log is retrieved: the first page reports
+        the total number of entries and the remaining pages are then fetched concurrently.
+
         Args:
             issue_key_or_id: the case-sensitive key or id of a work item.
             offset: the index of the first item to return in a page of results (page offset).
@@ -2604,7 +3664,24 @@ class APIController:
             `APIControllerResponse(success=False)` if there is an error.
         """
         try:
-            response: dict = await self.api.get_issue_work_log(issue_key_or_id, offset, limit)
+            if offset is None and limit is None:
+                paginator = OffsetPaginator(
+                    lambda start_at, max_results: self.api.get_issue_work_log(
+                        issue_key_or_id, start_at, max_results
+                    ),
+                    page_size=RECORDS_PER_PAGE_LIST_WORKLOGS,
+                    items_key='worklogs',
+                    max_concurrency=MAXIMUM_CONCURRENT_PAGES_LIST_WORKLOGS,
+                )
+                worklogs: list[dict] = await paginator.collect()
+                response: dict = {
+                    'worklogs': worklogs,
+                    'startAt': 0,
+                    'maxResults': len(worklogs),
+                    'total': len(worklogs),
+                }
+            else:
+                response = await self.api.get_issue_work_log(issue_key_or_id, offset, limit)
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error(
@@ -2720,6 +3797,8 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
 
         update_author = None
         if value := response.get('updateAuthor'):
@@ -2783,6 +3862,8 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_id_or_key)
         return APIControllerResponse()
 
     async def update_worklog(
@@ -2842,6 +3923,8 @@ class APIController:
                 },
             )
             return APIControllerResponse(success=False, error=exception_details.get('message'))
+        finally:
+            self._invalidate_work_items(issue_key_or_id)
 
         update_author = None
         if value := response.get('updateAuthor'):
@@ -2882,15 +3965,22 @@ class APIController:
             )
         )
 
-    async def get_fields(self, field_name: str | None = None) -> APIControllerResponse:
+    @single_flight
+    async def get_fields(
+        self, field_name: str | None = None, cached: bool = False
+    ) -> APIControllerResponse:
         """Retrieves system and custom issue fields.
 
+        Args:
+            field_name: the (case-insensitive) name of a field to filter the results by.
+            cached: if `True` the fields stored in the persistent cache (if any) are returned.
+
         Returns:
             `APIControllerResponse(success=True, result=fields)` if the operation was successful;
             `APIControllerResponse(success=False)` if there is an error.
         """
         try:
-            response = await self.api.get_fields()
+            response = await self._fetch_metadata('fields', self.api.get_fields, cached=cached)
         except Exception as e:
             exception_details: dict = self._extract_exception_details(e)
             self.logger.error('Unable to fetch fields', extra=exception_details.get('extra'))
@@ -3031,6 +4121,8 @@ class APIController:
             return APIControllerResponse(
                 result=UpdateWorkItemResponse(success=True, updated_fields=updated_fields)
             )
+        finally:
+            self._invalidate_work_items(issue_id_or_key)
 
     async def get_jql_autocomplete_suggestions(
         self,
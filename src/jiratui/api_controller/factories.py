@@ -1,5 +1,6 @@
-from datetime import datetime
-from typing import Any
+import dataclasses
+from datetime import date, datetime
+from typing import Any, Callable
 
 from dateutil.parser import isoparse  # type:ignore[import-untyped]
 
@@ -11,6 +12,7 @@ from jiratui.models import (
     IssueType,
     JiraIssue,
     JiraIssueComponent,
+    JiraIssueSearchRow,
     JiraUser,
     JiraWorkItemFields,
     Project,
@@ -25,6 +27,10 @@ class WorkItemFactory:
     def create_work_item(data: dict) -> JiraIssue:
         """Creates an instance of [JiraIssue](#jiratui.models.JiraIssue) from the work item data as returned by the API.
 
+        Only the attributes that are cheap to extract are set when the work item is created. Comments, related work
+        items, attachments, components, time tracking, custom and additional fields and dates are built from the data
+        the first time they are accessed. See [LazyJiraIssue](#jiratui.api_controller.factories.LazyJiraIssue).
+
         Args:
             data: the work item data as returned by the API.
 
@@ -44,61 +50,8 @@ class WorkItemFactory:
             else None
         )
 
-        tracking = None
-        if time_tracking := fields.get(JiraWorkItemFields.TIME_TRACKING.value):
-            tracking = TimeTracking(
-                original_estimate=time_tracking.get('originalEstimate'),
-                remaining_estimate=time_tracking.get('remainingEstimate'),
-                time_spent=time_tracking.get('timeSpent'),
-                original_estimate_seconds=time_tracking.get('originalEstimateSeconds'),
-                remaining_estimate_seconds=time_tracking.get('remainingEstimateSeconds'),
-                time_spent_seconds=time_tracking.get('timeSpentSeconds'),
-            )
-
-        attachments: list[Attachment] = []
-        for item in fields.get(JiraWorkItemFields.ATTACHMENT.value, []):
-            creator = None
-            if author := item.get('author'):
-                creator = JiraUser(
-                    account_id=author.get('accountId'),
-                    active=author.get('active'),
-                    display_name=author.get('displayName'),
-                    email=author.get('emailAddress'),
-                )
-            attachments.append(
-                Attachment(
-                    id=item.get('id'),
-                    filename=item.get('filename'),
-                    size=item.get('size'),
-                    created=isoparse(item.get('created')) if item.get('created') else None,
-                    mime_type=item.get('mimeType'),
-                    author=creator,
-                )
-            )
-
-        # extract the components
-        components: list[JiraIssueComponent] = []
-        for component in fields.get(JiraWorkItemFields.COMPONENTS.value, []) or []:
-            components.append(
-                JiraIssueComponent(
-                    id=component.get('id'),
-                    name=component.get('name'),
-                    description=component.get('description'),
-                )
-            )
-
-        # extract the value of the issue's custom fields
-        custom_fields_values: dict[str, Any] | None = None
-        if edit_meta := data.get('editmeta', {}):
-            custom_fields_values = get_custom_fields_values(fields, edit_meta.get('fields', {}))
-
-        # extract the value of the issue's additional fields
-        additional_fields: dict[str, Any] = get_additional_fields_values(
-            fields,
-            [item.value for item in JiraWorkItemFields],
-        )
-
-        return JiraIssue(
+        return LazyJiraIssue(
+            data,
             id=str(data.get('id')),
             key=str(data.get('key')),
             summary=fields.get(JiraWorkItemFields.SUMMARY.value, ''),
@@ -110,16 +63,6 @@ class WorkItemFactory:
             )
             if project
             else None,
-            created=(
-                isoparse(fields.get(JiraWorkItemFields.CREATED.value))
-                if fields.get(JiraWorkItemFields.CREATED.value)
-                else None
-            ),
-            updated=(
-                isoparse(fields.get(JiraWorkItemFields.UPDATED.value))
-                if fields.get(JiraWorkItemFields.UPDATED.value)
-                else None
-            ),
             priority=IssuePriority(
                 id=priority.get('id'),
                 name=priority.get('name'),
@@ -150,38 +93,221 @@ class WorkItemFactory:
                     'hierarchyLevel'
                 ),
             ),
-            comments=build_comments(
-                fields.get(JiraWorkItemFields.COMMENT.value, {}).get('comments', [])
-            ),
-            related_issues=build_related_work_items(
-                fields.get(JiraWorkItemFields.ISSUE_LINKS.value, [])
-            ),
             parent_issue_key=parent_issue_key,
-            time_tracking=tracking,
             resolution=(
                 fields.get(JiraWorkItemFields.RESOLUTION.value).get('name')
                 if fields.get(JiraWorkItemFields.RESOLUTION.value)
                 else None
             ),
-            resolution_date=isoparse(fields.get(JiraWorkItemFields.RESOLUTION_DATE.value))
-            if fields.get(JiraWorkItemFields.RESOLUTION_DATE.value)
-            else None,
             labels=fields.get(JiraWorkItemFields.LABELS.value, [])
             if fields.get(JiraWorkItemFields.LABELS.value)
             else None,
-            attachments=attachments,
             edit_meta=data.get('editmeta', {}),
-            due_date=datetime.strptime(
-                fields.get(JiraWorkItemFields.DUE_DATE.value), '%Y-%m-%d'
-            ).date()
-            if fields.get(JiraWorkItemFields.DUE_DATE.value)
-            else None,
-            custom_fields=custom_fields_values,
-            additional_fields=additional_fields,
-            components=components,
             environment=fields.get(JiraWorkItemFields.ENVIRONMENT.value),
         )
 
+    @staticmethod
+    def create_search_row(data: dict) -> JiraIssueSearchRow:
+        """Creates an instance of [JiraIssueSearchRow](#jiratui.models.JiraIssueSearchRow) from the work item data as
+        returned by the API.
+
+        Args:
+            data: the work item data as returned by the API.
+
+        Returns:
+            An instance of `JiraIssueSearchRow` with the fields displayed in the list of search results.
+        """
+
+        fields: dict[str, Any] = data.get('fields', {})
+        status: dict = fields.get(JiraWorkItemFields.STATUS.value) or {}
+        issue_type: dict = fields.get(JiraWorkItemFields.ISSUE_TYPE.value) or {}
+        parent: dict = fields.get(JiraWorkItemFields.PARENT.value) or {}
+        assignee: dict = fields.get(JiraWorkItemFields.ASSIGNEE.value) or {}
+        return JiraIssueSearchRow(
+            id=str(data.get('id')),
+            key=str(data.get('key')),
+            summary=fields.get(JiraWorkItemFields.SUMMARY.value) or '',
+            status_id=str(status['id']) if status.get('id') is not None else None,
+            status_name=status.get('name') or '',
+            work_item_type_name=issue_type.get('name') or '',
+            parent_issue_key=parent.get('key'),
+            assignee_display_name=assignee.get('displayName') or '',
+            labels=fields.get(JiraWorkItemFields.LABELS.value) or None,
+        )
+
+
+class _LazyAttribute:
+    """A descriptor that builds the value of an attribute of a `LazyJiraIssue` from the work item data.
+
+    The value is stored in the instance the first time it is read. Since the descriptor does not define `__set__`
+    the stored value takes precedence over the descriptor, so it is built only once and it can be replaced as usual.
+    """
+
+    def __init__(self, build: Callable[[dict], Any]):
+        self.build = build
+        self.name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        lazy_attributes: tuple[str, ...] = getattr(owner, '_lazy_attributes', ())
+        owner._lazy_attributes = (*lazy_attributes, name)  # type:ignore[attr-defined]
+
+    def __get__(self, instance: 'LazyJiraIssue | None', owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value = self.build(instance._data)
+        instance.__dict__[self.name] = value
+        instance._release_data()
+        return value
+
+
+def _get_fields(data: dict) -> dict[str, Any]:
+    return data.get('fields', {})
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return isoparse(value) if value else None
+
+
+def _build_datetime(field: JiraWorkItemFields) -> Callable[[dict], datetime | None]:
+    return lambda data: _parse_datetime(_get_fields(data).get(field.value))
+
+
+def _build_due_date(data: dict) -> date | None:
+    if due_date := _get_fields(data).get(JiraWorkItemFields.DUE_DATE.value):
+        return datetime.strptime(due_date, '%Y-%m-%d').date()
+    return None
+
+
+def _build_comments(data: dict) -> list[IssueComment]:
+    return build_comments(
+        _get_fields(data).get(JiraWorkItemFields.COMMENT.value, {}).get('comments', [])
+    )
+
+
+def _build_related_work_items(data: dict) -> list[RelatedJiraIssue]:
+    return build_related_work_items(_get_fields(data).get(JiraWorkItemFields.ISSUE_LINKS.value, []))
+
+
+def _build_time_tracking(data: dict) -> TimeTracking | None:
+    if time_tracking := _get_fields(data).get(JiraWorkItemFields.TIME_TRACKING.value):
+        return TimeTracking(
+            original_estimate=time_tracking.get('originalEstimate'),
+            remaining_estimate=time_tracking.get('remainingEstimate'),
+            time_spent=time_tracking.get('timeSpent'),
+            original_estimate_seconds=time_tracking.get('originalEstimateSeconds'),
+            remaining_estimate_seconds=time_tracking.get('remainingEstimateSeconds'),
+            time_spent_seconds=time_tracking.get('timeSpentSeconds'),
+        )
+    return None
+
+
+def _build_attachments(data: dict) -> list[Attachment]:
+    attachments: list[Attachment] = []
+    for item in _get_fields(data).get(JiraWorkItemFields.ATTACHMENT.value, []):
+        creator = None
+        if author := item.get('author'):
+            creator = JiraUser(
+                account_id=author.get('accountId'),
+                active=author.get('active'),
+                display_name=author.get('displayName'),
+                email=author.get('emailAddress'),
+            )
+        attachments.append(
+            Attachment(
+                id=item.get('id'),
+                filename=item.get('filename'),
+                size=item.get('size'),
+                created=_parse_datetime(item.get('created')),
+                mime_type=item.get('mimeType'),
+                author=creator,
+            )
+        )
+    return attachments
+
+
+def _build_components(data: dict) -> list[JiraIssueComponent]:
+    components: list[JiraIssueComponent] = []
+    for component in _get_fields(data).get(JiraWorkItemFields.COMPONENTS.value, []) or []:
+        components.append(
+            JiraIssueComponent(
+                id=component.get('id'),
+                name=component.get('name'),
+                description=component.get('description'),
+            )
+        )
+    return components
+
+
+def _build_custom_fields(data: dict) -> dict[str, Any] | None:
+    # extract the value of the issue's custom fields
+    if edit_meta := data.get('editmeta', {}):
+        return get_custom_fields_values(_get_fields(data), edit_meta.get('fields', {}))
+    return None
+
+
+def _build_additional_fields(data: dict) -> dict[str, Any]:
+    # extract the value of the issue's additional fields
+    return get_additional_fields_values(
+        _get_fields(data),
+        [item.value for item in JiraWorkItemFields],
+    )
+
+
+class LazyJiraIssue(JiraIssue):
+    """A [JiraIssue](#jiratui.models.JiraIssue) whose expensive attributes are built on first access.
+
+    The instance keeps the data of the work item as returned by the API. The comments, related work items,
+    attachments, components, time tracking, custom and additional fields and dates are not built when the instance is
+    created; the first time one of them is read it is built from the data and stored in the instance. Once every one
+    of them is built the data of the work item is released.
+
+    Search results only display a few attributes of every work item so, e.g. the comments, the attachments or the
+    custom fields of a work item are never built unless the work item is selected.
+    """
+
+    _lazy_attributes: tuple[str, ...] = ()
+    """The names of the attributes built on first access; filled in by `_LazyAttribute`."""
+
+    created = _LazyAttribute(_build_datetime(JiraWorkItemFields.CREATED))
+    updated = _LazyAttribute(_build_datetime(JiraWorkItemFields.UPDATED))
+    resolution_date = _LazyAttribute(_build_datetime(JiraWorkItemFields.RESOLUTION_DATE))
+    due_date = _LazyAttribute(_build_due_date)
+    comments = _LazyAttribute(_build_comments)
+    related_issues = _LazyAttribute(_build_related_work_items)
+    time_tracking = _LazyAttribute(_build_time_tracking)
+    attachments = _LazyAttribute(_build_attachments)
+    components = _LazyAttribute(_build_components)
+    custom_fields = _LazyAttribute(_build_custom_fields)
+    additional_fields = _LazyAttribute(_build_additional_fields)
+
+    def __init__(self, data: dict, **attributes: Any):
+        """Initializes the work item.
+
+        Args:
+            data: the work item data as returned by the API.
+            **attributes: the value of the attributes of the work item that are not built lazily.
+        """
+        # JiraIssue.__init__() is not called because it would set every attribute
+        self._data = data
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    def _release_data(self) -> None:
+        if all(name in self.__dict__ for name in self._lazy_attributes):
+            self._data = {}
+
+    def __eq__(self, other: object) -> bool:
+        # the equality generated by the dataclass requires both instances to be of the same class
+        if not isinstance(other, JiraIssue):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in dataclasses.fields(JiraIssue)
+        )
+
+    __hash__ = None  # type:ignore[assignment]
+
 
 def build_comments(raw_comments: list[dict]) -> list[IssueComment]:
     """Builds a list of [IssueComment](#jiratui.models.IssueComment).
@@ -0,0 +1,128 @@
+"""Coalescing of identical requests of the controller that are in flight at the same time.
+
+Several widgets can ask for the same data at the same moment, e.g. the statuses of a project are retrieved by the main
+screen and by the details of a work item when the user selects a work item. `SingleFlight` runs a single call for all
+the identical calls that are in flight concurrently and hands its result to all of them. Calls that start after the
+shared call has finished send their own request.
+
+When a call is shared every caller receives its own copy of the result, so that they can modify it without affecting
+each other.
+The shared call is cancelled only when every caller waiting for it has been cancelled. After an update of the data in
+the server, `SingleFlight.clear()` stops sharing the calls in flight, so that later calls do not receive data retrieved
+before the update.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        self.joined = False
+
+
+class SingleFlight:
+    """Runs a single call for the identical calls that are in flight at the same time."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @staticmethod
+    def build_key(name: str, *args: Any, **kwargs: Any) -> Hashable | None:
+        """Builds the key that identifies a call.
+
+        Args:
+            name: the name of the operation.
+            *args: the positional arguments of the call.
+            **kwargs: the keyword arguments of the call.
+
+        Returns:
+            The key or `None` if the arguments can not be used to identify the call, e.g. they are not hashable.
+        """
+        key = (name, _freeze(args), _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    async def run(self, key: Hashable | None, call: Callable[[], Awaitable[T]]) -> T:
+        """Runs a call or, joins the identical call that is in flight.
+
+        Args:
+            key: the key that identifies the call. If it is `None` the call is never shared.
+            call: a function that starts the call.
+
+        Returns:
+            The result of the call. If other callers joined the call, every caller receives a copy of the result.
+        """
+        if key is None:
+            return await call()
+        shared = self._calls.get(key)
+        if shared is None:
+            shared = _Call(asyncio.ensure_future(call()))
+            self._calls[key] = shared
+            shared.task.add_done_callback(functools.partial(self._discard, key))
+        else:
+            shared.joined = True
+        shared.waiters += 1
+        try:
+            result = await asyncio.shield(shared.task)
+        except asyncio.CancelledError:
+            if not shared.task.done() and shared.waiters == 1:
+                shared.task.cancel()
+            raise
+        finally:
+            shared.waiters -= 1
+        # the result of the task is never handed out, so that every caller copies the same data
+        return copy.deepcopy(result) if shared.joined else result
+
+    def clear(self) -> None:
+        """Stops sharing the calls in flight. They finish for the callers that already joined them."""
+        self._calls.clear()
+
+    def _discard(self, key: Hashable, task: asyncio.Task) -> None:
+        if (shared := self._calls.get(key)) is not None and shared.task is task:
+            del self._calls[key]
+
+
+def single_flight(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorates a method of `APIController` so that identical calls in flight at the same time share one call.
+
+    Only methods that do not modify anything in the Jira server can be decorated.
+    """
+
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        try:
+            # the same call can pass its arguments by position or by name
+            bound = signature.bind(self, *args, **kwargs)
+        except TypeError:
+            return await method(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        key = SingleFlight.build_key(method.__name__, **arguments)
+        return await self.single_flight.run(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
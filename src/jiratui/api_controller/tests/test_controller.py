@@ -1,3 +1,5 @@
+import asyncio
+import copy
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, call, patch
 
@@ -6,7 +8,10 @@ import pytest
 from jiratui.api.api import JiraAPI, JiraDataCenterAPI, JiraSoftwareCloudAPI
 from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.api_controller.factories import WorkItemFactory
+from jiratui.api_controller.work_item_cache import WorkItemCache
+from jiratui.config import ProjectMirrorConfiguration
 from jiratui.exceptions import (
+    APIException,
     ServiceInvalidResponseException,
     ServiceUnavailableException,
     UpdateWorkItemException,
@@ -27,6 +32,7 @@ from jiratui.models import (
     JiraIssue,
     JiraIssuePickerSuggestion,
     JiraIssueSearchResponse,
+    JiraIssueSearchRow,
     JiraMyselfInfo,
     JiraServerInfo,
     JiraTimeTrackingConfiguration,
@@ -37,8 +43,13 @@ from jiratui.models import (
     PaginatedJiraWorklog,
     Project,
     UpdateWorkItemResponse,
+    WorkItemsSearchOrderBy,
 )
+from jiratui.utils.attachment_cache import AttachmentCache
+from jiratui.utils.metadata_cache import MetadataCache
+from jiratui.utils.project_mirror import ProjectMirror
 from jiratui.utils.test_utilities import load_json_response
+from jiratui.utils.work_item_index import WorkItemIndex
 
 
 @pytest.fixture
@@ -239,6 +250,64 @@ async def test_status_with_error(status_mock: Mock, jira_api_controller: APICont
     status_mock.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'status')
+async def test_status_uses_the_metadata_cache(
+    status_mock: Mock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.metadata_cache = MetadataCache(tmp_path)
+    status_mock.return_value = [{'id': 1, 'name': 'To Do', 'description': 'some description'}]
+    expected = APIControllerResponse(
+        result=[IssueStatus(id='1', name='To Do', description='some description')]
+    )
+    # WHEN
+    assert await jira_api_controller.status(cached=True) == expected
+    assert jira_api_controller.metadata_served_from_cache is False
+    assert await jira_api_controller.status(cached=True) == expected
+    # THEN
+    status_mock.assert_called_once_with()
+    assert jira_api_controller.metadata_served_from_cache is True
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'status')
+async def test_status_refreshes_the_metadata_cache(
+    status_mock: Mock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.metadata_cache = MetadataCache(tmp_path)
+    jira_api_controller.metadata_cache.set('statuses', [{'id': 1, 'name': 'Old'}])
+    status_mock.return_value = [{'id': 1, 'name': 'New'}]
+    # WHEN
+    response = await jira_api_controller.status()
+    # THEN
+    assert response.result == [IssueStatus(id='1', name='New', description=None)]
+    assert jira_api_controller.metadata_cache.get('statuses').data == [{'id': 1, 'name': 'New'}]
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'search_projects')
+async def test_search_projects_uses_the_metadata_cache(
+    search_projects_mock: Mock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.metadata_cache = MetadataCache(tmp_path)
+    search_projects_mock.return_value = {
+        'values': [{'id': '123', 'name': 'a', 'key': '1'}],
+        'isLast': True,
+    }
+    await jira_api_controller.search_projects(keys=['1'])
+    # WHEN
+    response = await jira_api_controller.search_projects(keys=['1'], cached=True)
+    # THEN
+    assert response == APIControllerResponse(result=[Project(id='123', name='a', key='1')])
+    search_projects_mock.assert_called_once()
+    # searches with a query are never cached
+    await jira_api_controller.search_projects(query='a', cached=True)
+    assert search_projects_mock.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_users_in_group')
 async def test_list_active_users_in_group(
@@ -325,6 +394,46 @@ async def test_list_active_users_in_group_sorted_results(
     )
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_users_in_group')
+async def test_list_active_users_in_group_fetches_the_remaining_pages_using_the_total(
+    get_users_in_group_mock: Mock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    def get_users_in_group(group_id: str, offset: int, limit: int) -> dict:
+        return {
+            'values': [
+                {
+                    'accountId': str(offset),
+                    'emailAddress': f'{offset}@a.com',
+                    'displayName': f'user {offset:03}',
+                    'active': True,
+                }
+            ],
+            'startAt': offset,
+            'maxResults': limit,
+            'total': 120,
+            'isLast': offset + limit >= 120,
+        }
+
+    get_users_in_group_mock.side_effect = get_users_in_group
+    # WHEN
+    response = await jira_api_controller.list_all_active_users_in_group('1')
+    # THEN
+    assert response.success is True
+    assert [user.account_id for user in response.result] == ['0', '50', '100']
+    assert get_users_in_group_mock.call_count == 3
+    get_users_in_group_mock.assert_has_calls(
+        [
+            call(group_id='1', offset=0, limit=50),
+            call(group_id='1', offset=50, limit=50),
+            call(group_id='1', offset=100, limit=50),
+        ],
+        any_order=True,
+    )
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_users_in_group')
 async def test_list_active_users_in_group_ignore_inactive_users(
@@ -470,6 +579,28 @@ async def test_get_project_statuses_with_error(
     get_project_statuses_mock.assert_called_once_with('PK1')
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_project_statuses')
+async def test_concurrent_get_project_statuses_share_one_request(
+    get_project_statuses_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    async def get_project_statuses(project_key: str) -> list[dict]:
+        await asyncio.sleep(0)
+        return [{'id': '2', 'name': 'b', 'statuses': []}]
+
+    get_project_statuses_mock.side_effect = get_project_statuses
+    # WHEN
+    responses = await asyncio.gather(
+        jira_api_controller.get_project_statuses('PK1'),
+        jira_api_controller.get_project_statuses(project_key='PK1'),
+    )
+    # THEN
+    assert responses[0] == responses[1]
+    assert responses[0].success is True
+    get_project_statuses_mock.assert_called_once_with('PK1')
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_project')
 async def test_get_issue_types_for_project(
@@ -1389,6 +1520,82 @@ async def test_get_issue_with_additional_parameters(
     )
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue')
+async def test_get_issue_uses_the_work_item_cache(
+    get_issue_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    jira_api_controller.work_item_cache = WorkItemCache(max_size=10, max_age=60)
+    get_issue_mock.return_value = load_json_response(__file__, 'issue.json')
+    # WHEN
+    first_response = await jira_api_controller.get_issue('10002', fields=['*all', '-comment'])
+    second_response = await jira_api_controller.get_issue('10002', fields=['*all', '-comment'])
+    subset_response = await jira_api_controller.get_issue('10002', fields=['summary'])
+    other_fields_response = await jira_api_controller.get_issue('10002', fields=['comment'])
+    # THEN
+    assert first_response.result.issues[0].key == second_response.result.issues[0].key
+    assert subset_response.result.issues[0].key == first_response.result.issues[0].key
+    assert other_fields_response.success is True
+    get_issue_mock.assert_has_calls(
+        [
+            call(issue_id_or_key='10002', fields='*all,-comment', properties=None),
+            call(issue_id_or_key='10002', fields='comment', properties=None),
+        ],
+    )
+    assert get_issue_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'delete_comment')
+@patch.object(JiraAPI, 'get_issue')
+async def test_updating_a_work_item_invalidates_the_work_item_cache(
+    get_issue_mock: Mock, delete_comment_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    jira_api_controller.work_item_cache = WorkItemCache(max_size=10, max_age=60)
+    get_issue_mock.return_value = load_json_response(__file__, 'issue.json')
+    delete_comment_mock.return_value = None
+    response = await jira_api_controller.get_issue('10002')
+    work_item_key = response.result.issues[0].key
+    # WHEN
+    await jira_api_controller.delete_comment(work_item_key, '1')
+    await jira_api_controller.get_issue('10002')
+    # THEN
+    assert get_issue_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'delete_comment')
+@patch.object(JiraAPI, 'get_issue')
+async def test_reads_in_flight_during_an_update_are_not_shared_nor_cached(
+    get_issue_mock: Mock, delete_comment_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    jira_api_controller.work_item_cache = WorkItemCache(max_size=10, max_age=60)
+    release = asyncio.Event()
+
+    async def get_issue(**kwargs) -> dict:
+        await release.wait()
+        return load_json_response(__file__, 'issue.json')
+
+    get_issue_mock.side_effect = get_issue
+    delete_comment_mock.return_value = None
+    read_before_update = asyncio.create_task(jira_api_controller.get_issue('SCRUM-10'))
+    await asyncio.sleep(0)
+    # WHEN
+    await jira_api_controller.delete_comment('SCRUM-10', '1')
+    read_after_update = asyncio.create_task(jira_api_controller.get_issue('SCRUM-10'))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(read_before_update, read_after_update)
+    # THEN
+    assert get_issue_mock.call_count == 2
+    # only the work item retrieved after the update is kept
+    await jira_api_controller.get_issue('SCRUM-10')
+    assert get_issue_mock.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_groups_in_bulk')
 async def test_find_groups(get_groups_in_bulk_mock: Mock, jira_api_controller: APIController):
@@ -1625,6 +1832,216 @@ async def test_search_issues(
     search_issues_mock.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraAPI, 'search_issues')
+async def test_search_issues_with_compact_results(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.return_value = {'issues': [load_json_response(__file__, 'issue.json')]}
+    # WHEN
+    response = await jira_api_controller.search_issues(compact=True)
+    # THEN
+    assert response.success is True
+    assert isinstance(response.result, JiraIssueSearchResponse)
+    assert response.result.issues == [
+        JiraIssueSearchRow(
+            id='10002',
+            key='SCRUM-10',
+            summary='(Sample) Set Up Payment Logging',
+            status_id='10001',
+            status_name='In Progress',
+            work_item_type_name='Task',
+            parent_issue_key='SCRUM-1',
+            assignee_display_name='Bart',
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraAPI, 'search_issues')
+async def test_search_issues_updates_the_work_item_index(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller: APIController,
+    tmp_path,
+):
+    # GIVEN
+    jira_api_controller.work_item_index = WorkItemIndex(tmp_path / 'index.sqlite3')
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.return_value = {'issues': [load_json_response(__file__, 'issue.json')]}
+    # WHEN
+    await jira_api_controller.search_issues(compact=True)
+    await asyncio.gather(*jira_api_controller._indexing_tasks)
+    response = await jira_api_controller.search_work_item_index('payment')
+    # THEN
+    assert response.success is True
+    assert [work_item.key for work_item in response.result.issues] == ['SCRUM-10']
+
+
+@pytest.mark.asyncio
+async def test_search_work_item_index_disabled(jira_api_controller: APIController):
+    # WHEN
+    response = await jira_api_controller.search_work_item_index('payment')
+    # THEN
+    assert response.success is False
+    assert response.error == 'The local index of work items is disabled.'
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'search_issues')
+async def test_sync_project_mirror(
+    search_issues_mock: AsyncMock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.config.project_mirror = ProjectMirrorConfiguration(projects=['SCRUM'])
+    jira_api_controller.project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    search_issues_mock.return_value = {
+        'issues': [load_json_response(__file__, 'issue.json')],
+        'isLast': True,
+    }
+    # WHEN
+    first_response = await jira_api_controller.sync_project_mirror('SCRUM')
+    second_response = await jira_api_controller.sync_project_mirror('SCRUM')
+    # THEN
+    assert first_response.result == 1
+    assert second_response.result == 1
+    # the first synchronization retrieves every work item; the second one only the ones updated since the first
+    first_call, second_call = search_issues_mock.call_args_list
+    assert first_call.kwargs['jql_query'] is None
+    assert first_call.kwargs['order_by'] == WorkItemsSearchOrderBy.KEY_ASC
+    assert second_call.kwargs['jql_query'] == 'updated >= "2025-07-14 22:32" order by updated asc'
+    assert jira_api_controller.project_mirror_covers(project_key='SCRUM') is True
+    response = await jira_api_controller.search_project_mirror('SCRUM', compact=True)
+    assert [work_item.key for work_item in response.result.issues] == ['SCRUM-10']
+    assert response.result.total == 1
+    assert response.result.next_page_token is None
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'search_issues')
+async def test_sync_project_mirror_fails(
+    search_issues_mock: AsyncMock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.config.project_mirror = ProjectMirrorConfiguration(projects=['SCRUM'])
+    jira_api_controller.project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    search_issues_mock.side_effect = ServiceUnavailableException('error')
+    # WHEN
+    response = await jira_api_controller.sync_project_mirror('SCRUM')
+    # THEN
+    assert response.success is False
+    assert jira_api_controller.project_mirror_covers(project_key='SCRUM') is False
+
+
+@pytest.mark.parametrize(
+    'criteria',
+    [
+        {'project_key': 'OTHER'},
+        {'project_key': 'SCRUM', 'jql_query': 'labels = ui'},
+        {'project_key': 'SCRUM', 'search_in_active_sprint': True},
+        {'project_key': 'SCRUM', 'order_by': WorkItemsSearchOrderBy.PRIORITY_ASC},
+    ],
+)
+def test_project_mirror_does_not_cover_the_search(
+    criteria: dict, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.config.project_mirror = ProjectMirrorConfiguration(projects=['SCRUM'])
+    jira_api_controller.project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    jira_api_controller.project_mirror.finish_sync('SCRUM', 1, full=True, last_updated=None)
+    # THEN
+    assert jira_api_controller.project_mirror_covers(project_key='SCRUM') is True
+    assert jira_api_controller.project_mirror_covers(**criteria) is False
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, 'get_issues_bulk')
+@patch.object(JiraAPI, 'search_issues')
+async def test_get_work_item_children_without_mirror(
+    search_issues_mock: AsyncMock,
+    get_issues_bulk_mock: AsyncMock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    search_issues_mock.side_effect = [
+        {'issues': [{'key': 'SCRUM-2'}, {'key': 'SCRUM-3'}], 'nextPageToken': 't1'},
+        {'issues': [{'key': 'SCRUM-4'}], 'isLast': True},
+    ]
+    get_issues_bulk_mock.return_value = APIControllerResponse()
+    # WHEN
+    await jira_api_controller.get_work_item_children('SCRUM-1', fields=['summary'])
+    # THEN
+    assert [call.kwargs['next_page_token'] for call in search_issues_mock.call_args_list] == [
+        None,
+        't1',
+    ]
+    assert search_issues_mock.call_args_list[0].kwargs['jql_query'] == 'parent=SCRUM-1'
+    assert search_issues_mock.call_args_list[0].kwargs['fields'] == ['key']
+    get_issues_bulk_mock.assert_awaited_once_with(
+        ['SCRUM-2', 'SCRUM-3', 'SCRUM-4'], fields=['summary']
+    )
+
+
+@pytest.mark.asyncio
+@patch('jiratui.api_controller.controller.WORK_ITEMS_BULK_FETCH_BATCH_SIZE', 2)
+@patch.object(JiraAPI, 'get_issues_bulk')
+async def test_get_issues_bulk(get_issues_bulk_mock: AsyncMock, jira_api_controller: APIController):
+    # GIVEN
+    issue = load_json_response(__file__, 'issue.json')
+    get_issues_bulk_mock.side_effect = [
+        {'issues': [issue, {**issue, 'id': '10003', 'key': 'SCRUM-11'}]},
+        {'issues': [], 'issueErrors': [{'issueIdsOrKeys': ['SCRUM-99']}]},
+    ]
+    # WHEN
+    response = await jira_api_controller.get_issues_bulk(
+        ['SCRUM-11', 'SCRUM-10', 'SCRUM-11', 'SCRUM-99'], fields=['summary']
+    )
+    # THEN
+    assert response.success is True
+    assert [work_item.key for work_item in response.result.issues] == ['SCRUM-11', 'SCRUM-10']
+    assert [call.args[0] for call in get_issues_bulk_mock.call_args_list] == [
+        ['SCRUM-11', 'SCRUM-10'],
+        ['SCRUM-99'],
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issues_bulk')
+async def test_get_issues_bulk_serves_cached_work_items(
+    get_issues_bulk_mock: AsyncMock, jira_api_controller: APIController
+):
+    # GIVEN
+    jira_api_controller.work_item_cache = WorkItemCache(max_size=10, max_age=60)
+    issue = load_json_response(__file__, 'issue.json')
+    get_issues_bulk_mock.return_value = {'issues': [issue]}
+    await jira_api_controller.get_issues_bulk(['SCRUM-10'], fields=['summary'])
+    # WHEN
+    response = await jira_api_controller.get_issues_bulk(['10002'], fields=['summary'])
+    # THEN
+    assert [work_item.key for work_item in response.result.issues] == ['SCRUM-10']
+    get_issues_bulk_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issues_bulk')
+async def test_get_issues_bulk_fails(
+    get_issues_bulk_mock: AsyncMock, jira_api_controller: APIController
+):
+    # GIVEN
+    get_issues_bulk_mock.side_effect = ValueError('boom')
+    # WHEN
+    response = await jira_api_controller.get_issues_bulk(['SCRUM-10'])
+    # THEN
+    assert response.success is False
+    assert response.error == 'boom'
+
+
 @pytest.mark.asyncio
 @patch.object(APIController, '_build_criteria_for_searching_work_items')
 @patch.object(JiraAPI, 'search_issues')
@@ -1741,6 +2158,148 @@ async def test_search_issues_for_jira_dc(
     )
 
 
+@pytest.mark.parametrize(
+    'page, limit, offset, expected_offset',
+    [(2, 200, None, 200), (3, None, None, 100), (2, 200, 250, 250), (None, 10, -1, 0)],
+)
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraDataCenterAPI, 'search_issues')
+async def test_search_issues_for_jira_dc_with_limit_and_offset(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller_for_jira_dc: APIController,
+    page,
+    limit,
+    offset,
+    expected_offset,
+):
+    # GIVEN
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.return_value = {'startAt': expected_offset, 'total': 1000, 'issues': []}
+    # WHEN
+    response = await jira_api_controller_for_jira_dc.search_issues_by_page_number(
+        page=page, limit=limit, offset=offset
+    )
+    # THEN
+    assert response.success is True
+    assert response.result.offset == expected_offset
+    assert search_issues_mock.call_args.kwargs['offset'] == expected_offset
+    assert search_issues_mock.call_args.kwargs['limit'] == limit
+
+
+def _build_search_page(keys: list[str], **kwargs) -> dict:
+    return {
+        'issues': [{'id': key, 'key': key, 'fields': {'summary': key}} for key in keys],
+        **kwargs,
+    }
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraAPI, 'search_issues')
+async def test_iter_search_issues_prefetches_the_next_page(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.side_effect = [
+        _build_search_page(['A-1', 'A-2'], nextPageToken='t1', isLast=False),
+        _build_search_page(['A-3'], nextPageToken='t2', isLast=False),
+        _build_search_page(['A-4'], isLast=True),
+    ]
+    keys: list[str] = []
+    # WHEN
+    async for work_item in jira_api_controller.iter_search_issues(jql_query='project = A'):
+        if not keys:
+            # let the background task fetch the next page
+            await asyncio.sleep(0.01)
+            # THEN
+            assert search_issues_mock.call_count == 2
+        keys.append(work_item.key)
+    # THEN
+    assert keys == ['A-1', 'A-2', 'A-3', 'A-4']
+    assert search_issues_mock.call_count == 3
+    assert [c.kwargs['next_page_token'] for c in search_issues_mock.call_args_list] == [
+        None,
+        't1',
+        't2',
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraAPI, 'search_issues')
+async def test_iter_search_issues_raises_after_yielding_the_previous_pages(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.side_effect = [
+        _build_search_page(['A-1'], nextPageToken='t1', isLast=False),
+        ServiceUnavailableException('some error'),
+    ]
+    keys: list[str] = []
+    # WHEN
+    with pytest.raises(APIException, match='Unable to connect to the Jira server.'):
+        async for work_item in jira_api_controller.iter_search_issues():
+            keys.append(work_item.key)
+    # THEN
+    assert keys == ['A-1']
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, 'search_issues')
+async def test_iter_search_issues_raises_the_errors_of_the_background_task(
+    search_issues_mock: AsyncMock, jira_api_controller: APIController
+):
+    # GIVEN
+    search_issues_mock.side_effect = [
+        APIControllerResponse(
+            result=Mock(issues=[Mock(key='A-1')], next_page_token='t1', is_last=False)
+        ),
+        ValueError('some error'),
+    ]
+    keys: list[str] = []
+
+    async def consume() -> None:
+        async for work_item in jira_api_controller.iter_search_issues():
+            keys.append(work_item.key)
+
+    # WHEN
+    with pytest.raises(ValueError, match='some error'):
+        await asyncio.wait_for(consume(), 1)
+    # THEN
+    assert keys == ['A-1']
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, '_build_criteria_for_searching_work_items')
+@patch.object(JiraDataCenterAPI, 'search_issues')
+async def test_iter_search_issues_for_jira_dc(
+    search_issues_mock: Mock,
+    build_criteria_for_searching_work_items_mock: Mock,
+    jira_api_controller_for_jira_dc: APIController,
+):
+    # GIVEN
+    build_criteria_for_searching_work_items_mock.return_value = {}
+    search_issues_mock.side_effect = [
+        _build_search_page([f'A-{i}' for i in range(50)], startAt=0, total=51),
+        _build_search_page(['A-50'], startAt=50, total=51),
+    ]
+    # WHEN
+    keys = [
+        work_item.key async for work_item in jira_api_controller_for_jira_dc.iter_search_issues()
+    ]
+    # THEN
+    assert keys == [f'A-{i}' for i in range(51)]
+    assert [c.kwargs['offset'] for c in search_issues_mock.call_args_list] == [0, 50]
+
+
 @pytest.mark.asyncio
 @patch.object(APIController, '_build_criteria_for_searching_work_items')
 @patch.object(JiraAPI, 'work_items_search_approximate_count')
@@ -3184,6 +3743,73 @@ async def test_transition_issue_status(
     transition_issue_mock.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue')
+@patch.object(JiraAPI, 'search_issues')
+@patch.object(JiraAPI, 'transition_issue')
+@patch.object(APIController, 'transitions')
+async def test_transition_issue_status_refreshes_the_project_mirror(
+    transitions_mock: Mock,
+    transition_issue_mock: Mock,
+    search_issues_mock: AsyncMock,
+    get_issue_mock: AsyncMock,
+    transitions: list[IssueTransition],
+    jira_api_controller: APIController,
+    tmp_path,
+):
+    # GIVEN
+    jira_api_controller.config.project_mirror = ProjectMirrorConfiguration(projects=['SCRUM'])
+    jira_api_controller.project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    work_item: dict = load_json_response(__file__, 'issue.json')
+    mirrored_work_item: dict = copy.deepcopy(work_item)
+    mirrored_work_item['fields']['status'] = {'id': '10000', 'name': 'To Do'}
+    search_issues_mock.return_value = {'issues': [mirrored_work_item], 'isLast': True}
+    await jira_api_controller.sync_project_mirror('SCRUM')
+    transitions_mock.return_value = APIControllerResponse(result=transitions)
+    transition_issue_mock.return_value = APIControllerResponse(result=[])
+    get_issue_mock.return_value = work_item
+    # WHEN
+    response = await jira_api_controller.transition_issue_status('SCRUM-10', '3')
+    # THEN
+    assert response.success is True
+    search_response = await jira_api_controller.search_project_mirror('SCRUM', compact=True)
+    assert [work_item.status_name for work_item in search_response.result.issues] == ['In Progress']
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue')
+@patch.object(JiraAPI, 'search_issues')
+@patch.object(JiraAPI, 'transition_issue')
+@patch.object(APIController, 'transitions')
+async def test_transition_issue_status_removes_the_work_item_from_the_project_mirror(
+    transitions_mock: Mock,
+    transition_issue_mock: Mock,
+    search_issues_mock: AsyncMock,
+    get_issue_mock: AsyncMock,
+    transitions: list[IssueTransition],
+    jira_api_controller: APIController,
+    tmp_path,
+):
+    # GIVEN
+    jira_api_controller.config.project_mirror = ProjectMirrorConfiguration(projects=['SCRUM'])
+    jira_api_controller.project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    search_issues_mock.return_value = {
+        'issues': [load_json_response(__file__, 'issue.json')],
+        'isLast': True,
+    }
+    await jira_api_controller.sync_project_mirror('SCRUM')
+    transitions_mock.return_value = APIControllerResponse(result=transitions)
+    transition_issue_mock.return_value = APIControllerResponse(result=[])
+    get_issue_mock.side_effect = ValueError('an error')
+    # WHEN
+    response = await jira_api_controller.transition_issue_status('SCRUM-10', '3')
+    # THEN
+    assert response.success is True
+    # the mirror does not serve the previous status of the work item
+    search_response = await jira_api_controller.search_project_mirror('SCRUM', compact=True)
+    assert search_response.result.issues == []
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'transition_issue')
 @patch.object(APIController, 'transitions')
@@ -3385,6 +4011,44 @@ async def test_get_comments(
     get_comments_mock.assert_called_once_with('1', 0, 10)
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_comments')
+async def test_list_all_comments(
+    get_comments_mock: Mock,
+    comment_response: dict,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    get_comments_mock.side_effect = lambda key, offset, limit: {
+        'comments': [{**comment_response, 'id': str(offset)}],
+        'startAt': offset,
+        'maxResults': limit,
+        'total': 250,
+    }
+    # WHEN
+    response = await jira_api_controller.list_all_comments('1')
+    # THEN
+    assert response.success is True
+    assert [comment.id for comment in response.result] == ['0', '100', '200']
+    get_comments_mock.assert_has_calls(
+        [call('1', 0, 100), call('1', 100, 100), call('1', 200, 100)], any_order=True
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_comments')
+async def test_list_all_comments_with_api_error(
+    get_comments_mock: Mock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    get_comments_mock.side_effect = ServiceUnavailableException('some error')
+    # WHEN
+    response = await jira_api_controller.list_all_comments('1')
+    # THEN
+    assert response == APIControllerResponse(success=False, error='some error')
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_comments')
 async def test_get_comments_without_adf(
@@ -3789,10 +4453,54 @@ async def test_get_work_item_worklog(
             )
         ],
         start_at=0,
-        max_results=10,
+        max_results=1,
         total=1,
     )
-    get_issue_work_log_mock.assert_called_once_with('1', None, None)
+    get_issue_work_log_mock.assert_called_once_with('1', 0, 1000)
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue_work_log')
+async def test_get_work_item_worklog_retrieves_every_page(
+    get_issue_work_log_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    get_issue_work_log_mock.side_effect = lambda key, offset, limit: {
+        'worklogs': [{'id': str(offset), 'issueId': '10002'}],
+        'startAt': offset,
+        'maxResults': limit,
+        'total': 2500,
+    }
+    # WHEN
+    response = await jira_api_controller.get_work_item_worklog('1')
+    # THEN
+    assert response.success is True
+    assert [worklog.id for worklog in response.result.logs] == ['0', '1000', '2000']
+    assert response.result.total == 3
+    get_issue_work_log_mock.assert_has_calls(
+        [call('1', 0, 1000), call('1', 1000, 1000), call('1', 2000, 1000)], any_order=True
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue_work_log')
+async def test_get_work_item_worklog_retrieves_a_page(
+    get_issue_work_log_mock: Mock, jira_api_controller: APIController
+):
+    # GIVEN
+    get_issue_work_log_mock.return_value = {
+        'worklogs': [{'id': '1', 'issueId': '10002'}],
+        'startAt': 10,
+        'maxResults': 1,
+        'total': 20,
+    }
+    # WHEN
+    response = await jira_api_controller.get_work_item_worklog('1', offset=10, limit=1)
+    # THEN
+    assert [worklog.id for worklog in response.result.logs] == ['1']
+    assert response.result.start_at == 10
+    assert response.result.total == 20
+    get_issue_work_log_mock.assert_called_once_with('1', 10, 1)
 
 
 @pytest.mark.asyncio
@@ -3809,7 +4517,7 @@ async def test_get_work_item_worklog_with_api_error(
     assert response.success is False
     assert response.error == 'some error'
     assert response.result is None
-    get_issue_work_log_mock.assert_called_once_with('1', None, None)
+    get_issue_work_log_mock.assert_called_once_with('1', 0, 1000)
 
 
 @pytest.mark.asyncio
@@ -4594,6 +5302,38 @@ async def test_get_required_fields_for_issue_type_different_cache_keys(
     assert get_issue_create_meta_mock.call_count == 2
 
 
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'get_issue_create_meta')
+async def test_get_required_fields_for_issue_type_revalidates_the_metadata_cache(
+    get_issue_create_meta_mock: AsyncMock, jira_api_controller: APIController, tmp_path
+):
+    # GIVEN
+    jira_api_controller.metadata_cache = MetadataCache(tmp_path)
+    jira_api_controller.metadata_cache.set(
+        'createmeta-TEST-10001', {'fields': [{'key': 'summary', 'required': True}]}
+    )
+    get_issue_create_meta_mock.return_value = {
+        'fields': [
+            {'key': 'summary', 'required': True},
+            {'key': 'components', 'required': True},
+        ]
+    }
+    # WHEN
+    result = await jira_api_controller.get_required_fields_for_issue_type('TEST', '10001')
+    await asyncio.gather(*jira_api_controller._revalidation_tasks.values())
+    # THEN
+    assert result.result == ['summary']
+    get_issue_create_meta_mock.assert_called_once_with('TEST', '10001')
+    assert jira_api_controller.metadata_cache.get('createmeta-TEST-10001').data == {
+        'fields': [
+            {'key': 'summary', 'required': True},
+            {'key': 'components', 'required': True},
+        ]
+    }
+    result = await jira_api_controller.get_required_fields_for_issue_type('TEST', '10001')
+    assert result.result == ['summary', 'components']
+
+
 @pytest.mark.asyncio
 @patch.object(JiraAPI, 'get_issue_create_meta')
 async def test_get_required_fields_for_issue_type_api_error(
@@ -5155,6 +5895,40 @@ async def test_get_project_sprints(
     )
 
 
+@pytest.mark.asyncio
+@patch.object(JiraSoftwareCloudAPI, 'get_board_sprints')
+@patch.object(JiraSoftwareCloudAPI, 'get_boards')
+async def test_get_project_sprints_uses_the_metadata_cache(
+    get_boards_mock: AsyncMock,
+    get_board_sprints_mock: AsyncMock,
+    jira_api_controller: APIController,
+    tmp_path,
+):
+    # GIVEN
+    jira_api_controller.metadata_cache = MetadataCache(tmp_path)
+    get_boards_mock.return_value = {'values': [{'id': 84, 'name': 'scrum board'}]}
+    get_board_sprints_mock.return_value = {
+        'values': [
+            {
+                'id': 37,
+                'state': 'active',
+                'name': 'sprint 1',
+                'startDate': '2015-04-11T15:22:00.000+10:00',
+                'originBoardId': 84,
+            },
+        ]
+    }
+    fetched = await jira_api_controller.get_project_sprints('P1')
+    # WHEN
+    result = await jira_api_controller.get_project_sprints('P1', cached=True)
+    # THEN
+    get_boards_mock.assert_awaited_once_with(project_key_or_id='P1')
+    get_board_sprints_mock.assert_awaited_once()
+    assert result == fetched
+    assert result.result[0].origin_board_name == 'scrum board'
+    assert result.result[0].start_date == datetime.fromisoformat('2015-04-11T15:22:00.000+10:00')
+
+
 @pytest.mark.asyncio
 @patch.object(JiraSoftwareCloudAPI, 'get_board_sprints')
 @patch.object(JiraSoftwareCloudAPI, 'get_boards')
@@ -5180,3 +5954,111 @@ async def test_get_project_sprints_getting_sprints_in_board_raises_exception(
         [call(84, state='active,future'), call(92, state='active,future')]
     )
     assert result == APIControllerResponse(success=True, result=[])
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'upload_attachment_to_issue')
+async def test_upload_attachment(
+    upload_attachment_to_issue_mock: AsyncMock, tmp_path, jira_api_controller: APIController
+):
+    # GIVEN
+    file_path = tmp_path / 'build.log'
+    file_path.write_text('some logs')
+    upload_attachment_to_issue_mock.return_value = [
+        {
+            'id': '10',
+            'filename': 'build.log',
+            'size': 9,
+            'mimeType': 'text/plain',
+            'created': '2025-01-01T10:00:00.000+0000',
+            'author': {'accountId': '1', 'active': True, 'displayName': 'Bart'},
+        }
+    ]
+    on_progress = Mock()
+    # WHEN
+    response = await jira_api_controller.upload_attachment(
+        'WI-1', str(file_path), on_progress=on_progress
+    )
+    # THEN
+    assert response.success is True
+    assert response.result.id == '10'
+    assert response.result.filename == 'build.log'
+    assert response.result.author.display_name == 'Bart'
+    upload_attachment_to_issue_mock.assert_awaited_once_with(
+        'WI-1', str(file_path), 'build.log', on_progress=on_progress
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'upload_attachment_to_issue')
+async def test_upload_attachment_with_missing_file(
+    upload_attachment_to_issue_mock: AsyncMock, tmp_path, jira_api_controller: APIController
+):
+    # WHEN
+    response = await jira_api_controller.upload_attachment('WI-1', str(tmp_path / 'missing.log'))
+    # THEN
+    assert response.success is False
+    assert response.error == 'The file provided does not exist.'
+    upload_attachment_to_issue_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'download_attachment_content')
+async def test_download_attachment_uses_the_attachment_cache(
+    download_attachment_content_mock: AsyncMock, tmp_path, jira_api_controller: APIController
+):
+    # GIVEN
+    jira_api_controller.attachment_cache = AttachmentCache(tmp_path, max_size=100)
+
+    async def download(attachment_id: str, destination):
+        destination.write_bytes(b'screenshot')
+        return destination
+
+    download_attachment_content_mock.side_effect = download
+    # WHEN
+    first_response = await jira_api_controller.download_attachment('10', 10)
+    second_response = await jira_api_controller.download_attachment('10', 10)
+    # THEN
+    assert first_response.success is True
+    assert first_response.result == tmp_path / '10-10'
+    assert second_response.result == first_response.result
+    download_attachment_content_mock.assert_awaited_once_with('10', tmp_path / '10-10')
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'download_attachment_content')
+@patch.object(JiraAPI, 'get_attachment')
+async def test_download_attachment_without_size(
+    get_attachment_mock: AsyncMock,
+    download_attachment_content_mock: AsyncMock,
+    tmp_path,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    jira_api_controller.attachment_cache = AttachmentCache(tmp_path, max_size=100)
+    get_attachment_mock.return_value = {'id': '10', 'size': 4}
+    download_attachment_content_mock.return_value = None
+    # WHEN
+    response = await jira_api_controller.download_attachment('10')
+    # THEN
+    assert response.success is False
+    download_attachment_content_mock.assert_awaited_once_with('10', tmp_path / '10-4')
+
+
+@pytest.mark.asyncio
+@patch.object(JiraAPI, 'download_attachment_content')
+@patch.object(APIController, 'get_attachment_content')
+async def test_download_attachment_without_attachment_cache(
+    get_attachment_content_mock: AsyncMock,
+    download_attachment_content_mock: AsyncMock,
+    jira_api_controller: APIController,
+):
+    # GIVEN
+    jira_api_controller.attachment_cache = None
+    get_attachment_content_mock.return_value = APIControllerResponse(result=b'screenshot')
+    # WHEN
+    response = await jira_api_controller.download_attachment('10', 10)
+    # THEN
+    assert response.result == b'screenshot'
+    get_attachment_content_mock.assert_awaited_once_with('10')
+    download_attachment_content_mock.assert_not_called()
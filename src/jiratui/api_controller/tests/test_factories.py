@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from jiratui.api_controller.factories import (
+    LazyJiraIssue,
     WorkItemFactory,
     build_comments,
     build_related_work_items,
@@ -26,9 +27,10 @@ from jiratui.utils.test_utilities import load_json_response
 
 
 @pytest.fixture
-def config_for_testing() -> ApplicationConfiguration:
+def config_for_testing(performance_settings_for_testing: dict) -> ApplicationConfiguration:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token='bar',
@@ -309,6 +311,45 @@ def test_build_issue_instance(config_for_testing):
     )
 
 
+@patch('jiratui.api_controller.factories.build_comments')
+def test_build_issue_instance_builds_attributes_on_first_access(
+    build_comments_mock: Mock, config_for_testing
+):
+    # GIVEN
+    work_item = load_json_response(__file__, 'issue.json')
+    build_comments_mock.return_value = []
+    # WHEN
+    issue = WorkItemFactory.create_work_item(work_item)
+    # THEN
+    assert isinstance(issue, LazyJiraIssue)
+    assert issue.key == 'SCRUM-10'
+    build_comments_mock.assert_not_called()
+    # WHEN
+    comments = issue.comments
+    comments_accessed_again = issue.comments
+    # THEN
+    assert comments == []
+    assert comments_accessed_again is comments
+    build_comments_mock.assert_called_once()
+    # WHEN
+    issue.comments = [Mock(spec=IssueComment)]
+    # THEN
+    assert len(issue.comments) == 1
+    build_comments_mock.assert_called_once()
+
+
+def test_build_issue_instance_releases_the_data_once_built(config_for_testing):
+    # GIVEN
+    work_item = load_json_response(__file__, 'issue.json')
+    issue = WorkItemFactory.create_work_item(work_item)
+    # WHEN
+    eager_issue = JiraIssue(**{name: getattr(issue, name) for name in issue.as_dict()})
+    # THEN
+    assert issue._data == {}
+    assert issue == eager_issue
+    assert eager_issue == issue
+
+
 def test_build_issue_instance_with_more_details(config_for_testing):
     # GIVEN
     work_item = load_json_response(__file__, 'issue.json')
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from jiratui.api_controller.single_flight import SingleFlight, single_flight
+
+
+class Controller:
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        self.calls: list[tuple] = []
+        self.release = asyncio.Event()
+
+    @single_flight
+    async def get_statuses(self, project_key: str, fields: list[str] | None = None) -> dict:
+        self.calls.append((project_key, fields))
+        await self.release.wait()
+        if project_key == 'FAIL':
+            raise ValueError('boom')
+        return {'project_key': project_key, 'statuses': ['To Do']}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_call():
+    # GIVEN
+    controller = Controller()
+    tasks = [
+        asyncio.create_task(controller.get_statuses('SCRUM')),
+        asyncio.create_task(controller.get_statuses(project_key='SCRUM', fields=None)),
+        asyncio.create_task(controller.get_statuses('SCRUM', fields=['id'])),
+    ]
+    await asyncio.sleep(0)
+    # WHEN
+    controller.release.set()
+    results = await asyncio.gather(*tasks)
+    # THEN
+    assert controller.calls == [('SCRUM', None), ('SCRUM', ['id'])]
+    assert results[0] == results[1] == {'project_key': 'SCRUM', 'statuses': ['To Do']}
+    assert results[0] is not results[1]
+    assert len(controller.single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_changes_of_a_caller_to_the_result_do_not_affect_the_other_callers():
+    # GIVEN
+    controller = Controller()
+
+    async def get_and_modify_statuses() -> dict:
+        statuses = await controller.get_statuses('SCRUM')
+        statuses['statuses'].append('Done')
+        return statuses
+
+    first = asyncio.create_task(get_and_modify_statuses())
+    second = asyncio.create_task(controller.get_statuses('SCRUM'))
+    await asyncio.sleep(0)
+    # WHEN
+    controller.release.set()
+    results = await asyncio.gather(first, second)
+    # THEN
+    assert results[0] == {'project_key': 'SCRUM', 'statuses': ['To Do', 'Done']}
+    assert results[1] == {'project_key': 'SCRUM', 'statuses': ['To Do']}
+
+
+@pytest.mark.asyncio
+async def test_calls_after_the_shared_call_finished_are_not_shared():
+    # GIVEN
+    controller = Controller()
+    controller.release.set()
+    # WHEN
+    await controller.get_statuses('SCRUM')
+    await controller.get_statuses('SCRUM')
+    # THEN
+    assert controller.calls == [('SCRUM', None), ('SCRUM', None)]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_every_caller():
+    # GIVEN
+    controller = Controller()
+    tasks = [asyncio.create_task(controller.get_statuses('FAIL')) for _ in range(2)]
+    await asyncio.sleep(0)
+    # WHEN
+    controller.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # THEN
+    assert len(controller.calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_caller_does_not_cancel_the_shared_call():
+    # GIVEN
+    controller = Controller()
+    first = asyncio.create_task(controller.get_statuses('SCRUM'))
+    second = asyncio.create_task(controller.get_statuses('SCRUM'))
+    await asyncio.sleep(0)
+    # WHEN
+    first.cancel()
+    await asyncio.sleep(0)
+    controller.release.set()
+    # THEN
+    assert await second == {'project_key': 'SCRUM', 'statuses': ['To Do']}
+    assert first.cancelled() is True
+
+
+@pytest.mark.asyncio
+async def test_cancelling_every_caller_cancels_the_shared_call():
+    # GIVEN
+    controller = Controller()
+    caller = asyncio.create_task(controller.get_statuses('SCRUM'))
+    await asyncio.sleep(0)
+    shared_task = next(iter(controller.single_flight._calls.values())).task
+    # WHEN
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0)
+    # THEN
+    assert shared_task.cancelled() is True
+    assert len(controller.single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_calls_after_clear_do_not_join_the_calls_in_flight():
+    # GIVEN
+    controller = Controller()
+    first = asyncio.create_task(controller.get_statuses('SCRUM'))
+    await asyncio.sleep(0)
+    # WHEN
+    controller.single_flight.clear()
+    second = asyncio.create_task(controller.get_statuses('SCRUM'))
+    await asyncio.sleep(0)
+    controller.release.set()
+    await asyncio.gather(first, second)
+    # THEN
+    assert controller.calls == [('SCRUM', None), ('SCRUM', None)]
+    assert len(controller.single_flight) == 0
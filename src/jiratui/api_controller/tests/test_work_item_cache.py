@@ -0,0 +1,125 @@
+import pytest
+
+from jiratui.api_controller.work_item_cache import FieldSet, WorkItemCache
+from jiratui.config import WorkItemCacheConfiguration
+from jiratui.models import IssueStatus, JiraIssue
+
+
+def build_work_item(key: str, work_item_id: str = '1') -> JiraIssue:
+    return JiraIssue(
+        id=work_item_id, key=key, summary=key, status=IssueStatus(id='1', name='To Do')
+    )
+
+
+@pytest.mark.parametrize(
+    'cached_fields, requested_fields, expected',
+    [
+        (None, None, True),
+        (None, ['summary', 'status'], True),
+        (None, ['*all', '-comment'], True),
+        (['*all', '-comment'], None, False),
+        (['*all', '-comment'], ['*all', '-comment', '-worklog'], True),
+        (['*all', '-comment'], ['summary'], True),
+        (['*all', '-comment'], ['comment'], False),
+        (['*all', '-comment'], ['*navigable'], False),
+        (['summary', 'status'], ['summary'], True),
+        (['summary', 'status'], ['summary', 'comment'], False),
+        (['summary', 'status'], None, False),
+    ],
+)
+def test_field_set_covers(
+    cached_fields: list[str] | None, requested_fields: list[str] | None, expected: bool
+):
+    assert (
+        FieldSet.from_fields(cached_fields).covers(FieldSet.from_fields(requested_fields))
+        is expected
+    )
+
+
+def test_get_work_item():
+    # GIVEN
+    cache = WorkItemCache()
+    cache.store('A-1', build_work_item('A-1', '10'), fields=['*all', '-comment'])
+    # WHEN
+    work_item = cache.get('A-1', fields=['summary'])
+    # THEN
+    assert work_item == build_work_item('A-1', '10')
+    assert cache.get('10', fields=['summary']) == work_item
+    assert cache.get('A-1', fields=['comment']) is None
+    assert cache.get('A-1', fields=['summary'], properties='all') is None
+    assert cache.get('A-2') is None
+
+
+def test_get_work_item_returns_a_copy():
+    # GIVEN
+    cache = WorkItemCache()
+    cache.store('A-1', build_work_item('A-1'))
+    # WHEN
+    cache.get('A-1').summary = 'changed'
+    # THEN
+    assert cache.get('A-1').summary == 'A-1'
+
+
+def test_work_items_expire():
+    # GIVEN
+    cache = WorkItemCache(max_age=0)
+    cache.store('A-1', build_work_item('A-1'))
+    # THEN
+    assert cache.get('A-1') is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_work_items_are_discarded():
+    # GIVEN
+    cache = WorkItemCache(max_size=2)
+    cache.store('A-1', build_work_item('A-1', '1'))
+    cache.store('A-2', build_work_item('A-2', '2'))
+    cache.get('A-1')
+    # WHEN
+    cache.store('A-3', build_work_item('A-3', '3'))
+    # THEN
+    assert cache.get('A-1') is not None
+    assert cache.get('A-2') is None
+    assert cache.get('A-3') is not None
+
+
+def test_invalidate_work_items():
+    # GIVEN
+    cache = WorkItemCache()
+    cache.store('10', build_work_item('A-1', '10'))
+    cache.store('A-1', build_work_item('A-1', '10'), fields=['summary'])
+    cache.store('A-2', build_work_item('A-2', '20'))
+    # WHEN
+    cache.invalidate('A-1', None)
+    # THEN
+    assert cache.get('10') is None
+    assert cache.get('A-1', fields=['summary']) is None
+    assert cache.get('A-2') is not None
+    # WHEN
+    cache.clear()
+    # THEN
+    assert len(cache) == 0
+
+
+def test_work_items_requested_before_an_invalidation_are_not_stored():
+    # GIVEN
+    cache = WorkItemCache()
+    generation = cache.generation
+    # WHEN
+    cache.invalidate('A-1')
+    cache.store('A-1', build_work_item('A-1'), generation=generation)
+    # THEN
+    assert cache.get('A-1') is None
+    # WHEN
+    cache.store('A-1', build_work_item('A-1'), generation=cache.generation)
+    # THEN
+    assert cache.get('A-1') is not None
+
+
+def test_disabled_cache_does_not_store_work_items():
+    # GIVEN
+    cache = WorkItemCache.from_configuration(WorkItemCacheConfiguration(enabled=False))
+    # WHEN
+    cache.store('A-1', build_work_item('A-1'))
+    # THEN
+    assert cache.get('A-1') is None
@@ -0,0 +1,191 @@
+"""In-memory store of the work items retrieved by the controller.
+
+The same work item is usually retrieved several times in a short period, e.g. by the main screen, the quick-view
+screen, the go-to screen and the worklog screen. `WorkItemCache` keeps the work items retrieved by
+`APIController.get_issue()` for a short time so that these screens do not send the same request again.
+
+Entries are keyed by the key (or id) of the work item, the set of fields and the properties that were requested. A
+work item retrieved with all its fields (`*all`) can also serve a request for a subset of its fields. The store is
+bounded; the least recently used work items are discarded first. Operations of the controller that update a work item
+invalidate its entries explicitly. Every invalidation starts a new generation of the store; a work item whose request
+started in a previous generation is not stored, because it may have been retrieved before the update.
+"""
+
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import time
+
+from jiratui.config import WorkItemCacheConfiguration
+from jiratui.models import JiraIssue
+
+ALL_FIELDS = '*all'
+"""The value of the `fields` parameter that requests all the fields of a work item."""
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    """The normalised value of the `fields` parameter of a request."""
+
+    included: frozenset[str]
+    excluded: frozenset[str]
+
+    @classmethod
+    def from_fields(cls, fields: list[str] | None) -> 'FieldSet':
+        if not fields:
+            # the API returns all the fields by default
+            return cls(included=frozenset({ALL_FIELDS}), excluded=frozenset())
+        included: set[str] = set()
+        excluded: set[str] = set()
+        for field in fields:
+            field = field.strip()
+            if field.startswith('-'):
+                excluded.add(field[1:])
+            elif field:
+                included.add(field)
+        return cls(included=frozenset(included), excluded=frozenset(excluded))
+
+    @property
+    def has_all_fields(self) -> bool:
+        return ALL_FIELDS in self.included
+
+    def covers(self, other: 'FieldSet') -> bool:
+        """Indicates whether a work item retrieved with this set of fields has every field of the other set."""
+        if self == other:
+            return True
+        if not self.has_all_fields:
+            # e.g. *navigable or a list of fields; only serve requests for some of the same fields
+            return (
+                not other.has_all_fields and not other.excluded and other.included <= self.included
+            )
+        if other.has_all_fields:
+            return self.excluded <= other.excluded
+        return not (other.included & self.excluded) and not any(
+            field.startswith('*') for field in other.included
+        )
+
+
+@dataclass
+class CachedWorkItem:
+    work_item: JiraIssue
+    fields: FieldSet
+    properties: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class WorkItemCache:
+    """A bounded in-memory store of work items with a time-to-live."""
+
+    def __init__(self, max_size: int = 200, max_age: float = 30.0):
+        """Initializes the store.
+
+        Args:
+            max_size: the maximum number of entries. Set it to 0 to disable the store.
+            max_age: the number of seconds an entry can be used for.
+        """
+        self.max_size = max(max_size, 0)
+        self.max_age = max_age
+        self._entries: OrderedDict[tuple[str, FieldSet, str | None], CachedWorkItem] = OrderedDict()
+        self.generation = 0
+        """The number of invalidations of the store."""
+
+    @classmethod
+    def from_configuration(cls, configuration: WorkItemCacheConfiguration) -> 'WorkItemCache':
+        return cls(
+            max_size=configuration.max_size if configuration.enabled else 0,
+            max_age=configuration.max_age,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, issue_id_or_key: str, fields: list[str] | None = None, properties: str | None = None
+    ) -> JiraIssue | None:
+        """Retrieves a work item from the store.
+
+        Args:
+            issue_id_or_key: the key or id of the work item.
+            fields: the fields of the work item that are requested.
+            properties: the properties of the work item that are requested.
+
+        Returns:
+            A copy of the work item or `None` if there is no fresh entry with the requested fields.
+        """
+        requested = FieldSet.from_fields(fields)
+        for entry_key in self._entries_of(issue_id_or_key):
+            entry = self._entries[entry_key]
+            if not entry.is_fresh:
+                del self._entries[entry_key]
+                continue
+            if entry.properties == properties and entry.fields.covers(requested):
+                self._entries.move_to_end(entry_key)
+                # callers may modify the work item; keep the stored one intact
+                return copy.deepcopy(entry.work_item)
+        return None
+
+    def store(
+        self,
+        issue_id_or_key: str,
+        work_item: JiraIssue,
+        fields: list[str] | None = None,
+        properties: str | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Stores a work item, discarding the least recently used entries if the store is full.
+
+        Args:
+            issue_id_or_key: the key or id used to retrieve the work item.
+            work_item: the work item.
+            fields: the fields that were requested.
+            properties: the properties that were requested.
+            generation: the generation of the store when the work item was requested. The work item is not stored if
+                the store was invalidated since then.
+
+        Returns:
+            Nothing.
+        """
+        if self.max_size == 0 or generation not in (None, self.generation):
+            return
+        entry_key = (issue_id_or_key, FieldSet.from_fields(fields), properties)
+        self._entries[entry_key] = CachedWorkItem(
+            work_item=copy.deepcopy(work_item),
+            fields=entry_key[1],
+            properties=properties,
+            expires_at=time.monotonic() + self.max_age,
+        )
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *issue_ids_or_keys: str | None) -> None:
+        """Discards every entry of some work items.
+
+        Args:
+            *issue_ids_or_keys: the keys or ids of the work items.
+
+        Returns:
+            Nothing.
+        """
+        self.generation += 1
+        for issue_id_or_key in issue_ids_or_keys:
+            if issue_id_or_key:
+                for entry_key in self._entries_of(issue_id_or_key):
+                    del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """Discards every entry, e.g. after an update whose work item is unknown."""
+        self.generation += 1
+        self._entries.clear()
+
+    def _entries_of(self, issue_id_or_key: str) -> list[tuple[str, FieldSet, str | None]]:
+        # a work item may have been retrieved by its key or by its id
+        return [
+            entry_key
+            for entry_key, entry in reversed(self._entries.items())
+            if issue_id_or_key in (entry_key[0], entry.work_item.key, entry.work_item.id)
+        ]
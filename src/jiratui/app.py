@@ -10,7 +10,7 @@ from textual.binding import Binding
 from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
 from jiratui.api_controller.controller import APIController, APIControllerResponse
-from jiratui.config import CONFIGURATION, ApplicationConfiguration
+from jiratui.config import CONFIGURATION, ApplicationConfiguration, load_configuration
 from jiratui.constants import LOGGER_NAME
 from jiratui.models import JiraServerInfo
 from jiratui.utils.logging import JiraTUILogger
@@ -197,8 +197,7 @@ class JiraApp(Actionable, App, inherit_bindings=False):  # type:ignore[call-arg]
         if CONFIGURATION.get().confirm_before_quit:
             await self.push_screen(QuitScreen())
         else:
-            await self.api.api.client.close_async_client()
-            await self.api.api.async_http_client.close_async_client()
+            await self.api.close_connections()
             self.app.exit()
 
     async def _set_application_title_using_server_info(self) -> None:
@@ -266,6 +265,6 @@ class JiraApp(Actionable, App, inherit_bindings=False):  # type:ignore[call-arg]
 
 if __name__ == '__main__':
     try:
-        JiraApp(ApplicationConfiguration()).run()  # type: ignore[call-arg] # noqa
+        JiraApp(load_configuration()).run()
     except Exception as e:
         sys.exit(str(e))
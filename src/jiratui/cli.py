@@ -1,3 +1,10 @@
+"""The command line interface of JiraTUI.
+
+Commands are often run from shell prompts and git hooks, where the time to start the process dominates. Every command
+imports the modules it needs when it runs: the commands that talk to the Jira API never import Textual, the widgets or
+GitPython, and `jiratui version` only imports click and rich.
+"""
+
 import asyncio
 from datetime import datetime
 import json
@@ -5,32 +12,20 @@ import os
 from pathlib import Path
 import subprocess
 import sys
+from typing import TYPE_CHECKING, Any
 
 import click
-from pydantic import ValidationError
 from rich.console import Console
-from textual.theme import BUILTIN_THEMES
-
-from jiratui.app import JiraApp
-from jiratui.commands.handler import CommandHandler
-from jiratui.commands.render import (
-    CLIExceptionRenderer,
-    CreateMetadataRenderer,
-    JiraIssueCommentRenderer,
-    JiraIssueCommentsRenderer,
-    JiraIssueCommentTextRenderer,
-    JiraIssueMetadataRenderer,
-    JiraIssueSearchRenderer,
-    JiraUserGroupRenderer,
-    JiraUserRenderer,
-    ThemesRenderer,
-)
-from jiratui.config import ApplicationConfiguration
-from jiratui.configuration_app import JiraTUIConfigurationApp
+
+from jiratui.constants import CLI_BATCH_DEFAULT_MAX_CONCURRENCY, ISSUE_SEARCH_DEFAULT_MAX_RESULTS
 from jiratui.exceptions import CLIException
 from jiratui.files import get_config_file
 
+if TYPE_CHECKING:
+    from jiratui.commands.handler import CommandHandler
+
 console = Console()
+error_console = Console(stderr=True)
 
 
 @click.group()
@@ -74,6 +69,10 @@ def version():
     'themes', help='List the available built-in themes. Using a theme: jiratui ui --theme <NAME>'
 )
 def themes():
+    from textual.theme import BUILTIN_THEMES
+
+    from jiratui.commands.render import ThemesRenderer
+
     console.print('Available built-in themes\n')
     renderer = ThemesRenderer()
     renderer.render(console, list(BUILTIN_THEMES.keys()))
@@ -100,6 +99,8 @@ def config():
     help='The path to the file where the configuration will be saved.',
 )
 def configure_create(output_file: str | None = None) -> None:
+    from jiratui.configuration_app import JiraTUIConfigurationApp
+
     JiraTUIConfigurationApp(output_file=output_file).run()
 
 
@@ -130,34 +131,91 @@ def configure_create(output_file: str | None = None) -> None:
     type=click.DateTime(['%Y-%m-%d']),
     help='Searches issues created until this date (inclusive). Expects YYYY-MM-DD',
 )
+@click.option('--jql', type=str, help='A JQL query to filter work items.')
+@click.option(
+    '--all',
+    '-a',
+    'fetch_all',
+    is_flag=True,
+    default=False,
+    help='Retrieves every work item found, page by page. --limit sets the maximum number of work items to return. '
+    'Requires a --format other than table.',
+)
+@click.option(
+    '--fields',
+    type=str,
+    help='A comma-separated list of the IDs of the fields to write, e.g. summary,status,assignee. Requires a '
+    '--format other than table.',
+)
+@click.option(
+    '--format',
+    '-f',
+    'output_format',
+    type=click.Choice(['table', 'jsonl', 'ndjson', 'csv']),
+    default='table',
+    show_default=True,
+    help='The format of the output. jsonl, ndjson and csv write every work item to stdout as soon as it is retrieved.',
+)
 def search_issues(
-    project_key: str,
+    project_key: str | None = None,
     key: str | None = None,
     assignee_account_id: str | None = None,
     limit: int | None = None,
     created_from: datetime | None = None,
     created_until: datetime | None = None,
+    jql: str | None = None,
+    fetch_all: bool = False,
+    fields: str | None = None,
+    output_format: str = 'table',
 ) -> None:
     """Searches work items.
 
     Args:
-        project_key:
-        key:
-        assignee_account_id:
-        limit:
-        created_from:
-        created_until:
+        project_key: searches items within the project with this key.
+        key: retrieves the item with this key.
+        assignee_account_id: searches items assigned to this user.
+        limit: retrieves items up to this limit.
+        created_from: searches items created from this date (inclusive).
+        created_until: searches items created until this date (inclusive).
+        jql: searches items matching this JQL query.
+        fetch_all: if `True` every page of results is retrieved.
+        fields: the comma-separated IDs of the fields to write in machine-readable formats.
+        output_format: the format of the output: `table`, `jsonl`, `ndjson` or `csv`.
 
     Returns:
-
+        Nothing.
     """
-    if not project_key and not key:
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueSearchRenderer
+
+    if not project_key and not key and not jql:
         raise click.BadParameter(
-            'One of --project-key (-p) or --key (-k) must be provided',
+            'One of --project-key (-p), --key (-k) or --jql must be provided',
         )
+    if output_format == 'table' and (fetch_all or fields):
+        raise click.BadParameter('--all and --fields require --format jsonl, ndjson or csv')
 
     handler = CommandHandler()
 
+    if output_format != 'table':
+        sys.exit(
+            _export_issues(
+                handler,
+                output_format,
+                fields=[field.strip() for field in fields.split(',') if field.strip()]
+                if fields
+                else None,
+                key=key.strip() if key else None,
+                project_key=project_key,
+                assignee_account_id=assignee_account_id,
+                limit=limit if fetch_all else limit or ISSUE_SEARCH_DEFAULT_MAX_RESULTS,
+                created_from=created_from.date() if created_from else None,
+                created_until=created_until.date() if created_until else None,
+                jql_query=jql,
+            )
+        )
+
     if key:
         with console.status('Fetching work item...'):
             try:
@@ -194,6 +252,7 @@ def search_issues(
                 limit=limit,
                 created_from=created_from.date() if created_from else None,
                 created_until=created_until.date() if created_until else None,
+                jql_query=jql,
             )
         except CLIException as e:
             console.print(str(e))
@@ -206,6 +265,59 @@ def search_issues(
             render.render(console, response)
 
 
+def _export_issues(
+    handler: 'CommandHandler',
+    output_format: str,
+    fields: list[str] | None = None,
+    key: str | None = None,
+    **search_criteria: Any,
+) -> int:
+    """Writes the work items found by a search to stdout in a machine-readable format.
+
+    Work items are written as soon as their page is retrieved; the next page is fetched while the current one is
+    written. Errors are written to stderr, so they never mix with the work items.
+
+    Args:
+        handler: the handler of the commands.
+        output_format: the format of the output: `jsonl`, `ndjson` or `csv`.
+        fields: the IDs of the fields to write. If `None` the main fields of the work items are written.
+        key: the key of a work item; if set only this work item is written.
+        **search_criteria: the criteria of the search, as expected by `CommandHandler.iter_search_issues()`.
+
+    Returns:
+        The exit status of the command.
+    """
+
+    from jiratui.commands.render import WORK_ITEM_EXPORT_FIELDS, WORK_ITEMS_WRITERS
+
+    fields = fields or list(WORK_ITEM_EXPORT_FIELDS)
+    writer = WORK_ITEMS_WRITERS[output_format](sys.stdout, fields)
+
+    async def export() -> None:
+        async for work_item in handler.iter_search_issues(
+            fields=['id', 'key', *fields], **search_criteria
+        ):
+            writer.write(work_item)
+
+    try:
+        if key:
+            for work_item in handler.get_issue(key=key, fields=['id', 'key', *fields]).issues:
+                writer.write(work_item)
+        else:
+            asyncio.run(export())
+    except CLIException as e:
+        error_console.print(str(e))
+        if details := e.get_extra_details():
+            error_console.print_json(data=details, default=str)
+        return 1
+    except Exception as e:
+        error_console.print(f'An unknown error occurred while searching for work items: {str(e)}')
+        return 1
+    finally:
+        sys.stdout.flush()
+    return 0
+
+
 @issues.command('metadata')
 @click.argument('work-item-key')
 @click.option(
@@ -224,6 +336,9 @@ def issue_metadata(work_item_key: str, field_id: str | None = None) -> None:
         None
     """
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import JiraIssueMetadataRenderer
+
     handler = CommandHandler()
     with console.status('Fetching metadata for the selected work item...'):
         try:
@@ -280,6 +395,9 @@ def update_issue(
 ):
     """Updates (some) fields of the work item identified by WORK_ITEM_KEY."""
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueMetadataRenderer
+
     # WORK_ITEM_KEY is the case-sensitive key that identifies the work item we want to update.
     handler = CommandHandler()
 
@@ -385,6 +503,9 @@ def clone_work_item(
         None
     """
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueSearchRenderer
+
     handler = CommandHandler()
     with console.status(f'Cloning work item with key {work_item_key}...'):
         try:
@@ -421,6 +542,9 @@ def delete_work_item(work_item_key: str) -> None:
         None
     """
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer
+
     handler = CommandHandler()
     with console.status(f'Deleting work item with key {work_item_key}...'):
         try:
@@ -454,6 +578,9 @@ def create_metadata(project_key: str, work_item_type_id: str, save_as: str | Non
     WORK_ITEM_TYPE_ID the id that identifies a type of work item in the project.
     """
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CreateMetadataRenderer
+
     handler = CommandHandler()
     with console.status(
         'Fetching create-metadata for the selected project and type of work item...'
@@ -486,6 +613,10 @@ def add_comment(message: str, work_item_key: str):
     WORK_ITEM_KEY is the case-sensitive key that identifies the work item.
     MESSAGE is the message of the comment.
     """
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueCommentRenderer
+
     handler = CommandHandler()
     with console.status('Trying to add the comment to the issue...'):
         try:
@@ -514,6 +645,10 @@ def list_comments(work_item_key: str, page: int = 1, comment_id: str | None = No
 
     WORK_ITEM_KEY is the case-sensitive key that identifies the work item.
     """
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueCommentsRenderer
+
     handler = CommandHandler()
     with console.status('Fetching comments for the issue...'):
         try:
@@ -536,6 +671,10 @@ def show_comment(work_item_key: str, comment_id: str) -> None:
     WORK_ITEM_KEY is the case-sensitive key that identifies the work item.
     COMMENT_ID the id of the comment whose text we want to view.
     """
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraIssueCommentTextRenderer
+
     handler = CommandHandler()
     with console.status('Fetching comment...'):
         try:
@@ -558,6 +697,10 @@ def delete_comment(work_item_key: str, comment_id: str):
     WORK_ITEM_KEY is the case-sensitive key that identifies the work item.
     COMMENT_ID the id of the comment whose text we want to view.
     """
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer
+
     handler = CommandHandler()
     with console.status('Trying to delete the comment...'):
         try:
@@ -572,6 +715,73 @@ def delete_comment(work_item_key: str, comment_id: str):
 # -- APPLICATION --
 
 
+@cli.command('batch')
+@click.option(
+    '--max-concurrency',
+    '-c',
+    type=click.IntRange(min=1),
+    default=CLI_BATCH_DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    help='The maximum number of operations that run at the same time.',
+)
+def batch(max_concurrency: int) -> None:
+    """Runs the operations read from stdin, one JSON object per line, and writes their results to stdout.
+
+    Supported operations (key "op"): search, update, transition, comment, delete and clone. The arguments of every
+    operation are the options of the equivalent command, e.g. {"op": "comment", "key": "SCRUM-1", "message": "Done"}.
+    All the operations share a single connection to the Jira server. The command exits with status 1 if any operation
+    fails.
+    """
+
+    from jiratui.commands.batch import BatchRunner
+    from jiratui.commands.handler import CommandHandler
+
+    runner = BatchRunner(CommandHandler(), max_concurrency=max_concurrency)
+    if asyncio.run(runner.run(sys.stdin, sys.stdout)):
+        sys.exit(1)
+
+
+@cli.command('daemon')
+@click.option(
+    '--status', is_flag=True, default=False, help='Shows whether the daemon is running and exits.'
+)
+def daemon(status: bool = False) -> None:
+    """Runs a process that keeps the connections to the Jira server and the caches warm for the other commands.
+
+    While the daemon is running the commands of the CLI send their requests to it over a Unix domain socket instead of
+    connecting to the server. The daemon runs until it is interrupted (Ctrl+C) or it receives SIGTERM.
+    """
+
+    from jiratui.commands.daemon import DaemonServer, daemon_supported, is_daemon_running
+    from jiratui.files import get_daemon_socket_file
+
+    if not daemon_supported():
+        console.print('The daemon is not supported in this platform.')
+        sys.exit(1)
+    socket_file = get_daemon_socket_file()
+    if status:
+        if is_daemon_running(socket_file):
+            console.print(f'The daemon is running: {socket_file}')
+        else:
+            console.print('The daemon is not running.')
+            sys.exit(1)
+        return
+
+    from jiratui.api_controller.controller import APIController
+    from jiratui.config import CONFIGURATION, load_configuration
+
+    CONFIGURATION.set(load_configuration())
+    server = DaemonServer(APIController(), socket_file)
+    console.print(f'Listening on {socket_file}. Press Ctrl+C to stop.')
+    try:
+        asyncio.run(server.serve())
+    except CLIException as e:
+        console.print(str(e))
+        sys.exit(1)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
 @cli.command('completions', help='Generate shell completion script.')
 @click.argument('shell', type=click.Choice(['bash', 'zsh', 'fish']))
 def completions(shell):
@@ -632,6 +842,12 @@ def ui(
 ):
     """Launches the JiraTUI application."""
 
+    from pydantic import ValidationError
+    from textual.theme import BUILTIN_THEMES
+
+    from jiratui.app import JiraApp
+    from jiratui.config import load_configuration
+
     # check that the config file exists
     try:
         check_config_file()
@@ -656,7 +872,7 @@ def ui(
 
     # get the configuration settings
     try:
-        settings = ApplicationConfiguration()  # type: ignore[call-arg] # noqa
+        settings = load_configuration()
     except FileNotFoundError as e:
         # this should not happen because we check above
         console.print(e)
@@ -705,6 +921,10 @@ def search_users(email_or_name: str):
 
     EMAIL_OR_NAME is the email address or name to search users.
     """
+
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraUserRenderer
+
     handler = CommandHandler()
     with console.status('Searching Jira users...'):
         try:
@@ -751,6 +971,9 @@ def search_users_groups(
 ) -> None:
     """Searches Jira users groups. Use it to find groups of users by name or ID."""
 
+    from jiratui.commands.handler import CommandHandler
+    from jiratui.commands.render import CLIExceptionRenderer, JiraUserGroupRenderer
+
     handler = CommandHandler()
     if group_id:
         # fetch the number of users in the group
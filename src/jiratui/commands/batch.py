@@ -0,0 +1,262 @@
+"""Runs many operations of the CLI in a single process.
+
+Every command of the CLI starts a process, builds an `APIController` and opens new connections to the Jira server.
+Scripts that run hundreds of commands pay that cost for every command. `BatchRunner` reads operations from a stream,
+one JSON object per line, runs them concurrently (up to a limit) using a single event loop and a single
+`APIController` and, writes the result of every operation as soon as it finishes, one JSON object per line.
+
+An operation is a JSON object with the name of the operation in the key `op` and its arguments, e.g.
+
+    {"id": "1", "op": "comment", "key": "SCRUM-1", "message": "Released in v1.2"}
+    {"id": "2", "op": "transition", "key": "SCRUM-1", "status_id": 31}
+
+The result of an operation includes the `id` of the operation (if any), the number of the line of the operation and
+either `"success": true` and the `result` or `"success": false` and the `error`.
+"""
+
+import asyncio
+from datetime import date
+import json
+from typing import Any, Awaitable, Callable, TextIO
+
+from jiratui.api_controller.controller import APIControllerResponse
+from jiratui.commands.handler import CommandHandler
+from jiratui.commands.render import comment_as_json, work_item_as_json
+from jiratui.constants import CLI_BATCH_DEFAULT_MAX_CONCURRENCY
+from jiratui.exceptions import CLIException
+
+SEARCH_FIELDS = [
+    'id',
+    'key',
+    'status',
+    'summary',
+    'created',
+    'updated',
+    'reporter',
+    'issuetype',
+    'assignee',
+    'priority',
+    'parent',
+    'labels',
+]
+"""The fields retrieved for every work item found by the `search` operation."""
+
+
+class BatchOperationError(Exception):
+    """Raised when an operation is not valid, e.g. a required argument is missing."""
+
+
+def _get_argument(operation: dict, name: str, required: bool = False) -> Any:
+    value = operation.get(name)
+    if required and (value is None or value == ''):
+        raise BatchOperationError(f'The operation requires the argument "{name}".')
+    return value
+
+
+def _get_date(operation: dict, name: str) -> date | None:
+    if (value := _get_argument(operation, name)) is None:
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError as e:
+        raise BatchOperationError(f'The argument "{name}" must be a date: YYYY-MM-DD.') from e
+
+
+class BatchRunner:
+    """Runs the operations read from a stream of JSON lines using a single `CommandHandler`."""
+
+    def __init__(
+        self, handler: CommandHandler, max_concurrency: int = CLI_BATCH_DEFAULT_MAX_CONCURRENCY
+    ):
+        """Initializes the runner.
+
+        Args:
+            handler: the handler of the commands; all the operations share its `APIController`.
+            max_concurrency: the maximum number of operations that run at the same time.
+        """
+        self.handler = handler
+        self.max_concurrency = max(max_concurrency, 1)
+        self.operations: dict[str, Callable[[dict], Awaitable[Any]]] = {
+            'search': self.search,
+            'update': self.update,
+            'transition': self.transition,
+            'comment': self.comment,
+            'delete': self.delete,
+            'clone': self.clone,
+        }
+
+    async def run(self, source: TextIO, output: TextIO) -> int:
+        """Runs every operation read from a stream.
+
+        Lines are read while operations run; no more than `max_concurrency` operations are pending at any time. Empty
+        lines are ignored.
+
+        Args:
+            source: the stream of operations, one JSON object per line.
+            output: the stream where the results are written, one JSON object per line, in the order the operations
+            finish.
+
+        Returns:
+            The number of operations that failed.
+        """
+        slots = asyncio.Semaphore(self.max_concurrency)
+        tasks: set[asyncio.Task] = set()
+        failed = 0
+
+        async def run_and_write(line_number: int, line: str) -> None:
+            nonlocal failed
+            try:
+                result = await self.run_line(line_number, line)
+                if not result['success']:
+                    failed += 1
+                output.write(json.dumps(result, default=str) + '\n')
+                output.flush()
+            finally:
+                slots.release()
+
+        line_number = 0
+        try:
+            while line := await asyncio.to_thread(source.readline):
+                line_number += 1
+                if not line.strip():
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(run_and_write(line_number, line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            await self.handler.api.close_connections()
+        return failed
+
+    async def run_line(self, line_number: int, line: str) -> dict:
+        """Runs the operation in a line.
+
+        Args:
+            line_number: the number of the line; it identifies the operation in the result.
+            line: a JSON object with the operation.
+
+        Returns:
+            A dictionary with the result of the operation.
+        """
+        result: dict[str, Any] = {'line': line_number}
+        try:
+            operation = json.loads(line)
+            if not isinstance(operation, dict):
+                raise BatchOperationError('The operation must be a JSON object.')
+            if 'id' in operation:
+                result['id'] = operation['id']
+            name = _get_argument(operation, 'op', required=True)
+            result['op'] = name
+            if (run_operation := self.operations.get(name)) is None:
+                raise BatchOperationError(
+                    f'Unknown operation "{name}". Supported operations: {", ".join(self.operations)}.'
+                )
+            value = await run_operation(operation)
+        except json.JSONDecodeError as e:
+            result.update(success=False, error=f'The line is not valid JSON: {str(e)}')
+        except BatchOperationError as e:
+            result.update(success=False, error=str(e))
+        except CLIException as e:
+            result.update(success=False, error=str(e), details=e.get_extra_details())
+        except Exception as e:
+            result.update(success=False, error=f'An unknown error occurred: {str(e)}')
+        else:
+            result.update(success=True, result=value)
+        return result
+
+    async def search(self, operation: dict) -> dict:
+        """Searches work items by key or by project, assignee and dates of creation."""
+        api = self.handler.api
+        response: APIControllerResponse
+        if key := _get_argument(operation, 'key'):
+            response = await api.get_issue(issue_id_or_key=str(key).strip(), fields=SEARCH_FIELDS)
+        else:
+            response = await api.search_issues(
+                project_key=_get_argument(operation, 'project_key', required=True),
+                assignee=_get_argument(operation, 'assignee_account_id'),
+                created_from=_get_date(operation, 'created_from'),
+                created_until=_get_date(operation, 'created_until'),
+                limit=_get_argument(operation, 'limit'),
+                fields=SEARCH_FIELDS,
+                order_by=api.config.search_results_default_order,
+            )
+        if not response.success or not response.result:
+            raise CLIException(
+                'An error occurred while searching for work items.',
+                extra={'work_item_key': key, 'error_message': response.error},
+            )
+        return {
+            'issues': [work_item_as_json(work_item) for work_item in response.result.issues],
+            'next_page_token': response.result.next_page_token,
+        }
+
+    async def update(self, operation: dict) -> dict:
+        """Updates the summary, assignee, due date, priority and/or status of a work item."""
+        key = _get_argument(operation, 'key', required=True)
+        status_id = _get_argument(operation, 'status_id')
+        fields = ['summary', 'assignee_account_id', 'due_date', 'priority_id']
+        if status_id is None and all(operation.get(field) is None for field in fields):
+            raise BatchOperationError(
+                f'The operation requires one of the arguments: {", ".join([*fields, "status_id"])}.'
+            )
+        result: dict[str, Any] = {'key': key}
+        if status_id is not None:
+            result['status_updated'] = await self.handler.update_issue_status(key, status_id)
+        if any(operation.get(field) is not None for field in fields):
+            summary = _get_argument(operation, 'summary')
+            if summary is not None and not str(summary).strip():
+                raise BatchOperationError('The summary can not be empty.')
+            result['updated'] = bool(
+                await self.handler.update_issue(
+                    key,
+                    summary=str(summary).strip() if summary is not None else None,
+                    assignee_account_id=_get_argument(operation, 'assignee_account_id'),
+                    due_date=_get_date(operation, 'due_date'),
+                    priority_id=_get_argument(operation, 'priority_id'),
+                )
+            )
+        return result
+
+    async def transition(self, operation: dict) -> dict:
+        """Transitions a work item to a status."""
+        key = _get_argument(operation, 'key', required=True)
+        status_id = _get_argument(operation, 'status_id', required=True)
+        return {
+            'key': key,
+            'status_updated': await self.handler.update_issue_status(key, status_id),
+        }
+
+    async def comment(self, operation: dict) -> dict:
+        """Adds a comment to a work item."""
+        key = _get_argument(operation, 'key', required=True)
+        message = _get_argument(operation, 'message', required=True)
+        response: APIControllerResponse = await self.handler.api.add_comment(key, message)
+        if not response.success:
+            raise CLIException(
+                'An error occurred while adding a comment.',
+                extra={'work_item_key': key, 'error_message': response.error},
+            )
+        return {
+            'key': key,
+            'comment': comment_as_json(response.result) if response.result else None,
+        }
+
+    async def delete(self, operation: dict) -> dict:
+        """Deletes a work item."""
+        key = _get_argument(operation, 'key', required=True)
+        return {'key': key, 'deleted': await self.handler.delete_work_item(key)}
+
+    async def clone(self, operation: dict) -> dict:
+        """Clones a work item."""
+        key = _get_argument(operation, 'key', required=True)
+        cloned: dict = await self.handler.clone_work_item(
+            key,
+            _get_argument(operation, 'summary'),
+            bool(_get_argument(operation, 'clone_status')),
+        )
+        return {
+            'key': cloned['key'],
+            'issues': [work_item_as_json(work_item) for work_item in cloned['work_item'].issues],
+        }
@@ -0,0 +1,277 @@
+"""A long-lived process that runs the requests of the CLI commands with a warm `APIController`.
+
+Every command of the CLI builds a new `APIController`, so it opens new connections to the Jira server (TCP and TLS
+handshakes) and starts with empty caches. `jiratui daemon` keeps a single `APIController` alive and listens on a Unix
+domain socket under `$XDG_RUNTIME_DIR`; `DaemonAPIController` is a drop-in replacement of `APIController` that sends
+every call to the daemon, so the commands reuse its connections, its caches of metadata and work items and, its
+coalescing of identical requests in flight.
+
+A request is a single call of a method of `APIController`. The request and its response are pickled and sent as a
+message prefixed by its length. The socket is only accessible by the user who started the daemon. When the daemon is
+not running, or it runs with another configuration, calls run in-process as usual.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import inspect
+import os
+from pathlib import Path
+import pickle
+import signal
+import socket
+import struct
+import sys
+from typing import Any, Awaitable, Callable
+
+from jiratui.api_controller.controller import APIController, WorkItemsSearchIterator
+from jiratui.config import ApplicationConfiguration
+from jiratui.exceptions import CLIException
+
+_HEADER = struct.Struct('!I')
+"""The header of a message: the size, in bytes, of the pickled message that follows."""
+
+_LOCAL_METHODS = {'close_connections', 'iter_search_issues'}
+"""The methods of `APIController` that always run in the process of the CLI."""
+
+
+class DaemonError(Exception):
+    """Raised when the daemon can not run a call, e.g. the connection was lost after sending the call."""
+
+
+class DaemonUnavailableError(DaemonError):
+    """Raised when the daemon is not running or, it can not run the calls of this configuration."""
+
+
+def daemon_supported() -> bool:
+    """Indicates whether the daemon is supported in this platform, i.e. it supports Unix domain sockets."""
+    return sys.platform != 'win32'
+
+
+def get_configuration_id(config: ApplicationConfiguration) -> str:
+    """Builds an identifier of a configuration.
+
+    The daemon only runs the calls of clients whose validated configuration is the same as its own, e.g. they connect
+    to the same Jira account and use the same settings of the caches and the searches.
+
+    Args:
+        config: the configuration of the application.
+
+    Returns:
+        A hash of every setting of the configuration, including a digest of the API token.
+    """
+    configuration = hashlib.sha256(config.model_dump_json().encode())
+    # the dump masks the API token, so a configuration with another token would match
+    token = config.jira_api_token.get_secret_value().encode()
+    configuration.update(hashlib.sha256(token).digest())
+    return configuration.hexdigest()
+
+
+def is_remote_method(name: str) -> bool:
+    """Indicates whether calls to a method of `APIController` can run in the daemon.
+
+    Args:
+        name: the name of the method.
+
+    Returns:
+        `True` if the method is a public coroutine of `APIController`; `False` otherwise.
+    """
+    if name.startswith('_') or name in _LOCAL_METHODS:
+        return False
+    return inspect.iscoroutinefunction(getattr(APIController, name, None))
+
+
+def is_daemon_running(socket_file: Path) -> bool:
+    """Checks whether a daemon is listening on a socket.
+
+    Args:
+        socket_file: the path to the socket of the daemon.
+
+    Returns:
+        `True` if a process accepts connections on the socket; `False` otherwise.
+    """
+    if not daemon_supported() or not socket_file.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_file))
+        except OSError:
+            return False
+    return True
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Any:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(size))
+
+
+async def _write_message(writer: asyncio.StreamWriter, payload: bytes) -> None:
+    writer.write(_HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+
+
+class DaemonServer:
+    """Runs the calls sent by the CLI commands using a single `APIController`."""
+
+    def __init__(self, controller: APIController, socket_file: Path):
+        """Initializes the server.
+
+        Args:
+            controller: the controller that runs every call.
+            socket_file: the path to the Unix domain socket where the server listens.
+        """
+        self.controller = controller
+        self.socket_file = socket_file
+        self.configuration_id = get_configuration_id(controller.config)
+
+    async def serve(self) -> None:
+        """Listens on the socket until the task is cancelled or, the process receives `SIGTERM`.
+
+        Raises:
+            CLIException: if another daemon is listening on the socket.
+        """
+        if self.socket_file.exists():
+            if is_daemon_running(self.socket_file):
+                raise CLIException(f'The daemon is already running: {self.socket_file}')
+            # the socket of a daemon that did not stop cleanly
+            self.socket_file.unlink()
+        # only the user that runs the daemon can connect to the socket
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self.socket_file)
+            )
+        finally:
+            os.umask(umask)
+        if (task := asyncio.current_task()) is not None:
+            # signals can only be handled in the main thread
+            with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+                asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_file.unlink()
+            await self.controller.close_connections()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            configuration_id, name, args, kwargs = await _read_message(reader)
+            await _write_message(writer, await self._run(configuration_id, name, args, kwargs))
+        except (asyncio.IncompleteReadError, ConnectionError, pickle.UnpicklingError):
+            # the client went away or, it did not send a valid request
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _run(self, configuration_id: str, name: str, args: tuple, kwargs: dict) -> bytes:
+        response: tuple[str, Any]
+        if configuration_id != self.configuration_id:
+            response = ('unavailable', 'The daemon runs with another configuration.')
+        elif not is_remote_method(name):
+            response = ('error', DaemonError(f'The daemon can not run the method "{name}".'))
+        else:
+            try:
+                response = ('ok', await getattr(self.controller, name)(*args, **kwargs))
+            except Exception as e:
+                response = ('error', e)
+        try:
+            return pickle.dumps(response)
+        except Exception as e:
+            return pickle.dumps(
+                ('error', DaemonError(f'The result of "{name}" can not be sent: {str(e)}'))
+            )
+
+
+class DaemonAPIController(WorkItemsSearchIterator):
+    """A replacement of `APIController` that runs every call in the daemon.
+
+    Calls run in a local `APIController` once the daemon is found to be unavailable, i.e. it is not running or it runs
+    with another configuration. Calls that may have reached the daemon are never run again locally, so operations
+    that update work items do not run twice. Search results are paged through by the local process
+    (`iter_search_issues()`); every page is retrieved by the daemon.
+    """
+
+    def __init__(self, config: ApplicationConfiguration, socket_file: Path):
+        """Initializes the controller.
+
+        Args:
+            config: the configuration of the application.
+            socket_file: the path to the socket of the daemon.
+        """
+        self.config = config
+        self.socket_file = socket_file
+        self.configuration_id = get_configuration_id(config)
+        self._local: APIController | None = None
+
+    @classmethod
+    def connect(
+        cls, config: ApplicationConfiguration, socket_file: Path
+    ) -> 'DaemonAPIController | None':
+        """Builds a controller that runs its calls in the daemon, if the daemon may be running.
+
+        Args:
+            config: the configuration of the application.
+            socket_file: the path to the socket of the daemon.
+
+        Returns:
+            An instance of `DaemonAPIController` or `None` if there is no socket of a daemon.
+        """
+        if not daemon_supported() or not socket_file.exists():
+            return None
+        return cls(config, socket_file)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if not is_remote_method(name):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._call(name, args, kwargs)
+
+        return call
+
+    async def close_connections(self) -> None:
+        """Releases the HTTP connections of the local controller, if any. The connections of the daemon stay open."""
+        if self._local is not None:
+            await self._local.close_connections()
+
+    async def _call(self, name: str, args: tuple, kwargs: dict) -> Any:
+        if self._local is None:
+            try:
+                return await self._call_daemon(name, args, kwargs)
+            except DaemonUnavailableError:
+                self._local = APIController(self.config)
+        return await getattr(self._local, name)(*args, **kwargs)
+
+    async def _call_daemon(self, name: str, args: tuple, kwargs: dict) -> Any:
+        try:
+            request = pickle.dumps((self.configuration_id, name, args, kwargs))
+        except Exception as e:
+            raise DaemonUnavailableError(
+                f'The arguments of "{name}" can not be sent: {str(e)}'
+            ) from e
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(self.socket_file))
+        except OSError as e:
+            raise DaemonUnavailableError(str(e)) from e
+        try:
+            await _write_message(writer, request)
+            status, result = await _read_message(reader)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            raise DaemonError(
+                f'The connection to the daemon was lost while running "{name}".'
+            ) from e
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+        if status == 'unavailable':
+            raise DaemonUnavailableError(result)
+        if status == 'error':
+            raise result
+        return result
@@ -1,14 +1,19 @@
 import asyncio
+import contextlib
 from datetime import date
-from typing import Any
+from typing import Any, AsyncGenerator, AsyncIterator
 
 from jiratui.api_controller.controller import APIController, APIControllerResponse
-from jiratui.config import CONFIGURATION, ApplicationConfiguration
+from jiratui.commands.daemon import DaemonAPIController
+from jiratui.config import CONFIGURATION, load_configuration
+from jiratui.constants import CLI_SEARCH_EXPORT_PAGE_SIZE, CLI_SEARCH_EXPORT_PREFETCH_PAGES
 from jiratui.exceptions import (
+    APIException,
     CLIException,
     UpdateWorkItemException,
     ValidationError,
 )
+from jiratui.files import get_daemon_socket_file
 from jiratui.models import (
     IssueComment,
     IssueTransition,
@@ -29,8 +34,12 @@ COMMENTS_PER_PAGE = 10
 
 class CommandHandler:
     def __init__(self):
-        CONFIGURATION.set(ApplicationConfiguration())  # type:ignore[call-arg]
-        self.api = APIController()
+        CONFIGURATION.set(load_configuration())
+        config = CONFIGURATION.get()
+        # the daemon, if it is running, keeps the connections to the server and the caches warm between commands
+        self.api: APIController | DaemonAPIController = (
+            config.cli_use_daemon and DaemonAPIController.connect(config, get_daemon_socket_file())
+        ) or APIController()
 
     def users(self, email_or_name: str) -> list[JiraUser]:
         """Searches Jira users by name or email.
@@ -324,11 +333,12 @@ class CommandHandler:
 
     def search_issues(
         self,
-        project_key: str,
+        project_key: str | None = None,
         assignee_account_id: str | None = None,
         limit: int | None = None,
         created_from: date | None = None,
         created_until: date | None = None,
+        jql_query: str | None = None,
     ) -> JiraIssueSearchResponse:
         """Searches work items based on different search criteria.
 
@@ -338,6 +348,7 @@ class CommandHandler:
             limit: retrieves items up to this limit.
             created_from: searches items created from this date (inclusive).
             created_until: searches items created until this date (inclusive).
+            jql_query: searches items matching this (additional) JQL query.
 
         Returns:
             An instance of `JiraIssueSearchResponse` with the list of work items found.
@@ -364,6 +375,7 @@ class CommandHandler:
                 limit=limit,
                 created_from=created_from,
                 created_until=created_until,
+                jql_query=jql_query,
                 order_by=CONFIGURATION.get().search_results_default_order,
             )
         )
@@ -371,6 +383,67 @@ class CommandHandler:
             return response.result
         raise CLIException(response.error)
 
+    async def iter_search_issues(
+        self,
+        project_key: str | None = None,
+        assignee_account_id: str | None = None,
+        limit: int | None = None,
+        created_from: date | None = None,
+        created_until: date | None = None,
+        jql_query: str | None = None,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[JiraIssue]:
+        """Searches work items based on different search criteria and yields every work item found.
+
+        Unlike `search_issues()` this pages through all the results; the next page is fetched while the work items
+        of the current one are consumed.
+
+        Args:
+            project_key: searches items within the project with this key.
+            assignee_account_id: searches items assigned to this user.
+            limit: stops after yielding this number of items. If `None` all the items found are yielded.
+            created_from: searches items created from this date (inclusive).
+            created_until: searches items created until this date (inclusive).
+            jql_query: searches items matching this (additional) JQL query.
+            fields: the fields to retrieve for every work item.
+
+        Returns:
+            An async iterator of `JiraIssue` instances.
+
+        Raises:
+            CLIException: if a page of results can not be retrieved.
+        """
+        page_size = CLI_SEARCH_EXPORT_PAGE_SIZE
+        if limit is not None:
+            page_size = max(min(limit, page_size), 1)
+        work_items: AsyncGenerator[JiraIssue, None] = self.api.iter_search_issues(
+            project_key=project_key,
+            assignee=assignee_account_id,
+            created_from=created_from,
+            created_until=created_until,
+            jql_query=jql_query,
+            limit=page_size,
+            order_by=CONFIGURATION.get().search_results_default_order,
+            fields=fields,
+            prefetch=CLI_SEARCH_EXPORT_PREFETCH_PAGES,
+        )
+        total = 0
+        try:
+            # closing the search as soon as the limit is reached stops fetching pages ahead
+            async with contextlib.aclosing(work_items):
+                async for work_item in work_items:
+                    if limit is not None and total >= limit:
+                        break
+                    total += 1
+                    yield work_item
+        except APIException as e:
+            raise CLIException(
+                'An error occurred while searching for work items.',
+                extra={'error_message': str(e)},
+            ) from e
+        finally:
+            await self.api.close_connections()
+
     def get_issue(self, key: str, fields: list[str] | None = None) -> JiraIssueSearchResponse:
         """Retrieves the details of a work item.
 
@@ -1,5 +1,7 @@
+from abc import ABC, abstractmethod
+import csv
 import json
-from typing import Any
+from typing import Any, TextIO
 
 from rich.console import Console
 from rich.rule import Rule
@@ -7,7 +9,13 @@ from rich.table import Table
 from rich.text import Text
 
 from jiratui.config import CONFIGURATION
-from jiratui.models import IssueComment, JiraIssueSearchResponse, JiraUser, JiraUserGroup
+from jiratui.models import (
+    IssueComment,
+    JiraIssue,
+    JiraIssueSearchResponse,
+    JiraUser,
+    JiraUserGroup,
+)
 from jiratui.utils.adf import convert_adf_to_markdown
 
 
@@ -307,3 +315,167 @@ class ThemesRenderer(Renderer):
                 f'config.theme: "{theme}"',
             )
         console.print(table)
+
+
+def _user_as_json(user: JiraUser | None) -> dict | None:
+    if user is None:
+        return None
+    return {'account_id': user.account_id, 'display_name': user.display_name, 'email': user.email}
+
+
+def work_item_as_json(work_item: JiraIssue) -> dict:
+    """Builds the machine-readable representation of a work item.
+
+    Args:
+        work_item: the work item.
+
+    Returns:
+        A dictionary that can be serialized to JSON with the main fields of the work item.
+    """
+    return {
+        'id': work_item.id,
+        'key': work_item.key,
+        'summary': work_item.summary,
+        'status': {'id': work_item.status.id, 'name': work_item.status.name}
+        if work_item.status
+        else None,
+        'type': {'id': work_item.issue_type.id, 'name': work_item.issue_type.name}
+        if work_item.issue_type
+        else None,
+        'priority': {'id': work_item.priority.id, 'name': work_item.priority.name}
+        if work_item.priority
+        else None,
+        'parent_key': work_item.parent_issue_key,
+        'assignee': _user_as_json(work_item.assignee),
+        'reporter': _user_as_json(work_item.reporter),
+        'labels': work_item.labels or [],
+        'created': work_item.created.isoformat() if work_item.created else None,
+        'updated': work_item.updated.isoformat() if work_item.updated else None,
+        'due_date': work_item.due_date.isoformat() if work_item.due_date else None,
+    }
+
+
+def comment_as_json(comment: IssueComment) -> dict:
+    """Builds the machine-readable representation of a comment.
+
+    Args:
+        comment: the comment.
+
+    Returns:
+        A dictionary that can be serialized to JSON with the comment; the text of the comment is in Markdown.
+    """
+    body = comment.body
+    if isinstance(body, dict):
+        body = convert_adf_to_markdown(body)
+    return {
+        'id': comment.id,
+        'author': _user_as_json(comment.author),
+        'created': comment.created.isoformat() if comment.created else None,
+        'updated': comment.updated.isoformat() if comment.updated else None,
+        'body': body,
+    }
+
+
+WORK_ITEM_EXPORT_FIELDS: dict[str, str] = {
+    'summary': 'summary',
+    'status': 'status',
+    'issuetype': 'type',
+    'priority': 'priority',
+    'parent': 'parent_key',
+    'assignee': 'assignee',
+    'reporter': 'reporter',
+    'labels': 'labels',
+    'created': 'created',
+    'updated': 'updated',
+    'duedate': 'due_date',
+}
+"""The fields of work items that can be exported, by the ID of the field in Jira and the name of the column."""
+
+
+def _export_value(work_item: JiraIssue, json_work_item: dict, field_id: str) -> Any:
+    if (column := WORK_ITEM_EXPORT_FIELDS.get(field_id)) is not None:
+        return json_work_item[column]
+    if (value := work_item.get_custom_field_value(field_id)) is not None:
+        return value
+    return work_item.get_additional_field_value(field_id)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ','.join(str(_csv_value(item)) for item in value)
+    if isinstance(value, dict):
+        # users, statuses, types and priorities are exported by name
+        for name in ('display_name', 'name', 'value'):
+            if value.get(name) is not None:
+                return value[name]
+        return json.dumps(value, default=str)
+    return value
+
+
+class WorkItemsWriter(ABC):
+    """Writes work items to a stream, one at a time, as soon as they are retrieved.
+
+    Nothing is buffered besides the row being written, so a search with any number of results is exported using the
+    same amount of memory.
+    """
+
+    def __init__(self, output: TextIO, fields: list[str]):
+        """Initializes the writer.
+
+        Args:
+            output: the stream where the work items are written.
+            fields: the IDs of the fields of the work items to write; the id and key are always written.
+        """
+        self.output = output
+        self.fields = [field_id for field_id in fields if field_id not in ('id', 'key')]
+        self.columns = ['id', 'key'] + [
+            WORK_ITEM_EXPORT_FIELDS.get(field_id, field_id) for field_id in self.fields
+        ]
+
+    def build_row(self, work_item: JiraIssue) -> dict:
+        json_work_item = work_item_as_json(work_item)
+        values = [_export_value(work_item, json_work_item, field_id) for field_id in self.fields]
+        return dict(
+            zip(self.columns, [json_work_item['id'], json_work_item['key'], *values], strict=True)
+        )
+
+    @abstractmethod
+    def write(self, work_item: JiraIssue) -> None:
+        """Writes a work item to the stream.
+
+        Args:
+            work_item: the work item.
+
+        Returns:
+            Nothing.
+        """
+
+
+class JSONLinesWorkItemsWriter(WorkItemsWriter):
+    """Writes every work item as a JSON object in its own line (JSON Lines / NDJSON)."""
+
+    def write(self, work_item: JiraIssue) -> None:
+        self.output.write(json.dumps(self.build_row(work_item), default=str) + '\n')
+
+
+class CSVWorkItemsWriter(WorkItemsWriter):
+    """Writes every work item as a row of CSV; the header is written when the writer is created."""
+
+    def __init__(self, output: TextIO, fields: list[str]):
+        super().__init__(output, fields)
+        self._writer = csv.DictWriter(self.output, fieldnames=self.columns)
+        self._writer.writeheader()
+
+    def write(self, work_item: JiraIssue) -> None:
+        row = self.build_row(work_item)
+        self._writer.writerow({name: _csv_value(value) for name, value in row.items()})
+
+
+WORK_ITEMS_WRITERS: dict[str, type[WorkItemsWriter]] = {
+    'jsonl': JSONLinesWorkItemsWriter,
+    'ndjson': JSONLinesWorkItemsWriter,
+    'csv': CSVWorkItemsWriter,
+}
+"""The writers of work items by the name of the output format."""
@@ -0,0 +1,181 @@
+import asyncio
+import contextlib
+from pathlib import Path
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, Mock, patch
+
+from pydantic import SecretStr
+import pytest
+
+from jiratui.api_controller.controller import APIController, APIControllerResponse
+from jiratui.commands.daemon import (
+    DaemonAPIController,
+    DaemonServer,
+    get_configuration_id,
+    is_daemon_running,
+    is_remote_method,
+)
+from jiratui.config import ApplicationConfiguration
+from jiratui.exceptions import ValidationError
+from jiratui.models import IssueStatus, JiraIssue, JiraIssueSearchResponse
+
+
+@pytest.fixture()
+def socket_file(tmp_path: Path) -> Path:
+    return tmp_path / 'daemon.sock'
+
+
+@pytest.fixture()
+def controller(config_for_testing: ApplicationConfiguration) -> Mock:
+    config_for_testing.model_dump_json.return_value = '{"cloud": true}'
+    controller_mock = Mock(spec=APIController)
+    controller_mock.config = config_for_testing
+    controller_mock.close_connections = AsyncMock()
+    return controller_mock
+
+
+@contextlib.asynccontextmanager
+async def running_daemon(controller: Mock, socket_file: Path) -> AsyncIterator[asyncio.Task]:
+    task = asyncio.create_task(DaemonServer(controller, socket_file).serve())
+    while not socket_file.exists():
+        await asyncio.sleep(0.01)
+    try:
+        yield task
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def test_configurations_with_different_api_tokens_are_not_matched(
+    config_for_testing: ApplicationConfiguration,
+):
+    # GIVEN
+    config_for_testing.model_dump_json.return_value = '{"jira_api_token": "**********"}'
+    configuration_id = get_configuration_id(config_for_testing)
+    # WHEN
+    config_for_testing.jira_api_token = SecretStr('rotated')
+    # THEN
+    assert get_configuration_id(config_for_testing) != configuration_id
+
+
+def test_is_remote_method():
+    assert is_remote_method('get_issue') is True
+    assert is_remote_method('close_connections') is False
+    assert is_remote_method('iter_search_issues') is False
+    assert is_remote_method('_build_search_results') is False
+    assert is_remote_method('unknown') is False
+
+
+@pytest.mark.asyncio
+async def test_calls_run_in_the_daemon(
+    controller: Mock, socket_file: Path, config_for_testing: ApplicationConfiguration
+):
+    # GIVEN
+    work_item = JiraIssue(
+        id='1', key='SCRUM-1', summary='Summary', status=IssueStatus(id='1', name='To Do')
+    )
+    controller.get_issue = AsyncMock(
+        return_value=APIControllerResponse(result=JiraIssueSearchResponse(issues=[work_item]))
+    )
+    async with running_daemon(controller, socket_file) as daemon:
+        client = DaemonAPIController.connect(config_for_testing, socket_file)
+        assert client is not None
+        # WHEN
+        response = await client.get_issue(issue_id_or_key='SCRUM-1', fields=['summary'])
+        await client.close_connections()
+        # THEN
+        assert response == APIControllerResponse(result=JiraIssueSearchResponse(issues=[work_item]))
+        controller.get_issue.assert_awaited_once_with(issue_id_or_key='SCRUM-1', fields=['summary'])
+        assert is_daemon_running(socket_file) is True
+        assert daemon.done() is False
+    assert socket_file.exists() is False
+    controller.close_connections.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_errors_raised_in_the_daemon_are_raised_by_the_client(
+    controller: Mock, socket_file: Path, config_for_testing: ApplicationConfiguration
+):
+    # GIVEN
+    controller.update_issue = AsyncMock(
+        side_effect=ValidationError('Invalid summary', extra={'work_item_key': 'SCRUM-1'})
+    )
+    async with running_daemon(controller, socket_file):
+        client = DaemonAPIController(config_for_testing, socket_file)
+        # WHEN
+        with pytest.raises(ValidationError, match='Invalid summary') as error:
+            await client.update_issue('SCRUM-1', {'summary': ''})
+    # THEN
+    assert error.value.extra == {'work_item_key': 'SCRUM-1'}
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, 'get_issue')
+async def test_calls_run_locally_when_the_daemon_is_not_running(
+    get_issue_mock: AsyncMock, socket_file: Path, config_for_testing: ApplicationConfiguration
+):
+    # GIVEN
+    config_for_testing.model_dump_json.return_value = '{"cloud": true}'
+    get_issue_mock.return_value = APIControllerResponse(result=None)
+    socket_file.touch()
+    client = DaemonAPIController.connect(config_for_testing, socket_file)
+    assert client is not None
+    # WHEN
+    response = await client.get_issue(issue_id_or_key='SCRUM-1')
+    # THEN
+    assert response == APIControllerResponse(result=None)
+    get_issue_mock.assert_awaited_once_with(issue_id_or_key='SCRUM-1')
+
+
+@pytest.mark.asyncio
+@patch.object(APIController, 'get_issue')
+async def test_calls_run_locally_when_the_daemon_uses_another_configuration(
+    get_issue_mock: AsyncMock,
+    controller: Mock,
+    socket_file: Path,
+    config_for_testing: ApplicationConfiguration,
+    config_for_testing_jira_dc: ApplicationConfiguration,
+):
+    # GIVEN
+    config_for_testing_jira_dc.model_dump_json.return_value = '{"cloud": false}'
+    get_issue_mock.return_value = APIControllerResponse(result=None)
+    controller.get_issue = AsyncMock()
+    async with running_daemon(controller, socket_file):
+        client = DaemonAPIController(config_for_testing_jira_dc, socket_file)
+        # WHEN
+        response = await client.get_issue(issue_id_or_key='SCRUM-1')
+    # THEN
+    assert response == APIControllerResponse(result=None)
+    controller.get_issue.assert_not_awaited()
+    get_issue_mock.assert_awaited_once_with(issue_id_or_key='SCRUM-1')
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_paged_through_by_the_client(
+    controller: Mock, socket_file: Path, config_for_testing: ApplicationConfiguration
+):
+    # GIVEN
+    work_item = JiraIssue(
+        id='1', key='SCRUM-1', summary='Summary', status=IssueStatus(id='1', name='To Do')
+    )
+    controller.search_issues = AsyncMock(
+        return_value=APIControllerResponse(
+            result=JiraIssueSearchResponse(issues=[work_item], is_last=True)
+        )
+    )
+    async with running_daemon(controller, socket_file):
+        client = DaemonAPIController(config_for_testing, socket_file)
+        # WHEN
+        work_items = [
+            work_item async for work_item in client.iter_search_issues(project_key='SCRUM')
+        ]
+    # THEN
+    assert work_items == [work_item]
+    # every page is retrieved by the daemon
+    controller.search_issues.assert_awaited_once()
+
+
+def test_connect_without_daemon(socket_file: Path, config_for_testing: ApplicationConfiguration):
+    assert DaemonAPIController.connect(config_for_testing, socket_file) is None
+    assert is_daemon_running(socket_file) is False
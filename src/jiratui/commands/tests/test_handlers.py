@@ -24,7 +24,7 @@ from jiratui.models import (
 )
 
 
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_users_without_email_or_name(config_mock, config_for_testing):
     config_mock.return_value = config_for_testing
     handler = CommandHandler()
@@ -36,7 +36,7 @@ def test_users_without_email_or_name(config_mock, config_for_testing):
 
 
 @patch.object(APIController, 'search_users')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_users_with_email_or_name_not_found(
     config_mock, search_users_mock: AsyncMock, config_for_testing
 ):
@@ -54,7 +54,7 @@ def test_users_with_email_or_name_not_found(
 
 
 @patch.object(APIController, 'search_users')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_users_with_email_or_name_found(
     config_mock, search_users_mock: AsyncMock, config_for_testing
 ):
@@ -72,7 +72,7 @@ def test_users_with_email_or_name_found(
 
 
 @patch.object(APIController, 'find_groups')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_search_user_groups(config_mock, find_groups_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -88,7 +88,7 @@ def test_search_user_groups(config_mock, find_groups_mock: AsyncMock, config_for
 
 
 @patch.object(APIController, 'find_groups')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_search_user_groups_no_success(
     config_mock, find_groups_mock: AsyncMock, config_for_testing
 ):
@@ -106,7 +106,7 @@ def test_search_user_groups_no_success(
 
 
 @patch.object(APIController, 'count_users_in_group')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_total_users_in_group(
     config_mock, count_users_in_group_mock: AsyncMock, config_for_testing
 ):
@@ -122,7 +122,7 @@ def test_total_users_in_group(
 
 
 @patch.object(APIController, 'add_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_add_comment_success(config_mock, add_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -141,7 +141,7 @@ def test_add_comment_success(config_mock, add_comment_mock: AsyncMock, config_fo
 
 
 @patch.object(APIController, 'add_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_add_comment_failure(config_mock, add_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -157,7 +157,7 @@ def test_add_comment_failure(config_mock, add_comment_mock: AsyncMock, config_fo
 
 
 @patch.object(APIController, 'get_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comments_single_comment_success(
     config_mock, get_comment_mock: AsyncMock, config_for_testing
 ):
@@ -174,7 +174,7 @@ def test_get_comments_single_comment_success(
 
 
 @patch.object(APIController, 'get_comments')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comments_multiple_comments_success(
     config_mock, get_comments_mock: AsyncMock, config_for_testing
 ):
@@ -194,7 +194,7 @@ def test_get_comments_multiple_comments_success(
 
 
 @patch.object(APIController, 'get_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comments_single_comment_failure(
     config_mock, get_comment_mock: AsyncMock, config_for_testing
 ):
@@ -210,7 +210,7 @@ def test_get_comments_single_comment_failure(
 
 
 @patch.object(APIController, 'get_comments')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comments_multiple_comments_failure(
     config_mock, get_comments_mock: AsyncMock, config_for_testing
 ):
@@ -230,7 +230,7 @@ def test_get_comments_multiple_comments_failure(
 
 
 @patch.object(APIController, 'get_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comment_success(config_mock, get_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -249,7 +249,7 @@ def test_get_comment_success(config_mock, get_comment_mock: AsyncMock, config_fo
 
 
 @patch.object(APIController, 'get_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comment_not_found(config_mock, get_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -263,7 +263,7 @@ def test_get_comment_not_found(config_mock, get_comment_mock: AsyncMock, config_
 
 
 @patch.object(APIController, 'get_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_comment_failure(config_mock, get_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -277,7 +277,7 @@ def test_get_comment_failure(config_mock, get_comment_mock: AsyncMock, config_fo
 
 
 @patch.object(APIController, 'delete_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_delete_comment_success(config_mock, delete_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -291,7 +291,7 @@ def test_delete_comment_success(config_mock, delete_comment_mock: AsyncMock, con
 
 
 @patch.object(APIController, 'delete_comment')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_delete_comment_failure(config_mock, delete_comment_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -311,7 +311,7 @@ def test_delete_comment_failure(config_mock, delete_comment_mock: AsyncMock, con
 @patch('jiratui.commands.handler.work_item_assignee_has_changed')
 @patch.object(APIController, 'update_issue')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_with_assignee_and_priority_changes(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -365,7 +365,7 @@ async def test_update_issue_with_assignee_and_priority_changes(
 @patch('jiratui.commands.handler.work_item_assignee_has_changed')
 @patch.object(APIController, 'update_issue')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_no_changes(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -405,7 +405,7 @@ async def test_update_issue_no_changes(
 @patch('jiratui.commands.handler.work_item_assignee_has_changed')
 @patch.object(APIController, 'update_issue')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_update_work_item_exception(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -444,7 +444,7 @@ async def test_update_issue_update_work_item_exception(
 @patch('jiratui.commands.handler.work_item_assignee_has_changed')
 @patch.object(APIController, 'update_issue')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_validation_error(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -481,7 +481,7 @@ async def test_update_issue_validation_error(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_status_success(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -513,7 +513,7 @@ async def test_update_issue_status_success(
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_status_issue_not_found(
     config_mock, get_issue_mock: AsyncMock, config_for_testing
 ):
@@ -531,7 +531,7 @@ async def test_update_issue_status_issue_not_found(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_update_issue_status_transition_failure(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -566,7 +566,7 @@ async def test_update_issue_status_transition_failure(
 
 
 @patch.object(APIController, 'search_issues')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_search_issues_success(config_mock, search_issues_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_for_testing.search_results_default_order = WorkItemsSearchOrderBy.CREATED_DESC
@@ -621,13 +621,14 @@ def test_search_issues_success(config_mock, search_issues_mock: AsyncMock, confi
         limit=10,
         created_from=date(2026, 1, 1),
         created_until=date(2026, 5, 17),
+        jql_query=None,
         order_by=config_for_testing.search_results_default_order,
     )
     assert result == expected_response
 
 
 @patch.object(APIController, 'search_issues')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_search_issues_failure(config_mock, search_issues_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_for_testing.search_results_default_order = WorkItemsSearchOrderBy.CREATED_DESC
@@ -656,12 +657,13 @@ def test_search_issues_failure(config_mock, search_issues_mock: AsyncMock, confi
         limit=None,
         created_from=None,
         created_until=None,
+        jql_query=None,
         order_by=config_for_testing.search_results_default_order,
     )
 
 
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_issue_success(config_mock, get_issue_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -689,7 +691,7 @@ def test_get_issue_success(config_mock, get_issue_mock: AsyncMock, config_for_te
 
 
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 def test_get_issue_failure(config_mock, get_issue_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -707,7 +709,7 @@ def test_get_issue_failure(config_mock, get_issue_mock: AsyncMock, config_for_te
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_success_with_priority_and_issue_type(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -760,7 +762,7 @@ async def test_get_metadata_success_with_priority_and_issue_type(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_no_edit_meta(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -794,7 +796,7 @@ async def test_get_metadata_no_edit_meta(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_priority_but_no_issue_type(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -837,7 +839,7 @@ async def test_get_metadata_priority_but_no_issue_type(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_issue_type_but_no_priority(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -880,7 +882,7 @@ async def test_get_metadata_issue_type_but_no_priority(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_get_issue_failure(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -899,7 +901,7 @@ async def test_get_metadata_get_issue_failure(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_success_with_unknown_field_id(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -952,7 +954,7 @@ async def test_get_metadata_success_with_unknown_field_id(
 @pytest.mark.asyncio
 @patch.object(APIController, 'transitions')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_metadata_success_with_known_field_id_metadata(
     config_mock, get_issue_mock: AsyncMock, transitions_mock: AsyncMock, config_for_testing
 ):
@@ -1013,7 +1015,7 @@ async def test_get_metadata_success_with_known_field_id_metadata(
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'get_issue_create_metadata')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_create_metadata_success(
     config_mock, get_issue_create_metadata_mock: AsyncMock, config_for_testing
 ):
@@ -1040,7 +1042,7 @@ async def test_get_create_metadata_success(
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'get_issue_create_metadata')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_get_create_metadata_failure(
     config_mock, get_issue_create_metadata_mock: AsyncMock, config_for_testing
 ):
@@ -1062,7 +1064,7 @@ async def test_get_create_metadata_failure(
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'delete_work_item')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_delete_work_item_fails(
     config_mock, delete_work_item_mock: AsyncMock, config_for_testing
 ):
@@ -1083,7 +1085,7 @@ async def test_delete_work_item_fails(
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'delete_work_item')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_delete_work_item(config_mock, delete_work_item_mock: AsyncMock, config_for_testing):
     # GIVEN
     config_mock.return_value = config_for_testing
@@ -1098,7 +1100,7 @@ async def test_delete_work_item(config_mock, delete_work_item_mock: AsyncMock, c
 
 @pytest.mark.asyncio
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_fails_to_find_source_item(
     config_mock, get_issue_mock: AsyncMock, config_for_testing
 ):
@@ -1116,7 +1118,7 @@ async def test_clone_work_item_fails_to_find_source_item(
 @pytest.mark.asyncio
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_fails(
     config_mock, get_issue_mock: AsyncMock, create_work_item_mock: AsyncMock, config_for_testing
 ):
@@ -1165,7 +1167,7 @@ async def test_clone_work_item_cloning_fails(
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_succeeds_with_clone_status_true(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -1239,7 +1241,7 @@ async def test_clone_work_item_cloning_succeeds_with_clone_status_true(
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_succeeds_with_clone_status_false(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -1313,7 +1315,7 @@ async def test_clone_work_item_cloning_succeeds_with_clone_status_false(
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_fails_to_get_cloned_item(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -1373,7 +1375,7 @@ async def test_clone_work_item_cloning_fails_to_get_cloned_item(
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_fails_to_get_cloned_item_without_exception(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -1430,7 +1432,7 @@ async def test_clone_work_item_cloning_fails_to_get_cloned_item_without_exceptio
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_succeeds_without_cloning_some_fields(
     config_mock,
     get_issue_mock: AsyncMock,
@@ -1494,7 +1496,7 @@ async def test_clone_work_item_cloning_succeeds_without_cloning_some_fields(
 @patch.object(APIController, 'transition_issue_status')
 @patch.object(APIController, 'create_work_item')
 @patch.object(APIController, 'get_issue')
-@patch('jiratui.commands.handler.ApplicationConfiguration')
+@patch('jiratui.commands.handler.load_configuration')
 async def test_clone_work_item_cloning_succeeds_with_custom_summary(
     config_mock,
     get_issue_mock: AsyncMock,
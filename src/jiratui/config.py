@@ -1,6 +1,9 @@
+import contextlib
 from contextvars import ContextVar
+import hashlib
 import os
 from pathlib import Path
+import pickle
 
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import (
@@ -11,11 +14,17 @@ from pydantic_settings import (
 )
 
 from jiratui.constants import (
+    ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES,
     DEFAULT_JIRA_API_VERSION,
+    FULL_TEXT_INDEX_DEFAULT_MAX_RESULTS,
     ISSUE_SEARCH_DEFAULT_DAYS_INTERVAL,
     ISSUE_SEARCH_DEFAULT_MAX_RESULTS,
+    METADATA_CACHE_DEFAULT_MAX_AGE,
+    PROJECT_MIRROR_DEFAULT_FULL_SYNC_INTERVAL,
+    PROJECT_MIRROR_DEFAULT_SYNC_INTERVAL,
+    RESPONSE_CACHE_DEFAULT_MAX_SIZE_IN_BYTES,
 )
-from jiratui.files import get_config_file
+from jiratui.files import get_cache_directory, get_config_file
 from jiratui.models import WorkItemsSearchOrderBy
 
 
@@ -34,6 +43,157 @@ class SSLConfiguration(BaseModel):
     """The password for the key file."""
 
 
+class ConnectionPoolConfiguration(BaseModel):
+    """Configuration for the pool of HTTP connections shared by all the clients connecting to the Jira API."""
+
+    max_connections: int | None = 20
+    """The maximum number of concurrent connections to the Jira server. Set it to `None` to remove the limit."""
+    max_keepalive_connections: int | None = 10
+    """The maximum number of idle connections that will be kept alive and re-used by future requests."""
+    keepalive_expiry: float | None = 30.0
+    """The number of seconds an idle connection is kept alive before it is closed. Set it to `None` to keep idle
+    connections alive indefinitely."""
+    http2: bool = False
+    """Set this to `True` to negotiate HTTP/2 with the Jira server. This requires the optional `http2` dependencies,
+    e.g. `pip install jiratui[http2]`; if these are not installed the clients fall back to HTTP/1.1."""
+
+
+class RateLimitConfiguration(BaseModel):
+    """Configuration for limiting the rate of requests sent to the Jira server and for retrying failed requests."""
+
+    enabled: bool | None = None
+    """Set this to `True` to limit the rate and the concurrency of the requests sent to any Jira server or, to `False`
+    to never limit them. If it is not set the requests are only limited when connecting to Jira Cloud (`cloud: true`).
+    Failed requests are retried in any case."""
+    requests_per_second: float | None = 10.0
+    """The maximum (sustained) number of requests per second sent to the server. Set it to `None` to remove the
+    limit."""
+    burst: int = 20
+    """The number of requests that can be sent at once after a period of inactivity."""
+    max_concurrency: int = 10
+    """The maximum number of requests in flight. The limit is reduced automatically when the server responds that the
+    client is being rate limited, and it grows back while the requests succeed."""
+    min_concurrency: int = 1
+    """The minimum number of requests in flight when the limit is reduced."""
+    max_retries: int = 3
+    """The maximum number of times a request is retried after a `429`, `502`, `503` or `504` response or a connection
+    error. Only idempotent requests, e.g. `GET`, `PUT` and `DELETE`, are retried."""
+    backoff_factor: float = 0.5
+    """The base (in seconds) of the exponential backoff between retries. A random jitter is applied to the delay.
+    The `Retry-After` and `X-RateLimit-Reset` headers sent by the server take precedence."""
+    max_backoff: float = 30.0
+    """The maximum number of seconds to wait before retrying a request. If the server asks to wait longer the request
+    fails."""
+
+
+class ResponseCacheConfiguration(BaseModel):
+    """Configuration for the in-memory cache of the responses of rarely changing resources of the Jira API."""
+
+    enabled: bool = True
+    """Set this to `False` to always fetch the resources from the server."""
+    max_size: int = RESPONSE_CACHE_DEFAULT_MAX_SIZE_IN_BYTES
+    """The maximum size (in bytes) of the cached responses. When the size is exceeded the least recently used responses
+    are discarded."""
+    ttls: dict[str, int] | None = None
+    """The number of seconds the responses of a resource are cached for. Keys are the URLs of the resources relative to
+    the base URL of the API and they override the default values, e.g. `{'field': 300}`. Setting a value of 0 disables
+    caching the resource.
+
+    When a response expires and the server provided an `ETag` or `Last-Modified` header it is revalidated using a
+    conditional request."""
+
+
+class MetadataCacheConfiguration(BaseModel):
+    """Configuration for the persistent cache of the metadata of the Jira server.
+
+    The cache holds projects, types of work items, statuses, fields, create metadata and sprints. On startup the
+    application renders these from the cache and refreshes them in the background.
+    """
+
+    enabled: bool = True
+    """Set this to `False` to always fetch the metadata from the server."""
+    max_age: int | None = METADATA_CACHE_DEFAULT_MAX_AGE
+    """The maximum age (in seconds) of the cached metadata. Older metadata is ignored and fetched again. Set it to
+    `None` to keep the metadata until it is refreshed."""
+
+
+class WorkItemPrefetchConfiguration(BaseModel):
+    """Configuration for prefetching the details of the work items highlighted in the search results."""
+
+    enabled: bool = True
+    """Set this to `False` to only fetch the details of a work item when it is selected."""
+    debounce: float = 0.3
+    """The number of seconds the cursor has to rest on a work item before its details are prefetched."""
+    neighbours: int = 2
+    """The number of work items before and after the highlighted one that are prefetched too."""
+    max_size: int = 50
+    """The maximum number of prefetched work items kept in memory. The least recently used are discarded."""
+    max_age: float = 60.0
+    """The number of seconds a prefetched work item can be used for before it is fetched again."""
+    max_concurrency: int = 3
+    """The maximum number of work items fetched concurrently."""
+
+
+class WorkItemCacheConfiguration(BaseModel):
+    """Configuration for the in-memory store of the work items retrieved from the server.
+
+    The store avoids retrieving the same work item repeatedly, e.g. when the quick-view screen is opened for the work
+    item shown in the main screen. Updating a work item discards it from the store.
+    """
+
+    enabled: bool = True
+    """Set this to `False` to always fetch the work items from the server."""
+    max_size: int = 200
+    """The maximum number of work items kept in memory. The least recently used are discarded."""
+    max_age: float = 30.0
+    """The number of seconds a work item is kept in memory before it is fetched again."""
+
+
+class AttachmentCacheConfiguration(BaseModel):
+    """Configuration for the persistent cache of the files attached to work items.
+
+    Attachments viewed in the application are downloaded to the cache directory and reused when they are viewed again.
+    """
+
+    enabled: bool = True
+    """Set this to `False` to always download the attachments from the server."""
+    max_size: int = ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES
+    """The maximum size (in bytes) of the files kept in the cache. The least recently used files are removed first."""
+
+
+class FullTextIndexConfiguration(BaseModel):
+    """Configuration for the local full-text index of the work items retrieved from the server.
+
+    The summary, description and comments of the work items viewed in the application, and the summary of the work
+    items found by searches, are indexed under the data directory. Text searches display the work items found in the
+    index immediately, while the search is sent to the server.
+    """
+
+    enabled: bool = True
+    """Set this to `False` to neither index work items nor search the index."""
+    offline: bool = False
+    """If `True` text searches only use the local index; they are not sent to the server."""
+    max_results: int = FULL_TEXT_INDEX_DEFAULT_MAX_RESULTS
+    """The maximum number of work items retrieved from the index by a text search."""
+
+
+class ProjectMirrorConfiguration(BaseModel):
+    """Configuration for the local mirror of the work items of some projects.
+
+    The work items of every project listed are stored under the data directory. The first synchronization retrieves
+    every work item of the project; the following ones only retrieve the work items updated since the previous one.
+    Searches of the main screen whose filters the mirror covers, and the subtasks of the work items of these projects,
+    are served from the mirror.
+    """
+
+    projects: list[str] = Field(default_factory=list)
+    """The keys of the projects to mirror. The mirror is disabled if there are none."""
+    sync_interval: float = PROJECT_MIRROR_DEFAULT_SYNC_INTERVAL
+    """The number of seconds between two synchronizations of the mirror."""
+    full_sync_interval: float = PROJECT_MIRROR_DEFAULT_FULL_SYNC_INTERVAL
+    """The number of seconds between two full synchronizations of a project, which remove the deleted work items."""
+
+
 class StylingConfiguration(BaseModel):
     """Configuration for styling components."""
 
@@ -109,7 +269,8 @@ class ApplicationConfiguration(BaseSettings):
     automatically select your user from the options. It is also used as the default reporter of any new work item that
     is created in the application."""
     search_results_per_page: int = ISSUE_SEARCH_DEFAULT_MAX_RESULTS
-    """The number of results to show in the search results. The default is 30."""
+    """The number of results to show in the search results. The default is 30. Jira caps the number of results returned
+    by a single request; pages with more results, e.g. 5000, are retrieved with several requests."""
     search_issues_default_day_interval: int = ISSUE_SEARCH_DEFAULT_DAYS_INTERVAL
     """This controls how many days worth of issues to fetch when no other search criteria has been defined."""
     show_issue_web_links: bool = True
@@ -163,6 +324,9 @@ class ApplicationConfiguration(BaseSettings):
     cli_search_results_truncate_work_item_summary: int | None = 20
     """When this is defined the summary of a work item will be truncated to the specified length when it is displayed in
     the search results for cli tool."""
+    cli_use_daemon: bool = True
+    """If `True` (default) the commands of the CLI send their requests to the daemon started with `jiratui daemon`,
+    when it is running, so they reuse its connections and caches. Otherwise every command connects to the server."""
     search_results_style_work_item_status: bool = True
     """If `True` (default) the status of a work item will be styled when it is displayed in the search results."""
     search_results_style_work_item_type: bool = True
@@ -210,6 +374,30 @@ class ApplicationConfiguration(BaseSettings):
     search items by summary and description fields."""
     ssl: SSLConfiguration | None = Field(default=None)
     """SSL configuration for client-side certificates and CA bundle."""
+    connection_pool: ConnectionPoolConfiguration = Field(
+        default_factory=ConnectionPoolConfiguration
+    )
+    """Configuration for the pool of HTTP connections shared by the clients of the Jira API."""
+    rate_limit: RateLimitConfiguration = Field(default_factory=RateLimitConfiguration)
+    """Configuration for limiting the rate of requests sent to the Jira server and for retrying failed requests."""
+    response_cache: ResponseCacheConfiguration = Field(default_factory=ResponseCacheConfiguration)
+    """Configuration for the in-memory cache of responses of the Jira API."""
+    metadata_cache: MetadataCacheConfiguration = Field(default_factory=MetadataCacheConfiguration)
+    """Configuration for the persistent cache of the metadata of the Jira server."""
+    work_item_prefetch: WorkItemPrefetchConfiguration = Field(
+        default_factory=WorkItemPrefetchConfiguration
+    )
+    """Configuration for prefetching the details of the work items highlighted in the search results."""
+    work_item_cache: WorkItemCacheConfiguration = Field(default_factory=WorkItemCacheConfiguration)
+    """Configuration for the in-memory store of the work items retrieved from the server."""
+    attachment_cache: AttachmentCacheConfiguration = Field(
+        default_factory=AttachmentCacheConfiguration
+    )
+    """Configuration for the persistent cache of the files attached to work items."""
+    full_text_index: FullTextIndexConfiguration = Field(default_factory=FullTextIndexConfiguration)
+    """Configuration for the local full-text index of the work items retrieved from the server."""
+    project_mirror: ProjectMirrorConfiguration = Field(default_factory=ProjectMirrorConfiguration)
+    """Configuration for the local mirror of the work items of some projects."""
     search_results_default_order: WorkItemsSearchOrderBy = WorkItemsSearchOrderBy.CREATED_DESC
     """The default order for search results. Accepts values from [WorkItemsSearchOrderBy](#jiratui.models.WorkItemsSearchOrderBy) enum: `CREATED_ASC`,
     `CREATED_DESC`, `PRIORITY_ASC`, `PRIORITY_DESC`, `KEY_ASC`, `KEY_DESC`."""
@@ -270,6 +458,10 @@ class ApplicationConfiguration(BaseSettings):
     related to the currently-selected item."""
     key_bindings_style: str = 'legacy'
     """Choices are: legacy (default) or standard"""
+    config_snapshot: bool = True
+    """If `True` (default) the validated configuration is kept in a snapshot under the cache directory. The CLI and the
+    app load the snapshot, without parsing and validating the config file again, until the config file or the
+    environment variables that affect the configuration change."""
 
     model_config = SettingsConfigDict(
         extra='allow',
@@ -312,3 +504,80 @@ from jiratui.config import CONFIGURATION
 CONFIGURATION.get().ssl
 ```
 """
+
+
+def _get_configuration_snapshot_file(conf_file: Path) -> Path:
+    # every config file has its own snapshot, e.g. when JIRA_TUI_CONFIG_FILE selects one of several files
+    name = hashlib.sha256(str(conf_file).encode()).hexdigest()[:16]
+    directory = get_cache_directory() / 'config-snapshots'
+    directory.mkdir(exist_ok=True, parents=True)
+    return directory / f'{name}.pickle'
+
+
+def _build_configuration_snapshot_key(conf_file: Path) -> bytes:
+    """Builds the key that identifies the inputs of a configuration.
+
+    The key includes the path, modification time, size and content of the config file, the environment variables
+    that can set (or override) settings and, the modification time and size of this module so that snapshots of a
+    previous version of the application are not used.
+
+    Args:
+        conf_file: the path to the config file.
+
+    Returns:
+        The key of the configuration.
+    """
+    digest = hashlib.sha256()
+    for path in (Path(__file__), conf_file):
+        stat = path.stat()
+        digest.update(f'{path}|{stat.st_mtime_ns}|{stat.st_size}\n'.encode())
+    digest.update(conf_file.read_bytes())
+    # environment variables are matched to the settings regardless of their case
+    names = {name.lower() for name in ApplicationConfiguration.model_fields}
+    names.update(['jira_tui_config_file', 'editor'])
+    for name, value in sorted(os.environ.items()):
+        if name.lower() in names:
+            digest.update(f'\n{name}={value}'.encode())
+    return digest.hexdigest().encode()
+
+
+def load_configuration() -> ApplicationConfiguration:
+    """Loads the configuration of the application.
+
+    The configuration is loaded from its snapshot when the config file and the relevant environment variables have
+    not changed since the snapshot was taken. Otherwise, the config file is parsed and validated and, a new snapshot is
+    taken. The snapshot may include secrets, e.g. the API token, so only the user can read it.
+
+    Returns:
+        An instance of `ApplicationConfiguration`.
+
+    Raises:
+        FileNotFoundError: if the config file does not exist.
+    """
+    conf_file = ApplicationConfiguration._get_config_file()
+    snapshot_file = _get_configuration_snapshot_file(conf_file)
+    key = _build_configuration_snapshot_key(conf_file)
+    with contextlib.suppress(Exception):
+        # a snapshot that can not be loaded, e.g. it was taken by another version, is replaced
+        with snapshot_file.open('rb') as f:
+            if f.readline().rstrip(b'\n') == key:
+                configuration = pickle.load(f)
+                if isinstance(configuration, ApplicationConfiguration):
+                    return configuration
+
+    configuration = ApplicationConfiguration()  # type:ignore[call-arg]
+    if not configuration.config_snapshot:
+        snapshot_file.unlink(missing_ok=True)
+        return configuration
+    temporary_file = snapshot_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        file_descriptor = os.open(temporary_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, 'wb') as f:
+            f.write(key + b'\n')
+            pickle.dump(configuration, f)
+        # readers never see a partially written snapshot
+        os.replace(temporary_file, snapshot_file)
+    except Exception:
+        # the configuration is loaded from the config file until a snapshot can be taken
+        temporary_file.unlink(missing_ok=True)
+    return configuration
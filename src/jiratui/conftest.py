@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import MagicMock, Mock
 
 from pydantic import SecretStr
@@ -6,7 +7,14 @@ import pytest
 
 from jiratui.api.api import JiraAPI, JiraAPIv2, JiraDataCenterAPI, JiraSoftwareCloudAPI
 from jiratui.api_controller.controller import APIController
-from jiratui.config import ApplicationConfiguration
+from jiratui.config import (
+    ApplicationConfiguration,
+    AttachmentCacheConfiguration,
+    FullTextIndexConfiguration,
+    MetadataCacheConfiguration,
+    WorkItemCacheConfiguration,
+    WorkItemPrefetchConfiguration,
+)
 from jiratui.models import (
     Attachment,
     IssuePriority,
@@ -24,9 +32,31 @@ from jiratui.models import (
 
 
 @pytest.fixture
-def config_for_testing() -> ApplicationConfiguration:
+def performance_settings_for_testing() -> dict[str, Any]:
+    """The settings of the connections, the caches and the daemon for the mocks of the configuration.
+
+    The caches, the prefetching of work items and the daemon are disabled; the other settings take their defaults.
+    """
+    settings: dict[str, Any] = {
+        name: ApplicationConfiguration.model_fields[name].get_default(call_default_factory=True)
+        for name in ('connection_pool', 'rate_limit', 'response_cache', 'project_mirror')
+    }
+    settings.update(
+        metadata_cache=MetadataCacheConfiguration(enabled=False),
+        work_item_prefetch=WorkItemPrefetchConfiguration(enabled=False),
+        work_item_cache=WorkItemCacheConfiguration(enabled=False),
+        attachment_cache=AttachmentCacheConfiguration(enabled=False),
+        full_text_index=FullTextIndexConfiguration(enabled=False),
+        cli_use_daemon=False,
+    )
+    return settings
+
+
+@pytest.fixture
+def config_for_testing(performance_settings_for_testing: dict) -> ApplicationConfiguration:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_base_url='foo.bar',
         jira_api_username='foo',
@@ -60,9 +90,10 @@ def config_for_testing() -> ApplicationConfiguration:
 
 
 @pytest.fixture
-def config_for_testing_jira_dc() -> ApplicationConfiguration:
+def config_for_testing_jira_dc(performance_settings_for_testing: dict) -> ApplicationConfiguration:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -93,9 +124,10 @@ def config_for_testing_jira_dc() -> ApplicationConfiguration:
 
 
 @pytest.fixture
-def jira_api_controller() -> APIController:
+def jira_api_controller(performance_settings_for_testing: dict) -> APIController:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -127,9 +159,10 @@ def jira_api_controller() -> APIController:
 
 
 @pytest.fixture
-def jira_api_controller_for_jira_dc() -> APIController:
+def jira_api_controller_for_jira_dc(performance_settings_for_testing: dict) -> APIController:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -161,11 +194,12 @@ def jira_api_controller_for_jira_dc() -> APIController:
 
 
 @pytest.fixture()
-def app():
+def app(performance_settings_for_testing: dict):
     from jiratui.app import JiraApp
 
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
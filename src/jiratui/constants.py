@@ -6,7 +6,49 @@ JIRA_SOFTWARE_CLOUD_API_SPRINT_SEARCH_LIMIT = 100
 ATTACHMENT_MAXIMUM_FILE_SIZE_IN_BYTES = 10485760  # 10MB
 """The maximum size of files that can be attached to work items. This is a restriction imposed by this tool and not by
 Jira."""
+ATTACHMENT_STREAMED_UPLOAD_MAXIMUM_FILE_SIZE_IN_BYTES = 2147483648  # 2GB
+"""The maximum size of files that can be attached to work items with streamed uploads. These files are sent in chunks
+and they are never loaded into memory. Jira may impose a lower limit."""
+ATTACHMENT_UPLOAD_CHUNK_SIZE_IN_BYTES = 262144  # 256KB
+"""The number of bytes of a file read and sent at a time when uploading an attachment."""
+ATTACHMENT_DOWNLOAD_CHUNK_SIZE_IN_BYTES = 262144  # 256KB
+"""The number of bytes of a file received and written to disk at a time when downloading an attachment."""
+ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES = 268435456  # 256MB
+"""The default maximum size of the files kept in the persistent cache of attachments."""
 LOGGER_NAME = 'jiratui'
 LOG_FILE_FILE_NAME = 'jiratui.log'
+DAEMON_SOCKET_FILE_NAME = 'daemon.sock'
 DEFAULT_JIRA_API_VERSION = 3
 FULL_TEXT_SEARCH_DEFAULT_MINIMUM_TERM_LENGTH = 3
+FULL_TEXT_INDEX_DEFAULT_MAX_RESULTS = 100
+"""The default maximum number of work items retrieved from the local full-text index by a text search."""
+PROJECT_MIRROR_DEFAULT_SYNC_INTERVAL = 300  # 5 minutes
+"""The default number of seconds between two synchronizations of the local mirror of the projects."""
+PROJECT_MIRROR_DEFAULT_FULL_SYNC_INTERVAL = 86400  # 1 day
+"""The default number of seconds between two full synchronizations of the local mirror of a project. Incremental
+synchronizations can not detect deleted work items; full synchronizations remove them."""
+RESPONSE_CACHE_DEFAULT_MAX_SIZE_IN_BYTES = 33554432  # 32MB
+"""The maximum size of the content of the responses kept in the in-memory cache of the Jira REST API."""
+RESPONSE_CACHE_DEFAULT_TTLS = {
+    'configuration': 3600,
+    'field': 900,
+    'issueLinkType': 3600,
+    'issuetype': 1800,
+    'serverInfo': 3600,
+    'status': 1800,
+}
+"""The number of seconds the responses of (rarely changing) resources of the Jira REST API are cached for."""
+METADATA_CACHE_DEFAULT_MAX_AGE = 604800  # 7 days
+"""The number of seconds the metadata of the Jira server, e.g. projects, statuses, is kept in the persistent cache."""
+WORK_ITEM_DEFERRED_FIELDS = ['comment', 'issuelinks', 'attachment', 'worklog']
+"""The fields of a work item that are not retrieved when the work item is first loaded in the main screen. These are
+retrieved afterwards, concurrently, and they stream into their tabs."""
+WORK_ITEM_DETAILS_FIELDS = ['*all', *[f'-{field}' for field in WORK_ITEM_DEFERRED_FIELDS]]
+"""The fields retrieved to show the details of a work item, e.g. in the main screen or the quick-view screen. Screens
+request the same fields so that they share the work items kept in the controller's `work_item_cache`."""
+CLI_BATCH_DEFAULT_MAX_CONCURRENCY = 8
+"""The default maximum number of operations run concurrently by the `jiratui batch` command."""
+CLI_SEARCH_EXPORT_PAGE_SIZE = 100
+"""The number of work items requested per page when `jiratui issues search` writes machine-readable output."""
+CLI_SEARCH_EXPORT_PREFETCH_PAGES = 2
+"""The number of pages of work items fetched ahead of the page being written by `jiratui issues search`."""
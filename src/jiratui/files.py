@@ -1,8 +1,14 @@
 from pathlib import Path
 
-from xdg_base_dirs import xdg_config_home, xdg_state_home
+from xdg_base_dirs import (
+    xdg_cache_home,
+    xdg_config_home,
+    xdg_data_home,
+    xdg_runtime_dir,
+    xdg_state_home,
+)
 
-from jiratui.constants import LOG_FILE_FILE_NAME
+from jiratui.constants import DAEMON_SOCKET_FILE_NAME, LOG_FILE_FILE_NAME
 
 
 def _jiratui_directory(root: Path) -> Path:
@@ -37,6 +43,37 @@ def get_logs_directory() -> Path:
     return _jiratui_directory(xdg_state_home())
 
 
+def get_cache_directory() -> Path:
+    """Retrieves the (default) directory where the application caches data, e.g. the metadata of the Jira server.
+
+    Returns:
+        A `Path` of the cache directory.
+    """
+    return _jiratui_directory(xdg_cache_home())
+
+
+def get_data_directory() -> Path:
+    """Retrieves the (default) directory where the application stores data, e.g. the index of the work items viewed.
+
+    Returns:
+        A `Path` of the data directory.
+    """
+    return _jiratui_directory(xdg_data_home())
+
+
+def get_runtime_directory() -> Path:
+    """Retrieves the directory where the application keeps runtime files, e.g. the socket of the daemon.
+
+    It falls back to the cache directory when `$XDG_RUNTIME_DIR` is not set, e.g. in macOS.
+
+    Returns:
+        A `Path` of the runtime directory.
+    """
+    if (runtime_directory := xdg_runtime_dir()) is None:
+        return get_cache_directory()
+    return _jiratui_directory(runtime_directory)
+
+
 def get_config_file() -> Path:
     """Retrieves the (default) path of the config file.
 
@@ -53,3 +90,12 @@ def get_log_file() -> Path:
         A `Path` of the logs file.
     """
     return get_logs_directory() / LOG_FILE_FILE_NAME
+
+
+def get_daemon_socket_file() -> Path:
+    """Retrieves the path of the Unix domain socket where the daemon listens.
+
+    Returns:
+        A `Path` of the socket file.
+    """
+    return get_runtime_directory() / DAEMON_SOCKET_FILE_NAME
@@ -15,7 +15,8 @@ from datetime import date, datetime
 from decimal import Decimal
 import enum
 from enum import Enum
-from typing import Any
+import sys
+from typing import Any, Generic, TypeVar
 
 
 def custom_as_dict_factory(data) -> dict:
@@ -38,6 +39,27 @@ def custom_as_json_dict_factory(data) -> dict:
     return {k: convert_value(v) for k, v in data}
 
 
+def truncate_summary(summary: str, max_length: int | None = None) -> str:
+    """Removes the leading and trailing whitespace of the summary of a work item and, truncates it.
+
+    Args:
+        summary: the summary of a work item.
+        max_length: the maximum length of the summary. Longer summaries are truncated and end with `...`.
+
+    Returns:
+        The cleaned summary.
+    """
+    if max_length is not None and max_length > 0:
+        if (stripped_summary := summary.strip()) and len(stripped_summary) > max_length:
+            suffix = '...'
+            end_idx = max_length - len(suffix)
+            if max_length <= len(suffix):
+                suffix = ''
+                end_idx = max_length
+            return f'{stripped_summary[:end_idx]}{suffix}'
+    return summary.strip()
+
+
 class JiraWorkItemFields(Enum):
     """The fields ids supported by JiraTUI whose values can be extracted from the details of a work item.
 
@@ -258,15 +280,7 @@ class RelatedJiraIssue(BaseModel):
         return self.priority.name if self.priority else ''
 
     def cleaned_summary(self, max_length: int | None = None) -> str:
-        if max_length is not None and max_length > 0:
-            if (stripped_summary := self.summary.strip()) and len(stripped_summary) > max_length:
-                suffix = '...'
-                end_idx = max_length - len(suffix)
-                if max_length <= len(suffix):
-                    suffix = ''
-                    end_idx = max_length
-                return f'{stripped_summary[:end_idx]}{suffix}'
-        return self.summary.strip()
+        return truncate_summary(self.summary, max_length)
 
     def display_status(self) -> str:
         if self.status:
@@ -396,15 +410,7 @@ class JiraIssue(JiraBaseIssue):
         return f'{self.key.strip()} - {self.summary.strip()}'
 
     def cleaned_summary(self, max_length: int | None = None) -> str:
-        if max_length is not None and max_length > 0:
-            if (stripped_summary := self.summary.strip()) and len(stripped_summary) > max_length:
-                suffix = '...'
-                end_idx = max_length - len(suffix)
-                if max_length <= len(suffix):
-                    suffix = ''
-                    end_idx = max_length
-                return f'{stripped_summary[:end_idx]}{suffix}'
-        return self.summary.strip()
+        return truncate_summary(self.summary, max_length)
 
     def display_status(self) -> str:
         if self.status:
@@ -579,9 +585,51 @@ class IssueRemoteLink(BaseModel):
     status_resolved: bool | None = None
 
 
+@dataclass(slots=True)
+class JiraIssueSearchRow:
+    """The compact representation of a work item listed in the results of a search.
+
+    Lists of search results only display, and filter by, a few fields of every work item, so they do not need the many (mostly empty)
+    attributes of a [JiraIssue](#jiratui.models.JiraIssue). Instances do not have a `__dict__` and, the names of the
+    status and the type of work item are interned, so the rows of a large result set share the same strings. The full
+    details of a work item are retrieved when the work item is opened.
+    """
+
+    id: str
+    key: str
+    summary: str
+    status_id: str | None = None
+    status_name: str = ''
+    work_item_type_name: str = ''
+    parent_issue_key: str | None = None
+    assignee_display_name: str = ''
+    labels: list[str] | None = None
+
+    def __post_init__(self) -> None:
+        # there are only a few statuses and types of work items; every row shares the same strings
+        self.status_name = sys.intern(self.status_name)
+        self.work_item_type_name = sys.intern(self.work_item_type_name)
+        if self.status_id is not None:
+            self.status_id = sys.intern(self.status_id)
+
+    @property
+    def parent_key(self) -> str:
+        return self.parent_issue_key or ''
+
+    def short_title(self) -> str:
+        return f'{self.key.strip()} - {self.summary.strip()}'
+
+    def cleaned_summary(self, max_length: int | None = None) -> str:
+        return truncate_summary(self.summary, max_length)
+
+
+SearchResultWorkItem = TypeVar('SearchResultWorkItem', JiraIssue, JiraIssueSearchRow)
+"""The type of the work items of a search response: the full details of the work items or, the compact rows."""
+
+
 @dataclass
-class JiraIssueSearchResponse(BaseModel):
-    issues: list[JiraIssue]
+class JiraIssueSearchResponse(BaseModel, Generic[SearchResultWorkItem]):
+    issues: list[SearchResultWorkItem]
     next_page_token: str | None = None
     is_last: bool | None = None
     total: int | None = None
@@ -15,9 +15,10 @@ from jiratui.widgets.screens.server import ServerInfoScreen
 
 
 @pytest.fixture()
-def app_with_unrecognized_config_theme() -> JiraApp:
+def app_with_unrecognized_config_theme(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -52,9 +53,10 @@ def app_with_unrecognized_config_theme() -> JiraApp:
 
 
 @pytest.fixture()
-def app_with_input_and_config_theme() -> JiraApp:
+def app_with_input_and_config_theme(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -89,9 +91,10 @@ def app_with_input_and_config_theme() -> JiraApp:
 
 
 @pytest.fixture()
-def app_with_input_theme() -> JiraApp:
+def app_with_input_theme(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -126,9 +129,10 @@ def app_with_input_theme() -> JiraApp:
 
 
 @pytest.fixture()
-def app_without_config_theme() -> JiraApp:
+def app_without_config_theme(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -163,9 +167,10 @@ def app_without_config_theme() -> JiraApp:
 
 
 @pytest.fixture()
-def app() -> JiraApp:
+def app(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -553,9 +558,10 @@ async def test_application_with_unrecognized_config_theme(
 
 
 @pytest.fixture()
-def config_dict() -> dict:
+def config_dict(performance_settings_for_testing: dict) -> dict:
     """Base configuration dictionary for testing."""
     return {
+        **performance_settings_for_testing,
         'jira_api_base_url': 'foo.bar',
         'jira_api_username': 'foo',
         'jira_api_token': SecretStr('foo'),
@@ -55,7 +55,11 @@ async def test_focus_attachments_datatable(
         await pilot.press('6')
         await pilot.press('tab')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -101,7 +105,11 @@ async def test_focus_attachments_datatable_highlight_file(
         await pilot.press('6')
         await pilot.press('tab')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -152,7 +160,11 @@ async def test_attachment_download_fails(
         await pilot.press('tab')
         await pilot.press('enter')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -209,7 +221,11 @@ async def test_show_attachment(
         await pilot.press('tab')
         await pilot.press('enter')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -294,7 +310,11 @@ async def test_show_attachment_with_language(
         await pilot.press('down')
         await pilot.press('enter')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -354,7 +374,11 @@ async def test_show_attachment_with_unsupported_type(
         await pilot.press('down')
         await pilot.press('enter')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -414,7 +438,11 @@ async def test_open_attachment_in_browser_without_url(
         await pilot.press('down')
         await pilot.press('ctrl+o')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -471,7 +499,11 @@ async def test_open_attachment_in_browser(
         await pilot.press('down')
         await pilot.press('ctrl+o')
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issue_mock.assert_any_call(
+            issue_id_or_key='key-2',
+            fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+        )
+        get_issue_mock.assert_any_call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment'])
         assert main_screen.issue_attachments_widget.issue_key == 'key-2'
         attachment_dt = main_screen.issue_attachments_widget.query_one(AttachmentsDataTable)
         assert attachment_dt.has_focus
@@ -510,3 +542,14 @@ def test_build_file_attachment_widget_for_supported_image_file_type(
         b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x01\x03\x00\x00\x00%\xdbV\xca\x00\x00\x00\x03PLTE\x00\x00\x00\xa7z=\xda\x00\x00\x00\x01tRNS\x00@\xe6\xd8f\x00\x00\x00\nIDAT\x08\xd7c`\x00\x00\x00\x02\x00\x01\xe2!\xbc3\x00\x00\x00\x00IEND\xaeB`\x82',
     )
     assert isinstance(widget, Image)
+
+
+def test_build_file_attachment_widget_from_file(tmp_path):
+    # GIVEN
+    downloaded_file = tmp_path / '10-11'
+    downloaded_file.write_bytes(b'hello world')
+    # WHEN
+    widget = FileAttachmentWidget.build_widget('text/plain', downloaded_file)
+    # THEN
+    assert isinstance(widget, TextArea)
+    assert widget.text == 'hello world'
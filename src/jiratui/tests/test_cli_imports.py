@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pytest
+
+UI_MODULES = ['textual', 'textual_image', 'git', 'jiratui.app', 'jiratui.widgets']
+
+
+def get_imported_modules(code: str) -> dict[str, int]:
+    """Runs some code in a new interpreter with `-X importtime`.
+
+    Returns:
+        The cumulative import time, in microseconds, of every module imported by the code.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # e.g. "import time:       179 |        319 |   jiratui.exceptions"
+        if not line.startswith('import time:') or line.endswith('| imported package'):
+            continue
+        _, cumulative, module = line.split('|')
+        modules[module.strip()] = int(cumulative.strip())
+    return modules
+
+
+@pytest.mark.parametrize(
+    'command, code, unexpected_modules',
+    [
+        (
+            'version',
+            'import jiratui.cli',
+            UI_MODULES + ['jiratui.commands.handler', 'httpx', 'pydantic', 'marklas'],
+        ),
+        (
+            'issues search',
+            'import jiratui.cli, jiratui.commands.handler, jiratui.commands.render',
+            UI_MODULES + ['marklas', 'puremagic'],
+        ),
+        (
+            'comments list',
+            'import jiratui.cli, jiratui.commands.handler, jiratui.commands.render',
+            UI_MODULES,
+        ),
+    ],
+)
+def test_cli_commands_only_import_what_they_need(
+    command: str, code: str, unexpected_modules: list[str]
+):
+    # WHEN
+    modules = get_imported_modules(code)
+    # THEN
+    assert 'jiratui.cli' in modules
+    imported = [
+        module
+        for module in modules
+        if any(module == name or module.startswith(f'{name}.') for name in unexpected_modules)
+    ]
+    assert imported == [], f'"jiratui {command}" imports {imported}'
@@ -1,12 +1,29 @@
+import asyncio
 import io
-from unittest.mock import Mock
+import json
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from rich.console import Console
 
-from jiratui.commands.render import JiraIssueSearchRenderer
+from jiratui.api_controller.controller import APIController, APIControllerResponse
+from jiratui.commands.batch import BatchRunner
+from jiratui.commands.handler import CommandHandler
+from jiratui.commands.render import (
+    CSVWorkItemsWriter,
+    JiraIssueSearchRenderer,
+    JSONLinesWorkItemsWriter,
+)
 from jiratui.config import CONFIGURATION, ApplicationConfiguration
-from jiratui.models import IssueStatus, IssueType, JiraIssue, JiraIssueSearchResponse
+from jiratui.exceptions import CLIException
+from jiratui.models import (
+    IssueComment,
+    IssueStatus,
+    IssueType,
+    JiraIssue,
+    JiraIssueSearchResponse,
+    JiraUser,
+)
 
 
 @pytest.fixture()
@@ -48,3 +65,177 @@ def test_search_renderer_does_not_truncate_summary_when_cli_config_is_unset(
     configuration.configure_mock(cli_search_results_truncate_work_item_summary=config_value)
     output = _rendered_search_results(io.StringIO(), 'the full summary is shown')
     assert 'the full summary is shown' in output
+
+
+@pytest.fixture()
+def batch_handler() -> Mock:
+    handler = Mock(spec=CommandHandler)
+    handler.api = Mock(spec=APIController)
+    handler.api.close_connections = AsyncMock()
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_writes_the_result_of_every_operation(batch_handler: Mock):
+    # GIVEN
+    batch_handler.api.add_comment = AsyncMock(
+        return_value=APIControllerResponse(
+            result=IssueComment(
+                id='10',
+                author=JiraUser(account_id='1', active=True, display_name='Bart'),
+                body='Done',
+            )
+        )
+    )
+    batch_handler.delete_work_item = AsyncMock(side_effect=CLIException('Unable to delete'))
+    source = io.StringIO(
+        '{"id": "a", "op": "comment", "key": "SCRUM-1", "message": "Done"}\n'
+        '\n'
+        '{"id": "b", "op": "delete", "key": "SCRUM-2"}\n'
+        'not json\n'
+        '{"op": "comment", "key": "SCRUM-1"}\n'
+        '{"op": "unknown"}\n'
+    )
+    output = io.StringIO()
+    # WHEN
+    failed = await BatchRunner(batch_handler).run(source, output)
+    # THEN
+    results = sorted(
+        (json.loads(line) for line in output.getvalue().splitlines()), key=lambda r: r['line']
+    )
+    assert failed == 4
+    assert results[0] == {
+        'line': 1,
+        'id': 'a',
+        'op': 'comment',
+        'success': True,
+        'result': {
+            'key': 'SCRUM-1',
+            'comment': {
+                'id': '10',
+                'author': {'account_id': '1', 'display_name': 'Bart', 'email': None},
+                'created': None,
+                'updated': None,
+                'body': 'Done',
+            },
+        },
+    }
+    assert results[1]['line'] == 3
+    assert results[1]['success'] is False
+    assert results[1]['error'] == 'Unable to delete'
+    assert results[2]['success'] is False
+    assert results[2]['error'].startswith('The line is not valid JSON')
+    assert results[3]['error'] == 'The operation requires the argument "message".'
+    assert results[4]['error'].startswith('Unknown operation "unknown"')
+    batch_handler.api.add_comment.assert_awaited_once_with('SCRUM-1', 'Done')
+    batch_handler.api.close_connections.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_limits_the_operations_running_concurrently(batch_handler: Mock):
+    # GIVEN
+    running = 0
+    max_running = 0
+
+    async def delete_work_item(key: str) -> bool:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    batch_handler.delete_work_item = AsyncMock(side_effect=delete_work_item)
+    source = io.StringIO(''.join(f'{{"op": "delete", "key": "SCRUM-{i}"}}\n' for i in range(10)))
+    output = io.StringIO()
+    # WHEN
+    failed = await BatchRunner(batch_handler, max_concurrency=3).run(source, output)
+    # THEN
+    assert failed == 0
+    assert len(output.getvalue().splitlines()) == 10
+    assert max_running <= 3
+    assert batch_handler.delete_work_item.await_count == 10
+
+
+def _build_work_items(total: int) -> list[JiraIssue]:
+    return [
+        JiraIssue(
+            id=str(i),
+            key=f'SCRUM-{i}',
+            summary=f'Summary {i}',
+            status=IssueStatus(id='1', name='To Do'),
+            issue_type=IssueType(id='3', name='Task'),
+            assignee=JiraUser(account_id='1', active=True, display_name='Bart', email=None),
+            labels=['backend', 'api'],
+        )
+        for i in range(1, total + 1)
+    ]
+
+
+def test_jsonl_writer_writes_the_fields_of_every_work_item():
+    # GIVEN
+    output = io.StringIO()
+    writer = JSONLinesWorkItemsWriter(output, ['summary', 'status'])
+    # WHEN
+    for work_item in _build_work_items(2):
+        writer.write(work_item)
+    # THEN
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == [
+        {
+            'id': '1',
+            'key': 'SCRUM-1',
+            'summary': 'Summary 1',
+            'status': {'id': '1', 'name': 'To Do'},
+        },
+        {
+            'id': '2',
+            'key': 'SCRUM-2',
+            'summary': 'Summary 2',
+            'status': {'id': '1', 'name': 'To Do'},
+        },
+    ]
+
+
+def test_csv_writer_writes_a_header_and_flat_values():
+    # GIVEN
+    output = io.StringIO()
+    writer = CSVWorkItemsWriter(output, ['issuetype', 'assignee', 'labels', 'duedate'])
+    # WHEN
+    writer.write(_build_work_items(1)[0])
+    # THEN
+    assert output.getvalue().splitlines() == [
+        'id,key,type,assignee,labels,due_date',
+        '1,SCRUM-1,Task,Bart,"backend,api",',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_handler_iter_search_issues_stops_at_the_limit(configuration):
+    # GIVEN
+    configuration.configure_mock(search_results_default_order=None)
+    closed = False
+
+    async def iter_search_issues(**kwargs):
+        nonlocal closed
+        try:
+            for work_item in _build_work_items(10):
+                yield work_item
+        finally:
+            closed = True
+
+    handler = Mock(spec=CommandHandler)
+    handler.api = Mock(spec=APIController)
+    handler.api.iter_search_issues = Mock(side_effect=iter_search_issues)
+    handler.api.close_connections = AsyncMock()
+    # WHEN
+    work_items = [
+        work_item
+        async for work_item in CommandHandler.iter_search_issues(
+            handler, project_key='SCRUM', limit=3, fields=['summary']
+        )
+    ]
+    # THEN
+    assert [work_item.key for work_item in work_items] == ['SCRUM-1', 'SCRUM-2', 'SCRUM-3']
+    assert handler.api.iter_search_issues.call_args.kwargs['limit'] == 3
+    assert closed is True
+    handler.api.close_connections.assert_awaited_once()
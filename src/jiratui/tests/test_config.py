@@ -1,11 +1,15 @@
+import os
 from pathlib import Path
 import tempfile
+import textwrap
 from unittest.mock import Mock, patch
 
 import pytest
 import yaml
 
-from jiratui.config import ApplicationConfiguration, SSLConfiguration
+from jiratui.config import ApplicationConfiguration, SSLConfiguration, load_configuration
+
+BENCHMARK_REPETITIONS = 5
 
 
 @pytest.fixture
@@ -64,3 +68,127 @@ def test_valid_config_when_ssl_is_partially_configured(
     assert config.ssl is not None
     assert isinstance(config.ssl, SSLConfiguration)
     assert config.ssl.verify_ssl is True
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    conf_file = tmp_path / 'config.yaml'
+    conf_file.write_text(
+        textwrap.dedent(
+            """
+            jira_api_username: 'bart'
+            jira_api_token: '12345'
+            jira_api_base_url: 'foo.bar'
+            """
+        )
+    )
+    return conf_file
+
+
+@pytest.fixture
+def snapshot_directory(tmp_path: Path, config_file: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        ApplicationConfiguration, '_get_config_file', classmethod(lambda cls: config_file)
+    )
+    monkeypatch.setattr('jiratui.config.get_cache_directory', lambda: tmp_path / 'cache')
+    for name in ('JIRA_API_USERNAME', 'JIRA_API_TOKEN', 'JIRA_API_BASE_URL'):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path / 'cache' / 'config-snapshots'
+
+
+def test_load_configuration_from_snapshot(snapshot_directory: Path):
+    # GIVEN
+    expected = load_configuration()
+    # WHEN
+    with patch.object(
+        ApplicationConfiguration, 'settings_customise_sources', side_effect=AssertionError
+    ):
+        config = load_configuration()
+    # THEN
+    assert config == expected
+    assert config.jira_api_username == 'bart'
+    assert config.jira_api_token.get_secret_value() == '12345'
+    snapshot_files = list(snapshot_directory.iterdir())
+    assert len(snapshot_files) == 1
+    assert snapshot_files[0].stat().st_mode & 0o777 == 0o600
+
+
+def test_load_configuration_when_the_config_file_changes(
+    snapshot_directory: Path, config_file: Path
+):
+    # GIVEN
+    load_configuration()
+    config_file.write_text(config_file.read_text().replace("'bart'", "'lisa'"))
+    # WHEN
+    config = load_configuration()
+    # THEN
+    assert config.jira_api_username == 'lisa'
+
+
+def test_load_configuration_when_an_environment_variable_changes(
+    snapshot_directory: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # GIVEN
+    monkeypatch.delenv('SEARCH_RESULTS_PER_PAGE', raising=False)
+    load_configuration()
+    # the setting is not in the config file
+    monkeypatch.setenv('SEARCH_RESULTS_PER_PAGE', '15')
+    # WHEN
+    config = load_configuration()
+    # THEN
+    assert config.search_results_per_page == 15
+
+
+def test_load_configuration_without_snapshot(snapshot_directory: Path, config_file: Path):
+    # GIVEN
+    config_file.write_text(config_file.read_text() + '\nconfig_snapshot: false\n')
+    # WHEN
+    config = load_configuration()
+    # THEN
+    assert config.config_snapshot is False
+    assert list(snapshot_directory.iterdir()) == []
+
+
+@pytest.fixture
+def large_config_file(config_file: Path) -> Path:
+    config = yaml.safe_load(config_file.read_text())
+    config['pre_defined_jql_expressions'] = {
+        i: {'label': f'Expression {i}', 'expression': f'project = P{i} AND status = "To Do"'}
+        for i in range(1, 1001)
+    }
+    config['git_repositories'] = {
+        i: {'name': f'Repository {i}', 'path': f'/home/bart/src/repository-{i}/.git'}
+        for i in range(1, 501)
+    }
+    config_file.write_text(yaml.safe_dump(config))
+    return config_file
+
+
+# the benchmarks only run with `make configtime`, which reports the duration of each one
+configtime = pytest.mark.skipif(
+    not os.getenv('JIRA_TUI_CONFIGTIME'), reason='Run the benchmarks with `make configtime`.'
+)
+
+
+@configtime
+def test_benchmark_parse_large_configuration(snapshot_directory: Path, large_config_file: Path):
+    # WHEN
+    for _ in range(BENCHMARK_REPETITIONS):
+        config = ApplicationConfiguration()  # type:ignore[call-arg]
+    # THEN
+    assert len(config.pre_defined_jql_expressions) == 1000
+    assert len(config.git_repositories) == 500
+
+
+@configtime
+def test_benchmark_load_large_configuration_from_snapshot(
+    snapshot_directory: Path, large_config_file: Path
+):
+    # GIVEN
+    load_configuration()
+    # WHEN
+    for _ in range(BENCHMARK_REPETITIONS):
+        config = load_configuration()
+    # THEN
+    assert len(config.pre_defined_jql_expressions) == 1000
+    assert len(config.git_repositories) == 500
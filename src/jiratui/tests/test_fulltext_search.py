@@ -5,18 +5,19 @@ from pydantic import SecretStr
 import pytest
 from textual.widgets import Input
 
-from jiratui.api_controller.controller import APIController
+from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.app import JiraApp
-from jiratui.config import ApplicationConfiguration
-from jiratui.models import WorkItemsSearchOrderBy
+from jiratui.config import ApplicationConfiguration, FullTextIndexConfiguration
+from jiratui.models import JiraIssueSearchResponse, JiraIssueSearchRow, WorkItemsSearchOrderBy
 from jiratui.widgets.screen import MainScreen
 from jiratui.widgets.screens.text_search import TextSearchScreen
 
 
 @pytest.fixture()
-def app() -> JiraApp:
+def app(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('foo'),
@@ -219,6 +220,44 @@ async def test_dismiss_fulltext_search_screen_with_value(
         action_search_mock.assert_not_called()
 
 
+@patch.object(APIController, 'search_work_item_index')
+@patch('jiratui.widgets.screen.MainScreen.action_search')
+@patch('jiratui.widgets.screen.MainScreen.search_issues')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_search_text_in_the_local_index_in_offline_mode(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    search_issues_mock: AsyncMock,
+    action_search_mock: AsyncMock,
+    search_work_item_index_mock: AsyncMock,
+    app,
+):
+    app.config.search_results_truncate_work_item_summary = 10
+    app.config.search_results_style_work_item_status = False
+    app.config.search_results_style_work_item_type = False
+    app.config.search_results_per_page = 10
+    search_work_item_index_mock.return_value = APIControllerResponse(
+        result=JiraIssueSearchResponse(
+            issues=[JiraIssueSearchRow(id='1', key='SCRUM-1', summary='test the login')],
+            is_last=True,
+        )
+    )
+    async with app.run_test():
+        # GIVEN
+        main_screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        main_screen.config.full_text_index = FullTextIndexConfiguration(offline=True)
+        # WHEN
+        await main_screen._search_text('test')
+        # THEN
+        search_work_item_index_mock.assert_called_once_with('test')
+        action_search_mock.assert_not_called()
+        assert main_screen.search_results_table.row_count == 1
+
+
 @pytest.mark.parametrize(
     'search_term, jql_expression, advanced_search, expected_query',
     [
@@ -18,6 +18,7 @@ from jiratui.models import (
     Project,
     WorkItemsSearchOrderBy,
 )
+from jiratui.utils.metadata_cache import MetadataCache
 from jiratui.widgets.attachments.attachments import IssueAttachmentsWidget
 from jiratui.widgets.comments.comments import IssueCommentsWidget
 from jiratui.widgets.commons.users import JiraUserInput
@@ -57,9 +58,10 @@ def jira_users() -> list[JiraUser]:
 
 
 @pytest.fixture()
-def app() -> JiraApp:
+def app(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -271,7 +273,7 @@ async def test_fetch_projects_without_initial_project_key(
         await app.push_screen(screen)
         await app.workers.wait_for_complete()
         # THEN
-        search_projects_mock.assert_has_calls([call(keys=[])])
+        search_projects_mock.assert_has_calls([call(keys=[], cached=False)])
         assert screen.project_selector.selection is None
         assert screen.project_selector._options == [
             ('', Select.NULL),
@@ -304,7 +306,7 @@ async def test_fetch_projects_with_initial_project_key_fetch_single_project_true
         await app.push_screen(screen)
         await app.workers.wait_for_complete()
         # THEN
-        search_projects_mock.assert_has_calls([call(keys=['P1'])])
+        search_projects_mock.assert_has_calls([call(keys=['P1'], cached=False)])
         assert screen.project_selector.selection == 'P1'
         assert screen.project_selector._options == [
             ('', Select.NULL),
@@ -337,7 +339,7 @@ async def test_fetch_projects_with_initial_project_key_fetch_single_project_fals
         await app.push_screen(screen)
         await app.workers.wait_for_complete()
         # THEN
-        search_projects_mock.assert_has_calls([call(keys=[])])
+        search_projects_mock.assert_has_calls([call(keys=[], cached=False)])
         assert screen.project_selector.selection == 'P1'
         assert screen.project_selector._options == [
             ('', Select.NULL),
@@ -346,6 +348,43 @@ async def test_fetch_projects_with_initial_project_key_fetch_single_project_fals
         ]
 
 
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch.object(APIController, 'search_projects')
+@pytest.mark.asyncio
+async def test_fetch_projects_renders_the_metadata_cache_and_refreshes_it(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    app,
+    tmp_path,
+):
+    # GIVEN
+    cached_projects = [Project(id='1', name='Project A', key='P1')]
+    projects = cached_projects + [Project(id='2', name='Project B', key='P2')]
+    search_projects_mock.side_effect = lambda keys, cached: APIControllerResponse(
+        result=cached_projects if cached else projects
+    )
+    async with app.run_test():
+        screen = MainScreen()
+        screen.initial_project_key = ''
+        screen.config.on_start_up_only_fetch_projects = True
+        screen.api.metadata_cache = MetadataCache(tmp_path)
+        screen.api.metadata_served_from_cache = True
+        # WHEN
+        await app.push_screen(screen)
+        await app.workers.wait_for_complete()
+        # THEN
+        search_projects_mock.assert_has_calls(
+            [call(keys=[], cached=True), call(keys=[], cached=False)]
+        )
+        assert screen.project_selector._options == [
+            ('', Select.NULL),
+            ('(P1) Project A', 'P1'),
+            ('(P2) Project B', 'P2'),
+        ]
+
+
 @patch('jiratui.widgets.screen.APIController.status')
 @patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
 @patch('jiratui.widgets.screen.MainScreen.fetch_projects')
@@ -1296,6 +1335,7 @@ async def test_show_quick_view_screen_after_creating_work_dismiss_with_escape(
 
 
 @patch('jiratui.widgets.screen.MainScreen._add_item_to_recent_history')
+@patch.object(APIController, 'list_all_comments')
 @patch.object(APIController, 'get_issue')
 @patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
 @patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
@@ -1306,6 +1346,7 @@ async def test_fetch_issue_with_recent_history_enabled(
     fetch_issue_types_mock: AsyncMock,
     fetch_statuses_mock: AsyncMock,
     get_issue_mock: AsyncMock,
+    list_all_comments_mock: AsyncMock,
     add_item_to_recent_history_mock: Mock,
     jira_issues: list[JiraIssue],
     app,
@@ -1317,6 +1358,7 @@ async def test_fetch_issue_with_recent_history_enabled(
     get_issue_mock.return_value = APIControllerResponse(
         result=JiraIssueSearchResponse(issues=[jira_issues[1]])
     )
+    list_all_comments_mock.return_value = APIControllerResponse(result=[])
     async with app.run_test():
         cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
         # WHEN
@@ -1329,6 +1371,7 @@ async def test_fetch_issue_with_recent_history_enabled(
 
 
 @patch('jiratui.widgets.screen.MainScreen._add_item_to_recent_history')
+@patch.object(APIController, 'list_all_comments')
 @patch.object(APIController, 'get_issue')
 @patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
 @patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
@@ -1339,6 +1382,7 @@ async def test_fetch_issue_with_recent_history_disabled(
     fetch_issue_types_mock: AsyncMock,
     fetch_statuses_mock: AsyncMock,
     get_issue_mock: AsyncMock,
+    list_all_comments_mock: AsyncMock,
     add_item_to_recent_history_mock: Mock,
     jira_issues: list[JiraIssue],
     app,
@@ -1350,6 +1394,7 @@ async def test_fetch_issue_with_recent_history_disabled(
     get_issue_mock.return_value = APIControllerResponse(
         result=JiraIssueSearchResponse(issues=[jira_issues[1]])
     )
+    list_all_comments_mock.return_value = APIControllerResponse(result=[])
     async with app.run_test():
         cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
         # WHEN
@@ -1359,6 +1404,54 @@ async def test_fetch_issue_with_recent_history_disabled(
         add_item_to_recent_history_mock.assert_not_called()
 
 
+@patch.object(MainScreen, 'retrieve_issue_subtasks')
+@patch.object(APIController, 'list_all_comments')
+@patch.object(APIController, 'get_issue')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_fetch_issue_loads_the_work_item_in_stages(
+    fetch_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    get_issue_mock: AsyncMock,
+    list_all_comments_mock: AsyncMock,
+    retrieve_issue_subtasks_mock: AsyncMock,
+    jira_issues: list[JiraIssue],
+    app,
+):
+    # GIVEN
+    app.config.show_issue_web_links = False
+    app.config.enable_updating_additional_fields = False
+    app.config.enable_recent_history = False
+    get_issue_mock.return_value = APIControllerResponse(
+        result=JiraIssueSearchResponse(issues=[jira_issues[1]])
+    )
+    list_all_comments_mock.return_value = APIControllerResponse(result=[])
+    async with app.run_test():
+        screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        # WHEN
+        await screen.fetch_issue('key-2')
+        await app.workers.wait_for_complete()
+        # THEN
+        get_issue_mock.assert_has_calls(
+            [
+                call(
+                    issue_id_or_key='key-2',
+                    fields=['*all', '-comment', '-issuelinks', '-attachment', '-worklog'],
+                ),
+                call(issue_id_or_key='key-2', fields=['issuelinks', 'attachment']),
+            ]
+        )
+        list_all_comments_mock.assert_awaited_once_with('key-2')
+        retrieve_issue_subtasks_mock.assert_awaited_once_with(jira_issues[1])
+        assert screen.issue_info_container.issue == jira_issues[1]
+        assert screen.issue_comments_widget.comments.work_item_key == 'key-2'
+        assert screen.issue_attachments_widget.attachments.work_item_key == 'key-2'
+        assert screen.related_issues_widget.issues.work_item_key == 'key-2'
+
+
 @patch('jiratui.widgets.screen.MainScreen._add_item_to_recent_history')
 @patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
 @patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
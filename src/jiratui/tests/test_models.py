@@ -1,6 +1,12 @@
 import pytest
 
-from jiratui.models import IssueStatus, IssueType, JiraIssue, RelatedJiraIssue
+from jiratui.models import (
+    IssueStatus,
+    IssueType,
+    JiraIssue,
+    JiraIssueSearchRow,
+    RelatedJiraIssue,
+)
 
 
 def _jira_issue(summary: str) -> JiraIssue:
@@ -22,7 +28,11 @@ def _related_jira_issue(summary: str) -> RelatedJiraIssue:
     )
 
 
-@pytest.mark.parametrize('issue_factory', [_jira_issue, _related_jira_issue])
+def _search_row(summary: str) -> JiraIssueSearchRow:
+    return JiraIssueSearchRow(id='1', key='TEST-1', summary=summary, status_name='To Do')
+
+
+@pytest.mark.parametrize('issue_factory', [_jira_issue, _related_jira_issue, _search_row])
 @pytest.mark.parametrize(
     'summary, max_length, expected',
     [
@@ -40,3 +50,33 @@ def _related_jira_issue(summary: str) -> RelatedJiraIssue:
 )
 def test_cleaned_summary(issue_factory, summary, max_length, expected):
     assert issue_factory(summary).cleaned_summary(max_length) == expected
+
+
+def test_search_row_shares_the_names_of_statuses_and_types():
+    # GIVEN
+    status_name = ''.join(['In ', 'Progress'])
+    work_item_type_name = ''.join(['Ta', 'sk'])
+    # WHEN
+    first = JiraIssueSearchRow(
+        id='1',
+        key='TEST-1',
+        summary='first',
+        status_name=status_name,
+        work_item_type_name=work_item_type_name,
+    )
+    second = JiraIssueSearchRow(
+        id='2',
+        key='TEST-2',
+        summary='second',
+        status_name=''.join(['In ', 'Progress']),
+        work_item_type_name=''.join(['Ta', 'sk']),
+        parent_issue_key='TEST-0',
+    )
+    # THEN
+    assert first.status_name is second.status_name
+    assert first.work_item_type_name is second.work_item_type_name
+    assert first.parent_key == ''
+    assert second.parent_key == 'TEST-0'
+    assert second.short_title() == 'TEST-2 - second'
+    # rows do not have a __dict__
+    assert not hasattr(first, '__dict__')
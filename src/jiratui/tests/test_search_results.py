@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
@@ -7,7 +8,12 @@ import pytest
 from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.app import JiraApp
 from jiratui.config import ApplicationConfiguration
-from jiratui.models import JiraIssue, JiraIssueSearchResponse, WorkItemsSearchOrderBy
+from jiratui.models import (
+    JiraIssue,
+    JiraIssueSearchResponse,
+    JiraIssueSearchRow,
+    WorkItemsSearchOrderBy,
+)
 from jiratui.widgets.screen import MainScreen, WorkItemSearchResult
 from jiratui.widgets.screens.goto import GoToScreen
 from jiratui.widgets.screens.work_item_quick_view import WorkItemQuickViewScreen
@@ -19,9 +25,10 @@ from jiratui.widgets.search import (
 
 
 @pytest.fixture()
-def app() -> JiraApp:
+def app(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -263,6 +270,53 @@ async def test_open_issue_in_browser(
         assert main_screen.search_results_container.border_subtitle == 'Page 1 of 1 (total: 2)'
 
 
+@patch('jiratui.widgets.screen.MainScreen._search_work_items')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_search_results_are_displayed_before_the_total_is_estimated(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    search_work_items_mock: AsyncMock,
+    jira_issues: list[JiraIssue],
+    app,
+):
+    app.config.search_results_truncate_work_item_summary = 10
+    app.config.search_results_style_work_item_status = False
+    app.config.search_results_style_work_item_type = False
+    app.config.search_results_per_page = 10
+    async with app.run_test() as pilot:
+        # GIVEN
+        estimated_total = asyncio.Event()
+
+        async def estimate_total() -> int:
+            await estimated_total.wait()
+            return 2
+
+        search_work_items_mock.side_effect = lambda **kwargs: WorkItemSearchResult(
+            response=JiraIssueSearchResponse(issues=jira_issues),
+            start=1,
+            end=2,
+            pending_total=asyncio.create_task(estimate_total()),
+        )
+        main_screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        # WHEN
+        await pilot.press('ctrl+r')
+        await pilot.pause()
+        # THEN
+        assert main_screen.search_results_table.search_results == JiraIssueSearchResponse(
+            issues=jira_issues
+        )
+        assert main_screen.search_results_container.border_subtitle == 'Page 1'
+        # WHEN
+        estimated_total.set()
+        await pilot.pause()
+        # THEN
+        assert main_screen.search_results_container.border_subtitle == 'Page 1 of 1 (total: 2)'
+
+
 @patch('jiratui.widgets.screen.MainScreen.fetch_issue')
 @patch('jiratui.widgets.screen.MainScreen._search_work_items')
 @patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
@@ -838,3 +892,113 @@ async def test_click_previous_page_on_first_page(
         assert main_screen.search_results_table.page == 1
         assert main_screen.search_results_table.current_work_item_key == jira_issues[0].key
         assert main_screen.search_results_container.border_subtitle == 'Page 1 of 1 (total: 2)'
+
+
+@patch('jiratui.widgets.screen.MainScreen.search_issues')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_search_results_rows_are_updated_by_key(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    search_issues_mock: AsyncMock,
+    app,
+):
+    app.config.search_results_truncate_work_item_summary = 10
+    app.config.search_results_style_work_item_status = False
+    app.config.search_results_style_work_item_type = False
+    rows = [
+        JiraIssueSearchRow(id=str(index), key=f'key-{index}', summary=f'summary {index}')
+        for index in range(1, 5)
+    ]
+    async with app.run_test() as pilot:
+        # GIVEN
+        main_screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        table = main_screen.search_results_table
+        table.search_results = JiraIssueSearchResponse(issues=rows)
+        await pilot.pause()
+        # WHEN
+        with patch.object(IssuesSearchResultsTable, 'clear') as clear_mock:
+            table.search_results = JiraIssueSearchResponse(issues=[rows[3], rows[1]])
+            await pilot.pause()
+        # THEN
+        clear_mock.assert_not_called()
+        assert [row.key.value for row in table.ordered_rows] == ['4#key-4', '2#key-2']
+        assert table.get_row_at(0)[:2] == [1, 'key-4']
+        assert table.get_row_at(1)[:2] == [2, 'key-2']
+
+
+@patch('jiratui.widgets.screen.MainScreen.search_issues')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_large_search_results_are_added_to_the_table_in_batches(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    search_issues_mock: AsyncMock,
+    app,
+):
+    app.config.search_results_truncate_work_item_summary = 10
+    app.config.search_results_style_work_item_status = False
+    app.config.search_results_style_work_item_type = False
+    rows = [
+        JiraIssueSearchRow(id=str(index), key=f'key-{index}', summary=f'summary {index}')
+        for index in range(5000)
+    ]
+    async with app.run_test() as pilot:
+        # GIVEN
+        main_screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        table = main_screen.search_results_table
+        table.focus()
+        # WHEN
+        table.search_results = JiraIssueSearchResponse(issues=rows)
+        await pilot.pause()
+        # THEN
+        assert table.row_count == IssuesSearchResultsTable.ROWS_LOADED_PER_BATCH
+        # WHEN
+        table.action_scroll_bottom()
+        await pilot.pause()
+        # THEN
+        assert table.row_count == 5000
+        assert table.cursor_row == 4999
+
+
+@patch.object(APIController, 'search_issues')
+@patch.object(APIController, 'search_project_mirror')
+@patch.object(APIController, 'project_mirror_covers')
+@patch('jiratui.widgets.screen.MainScreen.fetch_statuses')
+@patch('jiratui.widgets.screen.MainScreen.fetch_issue_types')
+@patch('jiratui.widgets.screen.MainScreen.fetch_projects')
+@pytest.mark.asyncio
+async def test_search_results_are_served_from_the_project_mirror(
+    search_projects_mock: AsyncMock,
+    fetch_issue_types_mock: AsyncMock,
+    fetch_statuses_mock: AsyncMock,
+    project_mirror_covers_mock: Mock,
+    search_project_mirror_mock: AsyncMock,
+    search_issues_mock: AsyncMock,
+    app,
+):
+    app.config.search_results_per_page = 10
+    app.config.enable_advanced_full_text_search = False
+    project_mirror_covers_mock.return_value = True
+    rows = [JiraIssueSearchRow(id='11', key='key-11', summary='summary 11')]
+    search_project_mirror_mock.return_value = APIControllerResponse(
+        result=JiraIssueSearchResponse(issues=rows, is_last=True, total=11, offset=10)
+    )
+    async with app.run_test():
+        # GIVEN
+        main_screen = cast('MainScreen', app.screen)  # type:ignore[name-defined] # noqa: F821
+        # WHEN
+        result = await main_screen._search_work_items(page=2)
+        # THEN
+        assert result.response.issues == rows
+        assert result.total == 11
+        assert result.pending_total is None
+        assert search_project_mirror_mock.call_args.kwargs['offset'] == 10
+        assert search_project_mirror_mock.call_args.kwargs['limit'] == 10
+        search_issues_mock.assert_not_called()
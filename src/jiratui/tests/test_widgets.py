@@ -11,9 +11,10 @@ from jiratui.widgets.work_item_details.fields import IssueSummaryField
 
 
 @pytest.fixture()
-def app() -> JiraApp:
+def app(performance_settings_for_testing: dict) -> JiraApp:
     config_mock = Mock(spec=ApplicationConfiguration)
     config_mock.configure_mock(
+        **performance_settings_for_testing,
         jira_api_base_url='foo.bar',
         jira_api_username='foo',
         jira_api_token=SecretStr('bar'),
@@ -1,4 +1,8 @@
-from marklas import to_adf, to_md
+"""Conversions between Markdown and Atlassian's ADF.
+
+`marklas` is imported by the first conversion, so that importing this module, e.g. from the commands of the CLI, is
+cheap.
+"""
 
 
 def convert_markdown_to_adf(content: str) -> dict:
@@ -11,6 +15,8 @@ def convert_markdown_to_adf(content: str) -> dict:
         A dict representing the ADF element.
     """
 
+    from marklas import to_adf
+
     return to_adf(content)
 
 
@@ -24,4 +30,6 @@ def convert_adf_to_markdown(content: dict) -> str:
         A CommonMark Markdown string.
     """
 
+    from marklas import to_md
+
     return to_md(content)
@@ -0,0 +1,149 @@
+import hashlib
+import logging
+import os
+from pathlib import Path
+import re
+
+from jiratui.constants import ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES, LOGGER_NAME
+from jiratui.files import get_cache_directory
+
+
+class AttachmentCache:
+    """Implements a persistent cache for the files attached to work items.
+
+    The content of an attachment never changes, so every file is stored under a name derived from the id and the size
+    of the attachment; a file with the expected name and size is the attachment. Files are stored in a directory that
+    is specific to the Jira server and the user. The total size of the cache is bounded: when it exceeds the maximum the
+    least recently used files are removed. Using a file updates its modification time, which the cache uses to
+    determine the order of use.
+    """
+
+    def __init__(self, directory: Path, max_size: int = ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES):
+        """Initializes the cache.
+
+        Args:
+            directory: the directory where the files are stored.
+            max_size: the maximum number of bytes of all the files in the cache.
+        """
+        self.directory = directory
+        self.max_size = max(max_size, 0)
+        self.logger = logging.getLogger(LOGGER_NAME)
+
+    @classmethod
+    def for_account(
+        cls,
+        server_url: str,
+        username: str,
+        max_size: int = ATTACHMENT_CACHE_DEFAULT_MAX_SIZE_IN_BYTES,
+    ) -> 'AttachmentCache':
+        """Builds the cache of the attachments of a Jira server for a user.
+
+        Args:
+            server_url: the base URL of the Jira server.
+            username: the username used to connect to the server.
+            max_size: the maximum number of bytes of all the files in the cache.
+
+        Returns:
+            An instance of `AttachmentCache`.
+        """
+
+        account = f'{server_url.rstrip("/")}\n{username}'.encode()
+        directory = get_cache_directory() / 'attachments' / hashlib.sha256(account).hexdigest()[:32]
+        return cls(directory, max_size=max_size)
+
+    def get_file(self, attachment_id: str, size: int) -> Path:
+        """Builds the path of the file of an attachment in the cache.
+
+        Args:
+            attachment_id: the ID of the attachment.
+            size: the size (in bytes) of the attachment.
+
+        Returns:
+            The path of the file; the file may not exist.
+        """
+        return self.directory / f'{self._get_prefix(attachment_id)}{size}'
+
+    @staticmethod
+    def _get_prefix(attachment_id: str) -> str:
+        return f'{re.sub(r"[^A-Za-z0-9_-]", "_", attachment_id)}-'
+
+    def get(self, attachment_id: str, size: int) -> Path | None:
+        """Retrieves the file of an attachment from the cache.
+
+        Args:
+            attachment_id: the ID of the attachment.
+            size: the size (in bytes) of the attachment.
+
+        Returns:
+            The path of the file or `None` if the attachment is not cached.
+        """
+
+        cached_file = self.get_file(attachment_id, size)
+        try:
+            if cached_file.stat().st_size != size:
+                return None
+            # mark the file as recently used
+            os.utime(cached_file)
+        except OSError:
+            return None
+        return cached_file
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Removes the least recently used files until the size of the cache does not exceed the maximum.
+
+        Partial files of interrupted downloads count towards the size of the cache and they are removed too.
+
+        Args:
+            keep: a file that must not be removed, e.g. the file that was just downloaded.
+
+        Returns:
+            Nothing.
+        """
+
+        try:
+            files = [
+                (cached_file, cached_file.stat())
+                for cached_file in self.directory.iterdir()
+                if cached_file.is_file()
+            ]
+        except OSError:
+            return
+        total_size = sum(stat.st_size for _, stat in files)
+        for cached_file, stat in sorted(files, key=lambda item: item[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+            if cached_file == keep:
+                continue
+            try:
+                cached_file.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning(
+                    'Unable to remove a file from the attachment cache',
+                    extra={'file': str(cached_file), 'error': str(e)},
+                )
+                continue
+            total_size -= stat.st_size
+
+    def delete(self, attachment_id: str) -> None:
+        """Removes the files of an attachment from the cache.
+
+        Args:
+            attachment_id: the ID of the attachment.
+
+        Returns:
+            Nothing.
+        """
+
+        if self.directory.exists():
+            prefix = self._get_prefix(attachment_id)
+            for cached_file in self.directory.glob(f'{prefix}*'):
+                # the ids of other attachments may start with the same prefix, e.g. 1-2 and 1
+                if cached_file.name[len(prefix) :].split('.')[0].isdigit():
+                    cached_file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Removes all the files of the cache."""
+        if self.directory.exists():
+            for cached_file in self.directory.iterdir():
+                if cached_file.is_file():
+                    cached_file.unlink(missing_ok=True)
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import tempfile
+from typing import Any
+
+from jiratui.constants import LOGGER_NAME
+from jiratui.files import get_cache_directory
+
+METADATA_CACHE_FORMAT_VERSION = 1
+"""The version of the format of the files of the cache. Files written with a different version are ignored."""
+
+
+@dataclass
+class MetadataCacheEntry:
+    data: Any
+    stored_at: float
+    """The timestamp (UTC) when the data was stored in the cache."""
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the data was stored in the cache."""
+        return datetime.now(tz=timezone.utc).timestamp() - self.stored_at
+
+
+class MetadataCache:
+    """Implements a persistent cache for the metadata of a Jira server, e.g. projects, types of work items, statuses.
+
+    Every entry of the cache is stored as a JSON file in a directory that is specific to the Jira server and the user,
+    so data cached for an account is never shown to a different account. Errors reading or writing the files are
+    logged and ignored; the cache never prevents the application from fetching the data from the server.
+    """
+
+    def __init__(self, directory: Path, max_age: int | None = None):
+        """Initializes the cache.
+
+        Args:
+            directory: the directory where the entries of the cache are stored.
+            max_age: the maximum age (in seconds) of the entries. Older entries are ignored. If `None` the entries
+            never expire.
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self.logger = logging.getLogger(LOGGER_NAME)
+
+    @classmethod
+    def for_account(
+        cls, server_url: str, username: str, max_age: int | None = None
+    ) -> 'MetadataCache':
+        """Builds the cache of the metadata of a Jira server for a user.
+
+        Args:
+            server_url: the base URL of the Jira server.
+            username: the username used to connect to the server.
+            max_age: the maximum age (in seconds) of the entries.
+
+        Returns:
+            An instance of `MetadataCache`.
+        """
+
+        account = f'{server_url.rstrip("/")}\n{username}'.encode()
+        directory = get_cache_directory() / 'metadata' / hashlib.sha256(account).hexdigest()[:32]
+        return cls(directory, max_age=max_age)
+
+    def _get_file(self, resource: str) -> Path:
+        return self.directory / f'{re.sub(r"[^A-Za-z0-9_.-]", "_", resource)}.json'
+
+    def get(self, resource: str) -> MetadataCacheEntry | None:
+        """Retrieves the data of a resource from the cache.
+
+        Args:
+            resource: the name of the resource, e.g. `projects`.
+
+        Returns:
+            An instance of `MetadataCacheEntry` or `None` if the resource is not cached or the entry expired.
+        """
+
+        try:
+            with self._get_file(resource).open(encoding='utf-8') as cache_file:
+                content: dict = json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                'Unable to read the metadata cache', extra={'resource': resource, 'error': str(e)}
+            )
+            return None
+        if not isinstance(content, dict) or content.get('version') != METADATA_CACHE_FORMAT_VERSION:
+            return None
+        entry = MetadataCacheEntry(data=content.get('data'), stored_at=content.get('stored_at', 0))
+        if self.max_age is not None and entry.age > self.max_age:
+            return None
+        return entry
+
+    def set(self, resource: str, data: Any) -> None:
+        """Stores the data of a resource in the cache.
+
+        The data is written to a temporary file first and then moved in place so readers never see partial files.
+
+        Args:
+            resource: the name of the resource, e.g. `projects`.
+            data: the data to store. It must be serializable to JSON.
+
+        Returns:
+            Nothing.
+        """
+
+        content = {
+            'version': METADATA_CACHE_FORMAT_VERSION,
+            'stored_at': datetime.now(tz=timezone.utc).timestamp(),
+            'data': data,
+        }
+        temporary_file: str | None = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temporary_file = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as cache_file:
+                json.dump(content, cache_file)
+            os.replace(temporary_file, self._get_file(resource))
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(
+                'Unable to update the metadata cache', extra={'resource': resource, 'error': str(e)}
+            )
+            if temporary_file and os.path.exists(temporary_file):
+                os.remove(temporary_file)
+
+    def delete(self, resource: str) -> None:
+        """Removes a resource from the cache.
+
+        Args:
+            resource: the name of the resource.
+
+        Returns:
+            Nothing.
+        """
+
+        self._get_file(resource).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Removes all the entries of the cache."""
+        if self.directory.exists():
+            for cache_file in self.directory.glob('*.json'):
+                cache_file.unlink(missing_ok=True)
@@ -0,0 +1,176 @@
+"""Speculative prefetching of the details of work items.
+
+While the user moves the cursor through the search results the application fetches the details of the highlighted
+work item, and of its neighbours, before the user selects one of them. The details are kept in a bounded in-memory
+LRU so that selecting a work item renders it without waiting for the server.
+
+To avoid sending a request for every row the cursor passes through, the prefetch starts only after the cursor rests on a
+row for a short time (debounce). Moving the cursor again cancels the requests of work items that are no longer
+wanted, and the number of requests in flight is bounded.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+import time
+from typing import Awaitable, Callable
+
+from jiratui.config import WorkItemPrefetchConfiguration
+from jiratui.models import JiraIssue
+
+
+@dataclass
+class PrefetchedWorkItem:
+    work_item: JiraIssue
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class WorkItemPrefetcher:
+    """Fetches the details of work items ahead of time and keeps them in an LRU cache."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[JiraIssue | None]],
+        debounce: float = 0.3,
+        max_size: int = 50,
+        max_age: float = 60.0,
+        max_concurrency: int = 3,
+    ):
+        """Initializes the prefetcher.
+
+        Args:
+            fetch: a function that retrieves the details of a work item given its key. It returns `None` if the work
+            item can not be retrieved.
+            debounce: the number of seconds to wait after a prefetch is requested before fetching the work items.
+            max_size: the maximum number of work items kept in memory.
+            max_age: the number of seconds a prefetched work item can be used for.
+            max_concurrency: the maximum number of work items fetched concurrently.
+        """
+        self.fetch = fetch
+        self.debounce = debounce
+        self.max_size = max(max_size, 1)
+        self.max_age = max_age
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self._work_items: OrderedDict[str, PrefetchedWorkItem] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[JiraIssue | None]] = {}
+        self._scheduled: asyncio.Task | None = None
+
+    @classmethod
+    def from_configuration(
+        cls,
+        fetch: Callable[[str], Awaitable[JiraIssue | None]],
+        configuration: WorkItemPrefetchConfiguration,
+    ) -> 'WorkItemPrefetcher | None':
+        if not configuration.enabled:
+            return None
+        return cls(
+            fetch,
+            debounce=configuration.debounce,
+            max_size=configuration.max_size,
+            max_age=configuration.max_age,
+            max_concurrency=configuration.max_concurrency,
+        )
+
+    def prefetch(self, keys: list[str]) -> None:
+        """Schedules prefetching the details of some work items.
+
+        Any pending prefetch is cancelled, as well as the requests of work items that are not in `keys`.
+
+        Args:
+            keys: the keys of the work items to prefetch, in order of priority.
+
+        Returns:
+            Nothing.
+        """
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+        for key in list(self._in_flight):
+            if key not in keys:
+                self._in_flight.pop(key).cancel()
+        self._scheduled = asyncio.create_task(self._prefetch_after_debounce(list(keys)))
+
+    async def _prefetch_after_debounce(self, keys: list[str]) -> None:
+        await asyncio.sleep(self.debounce)
+        for key in keys:
+            if key in self._in_flight or self._get_fresh(key) is not None:
+                continue
+            task = asyncio.create_task(self._fetch(key))
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._forget, key))
+
+    async def _fetch(self, key: str) -> JiraIssue | None:
+        async with self._semaphore:
+            try:
+                work_item = await self.fetch(key)
+            except Exception:
+                return None
+        if work_item is not None:
+            self.store(work_item)
+        return work_item
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def _get_fresh(self, key: str) -> JiraIssue | None:
+        if (entry := self._work_items.get(key)) is None:
+            return None
+        if not entry.is_fresh:
+            del self._work_items[key]
+            return None
+        self._work_items.move_to_end(key)
+        return entry.work_item
+
+    def store(self, work_item: JiraIssue) -> None:
+        """Keeps the details of a work item in memory, discarding the least recently used if necessary."""
+        self._work_items[work_item.key] = PrefetchedWorkItem(
+            work_item=work_item, expires_at=time.monotonic() + self.max_age
+        )
+        self._work_items.move_to_end(work_item.key)
+        while len(self._work_items) > self.max_size:
+            self._work_items.popitem(last=False)
+
+    async def take(self, key: str) -> JiraIssue | None:
+        """Retrieves and discards the prefetched details of a work item.
+
+        If the work item is being fetched this waits for the request to finish. The entry is discarded so that the
+        next time the work item is loaded its details are fetched from the server again.
+
+        Args:
+            key: the key of the work item.
+
+        Returns:
+            The details of the work item or `None` if the work item was not prefetched.
+        """
+        if (task := self._in_flight.get(key)) is not None:
+            try:
+                # shield the request so that cancelling the caller does not cancel the prefetch
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    # the caller was cancelled
+                    raise
+                return None
+        work_item = self._get_fresh(key)
+        self._work_items.pop(key, None)
+        return work_item
+
+    def invalidate(self, key: str) -> None:
+        """Discards the prefetched details of a work item, e.g. after the work item was updated or deleted."""
+        self._work_items.pop(key, None)
+        if (task := self._in_flight.pop(key, None)) is not None:
+            task.cancel()
+
+    def cancel(self) -> None:
+        """Cancels every pending and in-flight prefetch."""
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        for task in self._in_flight.values():
+            task.cancel()
+        self._in_flight.clear()
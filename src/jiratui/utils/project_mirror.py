@@ -0,0 +1,466 @@
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, datetime
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+from typing import Literal, overload
+
+from jiratui.constants import LOGGER_NAME
+from jiratui.files import get_data_directory
+from jiratui.models import (
+    IssuePriority,
+    IssueStatus,
+    IssueType,
+    JiraIssue,
+    JiraIssueSearchRow,
+    JiraUser,
+    Project,
+    WorkItemsSearchOrderBy,
+)
+
+PROJECT_MIRROR_FORMAT_VERSION = 1
+"""The version of the schema of the mirror. Mirrors with a different version are rebuilt."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    key TEXT PRIMARY KEY,
+    key_number INTEGER NOT NULL,
+    work_item_id TEXT NOT NULL,
+    project_key TEXT NOT NULL,
+    project_id TEXT,
+    project_name TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    status_id TEXT,
+    status_name TEXT NOT NULL DEFAULT '',
+    work_item_type_id TEXT,
+    work_item_type_name TEXT NOT NULL DEFAULT '',
+    hierarchy_level INTEGER,
+    parent_key TEXT,
+    assignee_account_id TEXT,
+    assignee_display_name TEXT,
+    labels TEXT,
+    priority_id TEXT,
+    priority_name TEXT,
+    created TEXT,
+    updated TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS work_items_by_project ON work_items (project_key, created);
+CREATE INDEX IF NOT EXISTS work_items_by_parent ON work_items (parent_key);
+CREATE TABLE IF NOT EXISTS projects (
+    project_key TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL,
+    last_updated TEXT
+);
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO work_items (
+    key, key_number, work_item_id, project_key, project_id, project_name, summary, status_id, status_name,
+    work_item_type_id, work_item_type_name, hierarchy_level, parent_key, assignee_account_id, assignee_display_name,
+    labels, priority_id, priority_name, created, updated, synced_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_COLUMNS = (
+    'work_item_id, key, project_key, project_id, project_name, summary, status_id, status_name, '
+    'work_item_type_id, work_item_type_name, hierarchy_level, parent_key, assignee_account_id, '
+    'assignee_display_name, labels, priority_id, priority_name, created, updated'
+)
+
+# the mirror does not store the rank of the priorities, so searches sorted by priority are not served from it
+_ORDER_BY: dict[WorkItemsSearchOrderBy | None, str] = {
+    None: 'created DESC, key_number DESC',
+    WorkItemsSearchOrderBy.CREATED_ASC: 'created ASC, key_number ASC',
+    WorkItemsSearchOrderBy.CREATED_DESC: 'created DESC, key_number DESC',
+    WorkItemsSearchOrderBy.KEY_ASC: 'key_number ASC',
+    WorkItemsSearchOrderBy.KEY_DESC: 'key_number DESC',
+}
+
+
+@dataclass
+class ProjectMirrorState:
+    """The state of the synchronization of a project in the mirror."""
+
+    project_key: str
+    synced_at: float
+    """The time when the last synchronization started."""
+    full_synced_at: float
+    """The time when the last full synchronization started."""
+    last_updated: str | None = None
+    """The date and time (as `yyyy-MM-dd HH:mm`) from which the next incremental synchronization retrieves the work
+    items updated."""
+
+
+class ProjectMirror:
+    """Implements a local mirror of the work items of some projects.
+
+    The mirror is a SQLite database with the fields of the work items that the main screen filters and displays. A
+    project is synchronized from scratch the first time; afterwards only the work items updated since the last
+    synchronization are retrieved, using a JQL query like `updated >= "2025-01-01 10:00"`. Incremental synchronizations
+    can not detect deleted work items, so full synchronizations run periodically too and, they remove the work items
+    that were not retrieved. The database is stored in a file that is specific to the Jira server and the user. Every
+    operation opens its own connection, so the methods can be called from worker threads, e.g. via
+    `asyncio.to_thread`.
+    """
+
+    def __init__(self, database: Path):
+        """Initializes the mirror.
+
+        Args:
+            database: the path of the SQLite database.
+        """
+        self.database = database
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self._initialized = False
+        self._synced_projects: set[str] | None = None
+
+    @classmethod
+    def for_account(cls, server_url: str, username: str) -> 'ProjectMirror':
+        """Builds the mirror of the projects of a Jira server for a user.
+
+        Args:
+            server_url: the base URL of the Jira server.
+            username: the username used to connect to the server.
+
+        Returns:
+            An instance of `ProjectMirror`.
+        """
+
+        account = f'{server_url.rstrip("/")}\n{username}'.encode()
+        name = hashlib.sha256(account).hexdigest()[:32]
+        return cls(get_data_directory() / 'mirror' / f'{name}.sqlite3')
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.database.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=5)
+        if not self._initialized:
+            with connection:
+                version: int = connection.execute('PRAGMA user_version').fetchone()[0]
+                if version != PROJECT_MIRROR_FORMAT_VERSION:
+                    connection.executescript(
+                        'DROP TABLE IF EXISTS work_items; DROP TABLE IF EXISTS projects;'
+                    )
+                connection.executescript(_SCHEMA)
+                connection.execute(f'PRAGMA user_version = {PROJECT_MIRROR_FORMAT_VERSION}')
+            self._initialized = True
+        return connection
+
+    def is_synced(self, project_key: str) -> bool:
+        """Determines whether a project was synchronized at least once, i.e. whether the mirror can serve its work
+        items.
+
+        Args:
+            project_key: the key of the project.
+
+        Returns:
+            `True` if the project was synchronized; `False` otherwise.
+        """
+        if self._synced_projects is None:
+            try:
+                with closing(self._connect()) as connection:
+                    self._synced_projects = {
+                        key for (key,) in connection.execute('SELECT project_key FROM projects')
+                    }
+            except sqlite3.Error as e:
+                self.logger.warning(
+                    'Unable to read the mirror of projects', extra={'error': str(e)}
+                )
+                return False
+        return project_key in self._synced_projects
+
+    def get_state(self, project_key: str) -> ProjectMirrorState | None:
+        """Retrieves the state of the synchronization of a project.
+
+        Args:
+            project_key: the key of the project.
+
+        Returns:
+            An instance of `ProjectMirrorState` or `None` if the project was never synchronized.
+        """
+        with closing(self._connect()) as connection:
+            record = connection.execute(
+                'SELECT synced_at, full_synced_at, last_updated FROM projects '
+                'WHERE project_key = ?',
+                (project_key,),
+            ).fetchone()
+        if record is None:
+            return None
+        return ProjectMirrorState(project_key, *record)
+
+    @staticmethod
+    def _get_key_number(key: str) -> int:
+        number = key.rsplit('-', 1)[-1]
+        return int(number) if number.isdigit() else 0
+
+    def store(self, project_key: str, work_items: list[JiraIssue], synced_at: float) -> None:
+        """Adds work items to the mirror or, replaces them if they are mirrored already.
+
+        Args:
+            project_key: the key of the project of the work items.
+            work_items: the work items retrieved from the server.
+            synced_at: the time when the synchronization started.
+
+        Returns:
+            Nothing.
+        """
+        rows: list[tuple] = []
+        for work_item in work_items:
+            try:
+                rows.append(
+                    (
+                        work_item.key,
+                        self._get_key_number(work_item.key),
+                        work_item.id,
+                        work_item.project.key if work_item.project else project_key,
+                        work_item.project.id if work_item.project else None,
+                        work_item.project.name if work_item.project else '',
+                        work_item.summary,
+                        work_item.status.id if work_item.status else None,
+                        work_item.status_name,
+                        work_item.issue_type.id if work_item.issue_type else None,
+                        work_item.work_item_type_name,
+                        work_item.issue_type.hierarchy_level if work_item.issue_type else None,
+                        work_item.parent_issue_key,
+                        work_item.assignee.account_id if work_item.assignee else None,
+                        work_item.assignee.display_name if work_item.assignee else None,
+                        json.dumps(work_item.labels) if work_item.labels else None,
+                        work_item.priority.id if work_item.priority else None,
+                        work_item.priority.name if work_item.priority else None,
+                        work_item.created.isoformat() if work_item.created else None,
+                        work_item.updated.isoformat() if work_item.updated else None,
+                        synced_at,
+                    )
+                )
+            except Exception as e:
+                self.logger.warning(
+                    'Unable to mirror a work item', extra={'key': work_item.key, 'error': str(e)}
+                )
+        if rows:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(_UPSERT, rows)
+
+    def finish_sync(
+        self, project_key: str, synced_at: float, full: bool, last_updated: str | None
+    ) -> None:
+        """Records the end of a successful synchronization of a project.
+
+        A full synchronization removes the work items of the project that it did not retrieve, i.e. the ones deleted
+        from the server or moved to other projects.
+
+        Args:
+            project_key: the key of the project.
+            synced_at: the time when the synchronization started.
+            full: whether every work item of the project was retrieved.
+            last_updated: the date and time (as `yyyy-MM-dd HH:mm`) from which the next incremental synchronization
+            retrieves the work items updated. If `None` the previous one is kept.
+
+        Returns:
+            Nothing.
+        """
+        with closing(self._connect()) as connection, connection:
+            if full:
+                connection.execute(
+                    'DELETE FROM work_items WHERE project_key = ? AND synced_at < ?',
+                    (project_key, synced_at),
+                )
+            connection.execute(
+                """
+                INSERT INTO projects (project_key, synced_at, full_synced_at, last_updated)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(project_key) DO UPDATE SET
+                    synced_at = excluded.synced_at,
+                    full_synced_at = CASE WHEN ? THEN excluded.full_synced_at ELSE projects.full_synced_at END,
+                    last_updated = COALESCE(excluded.last_updated, projects.last_updated)
+                """,
+                (project_key, synced_at, synced_at, last_updated, full),
+            )
+        if self._synced_projects is not None:
+            self._synced_projects.add(project_key)
+
+    def delete(self, key: str) -> None:
+        """Removes a work item from the mirror.
+
+        Args:
+            key: the key or the id of the work item.
+
+        Returns:
+            Nothing.
+        """
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    'DELETE FROM work_items WHERE key = ? OR work_item_id = ?', (key, key)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(
+                'Unable to remove a work item from the mirror', extra={'key': key, 'error': str(e)}
+            )
+
+    @staticmethod
+    def supports_order(order_by: WorkItemsSearchOrderBy | None) -> bool:
+        """Determines whether the mirror can sort work items by some criteria.
+
+        Args:
+            order_by: the order of the work items.
+
+        Returns:
+            `True` if the mirror supports the order; `False` otherwise.
+        """
+        return order_by in _ORDER_BY
+
+    def search(
+        self,
+        project_key: str,
+        created_from: date | None = None,
+        created_until: date | None = None,
+        status: int | None = None,
+        assignee: str | None = None,
+        issue_type: int | None = None,
+        order_by: WorkItemsSearchOrderBy | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        compact: bool = False,
+    ) -> tuple[list[JiraIssue] | list[JiraIssueSearchRow], int]:
+        """Searches the mirrored work items of a project.
+
+        The criteria are the ones of `APIController.search_issues`. Dates are compared with the date of creation of
+        the work items in the time zone reported by the server.
+
+        Args:
+            project_key: the key of the project.
+            created_from: search work items created from this date forward (inclusive).
+            created_until: search work items created until this date (inclusive).
+            status: search work items with this status.
+            assignee: search work items assigned to this user's account ID.
+            issue_type: search work items of this type.
+            order_by: the order of the work items. It must be supported by the mirror.
+            offset: the number of work items to skip.
+            limit: the maximum number of work items to retrieve.
+            compact: if `True` the work items are instances of `JiraIssueSearchRow` instead of `JiraIssue`.
+
+        Returns:
+            A tuple with the work items found and, the total number of work items that match the criteria.
+        """
+        conditions: list[str] = ['project_key = ?']
+        parameters: list = [project_key]
+        if created_from:
+            conditions.append('substr(created, 1, 10) >= ?')
+            parameters.append(created_from.isoformat())
+        if created_until:
+            conditions.append('substr(created, 1, 10) <= ?')
+            parameters.append(created_until.isoformat())
+        if status:
+            conditions.append('status_id = ?')
+            parameters.append(str(status))
+        if assignee:
+            conditions.append('assignee_account_id = ?')
+            parameters.append(assignee)
+        if issue_type:
+            conditions.append('work_item_type_id = ?')
+            parameters.append(str(issue_type))
+        where = ' AND '.join(conditions)
+        with closing(self._connect()) as connection:
+            total: int = connection.execute(
+                f'SELECT COUNT(*) FROM work_items WHERE {where}', parameters
+            ).fetchone()[0]
+            records: list[tuple] = connection.execute(
+                f'SELECT {_COLUMNS} FROM work_items WHERE {where} ORDER BY {_ORDER_BY[order_by]} '
+                'LIMIT ? OFFSET ?',
+                [*parameters, -1 if limit is None else limit, max(offset, 0)],
+            ).fetchall()
+        if compact:
+            return [self._build_work_item(record, compact=True) for record in records], total
+        return [self._build_work_item(record) for record in records], total
+
+    def get_children(self, key: str) -> list[JiraIssue]:
+        """Retrieves the mirrored work items whose parent is a work item.
+
+        Args:
+            key: the key of the parent work item.
+
+        Returns:
+            The child work items, sorted by key.
+        """
+        with closing(self._connect()) as connection:
+            records: list[tuple] = connection.execute(
+                f'SELECT {_COLUMNS} FROM work_items WHERE parent_key = ? ORDER BY key_number',
+                (key,),
+            ).fetchall()
+        return [self._build_work_item(record) for record in records]
+
+    @overload
+    @staticmethod
+    def _build_work_item(record: tuple, compact: Literal[False] = False) -> JiraIssue: ...
+
+    @overload
+    @staticmethod
+    def _build_work_item(record: tuple, compact: Literal[True]) -> JiraIssueSearchRow: ...
+
+    @staticmethod
+    def _build_work_item(record: tuple, compact: bool = False) -> JiraIssue | JiraIssueSearchRow:
+        (
+            work_item_id,
+            key,
+            project_key,
+            project_id,
+            project_name,
+            summary,
+            status_id,
+            status_name,
+            work_item_type_id,
+            work_item_type_name,
+            hierarchy_level,
+            parent_key,
+            assignee_account_id,
+            assignee_display_name,
+            labels,
+            priority_id,
+            priority_name,
+            created,
+            updated,
+        ) = record
+        if compact:
+            return JiraIssueSearchRow(
+                id=work_item_id,
+                key=key,
+                summary=summary,
+                status_id=status_id,
+                status_name=status_name,
+                work_item_type_name=work_item_type_name,
+                parent_issue_key=parent_key,
+                assignee_display_name=assignee_display_name or '',
+                labels=json.loads(labels) if labels else None,
+            )
+        return JiraIssue(
+            id=work_item_id,
+            key=key,
+            summary=summary,
+            status=IssueStatus(id=status_id, name=status_name),
+            project=Project(id=project_id, name=project_name, key=project_key)
+            if project_id
+            else None,
+            issue_type=IssueType(
+                id=work_item_type_id, name=work_item_type_name, hierarchy_level=hierarchy_level
+            )
+            if work_item_type_id
+            else None,
+            parent_issue_key=parent_key,
+            assignee=JiraUser(
+                account_id=assignee_account_id,
+                active=True,
+                display_name=assignee_display_name,
+            )
+            if assignee_account_id
+            else None,
+            labels=json.loads(labels) if labels else None,
+            priority=IssuePriority(id=priority_id, name=priority_name) if priority_id else None,
+            created=datetime.fromisoformat(created) if created else None,
+            updated=datetime.fromisoformat(updated) if updated else None,
+        )
@@ -0,0 +1,154 @@
+from typing import Generic, Sequence
+
+from jiratui.models import SearchResultWorkItem
+
+NGRAM_LENGTH = 3
+# separates the fields of a work item in the indexed text; queries never contain it, so n-grams that span two fields
+# never match
+FIELD_SEPARATOR = '\x00'
+
+
+class WorkItemSearchIndex(Generic[SearchResultWorkItem]):
+    """Implements an in-memory index for filtering a set of work items as the user types.
+
+    The index is built once for a set of work items, e.g. a page of search results. The searchable fields of every work
+    item (key, summary, parent, assignee, status and labels) are lower-cased and joined and, every n-gram of the
+    resulting text points to the work items that contain it. A query is split into terms and, a work item matches when
+    every term is a substring of one of its fields. The candidates of a term are the work items of its rarest n-gram,
+    so only a few work items are checked. When a query extends the previous query, e.g. while the user keeps typing,
+    the matches of the previous query are the only candidates.
+
+    Matches are ranked by the quality of the match of every term: an exact key, the start of the key, the start of a
+    word and, anywhere else, in this order. Matches in the key rank higher than matches in the summary and, these rank
+    higher than matches in other fields. Work items with the same rank keep their original order.
+    """
+
+    def __init__(self, work_items: Sequence[SearchResultWorkItem]):
+        """Builds the index.
+
+        Args:
+            work_items: the work items to index.
+        """
+        self.work_items: list[SearchResultWorkItem] = list(work_items)
+        self._fields: list[tuple[str, ...]] = [
+            self._get_searchable_fields(work_item) for work_item in self.work_items
+        ]
+        self._texts: list[str] = [FIELD_SEPARATOR.join(fields) for fields in self._fields]
+        self._postings: dict[str, list[int]] = {}
+        for position, text in enumerate(self._texts):
+            for ngram in {text[i : i + NGRAM_LENGTH] for i in range(len(text) - NGRAM_LENGTH + 1)}:
+                self._postings.setdefault(ngram, []).append(position)
+        # the last query and the positions of the work items that matched it
+        self._last_query: str | None = None
+        self._last_matches: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.work_items)
+
+    @staticmethod
+    def _get_searchable_fields(work_item: SearchResultWorkItem) -> tuple[str, ...]:
+        return (
+            work_item.key.lower(),
+            work_item.summary.lower(),
+            work_item.parent_key.lower(),
+            work_item.assignee_display_name.lower(),
+            work_item.status_name.lower(),
+            ' '.join(work_item.labels or []).lower(),
+        )
+
+    def _get_candidates(self, term: str, candidates: list[int] | None) -> list[int]:
+        """Retrieves the positions of the work items that may contain a term.
+
+        Args:
+            term: a lower-cased term of a query.
+            candidates: the positions of the work items that matched the previous terms. If `None` every work item is a
+            candidate.
+
+        Returns:
+            The positions of the candidates, in order.
+        """
+        if len(term) < NGRAM_LENGTH:
+            return list(range(len(self._texts))) if candidates is None else candidates
+        # the work items that contain the term contain all its n-grams; the rarest n-gram has the fewest candidates
+        postings: list[int] = []
+        for i in range(len(term) - NGRAM_LENGTH + 1):
+            ngram_postings = self._postings.get(term[i : i + NGRAM_LENGTH])
+            if not ngram_postings:
+                return []
+            if not postings or len(ngram_postings) < len(postings):
+                postings = ngram_postings
+        if candidates is None:
+            return postings
+        if len(postings) < len(candidates):
+            allowed = set(candidates)
+            return [position for position in postings if position in allowed]
+        return candidates
+
+    def search(self, query: str) -> list[SearchResultWorkItem]:
+        """Finds the work items that match a query.
+
+        Args:
+            query: the text typed by the user. Every whitespace-separated term must be found in the work item.
+
+        Returns:
+            The work items that match the query, best matches first.
+        """
+        cleaned = query.strip().lower()
+        terms: list[str] = cleaned.split()
+        if not terms:
+            self._last_query = None
+            return list(self.work_items)
+
+        candidates: list[int] | None = None
+        if self._last_query is not None and cleaned.startswith(self._last_query):
+            # every work item that matches the new query also matched the previous one
+            candidates = self._last_matches
+        for term in sorted(terms, key=len, reverse=True):
+            candidates = [
+                position
+                for position in self._get_candidates(term, candidates)
+                if term in self._texts[position]
+            ]
+            if not candidates:
+                break
+        matches: list[int] = candidates or []
+        self._last_query = cleaned
+        self._last_matches = matches
+
+        ranks: dict[int, int] = {
+            position: sum(self._rank(self._fields[position], term) for term in terms)
+            for position in matches
+        }
+        return [
+            self.work_items[position]
+            for position in sorted(matches, key=lambda position: (ranks[position], position))
+        ]
+
+    @staticmethod
+    def _rank(fields: tuple[str, ...], term: str) -> int:
+        """Ranks the match of a term in the fields of a work item; lower is better.
+
+        Args:
+            fields: the lower-cased searchable fields of a work item.
+            term: a lower-cased term.
+
+        Returns:
+            The rank of the best match of the term.
+        """
+        key = fields[0]
+        if key == term:
+            return 0
+        if key.startswith(term):
+            return 1
+        best = 100
+        for field_rank, field in enumerate(fields):
+            index = field.find(term)
+            if index < 0:
+                continue
+            # matches at the start of a word are better than matches in the middle of a word
+            if index == 0 or not field[index - 1].isalnum():
+                rank = 2 + field_rank
+            else:
+                rank = 10 + field_rank
+            best = min(best, rank)
+        return best
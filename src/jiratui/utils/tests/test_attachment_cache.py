@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+from jiratui.utils.attachment_cache import AttachmentCache
+
+
+def add_file(cache: AttachmentCache, attachment_id: str, size: int, used_at: int) -> Path:
+    cached_file = cache.get_file(attachment_id, size)
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    cached_file.write_bytes(b'x' * size)
+    os.utime(cached_file, (used_at, used_at))
+    return cached_file
+
+
+def test_get_attachment(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path)
+    cached_file = add_file(cache, '10', 5, used_at=1000)
+    # WHEN
+    result = cache.get('10', 5)
+    # THEN
+    assert result == cached_file
+    # the file is marked as recently used
+    assert cached_file.stat().st_mtime > 1000
+    # a different size is a different file
+    assert cache.get('10', 6) is None
+    assert cache.get('11', 5) is None
+
+
+def test_get_attachment_with_incomplete_file(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path)
+    cache.get_file('10', 5).write_bytes(b'xx')
+    # THEN
+    assert cache.get('10', 5) is None
+
+
+def test_get_file_sanitizes_the_attachment_id(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path)
+    # THEN
+    assert cache.get_file('../10', 5) == tmp_path / '___10-5'
+
+
+def test_evict_the_least_recently_used_files(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path, max_size=10)
+    oldest = add_file(cache, '1', 4, used_at=1000)
+    newest = add_file(cache, '2', 4, used_at=3000)
+    downloaded = add_file(cache, '3', 4, used_at=2000)
+    # WHEN
+    cache.evict(keep=downloaded)
+    # THEN
+    assert not oldest.exists()
+    assert newest.exists()
+    assert downloaded.exists()
+
+
+def test_evict_keeps_the_downloaded_file(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path, max_size=2)
+    other = add_file(cache, '1', 4, used_at=2000)
+    downloaded = add_file(cache, '2', 4, used_at=1000)
+    # WHEN
+    cache.evict(keep=downloaded)
+    # THEN
+    assert not other.exists()
+    assert downloaded.exists()
+
+
+def test_evict_without_directory(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path / 'missing', max_size=0)
+    # WHEN
+    cache.evict()
+    # THEN
+    assert not cache.directory.exists()
+
+
+def test_delete_attachment(tmp_path: Path):
+    # GIVEN
+    cache = AttachmentCache(tmp_path)
+    cached_file = add_file(cache, '1', 4, used_at=1000)
+    partial_file = tmp_path / '1-8.part'
+    partial_file.write_bytes(b'x')
+    other = add_file(cache, '1-2', 4, used_at=1000)
+    # WHEN
+    cache.delete('1')
+    # THEN
+    assert not cached_file.exists()
+    assert not partial_file.exists()
+    assert other.exists()
@@ -0,0 +1,79 @@
+import json
+from unittest.mock import patch
+
+from jiratui.utils.metadata_cache import MetadataCache
+
+
+def test_set_and_get(tmp_path):
+    # GIVEN
+    cache = MetadataCache(tmp_path)
+    # WHEN
+    cache.set('projects', [{'id': '1', 'key': 'P1', 'name': 'Project 1'}])
+    entry = cache.get('projects')
+    # THEN
+    assert entry is not None
+    assert entry.data == [{'id': '1', 'key': 'P1', 'name': 'Project 1'}]
+    assert entry.age >= 0
+
+
+def test_get_missing_resource(tmp_path):
+    assert MetadataCache(tmp_path).get('projects') is None
+
+
+def test_get_expired_resource(tmp_path):
+    # GIVEN
+    cache = MetadataCache(tmp_path, max_age=60)
+    cache.set('statuses', [])
+    # WHEN
+    with patch('jiratui.utils.metadata_cache.MetadataCacheEntry.age', 61):
+        entry = cache.get('statuses')
+    # THEN
+    assert entry is None
+
+
+def test_get_ignores_invalid_files(tmp_path):
+    # GIVEN
+    cache = MetadataCache(tmp_path)
+    (tmp_path / 'fields.json').write_text('{not json')
+    (tmp_path / 'statuses.json').write_text(json.dumps({'version': 0, 'data': []}))
+    # THEN
+    assert cache.get('fields') is None
+    assert cache.get('statuses') is None
+
+
+def test_resource_names_are_sanitized(tmp_path):
+    # GIVEN
+    cache = MetadataCache(tmp_path)
+    # WHEN
+    cache.set('createmeta-../P1-10', {'fields': []})
+    # THEN
+    assert [path.name for path in tmp_path.iterdir()] == ['createmeta-.._P1-10.json']
+    assert cache.get('createmeta-../P1-10').data == {'fields': []}
+
+
+def test_for_account_uses_a_directory_per_server_and_user(tmp_path):
+    # GIVEN
+    with patch('jiratui.utils.metadata_cache.get_cache_directory', return_value=tmp_path):
+        cache_a = MetadataCache.for_account('https://foo.bar/', 'bart')
+        cache_b = MetadataCache.for_account('https://foo.bar', 'lisa')
+        cache_c = MetadataCache.for_account('https://foo.bar', 'bart')
+    # THEN
+    assert cache_a.directory != cache_b.directory
+    assert cache_a.directory == cache_c.directory
+    assert cache_a.directory.parent == tmp_path / 'metadata'
+
+
+def test_delete_and_clear(tmp_path):
+    # GIVEN
+    cache = MetadataCache(tmp_path)
+    cache.set('projects', [])
+    cache.set('statuses', [])
+    # WHEN
+    cache.delete('projects')
+    # THEN
+    assert cache.get('projects') is None
+    assert cache.get('statuses') is not None
+    # WHEN
+    cache.clear()
+    # THEN
+    assert cache.get('statuses') is None
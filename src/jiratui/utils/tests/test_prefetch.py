@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from jiratui.config import WorkItemPrefetchConfiguration
+from jiratui.models import IssueStatus, JiraIssue
+from jiratui.utils.prefetch import WorkItemPrefetcher
+
+
+def build_work_item(key: str) -> JiraIssue:
+    return JiraIssue(id=key, key=key, summary=key, status=IssueStatus(id='1', name='To Do'))
+
+
+class FakeFetcher:
+    def __init__(self):
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, key: str) -> JiraIssue | None:
+        self.calls.append(key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        return None if key == 'missing' else build_work_item(key)
+
+
+def test_prefetcher_from_configuration():
+    # WHEN
+    prefetcher = WorkItemPrefetcher.from_configuration(
+        FakeFetcher(), WorkItemPrefetchConfiguration(max_size=5, max_concurrency=2)
+    )
+    # THEN
+    assert prefetcher is not None
+    assert prefetcher.max_size == 5
+    assert (
+        WorkItemPrefetcher.from_configuration(
+            FakeFetcher(), WorkItemPrefetchConfiguration(enabled=False)
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_after_the_debounce():
+    # GIVEN
+    fetcher = FakeFetcher()
+    prefetcher = WorkItemPrefetcher(fetcher, debounce=0.01)
+    # WHEN
+    prefetcher.prefetch(['A-1', 'A-2'])
+    # THEN
+    assert fetcher.calls == []
+    # WHEN
+    await asyncio.sleep(0.05)
+    # THEN
+    assert fetcher.calls == ['A-1', 'A-2']
+    assert await prefetcher.take('A-1') == build_work_item('A-1')
+    # the work item is discarded once it is used
+    assert await prefetcher.take('A-1') is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_cancels_the_previous_requests():
+    # GIVEN
+    fetcher = FakeFetcher()
+    prefetcher = WorkItemPrefetcher(fetcher, debounce=0.01)
+    # WHEN
+    prefetcher.prefetch(['A-1'])
+    prefetcher.prefetch(['A-2'])
+    prefetcher.prefetch(['A-3'])
+    await asyncio.sleep(0.05)
+    # THEN
+    assert fetcher.calls == ['A-3']
+    # WHEN
+    fetcher.release.clear()
+    prefetcher.prefetch(['A-4'])
+    await asyncio.sleep(0.05)
+    prefetcher.prefetch(['A-5'])
+    fetcher.release.set()
+    await asyncio.sleep(0.05)
+    # THEN
+    assert await prefetcher.take('A-4') is None
+    assert await prefetcher.take('A-5') == build_work_item('A-5')
+
+
+@pytest.mark.asyncio
+async def test_prefetch_limits_the_requests_in_flight():
+    # GIVEN
+    fetcher = FakeFetcher()
+    fetcher.release.clear()
+    prefetcher = WorkItemPrefetcher(fetcher, debounce=0, max_concurrency=2)
+    # WHEN
+    prefetcher.prefetch(['A-1', 'A-2', 'A-3', 'A-4'])
+    await asyncio.sleep(0.01)
+    # THEN
+    assert fetcher.max_in_flight == 2
+    # WHEN
+    fetcher.release.set()
+    await asyncio.sleep(0.01)
+    # THEN
+    assert fetcher.calls == ['A-1', 'A-2', 'A-3', 'A-4']
+
+
+@pytest.mark.asyncio
+async def test_take_waits_for_the_request_in_flight():
+    # GIVEN
+    fetcher = FakeFetcher()
+    fetcher.release.clear()
+    prefetcher = WorkItemPrefetcher(fetcher, debounce=0)
+    prefetcher.prefetch(['A-1', 'missing'])
+    await asyncio.sleep(0.01)
+    # WHEN
+    taking = asyncio.create_task(prefetcher.take('A-1'))
+    await asyncio.sleep(0.01)
+    # THEN
+    assert not taking.done()
+    # WHEN
+    fetcher.release.set()
+    # THEN
+    assert await taking == build_work_item('A-1')
+    assert await prefetcher.take('missing') is None
+
+
+@pytest.mark.asyncio
+async def test_prefetcher_evicts_the_least_recently_used_work_items():
+    # GIVEN
+    prefetcher = WorkItemPrefetcher(FakeFetcher(), max_size=2)
+    # WHEN
+    prefetcher.store(build_work_item('A-1'))
+    prefetcher.store(build_work_item('A-2'))
+    prefetcher.store(build_work_item('A-3'))
+    # THEN
+    assert await prefetcher.take('A-1') is None
+    assert await prefetcher.take('A-3') == build_work_item('A-3')
+
+
+@pytest.mark.asyncio
+async def test_prefetcher_discards_expired_and_invalidated_work_items():
+    # GIVEN
+    prefetcher = WorkItemPrefetcher(FakeFetcher(), max_age=0)
+    prefetcher.store(build_work_item('A-1'))
+    # THEN
+    assert await prefetcher.take('A-1') is None
+    # GIVEN
+    prefetcher.max_age = 60
+    prefetcher.store(build_work_item('A-2'))
+    # WHEN
+    prefetcher.invalidate('A-2')
+    # THEN
+    assert await prefetcher.take('A-2') is None
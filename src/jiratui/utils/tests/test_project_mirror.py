@@ -0,0 +1,142 @@
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from jiratui.models import (
+    IssueStatus,
+    IssueType,
+    JiraIssue,
+    JiraIssueSearchRow,
+    JiraUser,
+    Project,
+    WorkItemsSearchOrderBy,
+)
+from jiratui.utils.project_mirror import ProjectMirror
+
+
+def build_work_item(key: str, created: datetime, **attributes) -> JiraIssue:
+    return JiraIssue(
+        id=key.split('-')[1],
+        key=key,
+        summary=f'Summary of {key}',
+        status=attributes.pop('status', IssueStatus(id='1', name='To Do')),
+        project=Project(id='10', name='Scrum', key='SCRUM'),
+        issue_type=attributes.pop('issue_type', IssueType(id='3', name='Task')),
+        created=created,
+        updated=created,
+        **attributes,
+    )
+
+
+@pytest.fixture()
+def mirror(tmp_path: Path) -> ProjectMirror:
+    project_mirror = ProjectMirror(tmp_path / 'mirror.sqlite3')
+    project_mirror.store(
+        'SCRUM',
+        [
+            build_work_item('SCRUM-1', datetime(2025, 1, 1, 10, tzinfo=timezone.utc)),
+            build_work_item(
+                'SCRUM-2',
+                datetime(2025, 1, 2, 10, tzinfo=timezone.utc),
+                status=IssueStatus(id='2', name='Done'),
+                assignee=JiraUser(account_id='bart', active=True, display_name='Bart'),
+            ),
+            build_work_item(
+                'SCRUM-10',
+                datetime(2025, 1, 3, 10, tzinfo=timezone.utc),
+                issue_type=IssueType(id='4', name='Subtask'),
+                parent_issue_key='SCRUM-1',
+            ),
+        ],
+        synced_at=100,
+    )
+    project_mirror.finish_sync('SCRUM', synced_at=100, full=True, last_updated='2025-01-03 09:59')
+    return project_mirror
+
+
+@pytest.mark.parametrize(
+    'criteria, expected_keys',
+    [
+        ({}, ['SCRUM-10', 'SCRUM-2', 'SCRUM-1']),
+        ({'order_by': WorkItemsSearchOrderBy.KEY_ASC}, ['SCRUM-1', 'SCRUM-2', 'SCRUM-10']),
+        ({'order_by': WorkItemsSearchOrderBy.CREATED_ASC}, ['SCRUM-1', 'SCRUM-2', 'SCRUM-10']),
+        ({'status': 2}, ['SCRUM-2']),
+        ({'assignee': 'bart'}, ['SCRUM-2']),
+        ({'issue_type': 4}, ['SCRUM-10']),
+        ({'created_from': date(2025, 1, 2), 'created_until': date(2025, 1, 2)}, ['SCRUM-2']),
+    ],
+)
+def test_search(mirror: ProjectMirror, criteria: dict, expected_keys: list[str]):
+    # WHEN
+    work_items, total = mirror.search('SCRUM', **criteria)
+    # THEN
+    assert [work_item.key for work_item in work_items] == expected_keys
+    assert total == len(expected_keys)
+
+
+def test_search_page_of_compact_rows(mirror: ProjectMirror):
+    # WHEN
+    work_items, total = mirror.search(
+        'SCRUM', order_by=WorkItemsSearchOrderBy.KEY_ASC, offset=1, limit=1, compact=True
+    )
+    # THEN
+    assert total == 3
+    assert work_items == [
+        JiraIssueSearchRow(
+            id='2',
+            key='SCRUM-2',
+            summary='Summary of SCRUM-2',
+            status_id='2',
+            status_name='Done',
+            work_item_type_name='Task',
+            assignee_display_name='Bart',
+        )
+    ]
+
+
+def test_get_children(mirror: ProjectMirror):
+    # WHEN
+    children = mirror.get_children('SCRUM-1')
+    # THEN
+    assert [child.key for child in children] == ['SCRUM-10']
+    assert children[0].issue_type.name == 'Subtask'
+    assert children[0].created == datetime(2025, 1, 3, 10, tzinfo=timezone.utc)
+
+
+def test_sync_state(mirror: ProjectMirror):
+    # GIVEN
+    mirror.finish_sync('SCRUM', synced_at=200, full=False, last_updated=None)
+    # WHEN
+    state = mirror.get_state('SCRUM')
+    # THEN
+    assert state is not None
+    assert state.synced_at == 200
+    assert state.full_synced_at == 100
+    assert state.last_updated == '2025-01-03 09:59'
+    assert mirror.is_synced('SCRUM') is True
+    assert mirror.is_synced('OTHER') is False
+    assert mirror.get_state('OTHER') is None
+
+
+def test_full_sync_removes_the_work_items_not_retrieved(mirror: ProjectMirror):
+    # GIVEN
+    mirror.store(
+        'SCRUM',
+        [build_work_item('SCRUM-1', datetime(2025, 1, 1, 10, tzinfo=timezone.utc))],
+        synced_at=300,
+    )
+    # WHEN
+    mirror.finish_sync('SCRUM', synced_at=300, full=True, last_updated=None)
+    # THEN
+    work_items, _ = mirror.search('SCRUM')
+    assert [work_item.key for work_item in work_items] == ['SCRUM-1']
+
+
+def test_delete(mirror: ProjectMirror):
+    # WHEN
+    mirror.delete('SCRUM-2')
+    # THEN
+    work_items, total = mirror.search('SCRUM')
+    assert total == 2
+    assert 'SCRUM-2' not in [work_item.key for work_item in work_items]
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from jiratui.models import IssueStatus, JiraIssue, JiraIssueSearchRow, JiraUser
+from jiratui.utils.search_index import WorkItemSearchIndex
+
+
+@pytest.fixture()
+def work_items() -> list[JiraIssueSearchRow]:
+    return [
+        JiraIssueSearchRow(
+            id='1',
+            key='SCRUM-1',
+            summary='Set up payment logging',
+            status_name='In Progress',
+            assignee_display_name='Bart Simpson',
+            labels=['backend'],
+        ),
+        JiraIssueSearchRow(
+            id='2',
+            key='SCRUM-12',
+            summary='Update the logo',
+            status_name='To Do',
+            parent_issue_key='SCRUM-1',
+        ),
+        JiraIssueSearchRow(
+            id='3',
+            key='SCRUM-123',
+            summary='Catalog of products',
+            status_name='Done',
+            assignee_display_name='Lisa Simpson',
+            labels=['frontend', 'ui'],
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    'query, expected_keys',
+    [
+        ('', ['SCRUM-1', 'SCRUM-12', 'SCRUM-123']),
+        ('LOG', ['SCRUM-1', 'SCRUM-12', 'SCRUM-123']),
+        ('scrum-12', ['SCRUM-12', 'SCRUM-123']),
+        ('lisa', ['SCRUM-123']),
+        ('simpson backend', ['SCRUM-1']),
+        ('in progress', ['SCRUM-1']),
+        ('ui', ['SCRUM-123']),
+        ('missing', []),
+    ],
+)
+def test_search(work_items: list[JiraIssueSearchRow], query: str, expected_keys: list[str]):
+    # GIVEN
+    index = WorkItemSearchIndex(work_items)
+    # WHEN
+    result = index.search(query)
+    # THEN
+    assert [work_item.key for work_item in result] == expected_keys
+
+
+def test_search_full_work_items():
+    # GIVEN
+    work_item = JiraIssue(
+        id='1',
+        key='SCRUM-1',
+        summary='Set up payment logging',
+        status=IssueStatus(id='1', name='To Do'),
+        assignee=JiraUser(account_id='1', active=True, display_name='Bart Simpson'),
+        labels=['backend'],
+    )
+    index = WorkItemSearchIndex([work_item])
+    # THEN
+    assert index.search('bart to do backend') == [work_item]
+
+
+def test_narrowing_a_query_only_checks_the_previous_matches(
+    work_items: list[JiraIssueSearchRow],
+):
+    # GIVEN
+    index = WorkItemSearchIndex(work_items)
+    index.search('simpson')
+    # WHEN
+    with patch.object(WorkItemSearchIndex, '_get_candidates', autospec=True) as get_candidates:
+        get_candidates.side_effect = lambda _, term, candidates: candidates
+        result = index.search('simpson l')
+    # THEN
+    assert [work_item.key for work_item in result] == ['SCRUM-1', 'SCRUM-123']
+    assert all(call.args[2] is not None for call in get_candidates.call_args_list)
+    assert get_candidates.call_args_list[0].args[2] == [0, 2]
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+
+from jiratui.models import IssueComment, IssueStatus, JiraIssue, JiraIssueSearchRow, JiraUser
+from jiratui.utils.work_item_index import WORK_ITEM_INDEX_FORMAT_VERSION, WorkItemIndex
+
+
+@pytest.fixture()
+def index(tmp_path: Path) -> WorkItemIndex:
+    work_item_index = WorkItemIndex(tmp_path / 'index.sqlite3')
+    work_item_index.add(
+        [
+            JiraIssue(
+                id='1',
+                key='SCRUM-1',
+                summary='Set up payment logging',
+                status=IssueStatus(id='3', name='In Progress'),
+                description='Log every refund request',
+            ),
+            JiraIssueSearchRow(id='2', key='SCRUM-2', summary='Update the logo'),
+        ]
+    )
+    return work_item_index
+
+
+@pytest.mark.parametrize(
+    'text, expected_keys',
+    [
+        ('payment', ['SCRUM-1']),
+        ('refund', ['SCRUM-1']),
+        ('log', ['SCRUM-1', 'SCRUM-2']),
+        ('logo update', ['SCRUM-2']),
+        ('scrum 2', ['SCRUM-2']),
+        ('"payment" (log*', ['SCRUM-1']),
+        ('missing', []),
+        ('', []),
+    ],
+)
+def test_search(index: WorkItemIndex, text: str, expected_keys: list[str]):
+    # WHEN
+    result = index.search(text)
+    # THEN
+    assert sorted(work_item.key for work_item in result) == expected_keys
+
+
+def test_search_builds_rows(index: WorkItemIndex):
+    # WHEN
+    result = index.search('payment')
+    # THEN
+    assert result == [
+        JiraIssueSearchRow(
+            id='1',
+            key='SCRUM-1',
+            summary='Set up payment logging',
+            status_id='3',
+            status_name='In Progress',
+        )
+    ]
+
+
+def test_search_results_keep_the_description(index: WorkItemIndex):
+    # GIVEN
+    index.add([JiraIssueSearchRow(id='1', key='SCRUM-1', summary='Set up payment auditing')])
+    # THEN
+    assert [work_item.summary for work_item in index.search('refund')] == [
+        'Set up payment auditing'
+    ]
+    assert index.search('logging') == []
+
+
+def test_set_comments(index: WorkItemIndex):
+    # GIVEN
+    comment = IssueComment(
+        id='1',
+        author=JiraUser(account_id='1', active=True, display_name='Bart'),
+        body='the colours are wrong',
+    )
+    # WHEN
+    index.set_comments('2', [comment])
+    # THEN
+    assert [work_item.key for work_item in index.search('colours')] == ['SCRUM-2']
+
+
+def test_delete(index: WorkItemIndex):
+    # WHEN
+    index.delete('SCRUM-1')
+    # THEN
+    assert index.search('payment') == []
+    assert [work_item.key for work_item in index.search('logo')] == ['SCRUM-2']
+
+
+def test_index_with_a_different_version_is_rebuilt(index: WorkItemIndex):
+    # GIVEN
+    connection = index._connect()
+    connection.execute(f'PRAGMA user_version = {WORK_ITEM_INDEX_FORMAT_VERSION + 1}')
+    connection.close()
+    # WHEN
+    result = WorkItemIndex(index.database).search('payment')
+    # THEN
+    assert result == []
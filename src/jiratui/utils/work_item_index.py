@@ -0,0 +1,321 @@
+from contextlib import closing
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import time
+
+from jiratui.constants import FULL_TEXT_INDEX_DEFAULT_MAX_RESULTS, LOGGER_NAME
+from jiratui.files import get_data_directory
+from jiratui.models import IssueComment, JiraIssue, JiraIssueSearchRow
+from jiratui.utils.adf import convert_adf_to_markdown
+
+WORK_ITEM_INDEX_FORMAT_VERSION = 1
+"""The version of the schema of the index. Indexes with a different version are rebuilt."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    work_item_id TEXT NOT NULL,
+    status_id TEXT,
+    status_name TEXT NOT NULL DEFAULT '',
+    work_item_type_name TEXT NOT NULL DEFAULT '',
+    parent_key TEXT,
+    assignee TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    description TEXT,
+    comments TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS work_items_text USING fts5(
+    key, summary, description, comments, content='work_items', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS work_items_inserted AFTER INSERT ON work_items BEGIN
+    INSERT INTO work_items_text(rowid, key, summary, description, comments)
+    VALUES (new.id, new.key, new.summary, new.description, new.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS work_items_deleted AFTER DELETE ON work_items BEGIN
+    INSERT INTO work_items_text(work_items_text, rowid, key, summary, description, comments)
+    VALUES ('delete', old.id, old.key, old.summary, old.description, old.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS work_items_updated AFTER UPDATE ON work_items BEGIN
+    INSERT INTO work_items_text(work_items_text, rowid, key, summary, description, comments)
+    VALUES ('delete', old.id, old.key, old.summary, old.description, old.comments);
+    INSERT INTO work_items_text(rowid, key, summary, description, comments)
+    VALUES (new.id, new.key, new.summary, new.description, new.comments);
+END;
+"""
+
+# the description and the comments are only replaced when they are known; the work items found by searches only have
+# a summary
+_UPSERT = """
+INSERT INTO work_items (
+    key, work_item_id, status_id, status_name, work_item_type_name, parent_key, assignee, summary, description,
+    comments, indexed_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    work_item_id = excluded.work_item_id,
+    status_id = excluded.status_id,
+    status_name = excluded.status_name,
+    work_item_type_name = excluded.work_item_type_name,
+    parent_key = excluded.parent_key,
+    assignee = CASE WHEN excluded.assignee != '' THEN excluded.assignee ELSE work_items.assignee END,
+    summary = excluded.summary,
+    description = COALESCE(excluded.description, work_items.description),
+    comments = COALESCE(excluded.comments, work_items.comments),
+    indexed_at = excluded.indexed_at
+"""
+
+
+class WorkItemIndex:
+    """Implements a local full-text index of the work items retrieved from the Jira server.
+
+    The index is a SQLite database with an FTS5 table over the key, summary, description and comments of the work
+    items. Descriptions and comments in ADF are converted to Markdown before they are indexed. The database is stored
+    in a file that is specific to the Jira server and the user. Every operation opens its own connection, so the
+    methods can be called from worker threads, e.g. via `asyncio.to_thread`. Errors are logged and ignored; the index
+    never prevents the application from using the server.
+    """
+
+    def __init__(self, database: Path):
+        """Initializes the index.
+
+        Args:
+            database: the path of the SQLite database.
+        """
+        self.database = database
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self._initialized = False
+
+    @classmethod
+    def for_account(cls, server_url: str, username: str) -> 'WorkItemIndex':
+        """Builds the index of the work items of a Jira server for a user.
+
+        Args:
+            server_url: the base URL of the Jira server.
+            username: the username used to connect to the server.
+
+        Returns:
+            An instance of `WorkItemIndex`.
+        """
+
+        account = f'{server_url.rstrip("/")}\n{username}'.encode()
+        name = hashlib.sha256(account).hexdigest()[:32]
+        return cls(get_data_directory() / 'index' / f'{name}.sqlite3')
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.database.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=5)
+        if not self._initialized:
+            with connection:
+                version: int = connection.execute('PRAGMA user_version').fetchone()[0]
+                if version != WORK_ITEM_INDEX_FORMAT_VERSION:
+                    connection.executescript(
+                        'DROP TABLE IF EXISTS work_items_text; DROP TABLE IF EXISTS work_items;'
+                    )
+                connection.executescript(_SCHEMA)
+                connection.execute(f'PRAGMA user_version = {WORK_ITEM_INDEX_FORMAT_VERSION}')
+            self._initialized = True
+        return connection
+
+    @staticmethod
+    def _to_text(content: dict | str | None) -> str | None:
+        if content is None:
+            return None
+        if isinstance(content, dict):
+            return convert_adf_to_markdown(content)
+        return str(content)
+
+    @classmethod
+    def _get_comments_text(cls, comments: list[IssueComment]) -> str:
+        return '\n\n'.join(
+            text for comment in comments if (text := cls._to_text(comment.body)) is not None
+        )
+
+    def add(self, work_items: list[JiraIssue] | list[JiraIssueSearchRow]) -> None:
+        """Adds work items to the index or, updates them if they are indexed already.
+
+        The description and the comments of an indexed work item are kept if they are not available in the new version
+        of the work item, e.g. work items found by a search only have a summary.
+
+        Args:
+            work_items: the work items to index.
+
+        Returns:
+            Nothing.
+        """
+
+        indexed_at = time.time()
+        rows: list[tuple] = []
+        for work_item in work_items:
+            try:
+                if isinstance(work_item, JiraIssue):
+                    rows.append(
+                        (
+                            work_item.key,
+                            work_item.id,
+                            work_item.status.id if work_item.status else None,
+                            work_item.status_name,
+                            work_item.work_item_type_name,
+                            work_item.parent_issue_key,
+                            work_item.assignee_display_name,
+                            work_item.summary,
+                            self._to_text(work_item.description),
+                            self._get_comments_text(work_item.comments)
+                            if work_item.comments
+                            else None,
+                            indexed_at,
+                        )
+                    )
+                else:
+                    rows.append(
+                        (
+                            work_item.key,
+                            work_item.id,
+                            work_item.status_id,
+                            work_item.status_name,
+                            work_item.work_item_type_name,
+                            work_item.parent_issue_key,
+                            work_item.assignee_display_name,
+                            work_item.summary,
+                            None,
+                            None,
+                            indexed_at,
+                        )
+                    )
+            except Exception as e:
+                self.logger.warning(
+                    'Unable to index a work item', extra={'key': work_item.key, 'error': str(e)}
+                )
+        if not rows:
+            return
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(_UPSERT, rows)
+        except sqlite3.Error as e:
+            self.logger.warning('Unable to update the index of work items', extra={'error': str(e)})
+
+    def set_comments(self, key: str, comments: list[IssueComment]) -> None:
+        """Replaces the comments of an indexed work item.
+
+        Args:
+            key: the key or the id of the work item.
+            comments: all the comments of the work item.
+
+        Returns:
+            Nothing.
+        """
+        try:
+            text = self._get_comments_text(comments)
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    'UPDATE work_items SET comments = ? WHERE key = ? OR work_item_id = ?',
+                    (text, key, key),
+                )
+        except Exception as e:
+            self.logger.warning(
+                'Unable to update the comments in the index', extra={'key': key, 'error': str(e)}
+            )
+
+    def delete(self, key: str) -> None:
+        """Removes a work item from the index.
+
+        Args:
+            key: the key or the id of the work item.
+
+        Returns:
+            Nothing.
+        """
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    'DELETE FROM work_items WHERE key = ? OR work_item_id = ?', (key, key)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(
+                'Unable to remove a work item from the index', extra={'key': key, 'error': str(e)}
+            )
+
+    def clear(self) -> None:
+        """Removes all the work items from the index."""
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute('DELETE FROM work_items')
+        except sqlite3.Error as e:
+            self.logger.warning('Unable to clear the index of work items', extra={'error': str(e)})
+
+    @staticmethod
+    def build_query(text: str) -> str | None:
+        """Builds an FTS5 query that matches the work items that contain every word of a text.
+
+        Every word is quoted, so the syntax of FTS5 is never interpreted, and matches words that start with it.
+
+        Args:
+            text: the text typed by the user.
+
+        Returns:
+            The FTS5 query or `None` if the text has no words.
+        """
+        words: list[str] = re.findall(r'\w+', text)
+        if not words:
+            return None
+        return ' AND '.join(f'"{word}"*' for word in words)
+
+    def search(
+        self, text: str, limit: int = FULL_TEXT_INDEX_DEFAULT_MAX_RESULTS
+    ) -> list[JiraIssueSearchRow]:
+        """Finds the indexed work items that contain every word of a text.
+
+        Args:
+            text: the text to find in the key, summary, description or comments of the work items.
+            limit: the maximum number of work items to retrieve.
+
+        Returns:
+            The work items found, best matches first.
+        """
+
+        if (query := self.build_query(text)) is None:
+            return []
+        try:
+            with closing(self._connect()) as connection:
+                records: list[tuple] = connection.execute(
+                    """
+                    SELECT w.work_item_id, w.key, w.summary, w.status_id, w.status_name, w.work_item_type_name,
+                           w.parent_key, w.assignee
+                    FROM work_items_text
+                    JOIN work_items AS w ON w.id = work_items_text.rowid
+                    WHERE work_items_text MATCH ?
+                    ORDER BY bm25(work_items_text, 10.0, 5.0, 1.0, 1.0)
+                    LIMIT ?
+                    """,
+                    (query, max(limit, 1)),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning('Unable to search the index of work items', extra={'error': str(e)})
+            return []
+        return [
+            JiraIssueSearchRow(
+                id=work_item_id,
+                key=key,
+                summary=summary,
+                status_id=status_id,
+                status_name=status_name,
+                work_item_type_name=work_item_type_name,
+                parent_issue_key=parent_key,
+                assignee_display_name=assignee,
+            )
+            for (
+                work_item_id,
+                key,
+                summary,
+                status_id,
+                status_name,
+                work_item_type_name,
+                parent_key,
+                assignee,
+            ) in records
+        ]
@@ -1,18 +1,29 @@
+import asyncio
 from dataclasses import dataclass
 from io import BytesIO
 import json
 import os
+from pathlib import Path
 from typing import cast
 
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Center, Vertical, VerticalScroll
+from textual.containers import Center, HorizontalGroup, Vertical, VerticalScroll
 from textual.message import Message
 from textual.reactive import Reactive, reactive
 from textual.screen import ModalScreen
 from textual.widget import Widget
-from textual.widgets import DataTable, LoadingIndicator, Markdown, Static, TextArea
+from textual.widgets import (
+    Button,
+    DataTable,
+    LoadingIndicator,
+    Markdown,
+    ProgressBar,
+    Static,
+    TextArea,
+)
+from textual.worker import Worker
 from textual_image.widget import Image, SixelImage
 
 from jiratui.actions.constants import SupportedActions
@@ -103,6 +114,8 @@ class AttachmentsDataTable(Actionable, DataTable, inherit_bindings=False):  # ty
         self._selected_attachment_id: str | None = None
         self._selected_attachment_file_name: str | None = None
         self._work_item_key: str | None = work_item_key
+        self.attachment_sizes: dict[str, int] = {}
+        """The size (in bytes) of the attachments listed in the table, by the ID of the attachment."""
 
     @on(DataTable.RowHighlighted)
     def highlighted(self, event: DataTable.RowHighlighted) -> None:
@@ -150,6 +163,9 @@ class AttachmentsDataTable(Actionable, DataTable, inherit_bindings=False):  # ty
                                 self._selected_attachment_id,
                                 selected_attachment_file_type,
                                 self._selected_attachment_file_name,
+                                attachment_size=self.attachment_sizes.get(
+                                    self._selected_attachment_id
+                                ),
                             )
                         )
 
@@ -191,6 +207,36 @@ class AttachmentsDataTable(Actionable, DataTable, inherit_bindings=False):  # ty
             self.notify('Deleting attachment...', title=self.NOTIFICATIONS_DEFAULT_TITLE)
 
 
+class AttachmentUploadProgress(HorizontalGroup):
+    """Displays the progress of a file being uploaded and allows the user to cancel the upload."""
+
+    def __init__(self, work_item_key: str, file_name: str):
+        super().__init__(classes='attachment-upload-progress')
+        self.work_item_key = work_item_key
+        self.file_name = file_name
+        self.worker: Worker | None = None
+        """The worker that uploads the file."""
+
+    @property
+    def progress_bar(self) -> ProgressBar:
+        return self.query_one(ProgressBar)
+
+    def compose(self) -> ComposeResult:
+        yield Static(f'{self.work_item_key}: {os.path.basename(self.file_name)}')
+        yield ProgressBar(show_percentage=True, show_eta=True)
+        yield Button('Cancel', variant='error', compact=True)
+
+    def update_progress(self, bytes_sent: int, total_bytes: int) -> None:
+        if self.is_mounted:
+            self.progress_bar.update(total=total_bytes, progress=bytes_sent)
+
+    @on(Button.Pressed)
+    def cancel_upload(self, event: Button.Pressed) -> None:
+        event.stop()
+        if self.worker is not None:
+            self.worker.cancel()
+
+
 class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_focus=True):  # type:ignore[call-arg]
     """A container for displaying the files attached to a work item.
 
@@ -201,6 +247,8 @@ class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_f
     - deleting attachments from the work item via the API when the message
     `jiratui.widgets.attachments.attachments.AttachmentsDataTable.Deleted` is posted.
     - updating the list of attachments when an attachment is deleted.
+    - displaying the progress of the files being uploaded. Files are uploaded in the background, concurrently, and the
+    user can cancel the uploads.
 
     The config variable `config.fetch_attachments_on_delete` controls whether the widget retrieves the attachments from
     the work item after an attachment is deleted.
@@ -344,6 +392,9 @@ class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_f
     def upload_attachment(self, content: str) -> None:
         """Uploads a file as an attachment to the work item.
 
+        The file is uploaded by a worker, so several files can be uploaded concurrently while the user keeps using the
+        application.
+
         Args:
             content: the name of the file to attach.
 
@@ -351,24 +402,47 @@ class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_f
             None
         """
 
-        if content and (file_name := content.strip()):
-            self.notify('Uploading attachment...', title=self.NOTIFICATIONS_DEFAULT_TITLE)
-            screen = cast('MainScreen', self.screen)  # type:ignore[name-defined] # noqa: F821
-            response: APIControllerResponse = screen.api.add_attachment(self.issue_key, file_name)
+        if self.issue_key and content and (file_name := content.strip()):
             self._update_recently_used_path(file_name)
-            if response.success:
-                # update the list of attachments being displayed in the table
-                # avoid fetching the list from the API to avoid making a request; simple append the new attachment
-                current_attachments = self.attachments.attachments if self.attachments else []
-                new_attachments = [response.result] if response.result else []
-                self.attachments = WorkItemAttachments(
-                    work_item_key=self.issue_key,
-                    attachments=current_attachments + new_attachments,
-                )
-            else:
-                self.notify(
-                    f'{response.error}', title=self.NOTIFICATIONS_DEFAULT_TITLE, severity='error'
-                )
+            upload_progress = AttachmentUploadProgress(self.issue_key, file_name)
+            self.mount(upload_progress)
+            upload_progress.worker = self.run_worker(
+                self._upload_attachment(self.issue_key, file_name, upload_progress),
+                group='attachment-uploads',
+            )
+
+    async def _upload_attachment(
+        self, work_item_key: str, file_name: str, upload_progress: AttachmentUploadProgress
+    ) -> None:
+        """Uploads a file and adds it to the list of attachments once the upload finishes."""
+
+        screen = cast('MainScreen', self.screen)  # type:ignore[name-defined] # noqa: F821
+        try:
+            response: APIControllerResponse = await screen.api.upload_attachment(
+                work_item_key, file_name, on_progress=upload_progress.update_progress
+            )
+        except asyncio.CancelledError:
+            self.notify(
+                f'The upload of the file {os.path.basename(file_name)} was cancelled',
+                title=self.NOTIFICATIONS_DEFAULT_TITLE,
+                severity='warning',
+            )
+            raise
+        finally:
+            upload_progress.remove()
+        if not response.success:
+            self.notify(
+                f'{response.error}', title=self.NOTIFICATIONS_DEFAULT_TITLE, severity='error'
+            )
+        elif self.issue_key == work_item_key:
+            # update the list of attachments being displayed in the table
+            # avoid fetching the list from the API to avoid making a request; simple append the new attachment
+            current_attachments = self.attachments.attachments if self.attachments else []
+            new_attachments = [response.result] if response.result else []
+            self.attachments = WorkItemAttachments(
+                work_item_key=work_item_key,
+                attachments=current_attachments + new_attachments,
+            )
 
     def _update_recently_used_path(self, filename: str) -> None:
         application = cast('JiraApp', self.app)  # type:ignore[name-defined] # noqa: F821
@@ -377,8 +451,8 @@ class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_f
     def watch_attachments(self, data: WorkItemAttachments | None) -> None:
         """Updates the table that displays the attached files with new attachments."""
 
-        # reset the widget's data
-        self.remove_children()
+        # reset the widget's data; the progress of the uploads is kept
+        self.remove_children(AttachmentsDataTable)
         self.issue_key = data.work_item_key if data else None
 
         if self.issue_key and data and data.attachments:
@@ -396,7 +470,8 @@ class IssueAttachmentsWidget(Actionable, Vertical, inherit_bindings=False, can_f
                     ],
                     key=item.id,
                 )
-            self.mount(table)
+                table.attachment_sizes[item.id] = item.size
+            self.mount(table, before=0 if self.children else None)
 
 
 class ViewAttachmentScreen(ModalScreen):
@@ -411,11 +486,18 @@ class ViewAttachmentScreen(ModalScreen):
     TITLE = 'Image'
     HELP = None
 
-    def __init__(self, attachment_id: str, attachment_file_type: str, attachment_file_name: str):
+    def __init__(
+        self,
+        attachment_id: str,
+        attachment_file_type: str,
+        attachment_file_name: str,
+        attachment_size: int | None = None,
+    ):
         super().__init__()
         self._attachment_id = attachment_id
         self._attachment_file_type = attachment_file_type
         self._attachment_file_name = attachment_file_name
+        self._attachment_size = attachment_size
         self._rendered_sixel_image = False
 
     @property
@@ -433,8 +515,10 @@ class ViewAttachmentScreen(ModalScreen):
 
     async def _download_attachment(self, attachment_id: str) -> None:
         app = cast('JiraApp', self.screen.app)  # type:ignore[name-defined] # noqa: F821
-        response: APIControllerResponse = await app.api.get_attachment_content(attachment_id)
-        app.logger.warning(response)
+        # the file is downloaded to the attachment cache; viewing it again does not download it again
+        response: APIControllerResponse = await app.api.download_attachment(
+            attachment_id, self._attachment_size
+        )
         container = self.center_widget
         await container.remove_children(LoadingIndicator)
         if response.success and response.result:
@@ -481,12 +565,14 @@ class FileAttachmentWidget:
     """A factory to build Widgets to view different types of files attached to a work item."""
 
     @staticmethod
-    def build_widget(file_type: str, content: bytes) -> Widget | None:
+    def build_widget(file_type: str, content: bytes | Path) -> Widget | None:
         """Builds a `textual.widget.Widget` for visualizing a specific type of file/content.
 
+        Images are loaded from the file when a path is given, so the file is not read into memory beforehand.
+
         Args:
             file_type: the file's MIME type.
-            content: the bytes representation of the file's content to display.
+            content: the bytes representation of the file's content to display or, the path of the file.
 
         Returns:
             A `textual.widget.Widget` to display the contents or `None` if the file's content is not supported.
@@ -495,6 +581,17 @@ class FileAttachmentWidget:
             mime = SupportedAttachmentVisualizationMimeTypes(file_type)
         except ValueError:
             return None
+        if is_image(file_type):
+            if not _image_support_is_enabled():
+                return None
+            from PIL import UnidentifiedImageError
+
+            try:
+                return Image(content if isinstance(content, Path) else BytesIO(content))
+            except UnidentifiedImageError:
+                return None
+        if isinstance(content, Path):
+            content = content.read_bytes()
         if mime == SupportedAttachmentVisualizationMimeTypes.APPLICATION_JSON:
             return TextArea.code_editor(
                 json.dumps(json.loads(content), indent=3),
@@ -515,14 +612,6 @@ class FileAttachmentWidget:
             )
         if mime == SupportedAttachmentVisualizationMimeTypes.TEXT_MARKDOWN:
             return Markdown(str(content.decode()))
-
-        if is_image(file_type) and _image_support_is_enabled():
-            from PIL import UnidentifiedImageError
-
-            try:
-                return Image(BytesIO(content))
-            except UnidentifiedImageError:
-                return None
         return None
 
 
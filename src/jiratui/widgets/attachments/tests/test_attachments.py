@@ -1,12 +1,16 @@
-from unittest.mock import AsyncMock, Mock, call, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, Mock, call, patch
 
 import pytest
+from textual.widgets import Button
+from textual.worker import WorkerCancelled
 
 from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.models import Attachment, JiraIssueSearchResponse, JiraUser
 from jiratui.widgets.attachments.add import AddAttachmentScreen
 from jiratui.widgets.attachments.attachments import (
     AttachmentsDataTable,
+    AttachmentUploadProgress,
     IssueAttachmentsWidget,
     WorkItemAttachments,
 )
@@ -252,15 +256,15 @@ async def test_open_screen_to_add_attachment_without_issue_key(
         assert isinstance(app.screen, MainScreen)
 
 
-@patch.object(APIController, 'add_attachment')
+@patch.object(APIController, 'upload_attachment')
 @patch.object(AddAttachmentScreen, '_get_initial_directory_for_upload')
 @pytest.mark.asyncio
 async def test_upload_attachment(
-    get_initial_directory_for_upload_mock: Mock, add_attachment_mock: Mock, app
+    get_initial_directory_for_upload_mock: Mock, upload_attachment_mock: AsyncMock, app
 ):
     # GIVEN
     get_initial_directory_for_upload_mock.return_value = ''
-    add_attachment_mock.return_value = APIControllerResponse(
+    upload_attachment_mock.return_value = APIControllerResponse(
         result=Attachment(
             id='3',
             filename='file3.txt',
@@ -269,7 +273,7 @@ async def test_upload_attachment(
             author=JiraUser(account_id='1', active=True, display_name='Bart'),
         )
     )
-    async with app.run_test():
+    async with app.run_test() as pilot:
         widget = IssueAttachmentsWidget()
         await app.screen.mount(widget)
         widget.attachments = WorkItemAttachments(
@@ -293,9 +297,43 @@ async def test_upload_attachment(
         )
         # WHEN
         widget.upload_attachment('file3.txt')
+        await app.workers.wait_for_complete()
+        await pilot.pause()
         # THEN
-        add_attachment_mock.assert_called_once_with('WI-1', 'file3.txt')
+        upload_attachment_mock.assert_awaited_once_with('WI-1', 'file3.txt', on_progress=ANY)
         assert isinstance(widget.children[0], AttachmentsDataTable)
+        assert [attachment.id for attachment in widget.attachments.attachments] == ['1', '2', '3']
+        assert not widget.query(AttachmentUploadProgress)
+
+
+@patch.object(APIController, 'upload_attachment')
+@pytest.mark.asyncio
+async def test_cancel_upload_attachment(upload_attachment_mock: AsyncMock, app):
+    # GIVEN
+    upload_started = asyncio.Event()
+
+    async def upload_attachment(*args, **kwargs) -> APIControllerResponse:
+        upload_started.set()
+        await asyncio.sleep(10)
+        return APIControllerResponse()
+
+    upload_attachment_mock.side_effect = upload_attachment
+    async with app.run_test() as pilot:
+        widget = IssueAttachmentsWidget()
+        await app.screen.mount(widget)
+        widget.attachments = WorkItemAttachments(work_item_key='WI-1', attachments=None)
+        widget.upload_attachment('file3.txt')
+        await upload_started.wait()
+        await pilot.pause()
+        upload_progress = widget.query_one(AttachmentUploadProgress)
+        # WHEN
+        upload_progress.query_one(Button).press()
+        # THEN
+        with pytest.raises(WorkerCancelled):
+            await upload_progress.worker.wait()
+        await pilot.pause()
+        assert upload_progress.worker.is_cancelled
+        assert not widget.query(AttachmentUploadProgress)
 
 
 @patch.object(IssueAttachmentsWidget, '_fetch_attachments_on_delete')
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from datetime import date
 import logging
@@ -13,9 +14,14 @@ from textual.worker import Worker
 
 from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
+from jiratui.api_controller.constants import PROJECT_MIRROR_PAGE_TOKEN
 from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.config import CONFIGURATION
-from jiratui.constants import FULL_TEXT_SEARCH_DEFAULT_MINIMUM_TERM_LENGTH, LOGGER_NAME
+from jiratui.constants import (
+    FULL_TEXT_SEARCH_DEFAULT_MINIMUM_TERM_LENGTH,
+    LOGGER_NAME,
+    WORK_ITEM_DETAILS_FIELDS,
+)
 from jiratui.models import (
     IssueType,
     JiraBaseIssue,
@@ -26,6 +32,7 @@ from jiratui.models import (
 )
 from jiratui.utils.history import HistoryEntry, HistoryManager
 from jiratui.utils.logging import JiraTUILogger
+from jiratui.utils.prefetch import WorkItemPrefetcher
 from jiratui.utils.ui_actions import Actionable, UIAction
 from jiratui.utils.urls import build_external_url_for_issue
 from jiratui.widgets.attachments.attachments import IssueAttachmentsWidget, WorkItemAttachments
@@ -72,6 +79,9 @@ class WorkItemSearchResult:
     start: int = 0
     end: int = 0
     response: JiraIssueSearchResponse | None = None
+    pending_total: asyncio.Task[int] | None = None
+    """A task that estimates the total number of results. If set, `total` is not known when the results are
+    returned."""
 
 
 class MainScreen(Actionable, Screen):
@@ -166,6 +176,7 @@ class MainScreen(Actionable, Screen):
         self.api = APIController() if not api else api
         """The API instance used by the screen to interact with the Jira REST API via a an API controller."""
         self.available_issues_status: list[tuple[str, str]] = []
+        self.available_issue_types: list[tuple[str, str]] = []
         self.initial_project_key: str | None = project_key
         """A project key to set as the initial value of the projects dropdown widget."""
         self.initial_work_item_key = work_item_key
@@ -180,7 +191,15 @@ class MainScreen(Actionable, Screen):
         """The position of the work item to focus and open on startup. Requires search_on_startup to be enabled."""
         self.current_loaded_work_item_key: str | None = None
         """Track the currently loaded work item key to prevent redundant reloads."""
+        self._pending_search_total: asyncio.Task[int] | None = None
+        """The task that estimates the total number of results of the latest search, if it is still running."""
         self.config = CONFIGURATION.get()
+        self.work_item_prefetcher: WorkItemPrefetcher | None = (
+            WorkItemPrefetcher.from_configuration(
+                self._prefetch_work_item, self.config.work_item_prefetch
+            )
+        )
+        """Prefetches the details of the work items highlighted in the search results."""
         self.current_key_bindings: dict[str, dict] = get_application_key_bindings()
         self.work_item_tabs_titles: dict = {}
         if self.config.show_keybinding_hints:
@@ -434,6 +453,10 @@ class MainScreen(Actionable, Screen):
                         yield SubtasksWidget()
         yield Footer(show_command_palette=False, compact=True)
 
+    def on_unmount(self) -> None:
+        if self.work_item_prefetcher is not None:
+            self.work_item_prefetcher.cancel()
+
     async def on_mount(self) -> None:
         """Mounts the widgets on the screen.
 
@@ -517,15 +540,35 @@ class MainScreen(Actionable, Screen):
             None
         """
 
+        # render the metadata from the persistent cache (if enabled) and refresh it in the background
+        cached = self.api.metadata_cache is not None
         # fetch the list of projects
-        workers: list[Worker] = [self.run_worker(self.fetch_projects())]
+        workers: list[Worker] = [self.run_worker(self.fetch_projects(cached=cached))]
+        filter_workers: list[Worker] = []
         # if there is an initial value for the project key the worker that fetches the projects will trigger fetching
         # status codes and work item types after the project dropdown is updated with the selection.
         # the same happens when the user configures the app to fetch only projects on start up
         if not self.config.on_start_up_only_fetch_projects and not self.initial_project_key:
             # in this case we need to fetch users, status codes and work item types
-            self.run_worker(self.fetch_issue_types())
-            self.run_worker(self.fetch_statuses())
+            filter_workers = [
+                self.run_worker(self.fetch_issue_types(cached=cached)),
+                self.run_worker(self.fetch_statuses(cached=cached)),
+            ]
+        if cached:
+            self.run_worker(
+                self._revalidate_cached_metadata(
+                    workers + filter_workers,
+                    include_projects=True,
+                    include_filters=bool(filter_workers),
+                ),
+                group='revalidate-startup-metadata',
+            )
+
+        # keep the local mirror of the projects (if any) up to date while the application runs
+        if self.api.project_mirror is not None:
+            self.run_worker(
+                self._sync_project_mirror(), group='sync-project-mirror', exit_on_error=False
+            )
 
         # if the user launched the app with a pre-defined user account id then let's fetch the details of the user
         # and set the user selection widget with the corresponding user; if any exists
@@ -575,7 +618,7 @@ class MainScreen(Actionable, Screen):
             )
         )
 
-    async def fetch_projects(self) -> None:
+    async def fetch_projects(self, cached: bool = False) -> None:
         """Fetches the list of available projects.
 
         If the user pre-selects a project using the configuration setting `default_project_key_or_id` or by passing the
@@ -590,6 +633,12 @@ class MainScreen(Actionable, Screen):
 
         If no project is found then the application will leave the dropdown empty.
 
+        If the list of projects did not change the dropdown is not updated, this keeps the current selection when the
+        projects are refreshed in the background.
+
+        Args:
+            cached: if `True` the projects stored in the persistent metadata cache (if any) are used.
+
         Returns:
             None
         """
@@ -598,27 +647,34 @@ class MainScreen(Actionable, Screen):
         if self.initial_project_key:
             if self.config.fetch_single_project:
                 project_keys = [self.initial_project_key]
-        response: APIControllerResponse = await self.api.search_projects(keys=project_keys)
+        response: APIControllerResponse = await self.api.search_projects(
+            keys=project_keys, cached=cached
+        )
         if not response.success:
             self.notify(f'Failed to fetch the list of projects: {response.error}', severity='error')
         projects = response.result or []
         projects = list(projects)  # sort is async!
         projects.sort(key=lambda x: x.name)
+        if (current := self.project_selector.projects) and current.get('projects') == projects:
+            return
         self.project_selector.projects = {
             'projects': projects,
-            'selection': self.initial_project_key,
+            'selection': self.project_selector.selection or self.initial_project_key,
         }
 
-    async def fetch_statuses(self) -> list[tuple[str, str]]:
+    async def fetch_statuses(self, cached: bool = False) -> list[tuple[str, str]]:
         """Retrieves the valid status codes depending on the selected project and type of work item.
 
+        Args:
+            cached: if `True` the statuses stored in the persistent metadata cache (if any) are used.
+
         Returns:
             A list of tuples with the name and id of every project status code.
         """
 
         if self.project_selector.selection:
-            return await self._fetch_project_statuses(self.project_selector.selection)
-        response: APIControllerResponse = await self.api.status()
+            return await self._fetch_project_statuses(self.project_selector.selection, cached)
+        response: APIControllerResponse = await self.api.status(cached=cached)
         if not response.success:
             self.logger.error(
                 'Failed to fetch the available status codes', extra={'error': response.error}
@@ -632,17 +688,22 @@ class MainScreen(Actionable, Screen):
                 statuses.append((status.name, str(status.id)))
         return sorted(statuses, key=lambda x: x[0])
 
-    async def _fetch_project_statuses(self, project_key: str) -> list[tuple[str, str]]:
+    async def _fetch_project_statuses(
+        self, project_key: str, cached: bool = False
+    ) -> list[tuple[str, str]]:
         """Fetches the status codes applicable to a project and optionally to the type of issue selected by the user.
 
         Args:
             project_key: the key of the project whose status codes we want to retrieve.
+            cached: if `True` the statuses stored in the persistent metadata cache (if any) are used.
 
         Returns:
             A list of tuples with the name and id of every project status code.
         """
 
-        response: APIControllerResponse = await self.api.get_project_statuses(project_key)
+        response: APIControllerResponse = await self.api.get_project_statuses(
+            project_key, cached=cached
+        )
         if not response.success:
             self.logger.error(
                 'Failed to retrieve the status codes associated to the project',
@@ -666,12 +727,15 @@ class MainScreen(Actionable, Screen):
                     statuses.append((status.name, str(status.id)))
         return sorted(statuses, key=lambda x: x[0])
 
-    async def fetch_issue_types(self) -> list[tuple[str, str]]:
+    async def fetch_issue_types(self, cached: bool = False) -> list[tuple[str, str]]:
         """Retrieves the list of type of work items.
 
         If a project is selected then it will retrieve the types of work items associated to the project; otherwise it
         will retrieve all the possible types of work items.
 
+        Args:
+            cached: if `True` the types of work items stored in the persistent metadata cache (if any) are used.
+
         Returns:
             A list of tuples with the id of the type of issue and the name of the type of issue.
         """
@@ -679,7 +743,7 @@ class MainScreen(Actionable, Screen):
         types: list[IssueType]
         if self.project_selector.selection:
             response: APIControllerResponse = await self.api.get_issue_types_for_project(
-                self.project_selector.selection
+                self.project_selector.selection, cached=cached
             )
             if not response.success:
                 return []
@@ -688,7 +752,7 @@ class MainScreen(Actionable, Screen):
             return [(item.name, item.id) for item in types or []]
 
         # retrieve all available types of work items
-        response = await self.api.get_issue_types()
+        response = await self.api.get_issue_types(cached=cached)
         if not response.success:
             return []
         types = response.result or []
@@ -715,7 +779,41 @@ class MainScreen(Actionable, Screen):
             self.available_issues_status = event.worker.result or []
             self.issue_status_selector.statuses = self.available_issues_status
         elif event.worker.name == 'fetch_issue_types':
-            self.issue_type_selector.set_options(event.worker.result or [])
+            self.available_issue_types = event.worker.result or []
+            self.issue_type_selector.set_options(self.available_issue_types)
+
+    async def _revalidate_cached_metadata(
+        self, workers: list[Worker], include_projects: bool = False, include_filters: bool = True
+    ) -> None:
+        """Refreshes the metadata that was rendered from the persistent metadata cache.
+
+        The widgets are only updated if the metadata fetched from the server differs from the cached metadata.
+
+        Args:
+            workers: the workers that render the cached metadata. The metadata is refreshed after they complete.
+            include_projects: whether to refresh the list of projects.
+            include_filters: whether to refresh the types of work items and the status codes.
+
+        Returns:
+            None
+        """
+
+        await self.app.workers.wait_for_complete(workers)
+        if not self.api.metadata_served_from_cache:
+            # the metadata was just fetched from the server
+            return
+        if include_projects:
+            await self.fetch_projects()
+        if include_filters:
+            issue_types, statuses = await asyncio.gather(
+                self.fetch_issue_types(), self.fetch_statuses()
+            )
+            if issue_types and issue_types != self.available_issue_types:
+                self.available_issue_types = issue_types
+                self.issue_type_selector.set_options(issue_types)
+            if statuses and statuses != self.available_issues_status:
+                self.available_issues_status = statuses
+                self.issue_status_selector.statuses = statuses
 
     @on(Select.Changed, '#jira-project-selector')
     async def handle_project_selection(self, event: Select.Changed) -> None:
@@ -731,10 +829,17 @@ class MainScreen(Actionable, Screen):
             Nothing.
         """
 
+        cached = self.api.metadata_cache is not None
         # fetch issue types for the project
-        self.run_worker(self.fetch_issue_types())
+        workers = [self.run_worker(self.fetch_issue_types(cached=cached))]
         # fetch valid status codes
-        self.run_worker(self.fetch_statuses())
+        workers.append(self.run_worker(self.fetch_statuses(cached=cached)))
+        if cached:
+            self.run_worker(
+                self._revalidate_cached_metadata(workers),
+                group='revalidate-metadata',
+                exclusive=True,
+            )
 
     async def _search_work_items(
         self,
@@ -795,37 +900,61 @@ class MainScreen(Actionable, Screen):
         )
 
         # search work items by different criteria
+        criteria: dict = {
+            'project_key': project_key,
+            'created_from': search_field_created_from,
+            'created_until': search_field_created_until,
+            'status': search_field_status,
+            'assignee': search_field_assignee,
+            'issue_type': search_field_issue_type,
+            'search_in_active_sprint': self.active_sprint_checkbox.value,
+            'jql_query': jql_query,
+            'order_by': order_by,
+            'compact': True,
+        }
+        # the local mirror of the project (if any) serves the search without sending requests to the server
+        if self.api.project_mirror_covers(**criteria):
+            return await self._search_project_mirror(criteria, page)
+        if next_page_token == PROJECT_MIRROR_PAGE_TOKEN:
+            # the mirror served the previous page but it no longer covers the search
+            next_page_token = None
+
+        # estimation of search results count is only available in Jira Cloud
+        if not self.config.cloud:
+            calculate_total = False
+
+        # the count is estimated while the search is in progress so that it does not delay the results
+        pending_total: asyncio.Task[int] | None = None
+        if calculate_total:
+            pending_total = asyncio.create_task(
+                self._count_work_items(
+                    project_key=project_key,
+                    created_from=search_field_created_from,
+                    created_until=search_field_created_until,
+                    status=search_field_status,
+                    assignee=search_field_assignee,
+                    issue_type=search_field_issue_type,
+                    jql_query=jql_query,
+                )
+            )
+
         response: APIControllerResponse
         if self.config.cloud:
             response = await self.api.search_issues(
-                project_key=project_key,
-                created_from=search_field_created_from,
-                created_until=search_field_created_until,
-                status=search_field_status,
-                assignee=search_field_assignee,
-                issue_type=search_field_issue_type,
-                search_in_active_sprint=self.active_sprint_checkbox.value,
-                jql_query=jql_query,
                 next_page_token=next_page_token,
                 limit=self.config.search_results_per_page,
-                order_by=order_by,
+                **criteria,
             )
         else:
             response = await self.api.search_issues_by_page_number(
-                project_key=project_key,
-                created_from=search_field_created_from,
-                created_until=search_field_created_until,
-                status=search_field_status,
-                assignee=search_field_assignee,
-                issue_type=search_field_issue_type,
-                search_in_active_sprint=self.active_sprint_checkbox.value,
-                jql_query=jql_query,
                 page=page,
                 limit=self.config.search_results_per_page,
-                order_by=order_by,
+                **criteria,
             )
 
         if not response.success or response.result is None:
+            if pending_total is not None:
+                pending_total.cancel()
             self.notify(
                 'There was an error while performing the search',
                 severity='warning',
@@ -833,40 +962,151 @@ class MainScreen(Actionable, Screen):
             )
             return WorkItemSearchResult(total=0, start=0, end=0)
 
-        # estimation of search results count is only available in Jira Cloud
-        if not self.config.cloud:
-            calculate_total = False
-
-        result: JiraIssueSearchResponse = response.result
-        estimated_total_issues: int = 0
-        if calculate_total:
-            counting: APIControllerResponse = await self.api.count_issues(
-                project_key=project_key,
-                created_from=search_field_created_from,
-                created_until=search_field_created_until,
-                status=search_field_status,
-                assignee=search_field_assignee,
-                issue_type=search_field_issue_type,
-                jql_query=jql_query,
-            )
-            if counting.success:
-                estimated_total_issues = counting.result
-            else:
-                estimated_total_issues = 0
-                self.notify(
-                    'Failed to calculate the number of work items',
-                    title='Work Items Search',
-                    severity='warning',
-                )
-
+        result: JiraIssueSearchResponse = await self._fill_search_results_page(
+            response.result, criteria
+        )
         # the actual number of results
         issues_count = len(result.issues)
         return WorkItemSearchResult(
             response=result,
-            total=estimated_total_issues if estimated_total_issues else 0,
+            total=0,
             start=1 if issues_count else 0,
             end=issues_count,
+            pending_total=pending_total,
+        )
+
+    async def _search_project_mirror(
+        self, criteria: dict, page: int | None
+    ) -> WorkItemSearchResult:
+        """Searches work items in the local mirror of projects.
+
+        Args:
+            criteria: the criteria of the search, as accepted by `APIController.search_issues`. The mirror must cover
+            them.
+            page: the page of results to retrieve; the first one by default.
+
+        Returns:
+            An instance of `WorkItemSearchResult` with the results of the search and their total number.
+        """
+
+        limit: int = self.config.search_results_per_page
+        response: APIControllerResponse = await self.api.search_project_mirror(
+            project_key=criteria['project_key'],
+            created_from=criteria['created_from'],
+            created_until=criteria['created_until'],
+            status=criteria['status'],
+            assignee=criteria['assignee'],
+            issue_type=criteria['issue_type'],
+            order_by=criteria['order_by'],
+            offset=(max(page or 1, 1) - 1) * limit,
+            limit=limit,
+            compact=True,
+        )
+        if not response.success or response.result is None:
+            self.notify(
+                'There was an error while performing the search',
+                severity='warning',
+                title='Work Item Search',
+            )
+            return WorkItemSearchResult(total=0, start=0, end=0)
+        issues_count = len(response.result.issues)
+        return WorkItemSearchResult(
+            response=response.result,
+            total=response.result.total or 0,
+            start=1 if issues_count else 0,
+            end=issues_count,
+        )
+
+    async def _sync_project_mirror(self) -> None:
+        """Synchronizes the local mirror of the projects with the server periodically.
+
+        Returns:
+            Nothing.
+        """
+        while True:
+            for project_key in self.config.project_mirror.projects:
+                response: APIControllerResponse = await self.api.sync_project_mirror(project_key)
+                if not response.success:
+                    self.logger.warning(
+                        'Unable to synchronize the local mirror of a project',
+                        extra={'project_key': project_key, 'error': response.error},
+                    )
+            await asyncio.sleep(max(self.config.project_mirror.sync_interval, 1))
+
+    async def _fill_search_results_page(
+        self, result: JiraIssueSearchResponse, criteria: dict
+    ) -> JiraIssueSearchResponse:
+        """Retrieves the work items of a page of results that were not returned by the first request.
+
+        Jira caps the number of work items returned by a single request, so pages with more results than the cap, e.g.
+        an entire release, require several requests. The work items are requested until the page holds
+        `search_results_per_page` work items or, there are no more results.
+
+        Args:
+            result: the results returned by the first request of the page.
+            criteria: the criteria of the search, as accepted by `APIController.search_issues`.
+
+        Returns:
+            An instance of `JiraIssueSearchResponse` with the work items of the page.
+        """
+
+        limit: int = self.config.search_results_per_page
+        issues: list = list(result.issues)
+        last_result: JiraIssueSearchResponse = result
+        while last_result.issues and len(issues) < limit:
+            response: APIControllerResponse
+            if self.config.cloud:
+                if not last_result.next_page_token or last_result.is_last:
+                    break
+                response = await self.api.search_issues(
+                    next_page_token=last_result.next_page_token,
+                    limit=limit - len(issues),
+                    **criteria,
+                )
+            else:
+                offset: int = (result.offset or 0) + len(issues)
+                if last_result.total is None or offset >= last_result.total:
+                    break
+                response = await self.api.search_issues_by_page_number(
+                    offset=offset, limit=limit - len(issues), **criteria
+                )
+            if not response.success or response.result is None:
+                self.logger.warning(
+                    'Unable to retrieve all the work items of the page of results',
+                    extra={'error': response.error},
+                )
+                break
+            last_result = response.result
+            issues.extend(last_result.issues)
+
+        if last_result is result:
+            return result
+        return JiraIssueSearchResponse(
+            issues=issues,
+            next_page_token=last_result.next_page_token,
+            is_last=last_result.is_last,
+            total=last_result.total,
+            offset=result.offset,
+        )
+
+    async def _count_work_items(self, **criteria) -> int:
+        """Estimates the number of work items that match the criteria of a search.
+
+        Args:
+            **criteria: the criteria of the search, as accepted by `APIController.count_issues`.
+
+        Returns:
+            The estimated number of work items or 0 if the estimation fails.
+        """
+        counting: APIControllerResponse = await self.api.count_issues(**criteria)
+        if counting.success:
+            return counting.result
+        self.notify(
+            'Failed to calculate the number of work items',
+            title='Work Items Search',
+            severity='warning',
         )
+        return 0
 
     @staticmethod
     def _build_jql_query(
@@ -942,13 +1182,42 @@ class MainScreen(Actionable, Screen):
         table.search_results = results.response
         table.focus()
 
+        # a count that is still being estimated for a previous search is no longer relevant
+        if self._pending_search_total is not None:
+            self._pending_search_total.cancel()
+            self._pending_search_total = None
         # update results count for the table's container
         self.search_results_container.pagination = {
-            'total': results.total,
+            'total': None if results.pending_total is not None else results.total,
             'current_page_number': self.search_results_table.page,
         }
         self.run_button.loading = False
 
+        if results.pending_total is not None:
+            # the results are already displayed; fill in the total once the estimation is available
+            self._pending_search_total = results.pending_total
+            results.pending_total.add_done_callback(self._update_search_results_total)
+
+    def _update_search_results_total(self, task: asyncio.Task[int]) -> None:
+        """Updates the pagination details of the search results with the estimated total number of results.
+
+        Args:
+            task: the task that estimated the total number of results.
+
+        Returns:
+            Nothing.
+        """
+        # ignore the estimations of previous searches
+        if task is not self._pending_search_total:
+            return
+        self._pending_search_total = None
+        if task.cancelled() or task.exception() is not None or not self.is_mounted:
+            return
+        self.search_results_container.pagination = {
+            'total': task.result(),
+            'current_page_number': self.search_results_table.page,
+        }
+
     @on(Button.Pressed, '#run-button')
     async def handle_run_button(self) -> None:
         self.run_worker(self.action_search())
@@ -1195,9 +1464,8 @@ class MainScreen(Actionable, Screen):
         work_item_subtasks = WorkItemSubtasks(
             work_item_key=work_item.key, project_key=work_item.project.key
         )
-        response: APIControllerResponse = await self.api.search_issues(
-            jql_query=f'parent={work_item.key}',
-            fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee'],
+        response: APIControllerResponse = await self.api.get_work_item_children(
+            work_item.key, fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee']
         )
         if response.success and response.result:
             work_item_subtasks.issues = response.result.issues
@@ -1219,13 +1487,13 @@ class MainScreen(Actionable, Screen):
         This is triggered from the datatable that holds the search results:
         [IssuesSearchResultsTable](#jiratui.widgets.search.IssuesSearchResultsTable)
 
-        Every time a user selects a work item in the search results the application will do the following:
+        Every time a user selects a work item in the search results the application loads the work item in stages:
 
-        - retrieve the details of the work item by sending a request to the
-        API's [get_issue](#jiratui.api_controller.controller.APIController.get_issue) method.
-        - update the information on the description tab (summary and description)
-        - retrieve the subtasks associated to the selected work item
-        - update the data in all the other tabs
+        - retrieve the details of the work item, except its comments, links, attachments and worklog, by sending a
+        request to the API's [get_issue](#jiratui.api_controller.controller.APIController.get_issue) method.
+        - update the information on the description tab (summary and description) and the details tab
+        - retrieve, concurrently, the comments, the related work items and attachments, the subtasks and the web links
+        of the work item and update every tab as soon as its data is available
 
         Args:
             selected_work_item_key: the key of the work item selected by the user from the search results datatable.
@@ -1245,26 +1513,32 @@ class MainScreen(Actionable, Screen):
         # show loading indicator
         self.issue_info_container.show_loading()
 
-        # step 1: fetch issue
-        response: APIControllerResponse = await self.api.get_issue(
-            issue_id_or_key=selected_work_item_key,
-        )
-        if not response.success or not response.result:
-            self.issue_info_container.hide_loading()
-            self.notify(
-                'Unable to find the selected work item', title='Not Found', severity='error'
+        # step 1: fetch the work item without the fields that may be expensive to retrieve; use the details
+        # prefetched while the user moved through the search results, if any
+        work_item: JiraIssue | None = None
+        if self.work_item_prefetcher is not None:
+            work_item = await self.work_item_prefetcher.take(selected_work_item_key)
+        if work_item is None:
+            response: APIControllerResponse = await self.api.get_issue(
+                issue_id_or_key=selected_work_item_key,
+                fields=WORK_ITEM_DETAILS_FIELDS,
             )
-            return
+            if not response.success or not response.result:
+                self.issue_info_container.hide_loading()
+                self.notify(
+                    'Unable to find the selected work item', title='Not Found', severity='error'
+                )
+                return
 
-        result: JiraIssueSearchResponse | None = response.result
-        if not result or not result.issues:
-            self.issue_info_container.hide_loading()
-            self.notify(
-                'Unable to find the selected work item', title='Not Found', severity='error'
-            )
-            return
+            result: JiraIssueSearchResponse | None = response.result
+            if not result or not result.issues:
+                self.issue_info_container.hide_loading()
+                self.notify(
+                    'Unable to find the selected work item', title='Not Found', severity='error'
+                )
+                return
 
-        work_item: JiraIssue = result.issues[0]
+            work_item = result.issues[0]
         # track the currently loaded work item
         self.current_loaded_work_item_key = work_item.key
 
@@ -1275,26 +1549,13 @@ class MainScreen(Actionable, Screen):
         # step 3: populate the details tab
         self.issue_details_widget.issue = work_item
 
-        # step 4: populate the related-issues tab
-        self.related_issues_widget.issues = WorkItemRelatedItems(
-            work_item_key=work_item.key, related_items=work_item.related_issues
-        )
-
-        # step 5: populate comments tab
-        self.issue_comments_widget.comments = WorkItemComments(
-            work_item_key=work_item.key, comments=work_item.comments
-        )
-
-        # step 6: populate attachments tab
-        self.issue_attachments_widget.attachments = WorkItemAttachments(
-            work_item_key=work_item.key, attachments=work_item.attachments
-        )
-
-        # step 7: populate links tab
+        # step 4: populate links tab; the widget retrieves the links
         if self.config.show_issue_web_links:
             self.issue_remote_links_widget.issue_key = work_item.key
 
-        # step 8: populate subtasks tab
+        # step 5: retrieve the data of the remaining tabs concurrently
+        self.run_worker(self._fetch_work_item_comments(work_item.key))
+        self.run_worker(self._fetch_work_item_related_items_and_attachments(work_item.key))
         self.run_worker(self.retrieve_issue_subtasks(work_item))
 
         if self.config.enable_recent_history:
@@ -1306,16 +1567,114 @@ class MainScreen(Actionable, Screen):
                 summary=work_item.summary,
             )
 
+    async def _prefetch_work_item(self, work_item_key: str) -> JiraIssue | None:
+        """Retrieves the details of a work item, as loaded in the first stage of `fetch_issue`, ahead of time."""
+
+        response: APIControllerResponse = await self.api.get_issue(
+            issue_id_or_key=work_item_key,
+            fields=WORK_ITEM_DETAILS_FIELDS,
+        )
+        if not response.success or not response.result or not response.result.issues:
+            return None
+        return response.result.issues[0]
+
+    def prefetch_work_items(self, work_item_keys: list[str]) -> None:
+        """Prefetches the details of the work items highlighted in the search results.
+
+        Args:
+            work_item_keys: the keys of the work items to prefetch, in order of priority.
+
+        Returns:
+            Nothing.
+        """
+        if self.work_item_prefetcher is None:
+            return
+        self.work_item_prefetcher.prefetch(
+            [key for key in work_item_keys if key != self.current_loaded_work_item_key]
+        )
+
+    async def _fetch_work_item_comments(self, work_item_key: str) -> None:
+        """Retrieves the comments of a work item and populates the comments tab."""
+
+        response: APIControllerResponse = await self.api.list_all_comments(work_item_key)
+        if self.current_loaded_work_item_key != work_item_key:
+            # the user selected another work item in the meantime
+            return
+        if not response.success:
+            self.notify(
+                'Unable to retrieve the comments of the work item',
+                severity='warning',
+                title='Work Item Search',
+            )
+        self.issue_comments_widget.comments = WorkItemComments(
+            work_item_key=work_item_key, comments=response.result or []
+        )
+
+    async def _fetch_work_item_related_items_and_attachments(self, work_item_key: str) -> None:
+        """Retrieves the related work items and the attachments of a work item and populates their tabs."""
+
+        response: APIControllerResponse = await self.api.get_issue(
+            issue_id_or_key=work_item_key, fields=['issuelinks', 'attachment']
+        )
+        if self.current_loaded_work_item_key != work_item_key:
+            # the user selected another work item in the meantime
+            return
+        if not response.success or not response.result or not response.result.issues:
+            self.notify(
+                'Unable to retrieve the related work items and attachments of the work item',
+                severity='warning',
+                title='Work Item Search',
+            )
+            return
+        work_item: JiraIssue = response.result.issues[0]
+        self.related_issues_widget.issues = WorkItemRelatedItems(
+            work_item_key=work_item_key, related_items=work_item.related_issues
+        )
+        self.issue_attachments_widget.attachments = WorkItemAttachments(
+            work_item_key=work_item_key, attachments=work_item.attachments
+        )
+
     async def request_text_search(self, value: str):
         value = value or ''
         if (value := value.strip()) and len(value) >= max(
             FULL_TEXT_SEARCH_DEFAULT_MINIMUM_TERM_LENGTH,
             int(self.config.full_text_search_minimum_term_length),
         ):
-            self.run_worker(self.action_search(search_term=value))
+            if self.config.full_text_index.enabled:
+                self.run_worker(self._search_text(value))
+            else:
+                self.run_worker(self.action_search(search_term=value))
         else:
             self.notify('Nothing to search')
 
+    async def _search_text(self, value: str) -> None:
+        """Searches work items by text in the local full-text index and then, in the server.
+
+        The work items found in the local index are displayed immediately; the results of the search in the server
+        replace them when they are available. In offline mode only the local index is searched.
+
+        Args:
+            value: the text to search.
+
+        Returns:
+            Nothing.
+        """
+        response: APIControllerResponse = await self.api.search_work_item_index(value)
+        if response.success and response.result and response.result.issues:
+            table = self.search_results_table
+            table.page = 1
+            table.token_by_page = {}
+            table.set_initial_results_set(response.result)
+            table.search_results = response.result
+            self.search_results_container.pagination = {
+                'total': len(response.result.issues),
+                'current_page_number': table.page,
+            }
+        elif self.config.full_text_index.offline:
+            self.notify('No work items found in the local index', title='Search')
+        if not self.config.full_text_index.offline:
+            await self.action_search(search_term=value)
+
     async def action_find_by_text(self) -> None:
         """Opens a screen to allow the user to enter a term to search items by text."""
         await self.app.push_screen(TextSearchScreen(), self.request_text_search)
@@ -1405,6 +1764,9 @@ class MainScreen(Actionable, Screen):
             None
         """
 
+        if self.work_item_prefetcher is not None:
+            self.work_item_prefetcher.invalidate(message.work_item_key)
+
         if self.current_loaded_work_item_key == message.work_item_key:
             # clean up the forms and tabs
             self.related_issues_widget.issues = None
@@ -1433,6 +1795,8 @@ class MainScreen(Actionable, Screen):
             None
         """
 
+        if self.work_item_prefetcher is not None:
+            self.work_item_prefetcher.invalidate(message.work_item_key)
         self.run_worker(self.fetch_issue(message.work_item_key), exclusive=True)
 
     def _load_work_item(self, work_item_key: str | None = None) -> None:
@@ -308,17 +308,19 @@ class GoToScreen(ModalScreen[str]):
         self.dismiss(message.work_item_key)
 
     async def _get_subtasks(self) -> list[JiraIssue]:
-        search_issues_response: APIControllerResponse = await self.__controller.search_issues(
-            jql_query=f'parent={self.__work_item_key}',
-            fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee'],
+        search_issues_response: APIControllerResponse = (
+            await self.__controller.get_work_item_children(
+                self.__work_item_key,
+                fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee'],
+            )
         )
         if search_issues_response.success and search_issues_response.result:
             return search_issues_response.result.issues or []
         return []
 
     async def _get_parent(self, key: str) -> JiraIssue | None:
-        parent_search_response: APIControllerResponse = await self.__controller.get_issue(
-            issue_id_or_key=key,
+        parent_search_response: APIControllerResponse = await self.__controller.get_issues_bulk(
+            [key], fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee']
         )
         if parent_search_response.success and parent_search_response.result:
             parent_search_result: JiraIssueSearchResponse = parent_search_response.result
@@ -19,8 +19,7 @@ class QuitScreen(ModalScreen[str]):
 
     async def close_connections(self):
         app = cast('JiraApp', self.screen.app)  # type:ignore[name-defined] # noqa: F821
-        await app.api.api.client.close_async_client()
-        await app.api.api.async_http_client.close_async_client()
+        await app.api.close_connections()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == 'button-quit':
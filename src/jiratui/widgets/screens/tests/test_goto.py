@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -262,15 +262,15 @@ async def test_goto_screen_fill_in_related_work_items_table_without_tasks(
         assert screen.table_subtasks.display is False
 
 
-@patch.object(APIController, 'search_issues')
+@patch.object(APIController, 'get_work_item_children')
 @patch.object(APIController, 'get_issue')
 @pytest.mark.asyncio
 async def test_goto_screen_get_subtasks(
-    get_issue_mock: AsyncMock, search_issues_mock: AsyncMock, jira_issues, app
+    get_issue_mock: AsyncMock, get_work_item_children_mock: AsyncMock, jira_issues, app
 ):
     # GIVEN
     get_issue_mock.return_value = APIControllerResponse(result=JiraIssueSearchResponse(issues=[]))
-    search_issues_mock.return_value = APIControllerResponse(
+    get_work_item_children_mock.return_value = APIControllerResponse(
         result=JiraIssueSearchResponse(issues=[jira_issues[0]])
     )
     async with app.run_test():
@@ -281,6 +281,9 @@ async def test_goto_screen_get_subtasks(
         result = await screen._get_subtasks()
         # THEN
         assert result == [jira_issues[0]]
+        get_work_item_children_mock.assert_called_with(
+            'key-2', fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee']
+        )
 
 
 @pytest.mark.parametrize(
@@ -291,15 +294,15 @@ async def test_goto_screen_get_subtasks(
         APIControllerResponse(success=False),
     ],
 )
-@patch.object(APIController, 'search_issues')
+@patch.object(APIController, 'get_work_item_children')
 @patch.object(APIController, 'get_issue')
 @pytest.mark.asyncio
 async def test_goto_screen_get_subtasks_no_tasks_found(
-    get_issue_mock: AsyncMock, search_issues_mock: AsyncMock, search_issues_result, app
+    get_issue_mock: AsyncMock, get_work_item_children_mock: AsyncMock, search_issues_result, app
 ):
     # GIVEN
     get_issue_mock.return_value = APIControllerResponse(result=JiraIssueSearchResponse(issues=[]))
-    search_issues_mock.return_value = search_issues_result
+    get_work_item_children_mock.return_value = search_issues_result
     async with app.run_test():
         # WHEN
         screen = GoToScreen('key-2', APIController())
@@ -310,14 +313,17 @@ async def test_goto_screen_get_subtasks_no_tasks_found(
         assert result == []
 
 
+@patch.object(APIController, 'get_issues_bulk')
 @patch.object(APIController, 'get_issue')
 @pytest.mark.asyncio
-async def test_goto_screen_get_parent(get_issue_mock: AsyncMock, jira_issues, app):
+async def test_goto_screen_get_parent(
+    get_issue_mock: AsyncMock, get_issues_bulk_mock: AsyncMock, jira_issues, app
+):
     # GIVEN
-    get_issue_mock.side_effect = [
-        APIControllerResponse(result=JiraIssueSearchResponse(issues=[])),
-        APIControllerResponse(result=JiraIssueSearchResponse(issues=[jira_issues[0]])),
-    ]
+    get_issue_mock.return_value = APIControllerResponse(result=JiraIssueSearchResponse(issues=[]))
+    get_issues_bulk_mock.return_value = APIControllerResponse(
+        result=JiraIssueSearchResponse(issues=[jira_issues[0]])
+    )
     async with app.run_test():
         # WHEN
         screen = GoToScreen('key-2', APIController())
@@ -326,8 +332,9 @@ async def test_goto_screen_get_parent(get_issue_mock: AsyncMock, jira_issues, ap
         result = await screen._get_parent('key-1')
         # THEN
         assert result == jira_issues[0]
-        get_issue_mock.assert_has_calls(
-            [call(issue_id_or_key='key-2'), call(issue_id_or_key='key-1')]
+        get_issue_mock.assert_called_once_with(issue_id_or_key='key-2')
+        get_issues_bulk_mock.assert_called_once_with(
+            ['key-1'], fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee']
         )
 
 
@@ -339,16 +346,15 @@ async def test_goto_screen_get_parent(get_issue_mock: AsyncMock, jira_issues, ap
         APIControllerResponse(success=False),
     ],
 )
+@patch.object(APIController, 'get_issues_bulk')
 @patch.object(APIController, 'get_issue')
 @pytest.mark.asyncio
 async def test_goto_screen_get_parent_no_tasks_found(
-    get_issue_mock: AsyncMock, search_issues_result, app
+    get_issue_mock: AsyncMock, get_issues_bulk_mock: AsyncMock, search_issues_result, app
 ):
     # GIVEN
-    get_issue_mock.side_effect = [
-        APIControllerResponse(result=JiraIssueSearchResponse(issues=[])),
-        search_issues_result,
-    ]
+    get_issue_mock.return_value = APIControllerResponse(result=JiraIssueSearchResponse(issues=[]))
+    get_issues_bulk_mock.return_value = search_issues_result
     async with app.run_test():
         # WHEN
         screen = GoToScreen('key-2', APIController())
@@ -357,8 +363,8 @@ async def test_goto_screen_get_parent_no_tasks_found(
         result = await screen._get_parent('key-1')
         # THEN
         assert result is None
-        get_issue_mock.assert_has_calls(
-            [call(issue_id_or_key='key-2'), call(issue_id_or_key='key-1')]
+        get_issues_bulk_mock.assert_called_once_with(
+            ['key-1'], fields=['id', 'key', 'status', 'summary', 'issuetype', 'assignee']
         )
 
 
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 import pytest
 
 from jiratui.api_controller.controller import APIController, APIControllerResponse
+from jiratui.constants import WORK_ITEM_DETAILS_FIELDS
 from jiratui.models import JiraIssue, JiraIssueSearchResponse
 from jiratui.widgets.commons.widgets import ReadOnlyPlainTextTextAreaWidget
 from jiratui.widgets.screens.work_item_quick_view import QuickViewDetails, WorkItemQuickViewScreen
@@ -223,7 +224,9 @@ async def test_mount_rich_text_value_is_empty(
         await app.push_screen(screen)
         await pilot.pause()
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='WI-1')
+        get_issue_mock.assert_called_once_with(
+            issue_id_or_key='WI-1', fields=WORK_ITEM_DETAILS_FIELDS
+        )
         rich_text_value_is_empty_mock.assert_called_once_with(jira_issues[0].description)
         build_read_only_rich_text_widget_mock.assert_called_once()
         table = screen.query_one(QuickViewDetails)
@@ -254,7 +257,9 @@ async def test_mount_rich_text_value_is_not_empty(
         await app.push_screen(screen)
         await pilot.pause()
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='WI-1')
+        get_issue_mock.assert_called_once_with(
+            issue_id_or_key='WI-1', fields=WORK_ITEM_DETAILS_FIELDS
+        )
         rich_text_value_is_empty_mock.assert_called_once_with(jira_issues[0].description)
         build_read_only_rich_text_widget_mock.assert_not_called()
         table = screen.query_one(QuickViewDetails)
@@ -307,7 +312,9 @@ async def test_mount_with_issue_metadata(
         await app.push_screen(screen)
         await pilot.pause()
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='WI-1')
+        get_issue_mock.assert_called_once_with(
+            issue_id_or_key='WI-1', fields=WORK_ITEM_DETAILS_FIELDS
+        )
         rich_text_value_is_empty_mock.assert_has_calls(
             [
                 call(issue.description),
@@ -381,7 +388,9 @@ async def test_mount_with_issue_metadata_single_tab(
         await app.push_screen(screen)
         await pilot.pause()
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='WI-1')
+        get_issue_mock.assert_called_once_with(
+            issue_id_or_key='WI-1', fields=WORK_ITEM_DETAILS_FIELDS
+        )
         rich_text_value_is_empty_mock.assert_has_calls(
             [
                 call(issue.description),
@@ -449,7 +458,9 @@ async def test_mount_with_issue_metadata_with_environment_field(
         await app.push_screen(screen)
         await pilot.pause()
         # THEN
-        get_issue_mock.assert_called_once_with(issue_id_or_key='WI-1')
+        get_issue_mock.assert_called_once_with(
+            issue_id_or_key='WI-1', fields=WORK_ITEM_DETAILS_FIELDS
+        )
         rich_text_value_is_empty_mock.assert_has_calls(
             [
                 call(issue.description),
@@ -13,6 +13,7 @@ from textual.widgets import DataTable, Footer, Rule, Static, TabbedContent, TabP
 from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
 from jiratui.api_controller.controller import APIControllerResponse
+from jiratui.constants import WORK_ITEM_DETAILS_FIELDS
 from jiratui.models import JiraWorkItemFields
 from jiratui.utils.styling import (
     get_style_for_work_item_priority,
@@ -140,8 +141,9 @@ class WorkItemQuickViewScreen(Actionable, ModalScreen[str]):
         if not self._work_item_key:
             return
         application = cast('JiraApp', self.app)  # type:ignore[name-defined] # noqa: F821
+        # request the fields of the main screen so that the work item loaded there is reused
         response: APIControllerResponse = await application.api.get_issue(  # type:ignore[attr-defined]
-            issue_id_or_key=self._work_item_key
+            issue_id_or_key=self._work_item_key, fields=WORK_ITEM_DETAILS_FIELDS
         )
         if not response.success:
             log.error(
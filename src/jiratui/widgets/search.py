@@ -15,7 +15,8 @@ from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
 from jiratui.api_controller.controller import APIControllerResponse
 from jiratui.config import CONFIGURATION
-from jiratui.models import JiraIssue, JiraIssueSearchResponse
+from jiratui.models import JiraIssue, JiraIssueSearchResponse, JiraIssueSearchRow
+from jiratui.utils.search_index import WorkItemSearchIndex
 from jiratui.utils.styling import get_style_for_work_item_status, get_style_for_work_item_type
 from jiratui.utils.ui_actions import Actionable, UIAction
 from jiratui.utils.urls import build_external_url_for_issue
@@ -28,6 +29,10 @@ from jiratui.widgets.screens.work_item_quick_view import WorkItemQuickViewScreen
 class DataTableSearchInput(Input):
     """An input field that allows users to perform searches in the currently active search results page.
 
+    The work items are filtered using the index of the search results table, so every keystroke only checks the work
+    items that may match. The key, summary, parent, assignee, status and labels of the work items are searched and, the
+    best matches are displayed first. See [WorkItemSearchIndex](#jiratui.utils.search_index.WorkItemSearchIndex).
+
     The feature to search within search results pages is controlled by these settings:
 
     - `search_results_page_filtering_enabled`
@@ -84,24 +89,10 @@ class DataTableSearchInput(Input):
                 screen.search_results_table.get_initial_results_set()
             )
             self.total = 0
-        else:
-            cleaned = cleaned.lower()
-            if (initial_results_set := screen.search_results_table.get_initial_results_set()) and (
-                issues := initial_results_set.issues
-            ):
-                filtered: list[JiraIssue] = [
-                    record
-                    for record in issues
-                    if (
-                        cleaned in record.summary.lower()
-                        or cleaned in record.key.lower()
-                        or cleaned in record.parent_key
-                    )
-                ]
-                screen.search_results_table.search_results = JiraIssueSearchResponse(
-                    issues=filtered
-                )
-                self.total = len(filtered)
+        elif search_index := screen.search_results_table.get_search_index():
+            filtered: list = search_index.search(cleaned)
+            screen.search_results_table.search_results = JiraIssueSearchResponse(issues=filtered)
+            self.total = len(filtered)
 
 
 class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):  # type:ignore[call-arg]
@@ -176,6 +167,18 @@ class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):
     ] + [Binding('escape', 'hide', 'Hide search input', show=False)]
 
     SMALLEST_MAXIMUM_WIDTH_FOR_SUMMARY_COLUMN = 30
+    COLUMNS: list[tuple[str, str]] = [
+        ('#', 'number'),
+        ('Key', 'key'),
+        ('Parent', 'parent'),
+        ('Status', 'status'),
+        ('Type', 'type'),
+        ('Summary', 'summary'),
+    ]
+    """The label and the key of the columns of the table."""
+    ROWS_LOADED_PER_BATCH = 200
+    """The number of rows added to the table at a time. Rows are only added when the cursor, or the scroll position,
+    gets close to the last row in the table."""
 
     class WorkItemDeleted(Message):
         def __init__(self, work_item_key: str) -> None:
@@ -198,16 +201,48 @@ class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):
         self.current_work_item_key: str | None = None
         self.current_work_item_id: str | None = None
         self._initial_results_set: JiraIssueSearchResponse | None = None
+        # the index for filtering the initial results set and, the results set it was built for
+        self._search_index: WorkItemSearchIndex | None = None
+        self._indexed_results_set: JiraIssueSearchResponse | None = None
+        # the work items of the current results by row key and, the row keys in the order the work items are displayed
+        self._work_items: dict[str, JiraIssue | JiraIssueSearchRow] = {}
+        self._row_keys: list[str] = []
+        # the cells of the rows in the table by row key; the table holds a prefix of `_row_keys`
+        self._rows: dict[str, tuple] = {}
+
+    def on_mount(self) -> None:
+        self.watch(self, 'scroll_y', self._load_rows_near_viewport, init=False)
 
     def set_initial_results_set(self, data: JiraIssueSearchResponse | None = None):
         self._initial_results_set = data
+        # the index is built once per results set and reused by every keystroke of the filter
+        self._indexed_results_set = data
+        self._search_index = WorkItemSearchIndex(data.issues) if data and data.issues else None
 
     def get_initial_results_set(self) -> JiraIssueSearchResponse | None:
         return self._initial_results_set
 
+    def get_search_index(self) -> WorkItemSearchIndex | None:
+        """Retrieves the index for filtering the work items of the initial results set.
+
+        Returns:
+            An instance of `WorkItemSearchIndex` or `None` if there are no results.
+        """
+        if (results := self.get_initial_results_set()) is None or not results.issues:
+            return None
+        if self._search_index is None or self._indexed_results_set is not results:
+            self._search_index = WorkItemSearchIndex(results.issues)
+            self._indexed_results_set = results
+        return self._search_index
+
     def watch_search_results(self, response: JiraIssueSearchResponse | None = None) -> None:
         """Watches the content of a reactive attribute that contains the details of the work item selected by the user.
 
+        The table is not rebuilt when the results change, e.g. when the user filters the results. Instead, the rows
+        of the work items that are no longer part of the results are removed, the cells that changed are updated and
+        the rows of the new work items are added. Only the first rows are added to the table; the remaining rows are
+        added in batches as the user moves towards them. This keeps updates fast with thousands of results.
+
         Args:
             response: an instance of `JiraIssueSearchResponse` with the work item selected by the user.
 
@@ -217,47 +252,136 @@ class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):
         if response is None:
             return
 
-        # clear the existing data
-        self.clear(columns=True)
-
-        maximum_summary_column_width = max(
-            self.SMALLEST_MAXIMUM_WIDTH_FOR_SUMMARY_COLUMN,
-            self.parent.container_size.width - 42,  # type:ignore[attr-defined]
-        )
-
         # update next search tokens
         if response.next_page_token:
             # there is a token to fetch the next page
             self.token_by_page[self.page + 1] = response.next_page_token
 
         # set the columns
-        self.add_columns(*['#', 'Key', 'Parent', 'Status', 'Type', 'Summary'])
-        # build the rows
-        for index, issue in enumerate(response.issues):
-            issue_summary = issue.cleaned_summary(
-                CONFIGURATION.get().search_results_truncate_work_item_summary
-                or maximum_summary_column_width
-            )
+        if not self.columns:
+            for label, column_key in self.COLUMNS:
+                self.add_column(label, key=column_key)
 
-            style_status = ''
-            if CONFIGURATION.get().search_results_style_work_item_status:
-                style_status = get_style_for_work_item_status(issue.status.name.lower())
-
-            style_work_type = ''
-            if CONFIGURATION.get().search_results_style_work_item_type:
-                style_work_type = get_style_for_work_item_type(issue.issue_type.name.lower())
-
-            self.add_row(
-                *[
-                    index + 1,
-                    issue.key,
-                    issue.parent_key,
-                    Text(issue.status.name, style=style_status),
-                    Text(issue.work_item_type_name, style=style_work_type),
-                    Text(issue_summary),
-                ],
-                key=f'{issue.id}#{issue.key}',
-            )
+        self._work_items = {f'{issue.id}#{issue.key}': issue for issue in response.issues}
+        self._row_keys = list(self._work_items)
+        # keep the rows up to the cursor, and a few more, in the table
+        self._update_rows(self._row_keys[: self.cursor_row + self.ROWS_LOADED_PER_BATCH])
+
+    def _get_maximum_summary_width(self) -> int:
+        return CONFIGURATION.get().search_results_truncate_work_item_summary or max(
+            self.SMALLEST_MAXIMUM_WIDTH_FOR_SUMMARY_COLUMN,
+            self.parent.container_size.width - 42,  # type:ignore[attr-defined]
+        )
+
+    @staticmethod
+    def _build_row(
+        index: int, issue: JiraIssue | JiraIssueSearchRow, maximum_summary_width: int
+    ) -> tuple:
+        """Builds the cells of the row of a work item.
+
+        Args:
+            index: the position of the work item in the results.
+            issue: the work item.
+            maximum_summary_width: the maximum length of the summary of the work item.
+
+        Returns:
+            A tuple with the value of the cells of the row, in the order of the columns.
+        """
+
+        style_status = ''
+        if CONFIGURATION.get().search_results_style_work_item_status:
+            style_status = get_style_for_work_item_status(issue.status_name.lower())
+
+        style_work_type = ''
+        if CONFIGURATION.get().search_results_style_work_item_type:
+            style_work_type = get_style_for_work_item_type(issue.work_item_type_name.lower())
+
+        return (
+            index + 1,
+            issue.key,
+            issue.parent_key,
+            Text(issue.status_name, style=style_status),
+            Text(issue.work_item_type_name, style=style_work_type),
+            Text(issue.cleaned_summary(maximum_summary_width)),
+        )
+
+    def _update_rows(self, row_keys: list[str]) -> None:
+        """Updates the rows of the table so that it displays the work items with the given row keys, in order.
+
+        Args:
+            row_keys: the keys of the rows to display.
+
+        Returns:
+            None
+        """
+
+        rows: dict[str, tuple] = {}
+        if row_keys:
+            maximum_summary_width = self._get_maximum_summary_width()
+            rows = {
+                row_key: self._build_row(index, self._work_items[row_key], maximum_summary_width)
+                for index, row_key in enumerate(row_keys)
+            }
+        current_row_keys: list[str] = [
+            str(row.key.value) for row in self.ordered_rows if row.key.value in self._rows
+        ]
+        stale_row_keys: list[str] = [row_key for row_key in current_row_keys if row_key not in rows]
+        if 2 * len(stale_row_keys) > len(current_row_keys):
+            # removing a row is linear on the number of rows; rebuilding the table is cheaper when most rows go
+            self.clear()
+            self._rows = {}
+        else:
+            for row_key in stale_row_keys:
+                self.remove_row(row_key)
+                self._rows.pop(row_key, None)
+
+        for row_key, cells in rows.items():
+            if (current_cells := self._rows.get(row_key)) is None:
+                self.add_row(*cells, key=row_key)
+                continue
+            for (_, column_key), current_value, value in zip(
+                self.COLUMNS, current_cells, cells, strict=True
+            ):
+                if current_value != value:
+                    self.update_cell(row_key, column_key, value)
+        self._rows = rows
+
+        if [row.key.value for row in self.ordered_rows] != row_keys:
+            # the keys of the work items are unique within the results
+            positions: dict[str, int] = {
+                self._work_items[row_key].key: index for index, row_key in enumerate(row_keys)
+            }
+            self.sort('key', key=positions.__getitem__)
+
+    def _load_more_rows(self, count: int | None = None) -> None:
+        """Adds the rows of the next work items of the results to the table.
+
+        Args:
+            count: the number of rows to add. If `None`, the rows of all the remaining work items are added.
+
+        Returns:
+            None
+        """
+
+        start = len(self._rows)
+        end = len(self._row_keys) if count is None else min(start + count, len(self._row_keys))
+        if start >= end:
+            return
+        maximum_summary_width = self._get_maximum_summary_width()
+        for index in range(start, end):
+            row_key = self._row_keys[index]
+            cells = self._build_row(index, self._work_items[row_key], maximum_summary_width)
+            self.add_row(*cells, key=row_key)
+            self._rows[row_key] = cells
+
+    def _load_rows_near_viewport(self, scroll_y: float) -> None:
+        if self.max_scroll_y - scroll_y <= self.scrollable_content_region.height:
+            self._load_more_rows(self.ROWS_LOADED_PER_BATCH)
+
+    def action_scroll_bottom(self) -> None:
+        # the last row is the last row of the results, not the last row loaded so far
+        self._load_more_rows()
+        super().action_scroll_bottom()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Fetches the details of the currently-selected item."""
@@ -270,9 +394,34 @@ class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):
             self.run_worker(screen.fetch_issue(self.current_work_item_key), exclusive=True)
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        """Stores the key of the currently-selected item."""
+        """Stores the key of the currently-selected item and prefetches its details and those of its neighbours."""
+        if event.cursor_row >= self.row_count - self.ROWS_LOADED_PER_BATCH // 4:
+            self._load_more_rows(self.ROWS_LOADED_PER_BATCH)
         if event.row_key:
             self.current_work_item_id, self.current_work_item_key = event.row_key.value.split('#')
+            screen = cast('MainScreen', self.screen)  # type:ignore[name-defined] # noqa: F821
+            if screen.work_item_prefetcher is not None:
+                screen.prefetch_work_items(self._get_work_item_keys_around(event.cursor_row))
+
+    def _get_work_item_keys_around(self, row_index: int) -> list[str]:
+        """Retrieves the keys of the work item in a row and of the work items in the rows around it.
+
+        Args:
+            row_index: the index of the row.
+
+        Returns:
+            The keys of the work items, starting with the one in the given row followed by its closest neighbours.
+        """
+        neighbours: int = CONFIGURATION.get().work_item_prefetch.neighbours
+        indexes: list[int] = [row_index]
+        for distance in range(1, neighbours + 1):
+            indexes.extend([row_index + distance, row_index - distance])
+        # the work items of the rows that were not added to the table yet are prefetched too
+        return [
+            self._row_keys[index].split('#')[1]
+            for index in indexes
+            if 0 <= index < len(self._row_keys)
+        ]
 
     async def action_view_work_item(self) -> None:
         """Opens the quick-view screen for the currently selected work item."""
@@ -331,11 +480,15 @@ class IssuesSearchResultsTable(Actionable, DataTable, inherit_bindings=False):
                 self.current_work_item_key
             )
             if response.success:
+                row_key = f'{self.current_work_item_id}#{self.current_work_item_key}'
                 try:
-                    self.remove_row(f'{self.current_work_item_id}#{self.current_work_item_key}')
+                    self.remove_row(row_key)
                 except RowDoesNotExist:
                     pass
                 else:
+                    self._rows.pop(row_key, None)
+                    self._work_items.pop(row_key, None)
+                    self._row_keys.remove(row_key)
                     # post the message to the parent container can update the pagination legend
                     self.post_message(self.WorkItemDeleted(self.current_work_item_key))
                     # force the table to highlight another item to avoid RowDoesNotExist exceptions with the next delete
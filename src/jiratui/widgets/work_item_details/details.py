@@ -68,6 +68,7 @@ from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
 from jiratui.api_controller.controller import APIControllerResponse
 from jiratui.config import CONFIGURATION
+from jiratui.constants import WORK_ITEM_DETAILS_FIELDS
 from jiratui.exceptions import UpdateWorkItemException, ValidationError
 from jiratui.models import AgileSprint, IssuePriority, JiraIssue, TimeTracking
 from jiratui.utils.ui_actions import Actionable, UIAction
@@ -505,7 +506,9 @@ class IssueDetailsWidget(Actionable, Vertical, inherit_bindings=False):  # type:
         worklog."""
 
         application = cast('JiraApp', self.app)  # type:ignore[name-defined] # noqa: F821
-        issue_details_response = await application.api.get_issue(issue_id_or_key=self.issue.key)
+        issue_details_response = await application.api.get_issue(
+            issue_id_or_key=self.issue.key, fields=WORK_ITEM_DETAILS_FIELDS
+        )
         if issue_details_response.success and issue_details_response.result:
             self.issue = issue_details_response.result.issues[0]
 
@@ -1095,7 +1098,7 @@ class IssueDetailsWidget(Actionable, Vertical, inherit_bindings=False):  # type:
     async def _determine_issue_flagged_status(self, issue: JiraIssue) -> None:
         application = cast('JiraApp', self.app)  # type: ignore[name-defined] # noqa: F821
         # retrieve the configuration of all the supported fields
-        response: APIControllerResponse = await application.api.get_fields('flagged')
+        response: APIControllerResponse = await application.api.get_fields('flagged', cached=True)
         if response.success and response.result:
             # extract the key of the field used for flagging items based on the name of the field
             work_item_flag: Any = issue.get_custom_field_value(response.result[0].id)  # type:ignore
@@ -26,6 +26,7 @@ from textual.widgets import (
 from jiratui.actions.constants import SupportedActions
 from jiratui.actions.keys import get_application_key_bindings
 from jiratui.api_controller.controller import APIControllerResponse
+from jiratui.constants import WORK_ITEM_DETAILS_FIELDS
 from jiratui.models import (
     JiraIssue,
     JiraIssueSearchResponse,
@@ -306,7 +307,7 @@ class WorkItemWorkLogScreen(Actionable, Screen[dict]):
         if fetch_time_tracking:
             # fetch the work item's time tracking information
             work_item_response: APIControllerResponse = await application.api.get_issue(
-                issue_id_or_key=self._work_item_key,
+                issue_id_or_key=self._work_item_key, fields=WORK_ITEM_DETAILS_FIELDS
             )
             if not work_item_response.success or not work_item_response.result:
                 self.notify(
@@ -8,6 +8,7 @@ from textual.widgets import Button
 
 from jiratui.api_controller.controller import APIController, APIControllerResponse
 from jiratui.app import JiraApp
+from jiratui.constants import WORK_ITEM_DETAILS_FIELDS
 from jiratui.models import JiraIssue, JiraIssueSearchResponse, JiraWorklog, PaginatedJiraWorklog
 from jiratui.widgets.filters import ProjectSelectionInput
 from jiratui.widgets.screen import MainScreen, WorkItemSearchResult
@@ -1249,7 +1250,9 @@ async def test_work_log_screen_fetch_work_logs_with_fetch_time_tracking_true(
         # WHEN
         await screen._fetch_work_logs(fetch_time_tracking=True)
         # THEN
-        get_issue_mock.assert_has_calls([call(issue_id_or_key=work_item.key)])
+        get_issue_mock.assert_has_calls(
+            [call(issue_id_or_key=work_item.key, fields=WORK_ITEM_DETAILS_FIELDS)]
+        )
         assert screen._work_item_time_tracking == work_item.time_tracking
 
 